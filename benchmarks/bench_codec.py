@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+"""Compare the binary snapshot codec with path-keyed JSON.
+
+Run with ``python benchmarks/bench_codec.py``.
+"""
+
+import json
+import random
+import timeit
+
+from sdv_model import vehicle
+from sdv_model.codec.binary import SnapshotCodec
+from sdv_model.schema import Schema
+from sdv_model.snapshot import VersionedStore
+
+RANGES = {
+    "int8": (-128, 127),
+    "int16": (-32768, 32767),
+    "int32": (-(2**31), 2**31 - 1),
+    "uint8": (0, 255),
+    "uint16": (0, 65535),
+    "uint32": (0, 2**32 - 1),
+}
+
+
+def random_value(spec):
+    if spec.datatype == "boolean":
+        return random.random() < 0.5
+    if spec.datatype in RANGES:
+        return random.randint(*RANGES[spec.datatype])
+    if spec.datatype in ("float", "double"):
+        return random.uniform(-1000, 1000)
+    if spec.datatype == "string":
+        return random.choice(spec.allowed) if spec.allowed else "value"
+    if spec.datatype == "string[]":
+        return ["a", "b"]
+    return [1, 2, 3]
+
+
+def bench(name, func, number):
+    seconds = timeit.timeit(func, number=number) / number
+    print(f"{name:<20} {seconds * 1e6:10.1f} us")
+
+
+def main(number: int = 2000):
+    schema = Schema.from_model(vehicle)
+    store = VersionedStore(schema)
+    snapshot = store.update({spec.index: random_value(spec) for spec in schema})
+    codec = SnapshotCodec(schema)
+
+    encoded = codec.encode(snapshot)
+    as_json = json.dumps(snapshot.as_dict()).encode()
+    print(f"{len(schema)} datapoints")
+    print(f"{'binary size':<20} {len(encoded):10d} bytes")
+    print(f"{'json size':<20} {len(as_json):10d} bytes")
+    bench("binary encode", lambda: codec.encode(snapshot), number)
+    bench("json encode", lambda: json.dumps(snapshot.as_dict()), number)
+    bench("binary decode", lambda: codec.decode(encoded), number)
+    bench("json decode", lambda: json.loads(as_json), number)
+
+
+if __name__ == "__main__":
+    main()
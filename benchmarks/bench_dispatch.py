@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+"""Measure callback throughput of per-update and coalescing dispatch.
+
+A synthetic source commits batches touching every TractionBattery
+datapoint, several batches per event-loop iteration, while a number of
+callbacks watch the whole branch.
+
+Run with ``python benchmarks/bench_dispatch.py``.
+"""
+
+import asyncio
+import random
+import time
+
+from sdv_model import vehicle
+from sdv_model.dispatch import CoalescingDispatcher
+from sdv_model.schema import Schema
+from sdv_model.snapshot import VersionedStore
+
+BRANCH = "Vehicle.Powertrain.TractionBattery"
+
+
+def numeric_indexes(schema: Schema):
+    return [
+        index
+        for index in schema.under(BRANCH)
+        if schema.specs[index].datatype in ("float", "double", "uint8", "uint16", "uint32")
+    ]
+
+
+def report(name, calls, updates, seconds):
+    print(
+        f"{name:<12} {calls:9d} callbacks {calls / seconds:12.0f} callbacks/s"
+        f" {updates / seconds:12.0f} updates/s"
+    )
+
+
+async def per_update(schema, indexes, callbacks, ticks, batches_per_tick):
+    store = VersionedStore(schema)
+    calls = 0
+    total = 0.0
+
+    def on_value(value):
+        nonlocal calls, total
+        calls += 1
+        total += value
+
+    watchers = {index: [on_value] * callbacks for index in indexes}
+
+    def on_commit(snapshot, changed):
+        for index in changed:
+            value = snapshot.value_at(index)
+            for callback in watchers.get(index, ()):
+                callback(value)
+
+    store.add_listener(on_commit)
+    started = time.perf_counter()
+    for _ in range(ticks):
+        for _ in range(batches_per_tick):
+            store.update({index: random.uniform(0, 100) for index in indexes})
+        await asyncio.sleep(0)
+    return calls, time.perf_counter() - started
+
+
+async def coalescing(schema, indexes, callbacks, ticks, batches_per_tick):
+    store = VersionedStore(schema)
+    dispatcher = CoalescingDispatcher(schema)
+    calls = 0
+    total = 0.0
+
+    def on_changes(changes):
+        nonlocal calls, total
+        calls += 1
+        total += sum(changes.values())
+
+    for _ in range(callbacks):
+        dispatcher.register(indexes, on_changes)
+    dispatcher.attach(store)
+    started = time.perf_counter()
+    for _ in range(ticks):
+        for _ in range(batches_per_tick):
+            store.update({index: random.uniform(0, 100) for index in indexes})
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    dispatcher.close()
+    return calls, time.perf_counter() - started
+
+
+def main(callbacks: int = 20, ticks: int = 2000, batches_per_tick: int = 5):
+    schema = Schema.from_model(vehicle)
+    indexes = numeric_indexes(schema)
+    updates = len(indexes) * ticks * batches_per_tick
+    print(f"{len(indexes)} datapoints per batch, {batches_per_tick} batches per tick")
+    print(f"{callbacks} consumers watching {BRANCH}")
+    for name, run in (("per update", per_update), ("coalescing", coalescing)):
+        calls, seconds = asyncio.run(run(schema, indexes, callbacks, ticks, batches_per_tick))
+        report(name, calls, updates, seconds)
+
+
+if __name__ == "__main__":
+    main()
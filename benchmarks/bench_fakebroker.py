@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+"""Measure the subscription, get and actuator write paths against a fake broker.
+
+An in-process :class:`FakeBroker` serves the whole Vehicle tree with an
+injected round-trip latency, so the numbers are repeatable on any
+machine:
+
+* subscription: a random walk drives every numeric TractionBattery
+  datapoint and one :class:`SubscriptionSet` stream delivers it to
+  per-datapoint callbacks.
+* get: all attributes fetched one call per datapoint versus one call.
+* set: a burst of HVAC temperature ramps written one request per value
+  versus through an :class:`ActuatorWriteBuffer`.
+
+Run with ``python benchmarks/bench_fakebroker.py``.
+"""
+
+import asyncio
+import time
+
+from sdv_model import vehicle
+from sdv_model.actuators import ActuatorWriteBuffer
+from sdv_model.fakebroker import FakeBroker, RandomWalk, to_broker
+from sdv_model.schema import Schema
+from sdv_model.subscription import SubscriptionSet
+
+BRANCH = "Vehicle.Powertrain.TractionBattery.*"
+HVAC = "Vehicle.Cabin.HVAC.Station.*.*.Temperature"
+
+
+def report(name, operations, unit, seconds, calls=None):
+    line = f"{name:<28} {operations:8d} {unit:<8} {operations / seconds:12.0f} {unit}/s"
+    if calls is not None:
+        line += f" {calls:8d} broker calls"
+    print(line)
+
+
+async def subscription(schema, batches, latency):
+    broker = FakeBroker(schema, latency=latency)
+    walk = RandomWalk(schema, [BRANCH], seed=1)
+    subscriptions = SubscriptionSet(schema)
+    received = 0
+    delays = []
+
+    def on_value(result):
+        nonlocal received
+        received += 1
+
+    for spec in walk.specs:
+        subscriptions.add(spec.index, on_value)
+    stream = await subscriptions.subscribe(broker)
+    await asyncio.sleep(latency + 0.01)
+    started = time.perf_counter()
+    for _, batch in walk.take(batches):
+        committed = time.monotonic()
+        broker.store.update(batch)
+        before = received
+        while received - before < len(batch):
+            await asyncio.sleep(0)
+        delays.append(time.monotonic() - committed)
+    seconds = time.perf_counter() - started
+    await subscriptions.unsubscribe()
+    broker.close()
+    delays.sort()
+    return received, seconds, delays[len(delays) // 2], stream is not None
+
+
+async def get(schema, latency):
+    broker = FakeBroker(schema, latency=latency)
+    paths = [spec.path for spec in schema if spec.kind == "attribute"]
+    started = time.perf_counter()
+    for path in paths:
+        await broker.GetDatapoints([path])
+    single = time.perf_counter() - started, broker.calls
+    broker.calls = 0
+    started = time.perf_counter()
+    await broker.GetDatapoints(paths)
+    bulk = time.perf_counter() - started, broker.calls
+    broker.close()
+    return len(paths), single, bulk
+
+
+async def set_values(schema, steps, latency):
+    broker = FakeBroker(schema, latency=latency)
+    indexes = schema.match(HVAC)
+    started = time.perf_counter()
+    for step in range(steps):
+        for index in indexes:
+            spec = schema.specs[index]
+            await broker.SetDatapoints({spec.path: to_broker(spec.datatype, 18 + step)})
+    single = time.perf_counter() - started, broker.calls
+    broker.calls = 0
+    started = time.perf_counter()
+    async with ActuatorWriteBuffer(schema, window=latency, client=broker) as writes:
+        for step in range(steps):
+            writes.set_matching(HVAC, 18 + step)
+            await asyncio.sleep(latency / steps)
+    buffered = time.perf_counter() - started, broker.calls
+    broker.close()
+    return steps * len(indexes), single, buffered
+
+
+def main(batches: int = 2000, steps: int = 20, latency: float = 0.001):
+    schema = Schema.from_model(vehicle)
+    print(f"Fake broker with {len(schema)} datapoints, {latency * 1000:.1f} ms latency")
+    received, seconds, median, _ = asyncio.run(subscription(schema, batches, latency))
+    report("subscription", received, "updates", seconds)
+    print(f"{'':<28} median commit-to-callback latency {median * 1000:.2f} ms")
+    count, single, bulk = asyncio.run(get(schema, latency))
+    report("get one by one", count, "values", single[0], single[1])
+    report("get in one call", count, "values", bulk[0], bulk[1])
+    count, single, buffered = asyncio.run(set_values(schema, steps, latency))
+    report("set one by one", count, "writes", single[0], single[1])
+    report("set through write buffer", count, "writes", buffered[0], buffered[1])
+
+
+if __name__ == "__main__":
+    main()
@@ -94,7 +94,7 @@ class BeamCollection(Model):
     def element(self, index: int):
         if index < 1 or index > 2:
             raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {{
+        _options = {
             1: self.Low,
             2: self.High,
         }
@@ -110,7 +110,7 @@ class FogCollection(Model):
     def element(self, index: int):
         if index < 1 or index > 2:
             raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {{
+        _options = {
             1: self.Rear,
             2: self.Front,
         }
@@ -126,7 +126,7 @@ class DirectionIndicatorCollection(Model):
     def element(self, index: int):
         if index < 1 or index > 2:
             raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {{
+        _options = {
             1: self.Left,
             2: self.Right,
         }
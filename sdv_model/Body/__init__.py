@@ -96,7 +96,7 @@ class TrunkCollection(Model):
     def element(self, index: int):
         if index < 1 or index > 2:
             raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {{
+        _options = {
             1: self.Front,
             2: self.Rear,
         }
@@ -112,7 +112,7 @@ class WindshieldCollection(Model):
     def element(self, index: int):
         if index < 1 or index > 2:
             raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {{
+        _options = {
             1: self.Front,
             2: self.Rear,
         }
@@ -128,7 +128,7 @@ class MirrorsCollection(Model):
     def element(self, index: int):
         if index < 1 or index > 2:
             raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {{
+        _options = {
             1: self.Left,
             2: self.Right,
         }
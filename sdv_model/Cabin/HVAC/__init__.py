@@ -70,7 +70,7 @@ class StationCollection(Model):
     def Row(self, index: int):
         if index < 1 or index > 4:
             raise IndexError(f"Index {index} is out of range [1, 4]")
-        _options = {{
+        _options = {
             1: self.Row1,
             2: self.Row2,
             3: self.Row3,
@@ -88,7 +88,7 @@ class StationCollection(Model):
         def element(self, index: int):
             if index < 1 or index > 2:
                 raise IndexError(f"Index {index} is out of range [1, 2]")
-            _options = {{
+            _options = {
                 1: self.Left,
                 2: self.Right,
             }
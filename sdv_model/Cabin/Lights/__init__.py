@@ -67,7 +67,7 @@ class SpotlightCollection(Model):
     def Row(self, index: int):
         if index < 1 or index > 4:
             raise IndexError(f"Index {index} is out of range [1, 4]")
-        _options = {{
+        _options = {
             1: self.Row1,
             2: self.Row2,
             3: self.Row3,
@@ -108,7 +108,7 @@ class DoorCollection(Model):
     def Row(self, index: int):
         if index < 1 or index > 2:
             raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {{
+        _options = {
             1: self.Row1,
             2: self.Row2,
         }
@@ -124,7 +124,7 @@ class DoorCollection(Model):
         def element(self, index: int):
             if index < 1 or index > 2:
                 raise IndexError(f"Index {index} is out of range [1, 2]")
-            _options = {{
+            _options = {
                 1: self.Left,
                 2: self.Right,
             }
@@ -140,7 +140,7 @@ class SeatCollection(Model):
     def Row(self, index: int):
         if index < 1 or index > 2:
             raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {{
+        _options = {
             1: self.Row1,
             2: self.Row2,
         }
@@ -157,7 +157,7 @@ class SeatCollection(Model):
         def Pos(self, index: int):
             if index < 1 or index > 3:
                 raise IndexError(f"Index {index} is out of range [1, 3]")
-            _options = {{
+            _options = {
                 1: self.Pos1,
                 2: self.Pos2,
                 3: self.Pos3,
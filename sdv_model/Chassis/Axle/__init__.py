@@ -78,7 +78,7 @@ class WheelCollection(Model):
     def element(self, index: int):
         if index < 1 or index > 2:
             raise IndexError(f"Index {index} is out of range [1, 2]")
-        _options = {{
+        _options = {
             1: self.Left,
             2: self.Right,
         }
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+
+"""Coalescing write buffer for actuator datapoints.
+
+Comfort features tend to set actuators in bursts, e.g. ramping every
+``Cabin.HVAC.Station.*.*.Temperature`` or stepping ``Seat.*.*.Position``
+towards a target. Setting each value on its own costs a broker round-trip
+per write. An :class:`ActuatorWriteBuffer` collects the writes of a short
+window, keeps only the last value written to every datapoint and applies
+them with one ``SetDatapoints`` request through a :class:`BatchSetBuilder`.
+"""
+
+import asyncio
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from sdv.model import BatchSetBuilder
+
+from sdv_model.schema import Schema, Target
+
+
+class WriteStats(NamedTuple):
+    """Counters of a write buffer.
+
+    Attributes
+    ----------
+    writes: int
+        Values written to the buffer.
+    coalesced: int
+        Values replaced by a later write before they were flushed.
+    flushes: int
+        Batched set requests sent.
+    failed: int
+        Batched set requests that could not be built or raised.
+    pending: int
+        Datapoints waiting for the next flush.
+    """
+
+    writes: int
+    coalesced: int
+    flushes: int
+    failed: int
+    pending: int
+
+
+class ActuatorWriteBuffer:
+    """Buffers actuator writes and flushes them as batched set requests.
+
+    Writes return a future that completes once the batch holding the
+    written value, or a later value of the same datapoint, is applied, and
+    fails with the error of that request. A value the batch cannot take,
+    such as one out of range for the datatype, fails the futures of the
+    whole batch. Awaiting them is optional.
+
+    Parameters
+    ----------
+    schema: Schema
+        Schema of the model; its nodes provide datatypes and the client.
+    window: float
+        Seconds between the first buffered write and the flush.
+    max_pending: Optional[int]
+        Flush right away once this many datapoints are pending.
+    client: Optional[VehicleDataBrokerClient]
+        Client to set with; the model's client if omitted.
+    """
+
+    def __init__(
+        self,
+        schema: Schema,
+        window: float = 0.05,
+        max_pending: Optional[int] = None,
+        client=None,
+    ):
+        if window < 0:
+            raise ValueError("Window must not be negative")
+        if max_pending is not None and max_pending < 1:
+            raise ValueError("max_pending must be positive")
+        self.schema = schema
+        self.window = window
+        self.max_pending = max_pending
+        self.client = client
+        self._pending: Dict[int, Any] = {}
+        self._waiters: List["asyncio.Future[None]"] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: List["asyncio.Task[None]"] = []
+        self._writes = self._coalesced = self._flushed = self._failed = 0
+
+    @property
+    def stats(self) -> WriteStats:
+        return WriteStats(
+            self._writes, self._coalesced, self._flushed, self._failed, len(self._pending)
+        )
+
+    def _actuator(self, target: Target) -> int:
+        index = self.schema.index_of(target)
+        spec = self.schema.specs[index]
+        if spec.kind != "actuator":
+            kind = spec.kind or "datapoint"
+            raise TypeError(f"Datapoint {spec.path} is a {kind}, not an actuator")
+        if self.schema.nodes[index] is None:
+            raise ValueError(f"Schema has no model node for {spec.path}")
+        return index
+
+    def set(self, target: Target, value: Any) -> "asyncio.Future[None]":
+        """Buffer a write of ``value`` to the actuator ``target``.
+
+        Raises a TypeError if ``target`` is not an actuator. Must be
+        called from the event loop that runs the flushes.
+        """
+        return self._buffer({self._actuator(target): value})
+
+    def set_matching(self, pattern: Target, value: Any) -> "asyncio.Future[None]":
+        """Buffer a write of ``value`` to every actuator matching ``pattern``."""
+        indexes = self.schema.match(pattern)
+        if not indexes:
+            raise KeyError(f"No datapoint matches {pattern}")
+        return self._buffer({self._actuator(index): value for index in indexes})
+
+    def _buffer(self, writes: Dict[int, Any]) -> "asyncio.Future[None]":
+        loop = asyncio.get_running_loop()
+        pending = self._pending
+        for index, value in writes.items():
+            if index in pending:
+                self._coalesced += 1
+            pending[index] = value
+        self._writes += len(writes)
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        if self.max_pending is not None and len(pending) >= self.max_pending:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._start_flush)
+        return waiter
+
+    def _start_flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        task = asyncio.ensure_future(self._apply(*self._take()))
+        self._flushes.append(task)
+        task.add_done_callback(self._flushes.remove)
+
+    def _take(self):
+        pending, self._pending = self._pending, {}
+        waiters, self._waiters = self._waiters, []
+        return pending, waiters
+
+    async def _apply(self, writes: Dict[int, Any], waiters: List["asyncio.Future[None]"]):
+        nodes = self.schema.nodes
+        self._flushed += 1
+        try:
+            client = self.client
+            if client is None:
+                client = nodes[next(iter(writes))].get_client()
+            batch = BatchSetBuilder(client)
+            for index, value in writes.items():
+                batch.add(nodes[index], value)
+            await batch.apply()
+        except Exception as err:  # pylint: disable=W0703
+            self._failed += 1
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(err)
+            return
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def flush(self):
+        """Apply all buffered writes now and wait for every running flush."""
+        self._start_flush()
+        flushes = tuple(self._flushes)
+        if flushes:
+            await asyncio.gather(*flushes)
+
+    async def close(self):
+        """Flush what is buffered; call before the client goes away."""
+        await self.flush()
+
+    async def __aenter__(self) -> "ActuatorWriteBuffer":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+
+"""Streaming windowed aggregations over datapoint values.
+
+Windows update in O(1) amortized time per sample: minimum and maximum use
+monotonic deques, the mean a running sum and percentiles a log-bucketed
+quantile sketch, so the raw history is never scanned again.
+"""
+
+import math
+from collections import deque
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from sdv_model.schema import Target
+from sdv_model.snapshot import Snapshot, VersionedStore
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with bounded relative error.
+
+    Values are counted in logarithmically sized buckets, so every quantile
+    estimate is within ``relative_accuracy`` of a true sample value. Unlike
+    most streaming sketches, counts can also be removed again, which sliding
+    windows need when samples expire. NaN and infinite values have no
+    bucket; they are not inserted but counted in ``nonfinite``.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Relative accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self._zero = 0
+        self.count = 0
+        self.nonfinite = 0
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(abs(value)) / self._log_gamma)
+
+    def _adjust(self, value: float, delta: int):
+        if not math.isfinite(value):
+            self.nonfinite += delta
+            return
+        self.count += delta
+        if value == 0:
+            self._zero += delta
+            return
+        buckets = self._positive if value > 0 else self._negative
+        key = self._key(value)
+        remaining = buckets.get(key, 0) + delta
+        if remaining:
+            buckets[key] = remaining
+        else:
+            del buckets[key]
+
+    def add(self, value: float):
+        self._adjust(value, 1)
+
+    def remove(self, value: float):
+        """Remove one previously added ``value``."""
+        self._adjust(value, -1)
+
+    def merge(self, other: "QuantileSketch"):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches of different accuracy")
+        for mine, theirs in ((self._positive, other._positive), (self._negative, other._negative)):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+        self._zero += other._zero
+        self.count += other.count
+        self.nonfinite += other.nonfinite
+
+    def clear(self):
+        self._positive.clear()
+        self._negative.clear()
+        self._zero = self.count = self.nonfinite = 0
+
+    def _value(self, key: int) -> float:
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate the ``q``-quantile, or None if the sketch is empty."""
+        if not self.count:
+            return None
+        rank = q * (self.count - 1)
+        seen = 0
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return -self._value(key)
+        seen += self._zero
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._value(key)
+
+
+class WindowStats(NamedTuple):
+    """Aggregates of one window."""
+
+    start: float
+    end: float
+    count: int
+    minimum: Optional[float]
+    maximum: Optional[float]
+    mean: Optional[float]
+    quantiles: Dict[float, Optional[float]]
+
+
+class TumblingWindow:
+    """Aggregates over consecutive, non-overlapping windows of ``length`` seconds.
+
+    ``on_window`` is called with the statistics of every completed window.
+    NaN and infinite samples advance the window but are otherwise only
+    counted in ``nonfinite``.
+    """
+
+    def __init__(
+        self,
+        length: float,
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+        on_window: Optional[Callable[[WindowStats], None]] = None,
+        relative_accuracy: float = 0.01,
+    ):
+        self.length = length
+        self.quantiles = tuple(quantiles)
+        self.on_window = on_window
+        self.last: Optional[WindowStats] = None
+        self.nonfinite = 0
+        self._sketch = QuantileSketch(relative_accuracy)
+        self._start: Optional[float] = None
+        self._reset()
+
+    def _reset(self):
+        self._count = 0
+        self._sum = 0.0
+        self._min = math.inf
+        self._max = -math.inf
+        self._sketch.clear()
+
+    def add(self, timestamp: float, value: float) -> Optional[WindowStats]:
+        """Add a sample; return the window it completed, if any."""
+        completed = None
+        if self._start is None:
+            self._start = math.floor(timestamp / self.length) * self.length
+        elif timestamp >= self._start + self.length:
+            completed = self.current()
+            self._start = math.floor(timestamp / self.length) * self.length
+            self._reset()
+            self.last = completed
+            if self.on_window is not None:
+                self.on_window(completed)
+        if not math.isfinite(value):
+            self.nonfinite += 1
+            return completed
+        self._count += 1
+        self._sum += value
+        self._min = min(self._min, value)
+        self._max = max(self._max, value)
+        self._sketch.add(value)
+        return completed
+
+    def current(self) -> Optional[WindowStats]:
+        """Statistics of the window currently being filled."""
+        if self._start is None:
+            return None
+        count = self._count
+        return WindowStats(
+            self._start,
+            self._start + self.length,
+            count,
+            self._min if count else None,
+            self._max if count else None,
+            self._sum / count if count else None,
+            {q: self._sketch.quantile(q) for q in self.quantiles},
+        )
+
+
+class SlidingWindow:
+    """Aggregates over the samples of the last ``length`` seconds.
+
+    NaN and infinite samples are not aggregated but counted in ``nonfinite``.
+    """
+
+    def __init__(
+        self,
+        length: float,
+        quantiles: Sequence[float] = DEFAULT_QUANTILES,
+        relative_accuracy: float = 0.01,
+    ):
+        self.length = length
+        self.quantiles = tuple(quantiles)
+        self._samples: Deque[Tuple[float, float]] = deque()
+        self._mins: Deque[Tuple[float, float]] = deque()
+        self._maxs: Deque[Tuple[float, float]] = deque()
+        self._sketch = QuantileSketch(relative_accuracy)
+        self._sum = 0.0
+        self._now: Optional[float] = None
+        self.nonfinite = 0
+
+    def _expire(self, now: float):
+        horizon = now - self.length
+        samples = self._samples
+        while samples and samples[0][0] <= horizon:
+            _, value = samples.popleft()
+            self._sum -= value
+            self._sketch.remove(value)
+        while self._mins and self._mins[0][0] <= horizon:
+            self._mins.popleft()
+        while self._maxs and self._maxs[0][0] <= horizon:
+            self._maxs.popleft()
+
+    def add(self, timestamp: float, value: float):
+        self._now = timestamp
+        self._expire(timestamp)
+        if not math.isfinite(value):
+            self.nonfinite += 1
+            return
+        self._samples.append((timestamp, value))
+        self._sum += value
+        self._sketch.add(value)
+        while self._mins and self._mins[-1][1] >= value:
+            self._mins.pop()
+        self._mins.append((timestamp, value))
+        while self._maxs and self._maxs[-1][1] <= value:
+            self._maxs.pop()
+        self._maxs.append((timestamp, value))
+
+    def current(self, now: Optional[float] = None) -> Optional[WindowStats]:
+        """Statistics of the window ending at ``now`` or the latest sample."""
+        if now is not None:
+            self._now = now
+            self._expire(now)
+        if self._now is None:
+            return None
+        count = len(self._samples)
+        return WindowStats(
+            self._now - self.length,
+            self._now,
+            count,
+            self._mins[0][1] if count else None,
+            self._maxs[0][1] if count else None,
+            self._sum / count if count else None,
+            {q: self._sketch.quantile(q) for q in self.quantiles},
+        )
+
+
+class WindowAggregators:
+    """Feeds the numeric values committed to a store into attached windows."""
+
+    def __init__(self, store: VersionedStore):
+        self.store = store
+        self._windows: Dict[int, List] = {}
+        store.add_listener(self._on_commit)
+
+    def close(self):
+        self.store.remove_listener(self._on_commit)
+
+    def attach(self, target: Target, window):
+        """Attach a :class:`TumblingWindow` or :class:`SlidingWindow` to a datapoint."""
+        spec = self.store.schema[target]
+        if spec.datatype == "string" or spec.datatype.endswith("[]"):
+            raise TypeError(f"Cannot aggregate non-numeric datapoint {spec.path}")
+        self._windows.setdefault(spec.index, []).append(window)
+        return window
+
+    def detach(self, target: Target, window):
+        index = self.store.schema.index_of(target)
+        self._windows[index].remove(window)
+        if not self._windows[index]:
+            del self._windows[index]
+
+    def windows(self, target: Target) -> List:
+        return list(self._windows.get(self.store.schema.index_of(target), ()))
+
+    def _on_commit(self, snapshot: Snapshot, changed: Tuple[int, ...]):
+        windows = self._windows
+        for index in changed:
+            attached = windows.get(index)
+            if attached:
+                value = snapshot.value_at(index)
+                if value is not None:
+                    for window in attached:
+                        window.add(snapshot.timestamp, float(value))
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+
+"""Read-once cache of static attribute datapoints.
+
+Attributes such as ``VehicleIdentification.VIN``, ``CurbWeight`` or
+``TractionBattery.GrossCapacity`` never change while the vehicle runs,
+yet reading them like sensors costs a broker round-trip each time. An
+:class:`AttributeCache` fetches every ``attribute`` datapoint of the
+schema with one ``GetDatapoints`` call and serves them from memory. The
+values can be persisted to a JSON file, which is only trusted while its
+schema fingerprint matches, so a restart needs no broker call at all.
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+from sdv_model.schema import Schema, Target
+from sdv_model.snapshot import VersionedStore
+
+FORMAT_VERSION = 1
+
+
+def _broker_value(datapoint) -> Any:
+    """Value of a broker ``Datapoint`` message, None if it carries none."""
+    field = datapoint.WhichOneof("value")
+    if field is None or field == "failure_value":
+        return None
+    value = getattr(datapoint, field)
+    if field.endswith("_array"):
+        return list(value.values)
+    return value
+
+
+class AttributeCache:
+    """Serves the attribute datapoints of a schema from memory.
+
+    Attributes the broker has no value for, or reports a failure for, stay
+    unloaded, so the next :meth:`load` asks again and :meth:`save` does
+    not persist them. Reading an attribute that is not loaded raises a
+    LookupError.
+
+    Parameters
+    ----------
+    schema: Schema
+        Schema of the model; its nodes provide the client.
+    client: Optional[VehicleDataBrokerClient]
+        Client to fetch with; the model's client if omitted, which needs a
+        schema built from a model.
+    path: Optional[str]
+        JSON file to persist the values to across restarts.
+    """
+
+    def __init__(self, schema: Schema, client=None, path: Optional[str] = None):
+        self.schema = schema
+        self.client = client
+        self.path = path
+        self.indexes: List[int] = [spec.index for spec in schema if spec.kind == "attribute"]
+        self._values: Dict[int, Any] = {}
+        self.fetches = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, target: Target) -> bool:
+        return self.schema.index_of(target) in self._values
+
+    def _attribute(self, target: Target) -> int:
+        index = self.schema.index_of(target)
+        spec = self.schema.specs[index]
+        if spec.kind != "attribute":
+            kind = spec.kind or "datapoint"
+            raise TypeError(f"Datapoint {spec.path} is a {kind}, not an attribute")
+        return index
+
+    def __getitem__(self, target: Target) -> Any:
+        index = self._attribute(target)
+        try:
+            return self._values[index]
+        except KeyError:
+            path = self.schema.specs[index].path
+            raise LookupError(f"Attribute {path} is not loaded") from None
+
+    def get(self, target: Target, default: Any = None) -> Any:
+        value = self._values.get(self._attribute(target))
+        return default if value is None else value
+
+    def values(self) -> Dict[str, Any]:
+        """Loaded values by path."""
+        specs = self.schema.specs
+        return {specs[index].path: value for index, value in sorted(self._values.items())}
+
+    @property
+    def missing(self) -> List[int]:
+        """Attributes that are not loaded."""
+        return [index for index in self.indexes if index not in self._values]
+
+    async def load(self, refresh: bool = False) -> int:
+        """Load all attributes, from the persisted file if possible.
+
+        Only attributes missing from memory and the file are fetched, in a
+        single call. With ``refresh``, everything is fetched again. Returns
+        the number of attributes the broker had a value for.
+        """
+        if refresh:
+            self._values.clear()
+        elif not self._values and self.path is not None:
+            self._read()
+        fetched = await self.fetch(self.missing)
+        if fetched and self.path is not None:
+            self.save()
+        return fetched
+
+    async def fetch(self, targets: Iterable[Target]) -> int:
+        """Fetch ``targets`` with one ``GetDatapoints`` call; return how many got a value."""
+        indexes = [self._attribute(target) for target in targets]
+        if not indexes:
+            return 0
+        specs = self.schema.specs
+        client = self.client
+        if client is None:
+            node = self.schema.nodes[indexes[0]]
+            if node is None:
+                raise ValueError("Schema has no model to get a client from; pass a client")
+            client = node.get_client()
+        response = await client.GetDatapoints([specs[index].path for index in indexes])
+        self.fetches += 1
+        loaded = 0
+        for index in indexes:
+            datapoint = response.datapoints.get(specs[index].path)
+            value = None if datapoint is None else _broker_value(datapoint)
+            if value is None:
+                self._values.pop(index, None)
+            else:
+                self._values[index] = value
+                loaded += 1
+        return loaded
+
+    def invalidate(self, targets: Optional[Iterable[Target]] = None):
+        """Forget ``targets``, or everything, so the next :meth:`load` fetches them.
+
+        The persisted file is updated as well.
+        """
+        if targets is None:
+            self._values.clear()
+        else:
+            for target in targets:
+                self._values.pop(self._attribute(target), None)
+        if self.path is not None:
+            self.save()
+
+    def _read(self) -> bool:
+        try:
+            with open(self.path, encoding="utf-8") as fp:
+                document = json.load(fp)
+        except (OSError, ValueError):
+            return False
+        if (
+            not isinstance(document, dict)
+            or document.get("version") != FORMAT_VERSION
+            or document.get("fingerprint") != self.schema.fingerprint
+        ):
+            return False
+        for path, value in document.get("values", {}).items():
+            if value is not None and path in self.schema and self.schema[path].kind == "attribute":
+                self._values[self.schema.index_of(path)] = value
+        return True
+
+    def save(self):
+        """Write the loaded values to ``path``, replacing the file atomically."""
+        if self.path is None:
+            raise ValueError("Cache has no path to save to")
+        document = {
+            "version": FORMAT_VERSION,
+            "fingerprint": self.schema.fingerprint,
+            "values": self.values(),
+        }
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as fp:
+            json.dump(document, fp, separators=(",", ":"))
+        os.replace(temporary, self.path)
+
+    def publish(self, store: VersionedStore, timestamp: Optional[float] = None):
+        """Commit the loaded values that are set to ``store`` as one update."""
+        values = {index: value for index, value in self._values.items() if value is not None}
+        if values:
+            store.update(values, timestamp)
@@ -0,0 +1,3 @@
+#!/usr/bin/env python3
+
+"""Encoders and decoders for datapoint values."""
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+
+"""Export of recorded datapoint values to Apache Arrow and Parquet.
+
+Traces become wide tables with a ``timestamp`` column and one column per
+datapoint, typed after its declared datatype. Enum-like string datapoints
+are dictionary encoded. Rows are built and written in bounded chunks, so a
+recording never has to be materialized as a whole.
+"""
+
+from array import array
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from sdv_model.history import SignalHistory
+from sdv_model.schema import DataPointSpec, Schema, Target
+from sdv_model.snapshot import Snapshot, VersionedStore
+
+ARROW_TYPES = {
+    "boolean": pa.bool_(),
+    "int8": pa.int8(),
+    "int16": pa.int16(),
+    "int32": pa.int32(),
+    "int64": pa.int64(),
+    "uint8": pa.uint8(),
+    "uint16": pa.uint16(),
+    "uint32": pa.uint32(),
+    "uint64": pa.uint64(),
+    "float": pa.float32(),
+    "double": pa.float64(),
+    "string": pa.string(),
+}
+
+ENUM_TYPE = pa.dictionary(pa.int32(), pa.string())
+
+
+def arrow_type(spec: DataPointSpec) -> pa.DataType:
+    """Arrow type of a datapoint column."""
+    if spec.datatype == "string" and spec.allowed:
+        return ENUM_TYPE
+    if spec.datatype.endswith("[]"):
+        return pa.list_(ARROW_TYPES[spec.datatype[:-2]])
+    return ARROW_TYPES[spec.datatype]
+
+
+def arrow_schema(specs: Iterable[DataPointSpec]) -> pa.Schema:
+    """Arrow schema of a trace table over ``specs``."""
+    fields = [pa.field("timestamp", pa.float64(), nullable=False)]
+    fields.extend(pa.field(spec.path, arrow_type(spec)) for spec in specs)
+    return pa.schema(fields)
+
+
+def _column(spec: DataPointSpec, rows: int, positions: np.ndarray, values) -> pa.Array:
+    """Build a sparse column of ``rows`` with ``values`` at ``positions``."""
+    kind = arrow_type(spec)
+    if pa.types.is_dictionary(kind) or not (
+        pa.types.is_integer(kind) or pa.types.is_floating(kind) or pa.types.is_boolean(kind)
+    ):
+        dense: List[Any] = [None] * rows
+        for position, value in zip(positions.tolist(), values):
+            dense[position] = value
+        column = pa.array(dense, type=kind.value_type if pa.types.is_dictionary(kind) else kind)
+        return column.dictionary_encode() if pa.types.is_dictionary(kind) else column
+    dtype = kind.to_pandas_dtype()
+    data = np.zeros(rows, dtype=dtype)
+    data[positions] = np.asarray(values, dtype=dtype)
+    missing = np.ones(rows, dtype=bool)
+    missing[positions] = False
+    return pa.array(data, type=kind, mask=missing)
+
+
+def history_batches(
+    histories: Mapping[str, SignalHistory], chunk_seconds: float = 60.0
+) -> Iterator[pa.RecordBatch]:
+    """Yield one record batch per ``chunk_seconds`` of recorded histories.
+
+    Rows are the union of the sample times within the chunk; a datapoint
+    without a sample at a row's time is null there.
+    """
+    specs = [history.spec for history in histories.values()]
+    schema = arrow_schema(specs)
+    items = list(histories.values())
+    starts = [h.timestamps[0] for h in items if len(h)]
+    if not starts:
+        return
+    end = max(h.timestamps[-1] for h in items if len(h))
+    chunk_start = min(starts)
+    while chunk_start <= end:
+        chunk_end = chunk_start + chunk_seconds
+        slices: List[Tuple[np.ndarray, Any]] = []
+        for history in items:
+            times = np.frombuffer(history.timestamps, dtype=np.float64)
+            first, last = np.searchsorted(times, [chunk_start, chunk_end], side="left")
+            if history.numeric:
+                values = np.frombuffer(history.values, dtype=history.typecode)[first:last].copy()
+            else:
+                values = history.values[first:last]
+            slices.append((times[first:last].copy(), values))
+            del times
+        rows = np.unique(np.concatenate([times for times, _ in slices]))
+        if len(rows):
+            columns = [pa.array(rows, type=pa.float64())]
+            for spec, (times, values) in zip(specs, slices):
+                columns.append(_column(spec, len(rows), np.searchsorted(rows, times), values))
+            yield pa.RecordBatch.from_arrays(columns, schema=schema)
+        chunk_start = chunk_end
+
+
+def export_histories(
+    path: str, histories: Mapping[str, SignalHistory], chunk_seconds: float = 60.0, **options
+):
+    """Write recorded histories to a Parquet file chunk by chunk."""
+    specs = [history.spec for history in histories.values()]
+    with pq.ParquetWriter(path, arrow_schema(specs), **options) as writer:
+        for batch in history_batches(histories, chunk_seconds):
+            writer.write_batch(batch)
+
+
+class ParquetTraceWriter:
+    """Streams committed updates into a Parquet file.
+
+    Updates are buffered as sparse rows and written as one record batch
+    every ``batch_rows`` rows, which bounds memory use for any recording
+    length.
+
+    Parameters
+    ----------
+    path: str
+        File to write.
+    schema: Schema
+        Schema of the recorded datapoints.
+    targets: Optional[Iterable[Target]]
+        Datapoints to record as columns; all datapoints if omitted.
+    batch_rows: int
+        Rows per record batch and Parquet row group.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        schema: Schema,
+        targets: Optional[Iterable[Target]] = None,
+        batch_rows: int = 65536,
+        **options,
+    ):
+        indexes = range(len(schema)) if targets is None else map(schema.index_of, targets)
+        self._specs = [schema.specs[index] for index in indexes]
+        self._columns = {spec.index: column for column, spec in enumerate(self._specs)}
+        self.schema = arrow_schema(self._specs)
+        self.batch_rows = batch_rows
+        self._writer = pq.ParquetWriter(path, self.schema, **options)
+        self._store: Optional[VersionedStore] = None
+        self._reset()
+
+    def _reset(self):
+        self._timestamps = array("d")
+        self._positions: List[array] = [array("l") for _ in self._specs]
+        self._values: List[List[Any]] = [[] for _ in self._specs]
+
+    def write(self, timestamp: float, updates: Mapping[int, Any]):
+        """Add one row with the values of ``updates``, keyed by schema index."""
+        row = len(self._timestamps)
+        self._timestamps.append(timestamp)
+        for index, value in updates.items():
+            column = self._columns.get(index)
+            if column is not None and value is not None:
+                self._positions[column].append(row)
+                self._values[column].append(value)
+        if len(self._timestamps) >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        """Write the buffered rows as one record batch."""
+        rows = len(self._timestamps)
+        if not rows:
+            return
+        columns = [pa.array(np.frombuffer(self._timestamps, dtype=np.float64).copy())]
+        for spec, positions, values in zip(self._specs, self._positions, self._values):
+            columns.append(_column(spec, rows, np.array(positions, dtype=np.int64), values))
+        self._writer.write_batch(pa.RecordBatch.from_arrays(columns, schema=self.schema))
+        self._reset()
+
+    def attach(self, store: VersionedStore):
+        """Record every commit of ``store`` as a row."""
+        self._store = store
+        store.add_listener(self._on_commit)
+
+    def _on_commit(self, snapshot: Snapshot, changed: Tuple[int, ...]):
+        self.write(snapshot.timestamp, dict(zip(changed, snapshot.gather(changed))))
+
+    def close(self):
+        if self._store is not None:
+            self._store.remove_listener(self._on_commit)
+            self._store = None
+        self.flush()
+        self._writer.close()
+
+    def __enter__(self) -> "ParquetTraceWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
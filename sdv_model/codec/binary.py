@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+
+"""Compact, schema-indexed binary encoding of full-vehicle snapshots.
+
+Datapoints are identified by their schema index instead of their path.
+A snapshot is laid out as::
+
+    header | presence bits | boolean bits | fixed-width block | variable block
+
+The presence bits tell which datapoints hold a value. Booleans are packed
+one bit each. All scalar numbers are packed at their declared width into a
+single precompiled :class:`struct.Struct`, absent ones as zero, so every
+number sits at a fixed offset. Strings and arrays follow, length-prefixed
+with varints, for the datapoints that are present only.
+
+A :class:`SnapshotView` reads single datapoints straight from the encoded
+bytes at these offsets, without decoding the rest.
+
+The header carries the fingerprint of the encoding schema. A codec decodes
+snapshots of other schema versions it was given as sources by translating
+their indexes with a precomputed :class:`~sdv_model.schema.SchemaRemap`.
+"""
+
+import math
+import struct
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from sdv_model.codec.varint import read_varint, write_varint
+from sdv_model.schema import Schema, SchemaRemap, Target
+from sdv_model.snapshot import Snapshot, VersionedStore
+
+MAGIC = b"SDVS"
+FORMAT_VERSION = 2
+# Magic, format version, datapoint count, schema fingerprint, timestamp.
+HEADER = struct.Struct("<4sBxHQd")
+
+# struct format characters by scalar VSS datatype.
+FORMATS = {
+    "int8": "b",
+    "int16": "h",
+    "int32": "i",
+    "int64": "q",
+    "uint8": "B",
+    "uint16": "H",
+    "uint32": "I",
+    "uint64": "Q",
+    "float": "f",
+    "double": "d",
+}
+
+
+_BITS = [tuple(byte >> k & 1 for k in range(8)) for byte in range(256)]
+
+
+def _bits_to_bytes(bits: int, count: int) -> bytes:
+    return bits.to_bytes((count + 7) // 8, "little")
+
+
+def _unpack_bits(raw) -> List[int]:
+    """Expand little-endian packed bits into a list of 0/1 ints."""
+    return [bit for byte in raw for bit in _BITS[byte]]
+
+
+def write_variable(out: bytearray, datatype: str, value: Any):
+    """Append a string or array value with varint length prefixes."""
+    if datatype == "string":
+        raw = value.encode()
+        write_varint(out, len(raw))
+        out += raw
+        return
+    element = datatype[:-2]
+    write_varint(out, len(value))
+    if element == "string":
+        for item in value:
+            raw = item.encode()
+            write_varint(out, len(raw))
+            out += raw
+    elif element == "boolean":
+        out += bytes(bool(item) for item in value)
+    else:
+        out += struct.pack(f"<{len(value)}{FORMATS[element]}", *value)
+
+
+def read_variable(data, offset: int, datatype: str) -> Tuple[Any, int]:
+    """Read a value written by :func:`write_variable`; return it and the next offset."""
+    if datatype == "string":
+        length, offset = read_varint(data, offset)
+        return bytes(data[offset : offset + length]).decode(), offset + length
+    element = datatype[:-2]
+    count, offset = read_varint(data, offset)
+    if element == "string":
+        items = []
+        for _ in range(count):
+            length, offset = read_varint(data, offset)
+            items.append(bytes(data[offset : offset + length]).decode())
+            offset += length
+        return items, offset
+    if element == "boolean":
+        return [bool(b) for b in data[offset : offset + count]], offset + count
+    fmt = struct.Struct(f"<{count}{FORMATS[element]}")
+    return list(fmt.unpack_from(data, offset)), offset + fmt.size
+
+
+def skip_variable(data, offset: int, datatype: str) -> int:
+    """Return the offset after a value written by :func:`write_variable`."""
+    count, offset = read_varint(data, offset)
+    if datatype == "string":
+        return offset + count
+    element = datatype[:-2]
+    if element == "string":
+        for _ in range(count):
+            length, offset = read_varint(data, offset)
+            offset += length
+        return offset
+    if element == "boolean":
+        return offset + count
+    return offset + count * struct.calcsize(FORMATS[element])
+
+
+class SnapshotCodec:
+    """Encodes and decodes all datapoint values of a schema.
+
+    The layout is derived from the schema once, so encoding and decoding
+    are a handful of ``struct`` calls plus a loop over the present strings
+    and arrays.
+
+    Parameters
+    ----------
+    schema: Schema
+        Schema to encode with and decode to.
+    sources: Iterable[Schema]
+        Other schema versions whose snapshots can be decoded as well.
+    """
+
+    def __init__(self, schema: Schema, sources: Iterable[Schema] = ()):
+        self.schema = schema
+        self.booleans: List[int] = []
+        self.fixed: List[int] = []
+        self.variable: List[int] = []
+        formats = []
+        for spec in schema:
+            if spec.datatype == "boolean":
+                self.booleans.append(spec.index)
+            elif spec.datatype in FORMATS:
+                self.fixed.append(spec.index)
+                formats.append(FORMATS[spec.datatype])
+            else:
+                self.variable.append(spec.index)
+        self._fixed = struct.Struct("<" + "".join(formats))
+        self._presence_size = (len(schema) + 7) // 8
+        self._boolean_size = (len(self.booleans) + 7) // 8
+        self.fixed_offset = HEADER.size + self._presence_size + self._boolean_size
+        self.variable_offset = self.fixed_offset + self._fixed.size
+
+        # Where each datapoint sits: (struct, offset, 0) for a number,
+        # (None, byte offset, bit mask) for a boolean, None for the others.
+        self.layout: List[Optional[Tuple[Optional[struct.Struct], int, int]]] = [None] * len(
+            schema
+        )
+        boolean_offset = HEADER.size + self._presence_size
+        for bit, index in enumerate(self.booleans):
+            self.layout[index] = (None, boolean_offset + (bit >> 3), 1 << (bit & 7))
+        offset = self.fixed_offset
+        for index, fmt in zip(self.fixed, formats):
+            field = struct.Struct("<" + fmt)
+            self.layout[index] = (field, offset, 0)
+            offset += field.size
+
+        self._sources: Dict[int, Tuple["SnapshotCodec", SchemaRemap, SchemaRemap]] = {}
+        for source in sources:
+            self.add_source(source)
+
+    def add_source(self, schema: Schema):
+        """Decode snapshots encoded with ``schema`` as well, translated to this schema."""
+        if schema.fingerprint != self.schema.fingerprint:
+            self._sources[schema.fingerprint] = (
+                SnapshotCodec(schema),
+                schema.remap(self.schema),
+                self.schema.remap(schema),
+            )
+
+    def encode(
+        self, values: Union[Snapshot, Sequence[Any]], timestamp: Optional[float] = None
+    ) -> bytes:
+        """Encode a snapshot, or a value sequence in schema order."""
+        if isinstance(values, Snapshot):
+            if timestamp is None:
+                timestamp = values.timestamp
+            values = values.values()
+        presence = int("".join("0" if v is None else "1" for v in reversed(values)) or "0", 2)
+        booleans = int(
+            "".join("1" if values[i] else "0" for i in reversed(self.booleans)) or "0", 2
+        )
+
+        out = bytearray(
+            HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                len(self.schema),
+                self.schema.fingerprint,
+                math.nan if timestamp is None else timestamp,
+            )
+        )
+        out += _bits_to_bytes(presence, len(self.schema))
+        out += _bits_to_bytes(booleans, len(self.booleans))
+        fixed = [values[i] for i in self.fixed]
+        try:
+            out += self._fixed.pack(*[0 if v is None else v for v in fixed])
+        except struct.error as err:
+            raise ValueError(f"Value does not fit its declared datatype: {err}") from err
+        for index in self.variable:
+            value = values[index]
+            if value is not None:
+                write_variable(out, self.schema.specs[index].datatype, value)
+        return bytes(out)
+
+    def _check_header(self, data) -> Tuple[int, float]:
+        """Return the fingerprint and timestamp of a snapshot."""
+        magic, version, _, fingerprint, timestamp = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("Not an encoded vehicle snapshot")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot format version {version}")
+        if fingerprint != self.schema.fingerprint and fingerprint not in self._sources:
+            raise ValueError(f"Snapshot was encoded with unknown schema {fingerprint:016x}")
+        return fingerprint, timestamp
+
+    def decode(self, data: Union[bytes, memoryview]) -> Tuple[Optional[float], List[Any]]:
+        """Decode to the timestamp and the values in schema order."""
+        fingerprint, timestamp = self._check_header(data)
+        if fingerprint != self.schema.fingerprint:
+            codec, remap, _ = self._sources[fingerprint]
+            timestamp, values = codec.decode(data)
+            return timestamp, remap.values(values)
+        offset = HEADER.size
+        presence = _unpack_bits(data[offset : offset + self._presence_size])
+        offset += self._presence_size
+        booleans = _unpack_bits(data[offset : offset + self._boolean_size])
+
+        values: List[Any] = [None] * len(self.schema)
+        for bit, index in zip(booleans, self.booleans):
+            if presence[index]:
+                values[index] = bit == 1
+        for index, value in zip(self.fixed, self._fixed.unpack_from(data, self.fixed_offset)):
+            if presence[index]:
+                values[index] = value
+        offset = self.variable_offset
+        specs = self.schema.specs
+        for index in self.variable:
+            if presence[index]:
+                values[index], offset = read_variable(data, offset, specs[index].datatype)
+        return (None if math.isnan(timestamp) else timestamp), values
+
+    def decode_into(self, data: Union[bytes, memoryview], store: VersionedStore) -> Snapshot:
+        """Decode a snapshot and commit its present values to ``store``."""
+        timestamp, values = self.decode(data)
+        return store.update(
+            {index: value for index, value in enumerate(values) if value is not None},
+            timestamp,
+        )
+
+    def view(self, data: Union[bytes, memoryview]) -> "SnapshotView":
+        """Wrap an encoded snapshot for lazy reads of single datapoints."""
+        fingerprint, timestamp = self._check_header(data)
+        if fingerprint == self.schema.fingerprint:
+            return SnapshotView(self, data, timestamp)
+        codec, _, inverse = self._sources[fingerprint]
+        return SnapshotView(codec, data, timestamp, self.schema, inverse.table)
+
+
+class SnapshotView:
+    """Read-only view of an encoded snapshot that decodes on access.
+
+    The view keeps a reference to the encoded buffer instead of a copy.
+    A number is read with one ``struct.unpack_from`` at its fixed offset
+    and a boolean from its bit, so reading a few datapoints costs the same
+    for any schema size. The offsets of strings and arrays are found by
+    one scan over the variable block on the first read of one of them.
+    Create views with :meth:`SnapshotCodec.view`.
+    """
+
+    __slots__ = ("data", "timestamp", "_codec", "_schema", "_translate", "_variable")
+
+    def __init__(
+        self,
+        codec: SnapshotCodec,
+        data: Union[bytes, memoryview],
+        timestamp: float,
+        schema: Optional[Schema] = None,
+        translate: Optional[Tuple[int, ...]] = None,
+    ):
+        self.data = data
+        self.timestamp: Optional[float] = None if math.isnan(timestamp) else timestamp
+        self._codec = codec
+        self._schema = codec.schema if schema is None else schema
+        self._translate = translate
+        self._variable: Optional[Dict[int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self._schema)
+
+    def __getitem__(self, target: Target) -> Any:
+        return self.value_at(self._schema.index_of(target))
+
+    def get(self, target: Target, default: Any = None) -> Any:
+        value = self[target]
+        return default if value is None else value
+
+    def gather(self, targets: Iterable[Target]) -> List[Any]:
+        index_of = self._schema.index_of
+        return [self.value_at(index_of(target)) for target in targets]
+
+    def value_at(self, index: int) -> Any:
+        """Value of the datapoint at schema ``index``, None if unset."""
+        if self._translate is not None:
+            index = self._translate[index]
+            if index == -1:
+                return None
+        data = self.data
+        if not data[HEADER.size + (index >> 3)] >> (index & 7) & 1:
+            return None
+        location = self._codec.layout[index]
+        if location is None:
+            if self._variable is None:
+                self._variable = self._scan_variable()
+            return read_variable(
+                data, self._variable[index], self._codec.schema.specs[index].datatype
+            )[0]
+        field, offset, mask = location
+        if field is None:
+            return bool(data[offset] & mask)
+        return field.unpack_from(data, offset)[0]
+
+    def _scan_variable(self) -> Dict[int, int]:
+        """Offsets of the present strings and arrays."""
+        data, codec = self.data, self._codec
+        specs = codec.schema.specs
+        offsets: Dict[int, int] = {}
+        offset = codec.variable_offset
+        for index in codec.variable:
+            if data[HEADER.size + (index >> 3)] >> (index & 7) & 1:
+                offsets[index] = offset
+                offset = skip_variable(data, offset, specs[index].datatype)
+        return offsets
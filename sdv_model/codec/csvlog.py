@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+"""Vectorized import of CSV signal logs into per-signal histories.
+
+Logs have a timestamp column and one column per datapoint, named by its
+VSS path. Columns are mapped to datapoints once; rows are then parsed in
+large chunks by NumPy's C parser and appended to the histories as typed
+arrays, without creating a Python object per numeric cell. Chunks always
+end on a record boundary, so quoted cells may contain commas and
+newlines. Only string and array columns go through the :mod:`csv`
+module.
+"""
+
+import csv
+import io
+import json
+import re
+from itertools import islice
+from typing import IO, Any, Dict, Iterator, List, Optional, Union
+
+import numpy as np
+
+from sdv_model.history import SignalHistory
+from sdv_model.schema import DataPointSpec, Schema
+
+# Empty field: at line start or after a comma, and before a comma or line end.
+_EMPTY_FIELD = re.compile(r"(?:(?<=,)|(?<=\n)|^)(?=,|\r?\n)")
+_TRUE = ("1", "true", "True", "TRUE")
+
+
+def _chunks(source: IO[str], lines: int) -> Iterator[str]:
+    """Yield chunks of about ``lines`` lines that end on a record boundary.
+
+    Quotes inside quoted cells are doubled, so a line ends inside a quoted
+    cell exactly when an odd number of quotes precedes its line break.
+    """
+    while True:
+        block = list(islice(source, lines))
+        if not block:
+            return
+        quotes = sum(line.count('"') for line in block)
+        while quotes % 2:
+            line = source.readline()
+            if not line:
+                break
+            block.append(line)
+            quotes += line.count('"')
+        chunk = "".join(block)
+        yield chunk if chunk.endswith("\n") else chunk + "\n"
+
+
+def _parse_array(spec: DataPointSpec, cell: str) -> List[Any]:
+    """Parse an array cell written as a JSON list, e.g. ``"[1,2,3]"``."""
+    try:
+        value = json.loads(cell)
+    except ValueError:
+        value = None
+    if not isinstance(value, list):
+        raise ValueError(f"Column {spec.path} holds no JSON array: {cell!r}")
+    return value
+
+
+def import_csv(
+    source: Union[str, IO[str]],
+    schema: Schema,
+    histories: Optional[Dict[str, SignalHistory]] = None,
+    timestamp_column: str = "timestamp",
+    chunk_rows: int = 65536,
+    strict: bool = False,
+) -> Dict[str, SignalHistory]:
+    """Append the samples of a CSV log to per-signal histories.
+
+    Empty cells are missing samples. Cells of array datapoints hold JSON
+    lists and raise a ValueError otherwise. Columns that name no datapoint
+    are skipped, or raise a KeyError if ``strict``.
+
+    Parameters
+    ----------
+    source: Union[str, IO[str]]
+        Path or open text file of the log.
+    schema: Schema
+        Schema to map column names to.
+    histories: Optional[Dict[str, SignalHistory]]
+        Histories keyed by path to append to; missing ones are created.
+    timestamp_column: str
+        Name of the column holding the sample time in seconds.
+    chunk_rows: int
+        Lines parsed per chunk.
+
+    Returns
+    -------
+    Dict[str, SignalHistory]
+        ``histories`` with the imported samples.
+    """
+    if isinstance(source, str):
+        with open(source, encoding="utf-8", newline="") as fp:
+            return import_csv(fp, schema, histories, timestamp_column, chunk_rows, strict)
+
+    histories = {} if histories is None else histories
+    header = next(csv.reader([source.readline()]), [])
+    if timestamp_column not in header:
+        raise ValueError(f"CSV log has no {timestamp_column} column")
+    numeric: List[int] = [header.index(timestamp_column)]
+    numeric_specs: List[DataPointSpec] = []
+    text: List[int] = []
+    text_specs: List[DataPointSpec] = []
+    for column, name in enumerate(header):
+        if name == timestamp_column:
+            continue
+        if name not in schema:
+            if strict:
+                raise KeyError(f"Column {name} names no datapoint")
+            continue
+        spec = schema[name]
+        histories.setdefault(name, SignalHistory(spec))
+        if histories[name].numeric and spec.datatype != "boolean":
+            numeric.append(column)
+            numeric_specs.append(spec)
+        else:
+            text.append(column)
+            text_specs.append(spec)
+
+    for chunk in _chunks(source, chunk_rows):
+        filled = _EMPTY_FIELD.sub("nan", chunk)
+        numbers = np.loadtxt(
+            io.StringIO(filled), delimiter=",", quotechar='"', usecols=numeric, ndmin=2
+        )
+        del filled
+        timestamps = numbers[:, 0]
+        for column, spec in enumerate(numeric_specs, 1):
+            values = numbers[:, column]
+            present = ~np.isnan(values)
+            history = histories[spec.path]
+            history.extend(timestamps[present], values[present].astype(history.typecode))
+        if not text:
+            continue
+        cells: List[List[str]] = [[] for _ in text]
+        for record in csv.reader(io.StringIO(chunk)):
+            if not record:
+                continue
+            if len(record) != len(header):
+                raise ValueError(f"CSV log record has {len(record)} cells, expected {len(header)}")
+            for column, values in zip(text, cells):
+                values.append(record[column])
+        for spec, column_cells in zip(text_specs, cells):
+            values = np.array(column_cells, dtype=object)
+            present = values != ""
+            history = histories[spec.path]
+            if spec.datatype == "boolean":
+                history.extend(
+                    timestamps[present], np.isin(values[present], _TRUE).astype(np.uint8)
+                )
+            elif spec.datatype.endswith("[]"):
+                history.extend(
+                    timestamps[present].tolist(),
+                    [_parse_array(spec, cell) for cell in values[present]],
+                )
+            else:
+                history.extend(timestamps[present].tolist(), values[present].tolist())
+    return histories
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+
+"""Delta-encoded stream of datapoint updates.
+
+Each frame carries the updates since the previous frame as records sorted
+by schema index::
+
+    varint((index gap << 1) | is_null) [value]
+
+Values are compressed against the previous value of the same datapoint,
+which encoder and decoder both keep: integers as zigzag varints of the
+difference, floats as varints of the XOR of their IEEE bit patterns, which
+is small when consecutive values are close. Booleans take one byte and
+strings and arrays are written in full. Frames carry a sequence number so
+a decoder notices lost frames instead of applying deltas to a wrong base,
+and the fingerprint of the encoding schema, since the indexes and bases
+are only meaningful for the same schema on both ends.
+"""
+
+import math
+import struct
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from sdv_model.codec.binary import read_variable, write_variable
+from sdv_model.codec.varint import read_varint, unzigzag, write_varint, zigzag
+from sdv_model.schema import Schema, Target
+from sdv_model.snapshot import Snapshot, VersionedStore
+
+MAGIC = b"SDVD"
+FORMAT_VERSION = 2
+# Magic, format version, flags, schema fingerprint, timestamp.
+HEADER = struct.Struct("<4sBBQd")
+FLAG_RESET = 0x01
+
+_INTEGERS = ("int8", "int16", "int32", "int64", "uint8", "uint16", "uint32", "uint64")
+_FLOAT_BITS = {
+    "float": (struct.Struct("<f"), struct.Struct("<I")),
+    "double": (struct.Struct("<d"), struct.Struct("<Q")),
+}
+
+
+class _DeltaState:
+    """Previous value of every datapoint, shared logic of both directions."""
+
+    def __init__(self, schema: Schema):
+        self.schema = schema
+        self._datatypes = [spec.datatype for spec in schema]
+        self.sequence = 0
+        self._previous: List[Any] = []
+        self.reset()
+
+    def reset(self):
+        """Forget all previous values; the next frame is self-contained."""
+        self._previous = [None] * len(self.schema)
+        self._reset = True
+
+    def _base(self, index: int) -> int:
+        """Previous value as an integer, or bit pattern for floats."""
+        previous = self._previous[index]
+        datatype = self._datatypes[index]
+        if previous is None:
+            return 0
+        if datatype in _FLOAT_BITS:
+            value, bits = _FLOAT_BITS[datatype]
+            return bits.unpack(value.pack(previous))[0]
+        return int(previous)
+
+
+class DeltaEncoder(_DeltaState):
+    """Encodes update frames against the values sent in earlier frames."""
+
+    def encode(self, updates: Mapping[Target, Any], timestamp: Optional[float] = None) -> bytes:
+        """Encode ``updates`` as one frame.
+
+        The previous values only advance once the whole frame is encoded, so
+        a value that cannot be encoded leaves the encoder in step with its
+        decoder.
+        """
+        index_of = self.schema.index_of
+        records = sorted(
+            ((index_of(target), value) for target, value in updates.items()),
+            key=lambda record: record[0],
+        )
+        for (index, _), (following, _) in zip(records, records[1:]):
+            if index == following:
+                path = self.schema.specs[index].path
+                raise ValueError(f"Datapoint {path} is updated more than once in a frame")
+        out = bytearray(
+            HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                FLAG_RESET if self._reset else 0,
+                self.schema.fingerprint,
+                math.nan if timestamp is None else timestamp,
+            )
+        )
+        write_varint(out, self.sequence)
+        write_varint(out, len(records))
+        last = -1
+        for index, value in records:
+            gap = index - last - 1
+            last = index
+            if value is None:
+                write_varint(out, gap << 1 | 1)
+                continue
+            write_varint(out, gap << 1)
+            datatype = self._datatypes[index]
+            if datatype == "boolean":
+                out.append(1 if value else 0)
+            elif datatype in _INTEGERS:
+                write_varint(out, zigzag(value - self._base(index)))
+            elif datatype in _FLOAT_BITS:
+                packer, bits = _FLOAT_BITS[datatype]
+                write_varint(out, bits.unpack(packer.pack(value))[0] ^ self._base(index))
+            else:
+                write_variable(out, datatype, value)
+        for index, value in records:
+            self._previous[index] = value
+        self.sequence += 1
+        self._reset = False
+        return bytes(out)
+
+    def encode_changes(self, snapshot: Snapshot, indexes: Sequence[int]) -> bytes:
+        """Encode the current values of ``indexes``, e.g. from a dirty tracker."""
+        return self.encode(dict(zip(indexes, snapshot.gather(indexes))), snapshot.timestamp)
+
+
+class DeltaDecoder(_DeltaState):
+    """Decodes frames produced by a :class:`DeltaEncoder`, in order."""
+
+    def decode(self, data: Union[bytes, memoryview]) -> Tuple[Optional[float], Dict[int, Any]]:
+        """Decode a frame to its timestamp and updates keyed by schema index."""
+        magic, version, flags, fingerprint, timestamp = HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a delta update frame")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported delta frame version {version}")
+        if fingerprint != self.schema.fingerprint:
+            raise ValueError(f"Delta frame was encoded with unknown schema {fingerprint:016x}")
+        sequence, offset = read_varint(data, HEADER.size)
+        if flags & FLAG_RESET:
+            self.reset()
+        elif sequence != self.sequence:
+            raise ValueError(f"Expected delta frame {self.sequence}, got {sequence}")
+        count, offset = read_varint(data, offset)
+
+        updates: Dict[int, Any] = {}
+        index = -1
+        for _ in range(count):
+            tag, offset = read_varint(data, offset)
+            index += (tag >> 1) + 1
+            if tag & 1:
+                updates[index] = self._previous[index] = None
+                continue
+            datatype = self._datatypes[index]
+            if datatype == "boolean":
+                value = data[offset] == 1
+                offset += 1
+            elif datatype in _INTEGERS:
+                delta, offset = read_varint(data, offset)
+                value = self._base(index) + unzigzag(delta)
+            elif datatype in _FLOAT_BITS:
+                packer, bits = _FLOAT_BITS[datatype]
+                pattern, offset = read_varint(data, offset)
+                value = packer.unpack(bits.pack(pattern ^ self._base(index)))[0]
+            else:
+                value, offset = read_variable(data, offset, datatype)
+            updates[index] = self._previous[index] = value
+        self.sequence = sequence + 1
+        self._reset = False
+        return (None if math.isnan(timestamp) else timestamp), updates
+
+    def apply(self, data: Union[bytes, memoryview], store: VersionedStore) -> Snapshot:
+        """Decode a frame and commit all its updates to ``store`` at once."""
+        timestamp, updates = self.decode(data)
+        return store.update(updates, timestamp)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+"""Streaming JSON Lines import and export of datapoint updates.
+
+Every line holds one update::
+
+    {"ts": 1700000000.25, "path": "Vehicle.Speed", "value": 42.0}
+
+Readers and writers work line by line, so files of any size are processed
+at constant memory. NaN and infinite values, which JSON cannot represent,
+are written as null.
+"""
+
+import json
+import math
+from typing import IO, Any, Dict, Iterable, Iterator, Mapping, Optional, Tuple
+
+from sdv_model.schema import Schema
+from sdv_model.snapshot import Snapshot, VersionedStore
+
+Update = Tuple[float, str, Any]
+
+
+def _encoder() -> json.JSONEncoder:
+    return json.JSONEncoder(separators=(",", ":"), allow_nan=False)
+
+
+def _json_value(value: Any) -> Any:
+    """``value`` with NaN and infinities, also inside arrays, replaced by None."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, list):
+        return [_json_value(item) for item in value]
+    return value
+
+
+def write_updates(fp: IO[str], updates: Iterable[Update]) -> int:
+    """Write ``(timestamp, path, value)`` updates; return how many."""
+    dumps = _encoder().encode
+    count = 0
+    for timestamp, path, value in updates:
+        fp.write(dumps({"ts": timestamp, "path": path, "value": _json_value(value)}))
+        fp.write("\n")
+        count += 1
+    return count
+
+
+def read_updates(fp: IO[str]) -> Iterator[Update]:
+    """Yield ``(timestamp, path, value)`` for every non-empty line."""
+    loads = json.JSONDecoder().decode
+    for number, line in enumerate(fp, 1):
+        if not line.strip():
+            continue
+        try:
+            record = loads(line)
+            if not isinstance(record, dict):
+                raise ValueError(f"expected an object, got {type(record).__name__}")
+            yield record["ts"], record["path"], record["value"]
+        except (ValueError, KeyError) as err:
+            raise ValueError(f"Invalid update on line {number}: {err}") from err
+
+
+def read_batches(
+    fp: IO[str], schema: Schema, strict: bool = True, max_batch: int = 4096
+) -> Iterator[Tuple[float, Dict[int, Any]]]:
+    """Yield updates grouped by timestamp, keyed by schema index.
+
+    Consecutive lines with the same timestamp form one batch of at most
+    ``max_batch`` updates. Each distinct path is resolved once. Unknown
+    paths raise a KeyError, or are skipped if ``strict`` is false.
+    """
+    ids: Dict[str, Optional[int]] = {}
+    batch: Dict[int, Any] = {}
+    current: Optional[float] = None
+    for timestamp, path, value in read_updates(fp):
+        index = ids.get(path, -1)
+        if index == -1:
+            if strict or path in schema:
+                index = schema.index_of(path)
+            else:
+                index = None
+            ids[path] = index
+        if index is None:
+            continue
+        if batch and (timestamp != current or len(batch) >= max_batch):
+            yield current, batch
+            batch = {}
+        current = timestamp
+        batch[index] = value
+    if batch:
+        yield current, batch
+
+
+def load_updates(fp: IO[str], store: VersionedStore, strict: bool = True) -> int:
+    """Apply a JSON Lines trace to ``store``, one commit per timestamp.
+
+    Returns the number of updates applied.
+    """
+    count = 0
+    for timestamp, batch in read_batches(fp, store.schema, strict):
+        store.update(batch, timestamp)
+        count += len(batch)
+    return count
+
+
+class JsonlTraceWriter:
+    """Writes the commits of a store, or explicit updates, as JSON Lines."""
+
+    def __init__(self, fp: IO[str], schema: Schema):
+        self.fp = fp
+        self._paths = schema.paths
+        self._dumps = _encoder().encode
+        self._store: Optional[VersionedStore] = None
+        self.count = 0
+
+    def write(self, timestamp: float, updates: Mapping[int, Any]):
+        """Write ``updates`` keyed by schema index."""
+        dumps, paths = self._dumps, self._paths
+        self.fp.write(
+            "".join(
+                dumps({"ts": timestamp, "path": paths[index], "value": _json_value(value)}) + "\n"
+                for index, value in updates.items()
+            )
+        )
+        self.count += len(updates)
+
+    def attach(self, store: VersionedStore):
+        """Write every commit of ``store``."""
+        self._store = store
+        store.add_listener(self._on_commit)
+
+    def _on_commit(self, snapshot: Snapshot, changed: Tuple[int, ...]):
+        self.write(snapshot.timestamp, dict(zip(changed, snapshot.gather(changed))))
+
+    def close(self):
+        if self._store is not None:
+            self._store.remove_listener(self._on_commit)
+            self._store = None
+        self.fp.flush()
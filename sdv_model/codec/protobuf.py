@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+
+"""Protobuf batch messages mirroring the Vehicle model.
+
+``sdv_model/proto/vehicle.proto`` is generated from the model tree by this
+module; regenerate it and its Python bindings after the model changes::
+
+    python -m sdv_model.codec.protobuf > sdv_model/proto/vehicle.proto
+    python -m grpc_tools.protoc -I sdv_model/proto --python_out=sdv_model/proto \\
+        sdv_model/proto/vehicle.proto
+
+``VehicleSnapshot`` has one field per datapoint, numbered by schema index.
+``VehicleUpdateBatch`` carries a sparse list of updates keyed by schema
+index. Both carry the fingerprint of the schema, since the indexes only
+identify datapoints within it; messages of another schema are rejected.
+"""
+
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from sdv_model.schema import Schema, Target
+from sdv_model.snapshot import Snapshot, VersionedStore
+
+PACKAGE = "sdv.model.vehicle.v1"
+
+# First field number used for datapoints in VehicleSnapshot.
+FIRST_FIELD = 2
+# Field number of the schema fingerprint in VehicleSnapshot, the highest
+# protobuf allows, so datapoint numbering stays stable.
+FINGERPRINT_FIELD = (1 << 29) - 1
+
+PROTO_TYPES = {
+    "boolean": "bool",
+    "int8": "sint32",
+    "int16": "sint32",
+    "int32": "sint32",
+    "int64": "sint64",
+    "uint8": "uint32",
+    "uint16": "uint32",
+    "uint32": "uint32",
+    "uint64": "uint64",
+    "float": "float",
+    "double": "double",
+    "string": "string",
+}
+
+# Field of the DatapointUpdate value oneof by VSS datatype.
+UPDATE_FIELDS = {
+    "boolean": "bool_value",
+    "int8": "int_value",
+    "int16": "int_value",
+    "int32": "int_value",
+    "int64": "int_value",
+    "uint8": "uint_value",
+    "uint16": "uint_value",
+    "uint32": "uint_value",
+    "uint64": "uint_value",
+    "float": "float_value",
+    "double": "double_value",
+    "string": "string_value",
+}
+
+_UPDATE_PROTO = """
+message BoolArray {
+  repeated bool values = 1;
+}
+
+message IntArray {
+  repeated sint64 values = 1;
+}
+
+message UintArray {
+  repeated uint64 values = 1;
+}
+
+message FloatArray {
+  repeated float values = 1;
+}
+
+message DoubleArray {
+  repeated double values = 1;
+}
+
+message StringArray {
+  repeated string values = 1;
+}
+
+message DatapointUpdate {
+  // Schema index of the datapoint, see the field numbers of VehicleSnapshot.
+  uint32 id = 1;
+  oneof value {
+    bool bool_value = 2;
+    sint64 int_value = 3;
+    uint64 uint_value = 4;
+    float float_value = 5;
+    double double_value = 6;
+    string string_value = 7;
+    BoolArray bool_array = 8;
+    IntArray int_array = 9;
+    UintArray uint_array = 10;
+    FloatArray float_array = 11;
+    DoubleArray double_array = 12;
+    StringArray string_array = 13;
+  }
+}
+
+message VehicleUpdateBatch {
+  double timestamp = 1;
+  repeated DatapointUpdate updates = 2;
+  fixed64 schema_fingerprint = 3;
+}
+"""
+
+
+def field_name(path: str) -> str:
+    """Protobuf field name of a datapoint path, without the root branch."""
+    return path.split(".", 1)[1].replace(".", "_")
+
+
+def _update_field(datatype: str) -> str:
+    if datatype.endswith("[]"):
+        return UPDATE_FIELDS[datatype[:-2]].replace("_value", "_array")
+    return UPDATE_FIELDS[datatype]
+
+
+def generate_proto(schema: Schema) -> str:
+    """Return the ``.proto`` source mirroring ``schema``."""
+    lines = [
+        "// Generated from the vehicle model by sdv_model.codec.protobuf. DO NOT EDIT.",
+        "",
+        'syntax = "proto3";',
+        "",
+        f"package {PACKAGE};",
+        "",
+        "message VehicleSnapshot {",
+        "  double timestamp = 1;",
+        f"  fixed64 schema_fingerprint = {FINGERPRINT_FIELD};",
+    ]
+    for spec in schema:
+        number = spec.index + FIRST_FIELD
+        if spec.datatype.endswith("[]"):
+            kind = "repeated " + PROTO_TYPES[spec.datatype[:-2]]
+        else:
+            kind = "optional " + PROTO_TYPES[spec.datatype]
+        lines.append(f"  {kind} {field_name(spec.path)} = {number};  // {spec.path}")
+    lines.append("}")
+    return "\n".join(lines) + "\n" + _UPDATE_PROTO
+
+
+class ProtobufCodec:
+    """Fills and reads the generated messages for a schema.
+
+    Parameters
+    ----------
+    schema: Schema
+        Schema the messages were generated from.
+    module: Optional[Any]
+        Generated ``vehicle_pb2`` module; the bundled one if omitted.
+    """
+
+    def __init__(self, schema: Schema, module: Optional[Any] = None):
+        if module is None:
+            from sdv_model.proto import vehicle_pb2 as module  # pylint: disable=C0415
+        self.schema = schema
+        self.module = module
+        self._names = [field_name(spec.path) for spec in schema]
+        self._arrays = [spec.datatype.endswith("[]") for spec in schema]
+        self._update_fields = [_update_field(spec.datatype) for spec in schema]
+        fields = module.VehicleSnapshot.DESCRIPTOR.fields_by_name
+        if "schema_fingerprint" not in fields:
+            raise ValueError("Generated messages carry no schema fingerprint; regenerate them")
+        for spec, name in zip(schema, self._names):
+            field = fields.get(name)
+            if field is None or field.number != spec.index + FIRST_FIELD:
+                raise ValueError(f"Generated messages do not match datapoint {spec.path}")
+
+    def _check_fingerprint(self, message):
+        fingerprint = message.schema_fingerprint
+        if fingerprint != self.schema.fingerprint:
+            raise ValueError(f"Message was encoded with unknown schema {fingerprint:016x}")
+
+    def to_snapshot(self, values: Snapshot):
+        """Build a ``VehicleSnapshot`` holding every set value."""
+        message = self.module.VehicleSnapshot(
+            timestamp=values.timestamp or 0.0, schema_fingerprint=self.schema.fingerprint
+        )
+        for name, is_array, value in zip(self._names, self._arrays, values.values()):
+            if value is None:
+                continue
+            if is_array:
+                getattr(message, name).extend(value)
+            else:
+                setattr(message, name, value)
+        return message
+
+    def from_snapshot(self, message) -> Tuple[float, Dict[int, Any]]:
+        """Return the timestamp and the set values of a ``VehicleSnapshot``."""
+        self._check_fingerprint(message)
+        values: Dict[int, Any] = {}
+        for index, (name, is_array) in enumerate(zip(self._names, self._arrays)):
+            if is_array:
+                items = getattr(message, name)
+                if items:
+                    values[index] = list(items)
+            elif message.HasField(name):
+                values[index] = getattr(message, name)
+        return message.timestamp, values
+
+    def to_updates(self, updates: Mapping[Target, Any], timestamp: float = 0.0):
+        """Build a sparse ``VehicleUpdateBatch``; unset values are skipped."""
+        index_of = self.schema.index_of
+        batch = self.module.VehicleUpdateBatch(
+            timestamp=timestamp, schema_fingerprint=self.schema.fingerprint
+        )
+        for target, value in updates.items():
+            if value is None:
+                continue
+            index = index_of(target)
+            update = batch.updates.add(id=index)
+            field = self._update_fields[index]
+            if self._arrays[index]:
+                getattr(update, field).values.extend(value)
+            else:
+                setattr(update, field, value)
+        return batch
+
+    def from_updates(self, batch) -> Tuple[float, Dict[int, Any]]:
+        """Return the timestamp and the updates of a ``VehicleUpdateBatch``.
+
+        Raises a ValueError for unknown ids or values of the wrong type.
+        """
+        self._check_fingerprint(batch)
+        values: Dict[int, Any] = {}
+        count = len(self.schema)
+        for update in batch.updates:
+            index = update.id
+            if index >= count:
+                raise ValueError(f"Unknown datapoint id {index}")
+            field = update.WhichOneof("value")
+            if field != self._update_fields[index]:
+                raise ValueError(
+                    f"Datapoint {self.schema.specs[index].path} cannot hold a {field}"
+                )
+            value = getattr(update, field)
+            values[index] = list(value.values) if self._arrays[index] else value
+        return batch.timestamp, values
+
+    def apply_snapshot(self, message, store: VersionedStore) -> Snapshot:
+        timestamp, values = self.from_snapshot(message)
+        return store.update(values, timestamp)
+
+    def apply_updates(self, batch, store: VersionedStore) -> Snapshot:
+        timestamp, values = self.from_updates(batch)
+        return store.update(values, timestamp)
+
+
+def main():
+    from sdv_model import vehicle  # pylint: disable=C0415
+
+    print(generate_proto(Schema.from_model(vehicle)), end="")
+
+
+if __name__ == "__main__":
+    main()
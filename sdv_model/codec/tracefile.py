@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+
+"""Chunked, compressed columnar trace files with a time index.
+
+A trace file holds long recordings so that any time window can be read
+without scanning the file::
+
+    header | chunk | chunk | ... | footer | footer offset | magic
+
+Each chunk covers a span of trace time and holds one compressed block per
+datapoint with samples in that span: the float64 timestamps followed by
+the values, packed at their declared width, or length-prefixed as in the
+binary snapshot codec for strings and arrays. The footer lists every
+chunk's time range and the location of its blocks, so a reader maps the
+file and decompresses only the chunks and columns it is asked for.
+
+The header carries the fingerprint of the recording schema, so files
+recorded with another version of the model are read through a
+:class:`~sdv_model.schema.SchemaRemap` of their indexes.
+"""
+
+import lzma
+import mmap
+import struct
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
+
+from sdv_model.codec.binary import read_variable, write_variable
+from sdv_model.codec.varint import read_varint, write_varint
+from sdv_model.history import SignalHistory
+from sdv_model.schema import Schema, SchemaRemap, Target
+from sdv_model.snapshot import Snapshot, VersionedStore
+
+MAGIC = b"SDVT"
+FORMAT_VERSION = 2
+# Magic, format version, compression id, datapoint count, schema fingerprint.
+HEADER = struct.Struct("<4sBBxxIQ")
+TRAILER = struct.Struct("<Q4s")
+CHUNK_RANGE = struct.Struct("<dd")
+
+# Compression ids stored in the header, with their compress and decompress functions.
+COMPRESSIONS = {
+    "none": (0, bytes, bytes),
+    "zlib": (1, zlib.compress, zlib.decompress),
+    "lzma": (2, lzma.compress, lzma.decompress),
+}
+
+
+class BlockInfo(NamedTuple):
+    """Location of a datapoint's samples within the file."""
+
+    count: int
+    offset: int
+    length: int
+
+
+class ChunkInfo(NamedTuple):
+    """Time range and blocks of a chunk, keyed by schema index."""
+
+    start: float
+    end: float
+    blocks: Dict[int, BlockInfo]
+
+
+class TraceFileWriter:
+    """Writes committed updates to a trace file, one chunk per time span.
+
+    Samples are buffered per datapoint and written as a chunk once the
+    trace time passes ``chunk_seconds`` since the chunk's first sample, or
+    the chunk holds ``chunk_samples`` samples.
+
+    Parameters
+    ----------
+    path: str
+        File to write.
+    schema: Schema
+        Schema of the recorded datapoints.
+    targets: Optional[Iterable[Target]]
+        Datapoints to record; all datapoints if omitted.
+    chunk_seconds: float
+        Trace time covered by a chunk.
+    compression: str
+        One of ``"none"``, ``"zlib"`` or ``"lzma"``.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        schema: Schema,
+        targets: Optional[Iterable[Target]] = None,
+        chunk_seconds: float = 60.0,
+        chunk_samples: int = 1 << 20,
+        compression: str = "zlib",
+    ):
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression {compression}")
+        code, self._compress, _ = COMPRESSIONS[compression]
+        self.schema = schema
+        indexes = range(len(schema)) if targets is None else map(schema.index_of, targets)
+        self._recorded = set(indexes)
+        self.chunk_seconds = chunk_seconds
+        self.chunk_samples = chunk_samples
+        self.chunks: List[ChunkInfo] = []
+        self._fp = open(path, "wb")  # pylint: disable=R1732
+        self._fp.write(
+            HEADER.pack(MAGIC, FORMAT_VERSION, code, len(schema), schema.fingerprint)
+        )
+        self._store: Optional[VersionedStore] = None
+        self._reset()
+
+    def _reset(self):
+        self._start: Optional[float] = None
+        self._end = 0.0
+        self._samples = 0
+        self._histories: Dict[int, SignalHistory] = {}
+
+    def write(self, timestamp: float, updates: Mapping[int, Any]):
+        """Record ``updates``, keyed by schema index, at ``timestamp``."""
+        if self._start is not None and (
+            timestamp >= self._start + self.chunk_seconds or self._samples >= self.chunk_samples
+        ):
+            self.flush()
+        histories = self._histories
+        for index, value in updates.items():
+            if value is None or index not in self._recorded:
+                continue
+            history = histories.get(index)
+            if history is None:
+                history = histories[index] = SignalHistory(self.schema.specs[index])
+            history.append(timestamp, value)
+            self._samples += 1
+        if self._samples:
+            if self._start is None:
+                self._start = timestamp
+            self._end = max(self._end, timestamp)
+
+    def flush(self):
+        """Write the buffered samples as a chunk."""
+        if self._start is None:
+            return
+        offset = self._fp.tell()
+        blocks: Dict[int, BlockInfo] = {}
+        for index, history in sorted(self._histories.items()):
+            raw = bytearray(history.timestamps.tobytes())
+            if history.numeric:
+                raw += history.values.tobytes()
+            else:
+                datatype = history.spec.datatype
+                for value in history.values:
+                    write_variable(raw, datatype, value)
+            block = self._compress(raw)
+            blocks[index] = BlockInfo(len(history), offset, len(block))
+            self._fp.write(block)
+            offset += len(block)
+        self.chunks.append(ChunkInfo(self._start, self._end, blocks))
+        self._reset()
+
+    def attach(self, store: VersionedStore):
+        """Record every commit of ``store``."""
+        self._store = store
+        store.add_listener(self._on_commit)
+
+    def _on_commit(self, snapshot: Snapshot, changed: Tuple[int, ...]):
+        self.write(snapshot.timestamp, dict(zip(changed, snapshot.gather(changed))))
+
+    def close(self):
+        """Write the remaining samples and the footer, then close the file."""
+        if self._fp.closed:
+            return
+        if self._store is not None:
+            self._store.remove_listener(self._on_commit)
+            self._store = None
+        self.flush()
+        footer_offset = self._fp.tell()
+        footer = bytearray()
+        write_varint(footer, len(self.chunks))
+        for chunk in self.chunks:
+            footer += CHUNK_RANGE.pack(chunk.start, chunk.end)
+            write_varint(footer, len(chunk.blocks))
+            for index, block in chunk.blocks.items():
+                write_varint(footer, index)
+                write_varint(footer, block.count)
+                write_varint(footer, block.offset)
+                write_varint(footer, block.length)
+        self._fp.write(footer)
+        self._fp.write(TRAILER.pack(footer_offset, MAGIC))
+        self._fp.close()
+
+    def __enter__(self) -> "TraceFileWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+
+class TraceFileReader:
+    """Memory-maps a trace file and reads time windows of it.
+
+    Only the footer is parsed on open; blocks are decompressed when a
+    window that overlaps them is read.
+
+    Parameters
+    ----------
+    path: str
+        File to read.
+    schema: Schema
+        Schema to read into.
+    sources: Iterable[Schema]
+        Other schema versions the file may have been recorded with.
+    """
+
+    def __init__(self, path: str, schema: Schema, sources: Iterable[Schema] = ()):
+        self.schema = schema
+        with open(path, "rb") as fp:
+            self._map = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        data = self._map
+        if len(data) < HEADER.size + TRAILER.size:
+            raise ValueError("Not a vehicle trace file")
+        magic, version, code, count, fingerprint = HEADER.unpack_from(data, 0)
+        footer_offset, trailer_magic = TRAILER.unpack_from(data, len(data) - TRAILER.size)
+        if magic != MAGIC or trailer_magic != MAGIC:
+            raise ValueError("Not a vehicle trace file, or not closed by its writer")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported trace file format version {version}")
+        self._remap: Optional[SchemaRemap] = None
+        if fingerprint != schema.fingerprint:
+            source = next((s for s in sources if s.fingerprint == fingerprint), None)
+            if source is None:
+                raise ValueError(f"Trace was recorded with unknown schema {fingerprint:016x}")
+            self._remap = source.remap(schema)
+        if count != len(schema if self._remap is None else self._remap.source):
+            raise ValueError(f"Trace header is corrupt, it has {count} datapoints")
+        decompressors = {code: decompress for code, _, decompress in COMPRESSIONS.values()}
+        if code not in decompressors:
+            raise ValueError(f"Unknown compression id {code}")
+        self._decompress = decompressors[code]
+
+        self.chunks: List[ChunkInfo] = []
+        chunk_count, offset = read_varint(data, footer_offset)
+        for _ in range(chunk_count):
+            start, end = CHUNK_RANGE.unpack_from(data, offset)
+            block_count, offset = read_varint(data, offset + CHUNK_RANGE.size)
+            blocks: Dict[int, BlockInfo] = {}
+            for _ in range(block_count):
+                index, offset = read_varint(data, offset)
+                block_size, offset = read_varint(data, offset)
+                block_offset, offset = read_varint(data, offset)
+                length, offset = read_varint(data, offset)
+                blocks[index] = BlockInfo(block_size, block_offset, length)
+            self.chunks.append(ChunkInfo(start, end, blocks))
+        self._ends = [chunk.end for chunk in self.chunks]
+
+    @property
+    def start(self) -> Optional[float]:
+        return self.chunks[0].start if self.chunks else None
+
+    @property
+    def end(self) -> Optional[float]:
+        return self.chunks[-1].end if self.chunks else None
+
+    def chunks_between(self, start: Optional[float], end: Optional[float]) -> List[ChunkInfo]:
+        """Chunks whose time range overlaps ``[start, end]``."""
+        first = 0 if start is None else bisect_left(self._ends, start)
+        selected = []
+        for chunk in self.chunks[first:]:
+            if end is not None and chunk.start > end:
+                break
+            selected.append(chunk)
+        return selected
+
+    def _read_block(self, history: SignalHistory, block: BlockInfo) -> Tuple[array, Any]:
+        with memoryview(self._map) as view:
+            raw = self._decompress(view[block.offset : block.offset + block.length])
+        split = block.count * 8
+        timestamps = array("d")
+        timestamps.frombytes(raw[:split])
+        if history.numeric:
+            values: Union[array, List[Any]] = array(history.typecode)
+            values.frombytes(raw[split:])
+        else:
+            values = []
+            datatype, offset = history.spec.datatype, split
+            for _ in range(block.count):
+                value, offset = read_variable(raw, offset, datatype)
+                values.append(value)
+        return timestamps, values
+
+    def read(
+        self,
+        targets: Optional[Iterable[Target]] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Dict[str, SignalHistory]:
+        """Read the samples within ``[start, end]`` into histories keyed by path.
+
+        Parameters
+        ----------
+        targets: Optional[Iterable[Target]]
+            Datapoints to read; all recorded datapoints if omitted.
+        start: Optional[float]
+            First timestamp to include; the start of the trace if omitted.
+        end: Optional[float]
+            Last timestamp to include; the end of the trace if omitted.
+        """
+        schema = self.schema
+        wanted = None if targets is None else {schema.index_of(target) for target in targets}
+        histories: Dict[int, SignalHistory] = {}
+        if wanted is not None:
+            for index in sorted(wanted):
+                histories[index] = SignalHistory(schema.specs[index])
+        for chunk in self.chunks_between(start, end):
+            inside = (start is None or chunk.start >= start) and (end is None or chunk.end <= end)
+            for index, block in chunk.blocks.items():
+                if self._remap is not None:
+                    index = self._remap.table[index]
+                    if index == -1:
+                        continue
+                if wanted is not None and index not in wanted:
+                    continue
+                history = histories.get(index)
+                if history is None:
+                    history = histories[index] = SignalHistory(schema.specs[index])
+                timestamps, values = self._read_block(history, block)
+                if not inside:
+                    first = 0 if start is None else bisect_left(timestamps, start)
+                    last = len(timestamps) if end is None else bisect_right(timestamps, end)
+                    timestamps, values = timestamps[first:last], values[first:last]
+                history.extend(timestamps, values)
+        return {history.spec.path: history for history in histories.values()}
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self) -> "TraceFileReader":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+
+"""Unsigned LEB128 varints and zigzag mapping of signed integers."""
+
+from typing import Tuple
+
+
+def write_varint(buffer: bytearray, value: int):
+    """Append ``value`` (>= 0) to ``buffer`` as a varint."""
+    while value > 0x7F:
+        buffer.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(data, offset: int) -> Tuple[int, int]:
+    """Read a varint at ``offset``; return the value and the next offset."""
+    result = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, offset
+        shift += 7
+
+
+def zigzag(value: int) -> int:
+    """Map a signed integer onto an unsigned one, small magnitudes first."""
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
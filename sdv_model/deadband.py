@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+"""Per-datapoint deadband and change-detection filtering of writes."""
+
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional
+
+from sdv_model.schema import Schema, Target
+
+
+class Deadband(NamedTuple):
+    """Minimum change a write needs to be accepted.
+
+    A new value passes if it differs from the stored one by more than
+    ``max(absolute, relative * abs(stored))``. A zero deadband still drops
+    writes that repeat the stored value.
+    """
+
+    absolute: float = 0.0
+    relative: float = 0.0
+
+
+CHANGE = Deadband()
+
+# Defaults for floating point datapoints by catalog unit.
+UNIT_DEADBANDS: Dict[str, Deadband] = {
+    "degrees": Deadband(absolute=1e-5),
+    "degrees/s": Deadband(absolute=0.01),
+    "m/s^2": Deadband(absolute=0.01),
+    "km/h": Deadband(absolute=0.1),
+    "rpm": Deadband(absolute=1.0),
+    "percent": Deadband(absolute=0.1),
+    "celsius": Deadband(absolute=0.1),
+    "V": Deadband(absolute=0.01),
+    "A": Deadband(absolute=0.01),
+    "W": Deadband(absolute=1.0),
+    "kPa": Deadband(absolute=0.1),
+    "Pa": Deadband(absolute=1.0),
+    "km": Deadband(absolute=0.001),
+    "m": Deadband(absolute=0.01),
+    "l": Deadband(absolute=0.01),
+    "kWh": Deadband(absolute=0.01),
+}
+
+_FLOATING = ("float", "double")
+
+
+class DeadbandFilter:
+    """Write filter for :meth:`VersionedStore.add_filter`.
+
+    Floating point datapoints default to the deadband of their unit in
+    ``defaults``; every other datapoint only drops unchanged writes.
+
+    Parameters
+    ----------
+    schema: Schema
+        Schema of the store the filter is added to.
+    overrides: Optional[Mapping[Target, Optional[Deadband]]]
+        Per-datapoint deadbands; None disables filtering for a datapoint.
+    defaults: Mapping[str, Deadband]
+        Deadbands by unit for floating point datapoints.
+    """
+
+    def __init__(
+        self,
+        schema: Schema,
+        overrides: Optional[Mapping[Target, Optional[Deadband]]] = None,
+        defaults: Mapping[str, Deadband] = UNIT_DEADBANDS,
+    ):
+        self.schema = schema
+        self._bands: List[Optional[Deadband]] = [
+            defaults.get(spec.unit, CHANGE) if spec.datatype in _FLOATING else CHANGE
+            for spec in schema
+        ]
+        self.suppressed = 0
+        for target, band in (overrides or {}).items():
+            self.set(target, band)
+
+    def set(self, target: Target, band: Optional[Deadband]):
+        self._bands[self.schema.index_of(target)] = band
+
+    def get(self, target: Target) -> Optional[Deadband]:
+        return self._bands[self.schema.index_of(target)]
+
+    def __call__(self, index: int, previous: Any, value: Any) -> bool:
+        band = self._bands[index]
+        if band is None or previous is None or value is None:
+            return True
+        if band.absolute or band.relative:
+            try:
+                delta = abs(value - previous)
+            except TypeError:
+                return True
+            if delta > max(band.absolute, band.relative * abs(previous)):
+                return True
+        elif value != previous:
+            return True
+        self.suppressed += 1
+        return False
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+
+"""Hierarchical dirty tracking of model branches."""
+
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from sdv.model import DataPoint, Model
+
+from sdv_model.snapshot import Snapshot, VersionedStore
+
+Branch = Union[str, Model]
+
+
+class DirtyTracker:
+    """Keeps dirty bits on every branch of the model for a store.
+
+    Each committed datapoint write marks the datapoint and its ancestors
+    dirty; propagation stops at the first ancestor that already is. Every
+    branch counts its dirty direct children, so clearing a subtree can
+    clean ancestors that have nothing dirty left below them without a scan.
+    Consumers visit only dirty branches and clear what they have processed.
+    Marking and clearing hold a lock, so the store's writer thread and a
+    consumer may run concurrently.
+    """
+
+    def __init__(self, store: VersionedStore):
+        self.store = store
+        schema = store.schema
+        self._branch_ids: Dict[str, int] = {}
+        self.branches: List[str] = []
+        self._branch_parent: List[int] = []
+        self._child_branches: List[List[int]] = []
+        self._child_datapoints: List[List[int]] = []
+        self._datapoint_parent: List[int] = []
+        for spec in schema:
+            parent = self._branch(spec.path.rpartition(".")[0])
+            self._datapoint_parent.append(parent)
+            self._child_datapoints[parent].append(spec.index)
+        self._datapoint_dirty = bytearray(len(schema))
+        self._branch_dirty = bytearray(len(self.branches))
+        self._dirty_children = [0] * len(self.branches)
+        self._lock = threading.RLock()
+        store.add_listener(self._on_commit)
+
+    def _branch(self, path: str) -> int:
+        branch = self._branch_ids.get(path)
+        if branch is None:
+            head, _, _ = path.rpartition(".")
+            parent = self._branch(head) if head else -1
+            branch = self._branch_ids[path] = len(self.branches)
+            self.branches.append(path)
+            self._branch_parent.append(parent)
+            self._child_branches.append([])
+            self._child_datapoints.append([])
+            if parent >= 0:
+                self._child_branches[parent].append(branch)
+        return branch
+
+    def close(self):
+        self.store.remove_listener(self._on_commit)
+
+    def _resolve(self, target) -> Tuple[bool, int]:
+        """Return ``(is_branch, id)`` of a branch or datapoint target."""
+        if isinstance(target, (DataPoint, int)):
+            return False, self.store.schema.index_of(target)
+        path = target.get_path() if isinstance(target, Model) else target
+        branch = self._branch_ids.get(path)
+        if branch is not None:
+            return True, branch
+        return False, self.store.schema.index_of(path)
+
+    def _branch_of(self, target: Optional[Branch]) -> int:
+        if target is None:
+            return 0
+        is_branch, ident = self._resolve(target)
+        if not is_branch:
+            raise TypeError(f"{self.store.schema.specs[ident].path} is a datapoint, not a branch")
+        return ident
+
+    def _on_commit(self, snapshot: Snapshot, changed: Tuple[int, ...]):
+        with self._lock:
+            for index in changed:
+                self._mark(index)
+
+    def mark(self, index: int):
+        """Mark a datapoint and its ancestors dirty."""
+        with self._lock:
+            self._mark(index)
+
+    def _mark(self, index: int):
+        if self._datapoint_dirty[index]:
+            return
+        self._datapoint_dirty[index] = 1
+        branch = self._datapoint_parent[index]
+        while branch >= 0:
+            self._dirty_children[branch] += 1
+            if self._branch_dirty[branch]:
+                return
+            self._branch_dirty[branch] = 1
+            branch = self._branch_parent[branch]
+
+    def is_dirty(self, target=None) -> bool:
+        """Tell whether a branch or datapoint, or anything at all, is dirty."""
+        if target is None:
+            return bool(self._branch_dirty[0])
+        is_branch, ident = self._resolve(target)
+        return bool((self._branch_dirty if is_branch else self._datapoint_dirty)[ident])
+
+    def dirty_children(self, branch: Branch) -> List[str]:
+        """Paths of the dirty direct children of ``branch``."""
+        ident = self._branch_of(branch)
+        specs = self.store.schema.specs
+        with self._lock:
+            paths = [self.branches[b] for b in self._child_branches[ident] if self._branch_dirty[b]]
+            paths.extend(
+                specs[i].path for i in self._child_datapoints[ident] if self._datapoint_dirty[i]
+            )
+        return paths
+
+    def _walk(self, branch: int) -> Iterator[int]:
+        stack = [branch]
+        while stack:
+            branch = stack.pop()
+            yield branch
+            stack.extend(b for b in reversed(self._child_branches[branch]) if self._branch_dirty[b])
+
+    def dirty_branches(self, branch: Optional[Branch] = None) -> Iterator[str]:
+        """Yield the dirty branches at and below ``branch``, parents first."""
+        start = self._branch_of(branch)
+        with self._lock:
+            idents = list(self._walk(start)) if self._branch_dirty[start] else []
+        for ident in idents:
+            yield self.branches[ident]
+
+    def dirty_datapoints(self, branch: Optional[Branch] = None) -> List[int]:
+        """Schema indexes of the dirty datapoints at and below ``branch``."""
+        start = self._branch_of(branch)
+        with self._lock:
+            if not self._branch_dirty[start]:
+                return []
+            return [
+                index
+                for ident in self._walk(start)
+                for index in self._child_datapoints[ident]
+                if self._datapoint_dirty[index]
+            ]
+
+    def clear(self, target=None):
+        """Clear a branch subtree or datapoint, or everything if omitted."""
+        is_branch, ident = (True, 0) if target is None else self._resolve(target)
+        with self._lock:
+            self._clear(is_branch, ident)
+
+    def _clear(self, is_branch: bool, ident: int):
+        if is_branch:
+            if not self._branch_dirty[ident]:
+                return
+            for branch in list(self._walk(ident)):
+                for index in self._child_datapoints[branch]:
+                    self._datapoint_dirty[index] = 0
+                self._branch_dirty[branch] = 0
+                self._dirty_children[branch] = 0
+            parent = self._branch_parent[ident]
+        else:
+            if not self._datapoint_dirty[ident]:
+                return
+            self._datapoint_dirty[ident] = 0
+            parent = self._datapoint_parent[ident]
+        while parent >= 0:
+            self._dirty_children[parent] -= 1
+            if self._dirty_children[parent]:
+                return
+            self._branch_dirty[parent] = 0
+            parent = self._branch_parent[parent]
+
+    def take(self, branch: Optional[Branch] = None) -> List[int]:
+        """Return the dirty datapoints below ``branch`` and clear them."""
+        start = self._branch_of(branch)
+        with self._lock:
+            dirty = self.dirty_datapoints(self.branches[start])
+            self._clear(True, start)
+        return dirty
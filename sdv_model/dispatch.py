@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+"""Tick-coalescing dispatch of datapoint updates to callbacks.
+
+Updates are collected until the event loop runs its next iteration, then
+every callback is called once with all of its datapoints that changed in
+between. A batch that touches 40 datapoints a callback watches costs one
+call instead of 40.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+from sdv_model.schema import Schema, Target
+from sdv_model.snapshot import Snapshot, VersionedStore
+
+logger = logging.getLogger(__name__)
+
+# Called with the latest values of the changed datapoints, keyed by schema index.
+BatchCallback = Callable[[Dict[int, Any]], Any]
+
+
+class CoalescingDispatcher:
+    """Calls each registered callback at most once per event-loop iteration.
+
+    :meth:`notify` may be called from any thread; callbacks always run on
+    the dispatcher's event loop. Values of a datapoint updated several
+    times within one iteration are conflated to the latest one. Coroutine
+    callbacks are scheduled as tasks; exceptions raised by a callback are
+    logged and do not keep the others from being called.
+
+    Parameters
+    ----------
+    schema: Schema
+        Schema the updates are indexed by.
+    loop: Optional[asyncio.AbstractEventLoop]
+        Loop to dispatch on; if omitted, the loop running at the first
+        notification. Until then, notifications from other threads raise a
+        RuntimeError, but their updates stay queued for the first dispatch.
+    """
+
+    def __init__(self, schema: Schema, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.schema = schema
+        self._loop = loop
+        self._callbacks: List[Optional[BatchCallback]] = []
+        self._watched: List[FrozenSet[int]] = []
+        self._watchers: Dict[int, List[int]] = {}
+        self._pending: Dict[int, Any] = {}
+        self._scheduled = False
+        self._lock = threading.Lock()
+        self._store: Optional[VersionedStore] = None
+        self.received = 0
+        self.dispatched = 0
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop
+
+    def register(self, targets: Iterable[Target], callback: BatchCallback):
+        """Call ``callback`` with the changes of ``targets``, once per iteration."""
+        watched = frozenset(self.schema.index_of(target) for target in targets)
+        with self._lock:
+            handle = len(self._callbacks)
+            self._callbacks.append(callback)
+            self._watched.append(watched)
+            for index in watched:
+                self._watchers.setdefault(index, []).append(handle)
+
+    def unregister(self, callback: BatchCallback):
+        with self._lock:
+            for handle, registered in enumerate(self._callbacks):
+                if registered != callback:
+                    continue
+                self._callbacks[handle] = None
+                for index in self._watched[handle]:
+                    watching = self._watchers[index]
+                    watching.remove(handle)
+                    if not watching:
+                        del self._watchers[index]
+                        self._pending.pop(index, None)
+
+    def notify(self, updates: Mapping[int, Any]):
+        """Queue ``updates``, keyed by schema index, for the next dispatch."""
+        with self._lock:
+            watchers, pending = self._watchers, self._pending
+            self.received += len(updates)
+            for index, value in updates.items():
+                if index in watchers:
+                    pending[index] = value
+            if not pending or self._scheduled:
+                return
+            loop = self.loop
+            self._scheduled = True
+        try:
+            try:
+                on_loop = asyncio.get_running_loop() is loop
+            except RuntimeError:
+                on_loop = False
+            if on_loop:
+                loop.call_soon(self._dispatch)
+            else:
+                loop.call_soon_threadsafe(self._dispatch)
+        except BaseException:
+            with self._lock:
+                self._scheduled = False
+            raise
+
+    def _dispatch(self):
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._scheduled = False
+            handles = set()
+            for index in pending:
+                handles.update(self._watchers.get(index, ()))
+            calls = [(self._callbacks[handle], self._watched[handle]) for handle in sorted(handles)]
+        for callback, watched in calls:
+            if callback is None:
+                continue
+            if len(watched) < len(pending):
+                changes = {index: pending[index] for index in watched if index in pending}
+            else:
+                changes = {index: value for index, value in pending.items() if index in watched}
+            try:
+                outcome = callback(changes)
+                if inspect.isawaitable(outcome):
+                    asyncio.ensure_future(outcome)
+            except Exception:  # pylint: disable=W0703
+                logger.exception("Dispatch callback %r failed", callback)
+            self.dispatched += 1
+
+    def attach(self, store: VersionedStore):
+        """Dispatch the commits of ``store``."""
+        self._store = store
+        store.add_listener(self._on_commit)
+
+    def _on_commit(self, snapshot: Snapshot, changed: Tuple[int, ...]):
+        watched = [index for index in changed if index in self._watchers]
+        if watched:
+            self.notify(dict(zip(watched, snapshot.gather(watched))))
+
+    def close(self):
+        if self._store is not None:
+            self._store.remove_listener(self._on_commit)
+            self._store = None
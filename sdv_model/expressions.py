@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+
+"""Derived signals defined by expressions over datapoint paths.
+
+Expressions are Python arithmetic over full VSS paths and previously
+defined derived signals::
+
+    engine.define(
+        "BatteryPower",
+        "Vehicle.Powertrain.TractionBattery.CurrentVoltage"
+        " * Vehicle.Powertrain.TractionBattery.CurrentCurrent",
+    )
+    engine.define(
+        "WheelSpeedError",
+        "Vehicle.Speed - mean('Vehicle.Chassis.Axle.*.Wheel.*.Speed')",
+    )
+
+Quoted glob patterns expand to all matching datapoints inside function
+calls. Each expression is parsed once with :mod:`ast`, checked against the
+schema and compiled to a function over a vector of slot values, so the
+same code evaluates a single update or whole columns of recorded samples
+with NumPy. Inputs and expressions form a dependency graph; an update
+recomputes only the expressions that depend on what changed.
+"""
+
+import ast
+import logging
+from functools import reduce
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from sdv_model.schema import Schema, Target
+from sdv_model.snapshot import Snapshot, VersionedStore
+
+logger = logging.getLogger(__name__)
+
+FUNCTIONS: Dict[str, Callable[..., Any]] = {
+    "abs": np.abs,
+    "sqrt": np.sqrt,
+    "exp": np.exp,
+    "log": np.log,
+    "hypot": np.hypot,
+    "clip": np.clip,
+    "where": np.where,
+    "min": lambda *args: reduce(np.minimum, args),
+    "max": lambda *args: reduce(np.maximum, args),
+    "sum": lambda *args: reduce(np.add, args),
+    "mean": lambda *args: reduce(np.add, args) / len(args),
+}
+
+_OPERATORS = (
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.USub,
+    ast.UAdd,
+    ast.Eq,
+    ast.NotEq,
+    ast.Lt,
+    ast.LtE,
+    ast.Gt,
+    ast.GtE,
+)
+
+_NUMERIC = (
+    "boolean",
+    "int8",
+    "int16",
+    "int32",
+    "int64",
+    "uint8",
+    "uint16",
+    "uint32",
+    "uint64",
+    "float",
+    "double",
+)
+
+DerivedCallback = Callable[[str, float], Any]
+
+
+class Expression(NamedTuple):
+    """A compiled derived signal.
+
+    Attributes
+    ----------
+    name: str
+        Name of the derived signal.
+    source: str
+        The expression text.
+    slot: int
+        Slot holding the derived value.
+    inputs: Tuple[int, ...]
+        Schema indexes of the datapoints the expression reads.
+    depends: Tuple[str, ...]
+        Derived signals the expression reads.
+    """
+
+    name: str
+    source: str
+    slot: int
+    inputs: Tuple[int, ...]
+    depends: Tuple[str, ...]
+
+
+def _dotted(node: ast.AST) -> Optional[str]:
+    """Dotted name of a Name/Attribute chain, None for other nodes."""
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+class _Compiler(ast.NodeTransformer):
+    """Rewrites datapoint and derived references into slot lookups."""
+
+    def __init__(self, engine: "ExpressionEngine", source: str):
+        self.engine = engine
+        self.source = source
+        self.inputs: Dict[int, None] = {}
+        self.depends: Dict[str, None] = {}
+
+    def _fail(self, message: str):
+        raise ValueError(f"{message} in expression {self.source!r}")
+
+    def _reference(self, name: str) -> ast.AST:
+        engine = self.engine
+        if name in engine.expressions:
+            self.depends[name] = None
+            slot = engine.expressions[name].slot
+        elif name in engine.schema:
+            index = engine.schema.index_of(name)
+            if engine.schema.specs[index].datatype not in _NUMERIC:
+                self._fail(f"Datapoint {name} is not numeric")
+            self.inputs[index] = None
+            slot = engine._input_slot(index)  # pylint: disable=W0212
+        else:
+            self._fail(f"Unknown datapoint or derived signal {name}")
+        return ast.Subscript(
+            value=ast.Name(id="v", ctx=ast.Load()),
+            slice=ast.Constant(value=slot),
+            ctx=ast.Load(),
+        )
+
+    def visit_Expression(self, node: ast.Expression) -> ast.AST:
+        node.body = self.visit(node.body)
+        return node
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        return self._reference(node.id)
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.AST:
+        name = _dotted(node)
+        if name is None:
+            self._fail("Attributes are only allowed in paths")
+        return self._reference(name)
+
+    def visit_Constant(self, node: ast.Constant) -> ast.AST:
+        if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+            self._fail(f"Unsupported constant {node.value!r}")
+        return node
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:
+        if not isinstance(node.func, ast.Name) or node.func.id not in FUNCTIONS:
+            self._fail(f"Unknown function {ast.unparse(node.func)}")
+        if node.keywords:
+            self._fail("Keyword arguments are not supported")
+        args: List[ast.AST] = []
+        for arg in node.args:
+            if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
+                indexes = self.engine.schema.match(arg.value)
+                if not indexes:
+                    self._fail(f"No datapoint matches {arg.value}")
+                specs = self.engine.schema.specs
+                args.extend(self._reference(specs[index].path) for index in indexes)
+            else:
+                args.append(self.visit(arg))
+        return ast.Call(
+            func=ast.Name(id=node.func.id, ctx=ast.Load()), args=args, keywords=[]
+        )
+
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        if len(node.ops) != 1:
+            self._fail("Chained comparisons are not supported")
+        return self.generic_visit(node)
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        if not isinstance(node, (ast.BinOp, ast.UnaryOp, ast.Compare, ast.Load) + _OPERATORS):
+            self._fail(f"Unsupported syntax {type(node).__name__}")
+        return super().generic_visit(node)
+
+
+class ExpressionEngine:
+    """Maintains derived signals over the datapoints of a schema.
+
+    Values are kept in one float64 vector of slots, one per datapoint read
+    by any expression and one per expression. Unset inputs are NaN, and so
+    is everything derived from them.
+
+    Parameters
+    ----------
+    schema: Schema
+        Schema the inputs are indexed by.
+    """
+
+    def __init__(self, schema: Schema):
+        self.schema = schema
+        self.expressions: Dict[str, Expression] = {}
+        self._functions: List[Callable[[np.ndarray], Any]] = []
+        self._callbacks: List[Optional[DerivedCallback]] = []
+        self._slots: Dict[int, int] = {}
+        self._dependents: Dict[int, Set[int]] = {}
+        self._values = np.full(0, np.nan)
+        self._store: Optional[VersionedStore] = None
+
+    def _input_slot(self, index: int) -> int:
+        slot = self._slots.get(index)
+        if slot is None:
+            slot = self._slots[index] = self._grow()
+        return slot
+
+    def _grow(self) -> int:
+        slot = len(self._values)
+        self._values = np.append(self._values, np.nan)
+        return slot
+
+    def define(
+        self, name: str, source: str, callback: Optional[DerivedCallback] = None
+    ) -> Expression:
+        """Compile and add a derived signal.
+
+        Expressions may only reference derived signals defined before
+        them, which keeps the dependency graph acyclic and the definition
+        order a valid evaluation order. ``callback`` is called with the
+        name and new value whenever the value changes; exceptions it
+        raises are logged and do not stop the update.
+        """
+        if name in self.expressions or name in self.schema:
+            raise ValueError(f"Name {name} is already defined")
+        try:
+            tree = ast.parse(source.strip(), mode="eval")
+        except SyntaxError as err:
+            raise ValueError(f"Invalid expression {source!r}: {err.msg}") from err
+        compiler = _Compiler(self, source)
+        body = compiler.visit(tree).body
+        arguments = ast.arguments(
+            posonlyargs=[],
+            args=[ast.arg(arg="v")],
+            kwonlyargs=[],
+            kw_defaults=[],
+            defaults=[],
+        )
+        tree = ast.fix_missing_locations(ast.Expression(ast.Lambda(arguments, body)))
+        namespace = {"__builtins__": {}, **FUNCTIONS}
+        # Only slot lookups, numeric constants, operators and FUNCTIONS
+        # survive the compiler, so evaluating the tree is safe.
+        function = eval(compile(tree, f"<{name}>", "eval"), namespace)  # pylint: disable=W0123
+        slot = self._grow()
+        number = len(self._functions)
+        expression = Expression(
+            name, source, slot, tuple(compiler.inputs), tuple(compiler.depends)
+        )
+        self.expressions[name] = expression
+        self._functions.append(function)
+        self._callbacks.append(callback)
+        for index in expression.inputs:
+            self._dependents.setdefault(self._slots[index], set()).add(number)
+        for dependency in expression.depends:
+            self._dependents.setdefault(self.expressions[dependency].slot, set()).add(number)
+        with np.errstate(all="ignore"):
+            self._values[slot] = function(self._values)
+        return expression
+
+    def __getitem__(self, name: str) -> float:
+        return float(self._values[self.expressions[name].slot])
+
+    def update(self, updates: Mapping[int, Any]) -> Dict[str, float]:
+        """Apply input updates keyed by schema index; return the changed derived values."""
+        values, slots = self._values, self._slots
+        dirty: Set[int] = set()
+        for index, value in updates.items():
+            slot = slots.get(index)
+            if slot is not None:
+                values[slot] = np.nan if value is None else value
+                dirty.update(self._dependents.get(slot, ()))
+        changed: Dict[str, float] = {}
+        if not dirty:
+            return changed
+        expressions = list(self.expressions.values())
+        pending = sorted(dirty)
+        with np.errstate(all="ignore"):
+            while pending:
+                number = pending.pop(0)
+                expression = expressions[number]
+                previous = values[expression.slot]
+                value = values[expression.slot] = self._functions[number](values)
+                if value == previous or (value != value and previous != previous):
+                    continue
+                changed[expression.name] = float(value)
+                callback = self._callbacks[number]
+                if callback is not None:
+                    try:
+                        callback(expression.name, float(value))
+                    except Exception:  # pylint: disable=W0703
+                        logger.exception("Derived signal callback %r failed", callback)
+                for dependent in self._dependents.get(expression.slot, ()):
+                    if dependent not in pending:
+                        pending.append(dependent)
+                pending.sort()
+        return changed
+
+    def evaluate(
+        self, columns: Mapping[Target, Sequence[float]], names: Optional[Sequence[str]] = None
+    ) -> Dict[str, np.ndarray]:
+        """Evaluate expressions over columns of input samples at once.
+
+        Parameters
+        ----------
+        columns: Mapping[Target, Sequence[float]]
+            Equally long sample columns by datapoint, e.g. resampled
+            histories; missing inputs are NaN.
+        names: Optional[Sequence[str]]
+            Expressions to return; all if omitted.
+        """
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("Columns differ in length")
+        rows = lengths.pop() if lengths else 1
+        matrix = np.full((len(self._values), rows), np.nan)
+        for target, column in columns.items():
+            slot = self._slots.get(self.schema.index_of(target))
+            if slot is not None:
+                matrix[slot] = column
+        with np.errstate(all="ignore"):
+            for expression, function in zip(self.expressions.values(), self._functions):
+                matrix[expression.slot] = function(matrix)
+        wanted = self.expressions if names is None else names
+        return {name: matrix[self.expressions[name].slot] for name in wanted}
+
+    def attach(self, store: VersionedStore):
+        """Recompute on every commit of ``store``."""
+        self._store = store
+        store.add_listener(self._on_commit)
+
+    def _on_commit(self, snapshot: Snapshot, changed: Tuple[int, ...]):
+        watched = [index for index in changed if index in self._slots]
+        if watched:
+            self.update(dict(zip(watched, snapshot.gather(watched))))
+
+    def close(self):
+        if self._store is not None:
+            self._store.remove_listener(self._on_commit)
+            self._store = None
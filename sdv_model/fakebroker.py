@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+
+"""In-process stand-in for the vehicle databroker.
+
+:class:`FakeBroker` implements the ``GetDatapoints``, ``SetDatapoints``
+and ``Subscribe`` calls of ``VehicleDataBrokerClient`` for every datapoint
+of a schema, answering with the broker's own protobuf messages, so it can
+be passed wherever the model expects a client. Values live in a
+:class:`VersionedStore`. Traffic comes from update generators such as
+:class:`RandomWalk` or recorded traces, replayed at a chosen speed, and
+every call and reply can be delayed by an injected latency. This gives
+repeatable throughput and latency measurements without a real broker.
+"""
+
+import asyncio
+import itertools
+import random
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from sdv.proto.broker_pb2 import GetDatapointsReply, SetDatapointsReply, SubscribeReply
+from sdv.proto.types_pb2 import Datapoint as BrokerDatapoint
+from sdv.proto.types_pb2 import DatapointError
+
+from sdv_model.replay import Batch, ReplayStats, TraceReplayer
+from sdv_model.schema import DataPointSpec, Schema, Target
+from sdv_model.snapshot import Snapshot, VersionedStore
+
+# Field of the broker Datapoint value oneof by VSS datatype.
+BROKER_FIELDS = {
+    "boolean": "bool_value",
+    "int8": "int32_value",
+    "int16": "int32_value",
+    "int32": "int32_value",
+    "int64": "int64_value",
+    "uint8": "uint32_value",
+    "uint16": "uint32_value",
+    "uint32": "uint32_value",
+    "uint64": "uint64_value",
+    "float": "float_value",
+    "double": "double_value",
+    "string": "string_value",
+    "boolean[]": "bool_array",
+    "int8[]": "int32_array",
+    "int16[]": "int32_array",
+    "int32[]": "int32_array",
+    "int64[]": "int64_array",
+    "uint8[]": "uint32_array",
+    "uint16[]": "uint32_array",
+    "uint32[]": "uint32_array",
+    "uint64[]": "uint64_array",
+    "float[]": "float_array",
+    "double[]": "double_array",
+    "string[]": "string_array",
+}
+
+_INT_RANGES = {
+    "int8": (-(1 << 7), (1 << 7) - 1),
+    "int16": (-(1 << 15), (1 << 15) - 1),
+    "int32": (-(1 << 31), (1 << 31) - 1),
+    "int64": (-(1 << 63), (1 << 63) - 1),
+    "uint8": (0, (1 << 8) - 1),
+    "uint16": (0, (1 << 16) - 1),
+    "uint32": (0, (1 << 32) - 1),
+    "uint64": (0, (1 << 64) - 1),
+}
+
+
+def to_broker(datatype: str, value: Any, timestamp: Optional[float] = None) -> BrokerDatapoint:
+    """Build the broker message of a value; None becomes ``NOT_AVAILABLE``."""
+    datapoint = BrokerDatapoint()
+    if value is None:
+        datapoint.failure_value = BrokerDatapoint.NOT_AVAILABLE
+    elif datatype.endswith("[]"):
+        getattr(datapoint, BROKER_FIELDS[datatype]).values.extend(value)
+    else:
+        setattr(datapoint, BROKER_FIELDS[datatype], value)
+    if timestamp is not None:
+        datapoint.timestamp.FromNanoseconds(int(timestamp * 1e9))
+    return datapoint
+
+
+def from_broker(datatype: str, datapoint: BrokerDatapoint) -> Any:
+    """Value of a broker message; raises a TypeError if it does not fit ``datatype``."""
+    field = datapoint.WhichOneof("value")
+    if field != BROKER_FIELDS[datatype]:
+        raise TypeError(f"Expected {BROKER_FIELDS[datatype]} for {datatype}, got {field}")
+    value = getattr(datapoint, field)
+    if datatype.endswith("[]"):
+        return list(value.values)
+    low_high = _INT_RANGES.get(datatype)
+    if low_high is not None and not low_high[0] <= value <= low_high[1]:
+        raise TypeError(f"Value {value} is out of range for {datatype}")
+    return value
+
+
+class FakeBroker:
+    """Serves the datapoints of a schema like a databroker, in process.
+
+    Parameters
+    ----------
+    schema: Schema
+        Schema of the served datapoints.
+    store: Optional[VersionedStore]
+        Store holding the values; a new one if omitted.
+    latency: float
+        Seconds added to every call and to the delivery of every
+        subscription reply.
+    jitter: float
+        Upper bound of a uniformly distributed extra delay.
+    seed: Optional[int]
+        Seed of the jitter.
+    actuators_only: bool
+        Reject ``SetDatapoints`` on sensors and attributes with
+        ``ACCESS_DENIED``, like the broker does for apps.
+    """
+
+    def __init__(
+        self,
+        schema: Schema,
+        store: Optional[VersionedStore] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: Optional[int] = None,
+        actuators_only: bool = True,
+    ):
+        if latency < 0 or jitter < 0:
+            raise ValueError("Latency must not be negative")
+        self.schema = schema
+        self.store = store if store is not None else VersionedStore(schema)
+        self.latency = latency
+        self.jitter = jitter
+        self.actuators_only = actuators_only
+        self._random = random.Random(seed)
+        self._timestamps: List[Optional[float]] = [None] * len(schema)
+        self._streams: List[Tuple[frozenset, "asyncio.Queue", asyncio.AbstractEventLoop]] = []
+        self.calls = 0
+        self.replies = 0
+        self.store.add_listener(self._on_commit)
+
+    def _delay(self) -> float:
+        if self.jitter:
+            return self.latency + self._random.uniform(0.0, self.jitter)
+        return self.latency
+
+    async def _wait(self):
+        self.calls += 1
+        delay = self._delay()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def _datapoint(self, snapshot: Snapshot, index: int) -> BrokerDatapoint:
+        return to_broker(
+            self.schema.specs[index].datatype, snapshot.value_at(index), self._timestamps[index]
+        )
+
+    async def GetDatapoints(self, datapoints: Sequence[str]) -> GetDatapointsReply:
+        await self._wait()
+        snapshot = self.store.snapshot()
+        reply = GetDatapointsReply()
+        for path in datapoints:
+            if path in self.schema:
+                reply.datapoints[path].CopyFrom(
+                    self._datapoint(snapshot, self.schema.index_of(path))
+                )
+            else:
+                reply.datapoints[path].failure_value = BrokerDatapoint.UNKNOWN_DATAPOINT
+        return reply
+
+    async def SetDatapoints(self, datapoints: Mapping[str, BrokerDatapoint]) -> SetDatapointsReply:
+        await self._wait()
+        reply = SetDatapointsReply()
+        values: Dict[int, Any] = {}
+        for path, datapoint in datapoints.items():
+            if path not in self.schema:
+                reply.errors[path] = DatapointError.UNKNOWN_DATAPOINT
+                continue
+            spec = self.schema[path]
+            if self.actuators_only and spec.kind != "actuator":
+                reply.errors[path] = DatapointError.ACCESS_DENIED
+                continue
+            try:
+                values[spec.index] = from_broker(spec.datatype, datapoint)
+            except TypeError:
+                reply.errors[path] = DatapointError.INVALID_TYPE
+        if values:
+            self.store.update(values)
+        return reply
+
+    def Subscribe(self, query: str) -> AsyncIterator[SubscribeReply]:
+        """Stream the datapoints of a ``SELECT a, b, ...`` query.
+
+        The first reply carries the current values of those that are set;
+        every later one the datapoints changed by a commit.
+        """
+        head, _, paths = query.strip().partition(" ")
+        if head.upper() != "SELECT" or not paths.strip():
+            raise ValueError(f"Unsupported query {query!r}")
+        indexes = []
+        for path in paths.split(","):
+            path = path.strip()
+            if path not in self.schema:
+                raise ValueError(f"Unknown datapoint {path} in query")
+            indexes.append(self.schema.index_of(path))
+        return self._stream(frozenset(indexes))
+
+    async def _stream(self, indexes: frozenset) -> AsyncIterator[SubscribeReply]:
+        await self._wait()
+        queue: "asyncio.Queue[Tuple[float, Snapshot, Tuple[int, ...]]]" = asyncio.Queue()
+        entry = (indexes, queue, asyncio.get_running_loop())
+        self._streams.append(entry)
+        try:
+            snapshot = self.store.snapshot()
+            current = tuple(i for i in sorted(indexes) if snapshot.value_at(i) is not None)
+            if current:
+                yield self._reply(snapshot, current)
+            while True:
+                due, snapshot, changed = await queue.get()
+                wait = due - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                yield self._reply(snapshot, changed)
+        finally:
+            self._streams.remove(entry)
+
+    def _reply(self, snapshot: Snapshot, indexes: Iterable[int]) -> SubscribeReply:
+        reply = SubscribeReply()
+        specs = self.schema.specs
+        for index in indexes:
+            reply.fields[specs[index].path].CopyFrom(self._datapoint(snapshot, index))
+        self.replies += 1
+        return reply
+
+    def _on_commit(self, snapshot: Snapshot, changed: Tuple[int, ...]):
+        for index in changed:
+            self._timestamps[index] = snapshot.timestamp
+        if not self._streams:
+            return
+        due = time.monotonic() + self._delay()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        for indexes, queue, loop in tuple(self._streams):
+            selected = tuple(index for index in changed if index in indexes)
+            if not selected:
+                continue
+            if loop is running:
+                queue.put_nowait((due, snapshot, selected))
+            else:
+                loop.call_soon_threadsafe(queue.put_nowait, (due, snapshot, selected))
+
+    async def feed(self, source: Iterable[Batch], speed: Optional[float] = None) -> ReplayStats:
+        """Commit the batches of a generator or recorded trace.
+
+        ``speed`` paces the batches by their timestamps, 1.0 for real
+        time; None commits them as fast as possible.
+        """
+        return await TraceReplayer(self.store, source, speed).run()
+
+    def close(self):
+        self.store.remove_listener(self._on_commit)
+
+
+class RandomWalk:
+    """Endless source of random-walk updates for numeric datapoints.
+
+    Iterating yields ``(timestamp, updates)`` batches ``interval`` seconds
+    apart, as :meth:`FakeBroker.feed` and :class:`TraceReplayer` expect.
+    Numbers move by a normally distributed step relative to their value
+    range and stay inside it; booleans flip and enum-like strings change
+    with probability ``step``. Other datapoints are skipped.
+
+    Parameters
+    ----------
+    schema: Schema
+        Schema of the datapoints.
+    targets: Optional[Iterable[Target]]
+        Datapoints or glob patterns to drive; all if omitted.
+    interval: float
+        Seconds between batches.
+    step: float
+        Standard deviation of a step as a fraction of the value range.
+    fraction: float
+        Share of the driven datapoints updated per batch.
+    seed: Optional[int]
+        Seed for repeatable sequences.
+    start: float
+        Timestamp of the first batch.
+    """
+
+    def __init__(
+        self,
+        schema: Schema,
+        targets: Optional[Iterable[Target]] = None,
+        interval: float = 0.01,
+        step: float = 0.01,
+        fraction: float = 1.0,
+        seed: Optional[int] = None,
+        start: float = 0.0,
+    ):
+        if not 0 < fraction <= 1:
+            raise ValueError("Fraction must be in (0, 1]")
+        if targets is None:
+            indexes = range(len(schema))
+        else:
+            indexes = sorted({index for target in targets for index in schema.match(target)})
+        self.schema = schema
+        self.interval = interval
+        self.step = step
+        self.fraction = fraction
+        self.start = start
+        self._tick = 0
+        self._random = random.Random(seed)
+        self.specs: List[DataPointSpec] = [
+            schema.specs[index] for index in indexes if self._drivable(schema.specs[index])
+        ]
+        self.values: Dict[int, Any] = {spec.index: self._initial(spec) for spec in self.specs}
+
+    @staticmethod
+    def _drivable(spec: DataPointSpec) -> bool:
+        if spec.datatype == "string":
+            return bool(spec.allowed)
+        return not spec.datatype.endswith("[]")
+
+    @staticmethod
+    def _bounds(spec: DataPointSpec) -> Tuple[float, float]:
+        # Unbounded sides default to a span of 200 around zero or the other bound.
+        kind_low, kind_high = _INT_RANGES.get(spec.datatype, (-float("inf"), float("inf")))
+        low, high = spec.minimum, spec.maximum
+        if low is None and high is None:
+            return max(kind_low, -100.0), min(kind_high, 100.0)
+        if high is None:
+            high = min(kind_high, low + 200.0)
+        elif low is None:
+            low = max(kind_low, high - 200.0)
+        return low, high
+
+    def _initial(self, spec: DataPointSpec) -> Any:
+        if spec.datatype == "boolean":
+            return False
+        if spec.datatype == "string":
+            return spec.allowed[0]
+        low, high = self._bounds(spec)
+        middle = (low + high) / 2
+        return round(middle) if spec.datatype in _INT_RANGES else middle
+
+    def _advance(self, spec: DataPointSpec) -> Any:
+        value, chance = self.values[spec.index], self._random.random()
+        if spec.datatype == "boolean":
+            return not value if chance < self.step else value
+        if spec.datatype == "string":
+            return self._random.choice(spec.allowed) if chance < self.step else value
+        low, high = self._bounds(spec)
+        value = min(high, max(low, value + self._random.gauss(0.0, self.step * (high - low))))
+        return round(value) if spec.datatype in _INT_RANGES else value
+
+    def __iter__(self) -> Iterator[Batch]:
+        while True:
+            if self.fraction < 1:
+                count = max(1, round(len(self.specs) * self.fraction))
+                specs = self._random.sample(self.specs, count)
+            else:
+                specs = self.specs
+            batch = {}
+            for spec in specs:
+                batch[spec.index] = self.values[spec.index] = self._advance(spec)
+            timestamp = self.start + self._tick * self.interval
+            self._tick += 1
+            yield timestamp, batch
+
+    def take(self, batches: int) -> List[Batch]:
+        """The next ``batches`` batches, e.g. for a finite feed; iteration continues after them."""
+        return list(itertools.islice(iter(self), batches))
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+
+"""Fan-out of datapoint updates to asyncio consumers with bounded queues.
+
+Every consumer reads from its own queue of ``(timestamp, updates)``
+batches, so a slow consumer only ever delays itself. What happens when a
+queue is full is the consumer's overflow policy:
+
+``DROP_OLDEST``
+    Discard the oldest queued batch.
+``CONFLATE``
+    Merge all queued batches into one holding the latest value of every
+    datapoint.
+``BLOCK``
+    Make :meth:`FanOut.publish` wait until the consumer catches up; the
+    other consumers receive the batch without waiting. Commits of an
+    attached store cannot wait, so they queue in a backlog of the
+    consumer bounded by ``max_backlog``. Beyond that, the oldest backlog
+    batch is dropped, which makes ``BLOCK`` lossless only up to that
+    bound.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from sdv_model.schema import Schema, Target
+from sdv_model.snapshot import Snapshot, VersionedStore
+
+DROP_OLDEST = "drop-oldest"
+CONFLATE = "conflate"
+BLOCK = "block"
+
+Batch = Tuple[float, Dict[int, Any]]
+
+
+class ConsumerStats(NamedTuple):
+    """Queue metrics of a consumer.
+
+    Attributes
+    ----------
+    pending: int
+        Batches waiting in the queue.
+    delivered: int
+        Batches taken by the consumer.
+    dropped: int
+        Batches discarded under ``DROP_OLDEST`` or from the ``BLOCK``
+        backlog.
+    conflated: int
+        Batches merged into others under ``CONFLATE``.
+    lag: float
+        Seconds the oldest queued batch has been waiting, 0 if none.
+    last_lag: float
+        Seconds the last delivered batch had been waiting.
+    blocked: float
+        Total seconds publishers waited for this consumer under ``BLOCK``.
+    backlog: int
+        Batches of an attached store waiting for room under ``BLOCK``.
+    """
+
+    pending: int
+    delivered: int
+    dropped: int
+    conflated: int
+    lag: float
+    last_lag: float
+    blocked: float
+    backlog: int
+
+
+class Consumer:
+    """Bounded queue of update batches for one consumer.
+
+    Read with ``await consumer.get()`` or ``async for timestamp, updates in
+    consumer``; once the consumer is closed and its queue is empty, both
+    raise StopAsyncIteration. Create consumers with
+    :meth:`FanOut.add_consumer`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        policy: str = DROP_OLDEST,
+        indexes: Optional[FrozenSet[int]] = None,
+        max_backlog: int = 1024,
+    ):
+        if policy not in (DROP_OLDEST, CONFLATE, BLOCK):
+            raise ValueError(f"Unknown overflow policy {policy}")
+        if maxsize < 1:
+            raise ValueError("Consumer queues need room for at least one batch")
+        self.name = name
+        self.maxsize = maxsize
+        self.policy = policy
+        self.indexes = indexes
+        self.max_backlog = max_backlog
+        self._queue: Deque[Tuple[float, float, Dict[int, Any]]] = deque()
+        self._backlog: Deque[Tuple[float, float, Dict[int, Any]]] = deque()
+        self._readable = asyncio.Event()
+        self._writable = asyncio.Event()
+        self._writable.set()
+        self.closed = False
+        self._delivered = self._dropped = self._conflated = 0
+        self._last_lag = self._blocked = 0.0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @property
+    def stats(self) -> ConsumerStats:
+        oldest = self._queue or self._backlog
+        lag = time.monotonic() - oldest[0][0] if oldest else 0.0
+        return ConsumerStats(
+            len(self._queue),
+            self._delivered,
+            self._dropped,
+            self._conflated,
+            lag,
+            self._last_lag,
+            self._blocked,
+            len(self._backlog),
+        )
+
+    def _select(self, updates: Mapping[int, Any]) -> Optional[Dict[int, Any]]:
+        """The part of ``updates`` this consumer watches, None if empty."""
+        if self.indexes is None:
+            return dict(updates)
+        batch = {index: value for index, value in updates.items() if index in self.indexes}
+        return batch or None
+
+    def _offer(self, timestamp: float, updates: Dict[int, Any]) -> bool:
+        """Queue a batch unless that has to wait; return whether it was queued."""
+        queue = self._queue
+        if len(queue) >= self.maxsize:
+            if self.policy == BLOCK:
+                return False
+            if self.policy == DROP_OLDEST:
+                queue.popleft()
+                self._dropped += 1
+            else:
+                enqueued, _, merged = queue.popleft()
+                while queue:
+                    merged.update(queue.popleft()[2])
+                    self._conflated += 1
+                merged.update(updates)
+                self._conflated += 1
+                queue.append((enqueued, timestamp, merged))
+                return True
+        queue.append((time.monotonic(), timestamp, updates))
+        self._readable.set()
+        return True
+
+    def put_nowait(self, timestamp: float, updates: Mapping[int, Any]):
+        """Queue a batch without waiting; under ``BLOCK``, in the backlog if full."""
+        batch = self._select(updates)
+        if batch is None or self.closed:
+            return
+        if not self._backlog and self._offer(timestamp, batch):
+            return
+        if len(self._backlog) >= self.max_backlog:
+            self._backlog.popleft()
+            self._dropped += 1
+        self._backlog.append((time.monotonic(), timestamp, batch))
+
+    async def put(self, timestamp: float, updates: Mapping[int, Any]):
+        """Queue a batch, waiting for room under ``BLOCK``."""
+        batch = self._select(updates)
+        if batch is None:
+            return
+        while not self.closed and (self._backlog or not self._offer(timestamp, batch)):
+            self._writable.clear()
+            started = time.monotonic()
+            await self._writable.wait()
+            self._blocked += time.monotonic() - started
+
+    def close(self):
+        """Stop accepting batches; wake publishers waiting on and readers of this consumer.
+
+        Batches already queued can still be read; backlog batches are discarded.
+        """
+        self.closed = True
+        self._dropped += len(self._backlog)
+        self._backlog.clear()
+        self._writable.set()
+        self._readable.set()
+
+    def get_nowait(self) -> Batch:
+        """Take the oldest batch; raise an IndexError if there is none."""
+        queue = self._queue
+        enqueued, timestamp, updates = queue.popleft()
+        while self._backlog and len(queue) < self.maxsize:
+            queue.append(self._backlog.popleft())
+        if not queue and not self.closed:
+            self._readable.clear()
+        self._writable.set()
+        self._delivered += 1
+        self._last_lag = time.monotonic() - enqueued
+        return timestamp, updates
+
+    async def get(self) -> Batch:
+        """Take the oldest batch, waiting for one if the queue is empty."""
+        while not self._queue:
+            if self.closed:
+                raise StopAsyncIteration
+            await self._readable.wait()
+        return self.get_nowait()
+
+    def __aiter__(self) -> "Consumer":
+        return self
+
+    async def __anext__(self) -> Batch:
+        return await self.get()
+
+
+class FanOut:
+    """Publishes update batches to any number of consumers.
+
+    Parameters
+    ----------
+    schema: Schema
+        Schema the updates are indexed by.
+    """
+
+    def __init__(self, schema: Schema):
+        self.schema = schema
+        self.consumers: List[Consumer] = []
+        self._store: Optional[VersionedStore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def add_consumer(
+        self,
+        name: str,
+        maxsize: int = 1024,
+        policy: str = DROP_OLDEST,
+        targets: Optional[Iterable[Target]] = None,
+        max_backlog: int = 1024,
+    ) -> Consumer:
+        """Add a consumer of the updates of ``targets``, all datapoints if omitted."""
+        indexes = None
+        if targets is not None:
+            indexes = frozenset(self.schema.index_of(target) for target in targets)
+        consumer = Consumer(name, maxsize, policy, indexes, max_backlog)
+        self.consumers.append(consumer)
+        return consumer
+
+    def remove_consumer(self, consumer: Consumer):
+        self.consumers.remove(consumer)
+        consumer.close()
+
+    def stats(self) -> Dict[str, ConsumerStats]:
+        """Queue metrics by consumer name."""
+        return {consumer.name: consumer.stats for consumer in self.consumers}
+
+    async def publish(self, timestamp: float, updates: Mapping[int, Any]):
+        """Queue a batch for every consumer; waits only on full ``BLOCK`` consumers.
+
+        Consumers that never wait get the batch first, so a full ``BLOCK``
+        consumer delays neither them nor the other ``BLOCK`` consumers.
+        """
+        blocking = []
+        for consumer in tuple(self.consumers):
+            if consumer.policy == BLOCK:
+                blocking.append(consumer.put(timestamp, updates))
+            else:
+                consumer.put_nowait(timestamp, updates)
+        if blocking:
+            await asyncio.gather(*blocking)
+
+    def publish_nowait(self, timestamp: float, updates: Mapping[int, Any]):
+        """Queue a batch for every consumer, into the backlog of full ``BLOCK`` ones."""
+        for consumer in tuple(self.consumers):
+            consumer.put_nowait(timestamp, updates)
+
+    def attach(self, store: VersionedStore):
+        """Publish every commit of ``store``.
+
+        Must be called from the event loop the consumers run on. Commits
+        from any thread are handed to that loop and published in order
+        with :meth:`publish_nowait`, so they never wait for a consumer.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._store = store
+        store.add_listener(self._on_commit)
+
+    def _on_commit(self, snapshot: Snapshot, changed: Tuple[int, ...]):
+        updates = dict(zip(changed, snapshot.gather(changed)))
+        self._loop.call_soon_threadsafe(self.publish_nowait, snapshot.timestamp, updates)
+
+    async def close(self):
+        """Stop publishing the commits of the attached store."""
+        if self._store is not None:
+            self._store.remove_listener(self._on_commit)
+            self._store = None
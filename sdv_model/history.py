@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+"""Per-datapoint recording of timestamped values."""
+
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from sdv_model.schema import DataPointSpec, Target
+from sdv_model.snapshot import Snapshot, VersionedStore
+
+# array.array typecodes by VSS datatype; other datatypes are kept in lists.
+TYPECODES = {
+    "boolean": "B",
+    "int8": "b",
+    "int16": "h",
+    "int32": "i",
+    "int64": "q",
+    "uint8": "B",
+    "uint16": "H",
+    "uint32": "I",
+    "uint64": "Q",
+    "float": "f",
+    "double": "d",
+}
+
+
+class SignalHistory:
+    """Append-only timestamps and values of a single datapoint.
+
+    Scalar numeric and boolean values are stored in an :class:`array.array`
+    of the declared width, so the buffers can be shared with NumPy without
+    copying. Strings and arrays are kept in a plain list.
+    """
+
+    def __init__(self, spec: DataPointSpec):
+        self.spec = spec
+        self.typecode: Optional[str] = TYPECODES.get(spec.datatype)
+        self.timestamps = array("d")
+        self.values: Union[array, List[Any]] = (
+            array(self.typecode) if self.typecode else []
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __iter__(self) -> Iterator[Tuple[float, Any]]:
+        return zip(self.timestamps, self.values)
+
+    @property
+    def numeric(self) -> bool:
+        return self.typecode is not None
+
+    @property
+    def last_timestamp(self) -> Optional[float]:
+        return self.timestamps[-1] if self.timestamps else None
+
+    def append(self, timestamp: float, value: Any):
+        self.timestamps.append(timestamp)
+        self.values.append(value)
+
+    def extend(self, timestamps, values):
+        """Append many samples, e.g. NumPy arrays, without per-sample objects."""
+        if hasattr(timestamps, "tobytes") and self.numeric and hasattr(values, "tobytes"):
+            self.timestamps.frombytes(_as_bytes(timestamps, "d"))
+            self.values.frombytes(_as_bytes(values, self.typecode))
+        else:
+            self.timestamps.extend(timestamps)
+            self.values.extend(values)
+
+
+def _as_bytes(data, typecode: str) -> bytes:
+    """Return ``data`` as raw bytes of the array typecode ``typecode``."""
+    if isinstance(data, array):
+        return data.tobytes() if data.typecode == typecode else array(typecode, data).tobytes()
+    return data.astype(typecode, copy=False).tobytes()
+
+
+class HistoryRecorder:
+    """Records the values committed to a store into per-signal histories.
+
+    Parameters
+    ----------
+    store: VersionedStore
+        Store to record from.
+    targets: Optional[Iterable[Target]]
+        Datapoints to record; all datapoints if omitted.
+    """
+
+    def __init__(self, store: VersionedStore, targets: Optional[Iterable[Target]] = None):
+        self.store = store
+        schema = store.schema
+        indexes = range(len(schema)) if targets is None else map(schema.index_of, targets)
+        self._histories: Dict[int, SignalHistory] = {
+            index: SignalHistory(schema.specs[index]) for index in indexes
+        }
+        store.add_listener(self._on_commit)
+
+    def close(self):
+        self.store.remove_listener(self._on_commit)
+
+    def __getitem__(self, target: Target) -> SignalHistory:
+        return self._histories[self.store.schema.index_of(target)]
+
+    def __contains__(self, target: Target) -> bool:
+        return self.store.schema.index_of(target) in self._histories
+
+    @property
+    def histories(self) -> Dict[str, SignalHistory]:
+        """Recorded histories keyed by path."""
+        return {history.spec.path: history for history in self._histories.values()}
+
+    def _on_commit(self, snapshot: Snapshot, changed: Tuple[int, ...]):
+        histories = self._histories
+        for index in changed:
+            history = histories.get(index)
+            if history is not None:
+                value = snapshot.value_at(index)
+                if value is not None:
+                    history.append(snapshot.timestamp, value)
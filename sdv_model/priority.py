@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+
+"""Priority classes of datapoints and a scheduler that honours them.
+
+Every datapoint belongs to a :class:`Priority` class, by default derived
+from its branch: ``ADAS``, ``Chassis.Brake``, brake and hazard lights are
+safety-relevant, the rest of ``Chassis`` and ``Powertrain`` drive vehicle
+control, infotainment and connectivity come last. A
+:class:`PriorityScheduler` queues update batches per class and always
+processes the highest class with pending work first, so a burst of media
+metadata cannot delay a brake update behind it.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from collections import deque
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from sdv_model.aggregate import QuantileSketch
+from sdv_model.schema import Schema, Target
+from sdv_model.snapshot import Snapshot, VersionedStore
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Priority classes; lower values are processed first."""
+
+    SAFETY = 0
+    CONTROL = 1
+    COMFORT = 2
+    INFOTAINMENT = 3
+    BACKGROUND = 4
+
+
+# Default class by path prefix; the longest matching prefix wins.
+DEFAULT_PRIORITIES: Dict[str, Priority] = {
+    "Vehicle": Priority.COMFORT,
+    "Vehicle.ADAS": Priority.SAFETY,
+    "Vehicle.Chassis.Brake": Priority.SAFETY,
+    "Vehicle.Body.Lights.Brake": Priority.SAFETY,
+    "Vehicle.Body.Lights.Hazard": Priority.SAFETY,
+    "Vehicle.Speed": Priority.CONTROL,
+    "Vehicle.Acceleration": Priority.CONTROL,
+    "Vehicle.AngularVelocity": Priority.CONTROL,
+    "Vehicle.Chassis": Priority.CONTROL,
+    "Vehicle.Powertrain": Priority.CONTROL,
+    "Vehicle.Cabin.Infotainment": Priority.INFOTAINMENT,
+    "Vehicle.Connectivity": Priority.INFOTAINMENT,
+    "Vehicle.OBD": Priority.BACKGROUND,
+    "Vehicle.Service": Priority.BACKGROUND,
+    "Vehicle.VehicleIdentification": Priority.BACKGROUND,
+    "Vehicle.VersionVSS": Priority.BACKGROUND,
+}
+
+
+class PriorityMap:
+    """Priority class of every datapoint of a schema.
+
+    Parameters
+    ----------
+    schema: Schema
+        Schema to classify.
+    defaults: Mapping[str, Priority]
+        Class by path prefix; the longest prefix matching a path on a
+        branch boundary wins. Unmatched datapoints are ``COMFORT``.
+    """
+
+    def __init__(self, schema: Schema, defaults: Mapping[str, Priority] = DEFAULT_PRIORITIES):
+        self.schema = schema
+        prefixes = sorted(defaults, key=len, reverse=True)
+        self.classes: List[Priority] = []
+        for spec in schema:
+            for prefix in prefixes:
+                if spec.path == prefix or spec.path.startswith(prefix + "."):
+                    self.classes.append(Priority(defaults[prefix]))
+                    break
+            else:
+                self.classes.append(Priority.COMFORT)
+
+    def __getitem__(self, target: Target) -> Priority:
+        return self.classes[self.schema.index_of(target)]
+
+    def set(self, pattern: Target, priority: Priority) -> Tuple[int, ...]:
+        """Override the class of every datapoint matching ``pattern``."""
+        indexes = self.schema.match(pattern)
+        if not indexes:
+            raise KeyError(f"No datapoint matches {pattern}")
+        priority = Priority(priority)
+        for index in indexes:
+            self.classes[index] = priority
+        return tuple(indexes)
+
+    def split(self, updates: Mapping[int, Any]) -> Dict[Priority, Dict[int, Any]]:
+        """Split an update batch by class."""
+        classes = self.classes
+        parts: Dict[Priority, Dict[int, Any]] = {}
+        for index, value in updates.items():
+            part = parts.get(classes[index])
+            if part is None:
+                part = parts[classes[index]] = {}
+            part[index] = value
+        return parts
+
+
+class ClassStats(NamedTuple):
+    """Queueing metrics of one priority class.
+
+    Latencies are the seconds from submission until a batch is handed to
+    the handler, None before the first batch.
+
+    Attributes
+    ----------
+    pending: int
+        Batches waiting.
+    processed: int
+        Batches handed to the handler.
+    dropped: int
+        Batches discarded because the queue was full.
+    p50: Optional[float]
+        Median latency.
+    p99: Optional[float]
+        99th percentile latency.
+    max: float
+        Largest latency seen.
+    """
+
+    pending: int
+    processed: int
+    dropped: int
+    p50: Optional[float]
+    p99: Optional[float]
+    max: float
+
+
+# Called with the timestamp and the values of one class's part of a batch.
+BatchHandler = Callable[[Optional[float], Dict[int, Any]], Any]
+
+
+class PriorityScheduler:
+    """Processes update batches strictly by priority class.
+
+    Batches are split by class on :meth:`submit`, which may be called from
+    any thread. :meth:`drain` processes queued batches, re-checking the
+    higher classes after each one; :meth:`run` does the same on an event
+    loop and yields between batches so new arrivals are seen.
+
+    Parameters
+    ----------
+    priorities: PriorityMap
+        Classes of the datapoints.
+    handler: BatchHandler
+        Called with every batch part; coroutines are awaited by :meth:`run`
+        and scheduled as tasks by :meth:`drain`. Exceptions it raises are
+        logged and the next batch is processed.
+    max_pending: Optional[Mapping[Priority, int]]
+        Queue bound per class; when full, the oldest batch is dropped.
+        Unbounded for classes not listed.
+    """
+
+    def __init__(
+        self,
+        priorities: PriorityMap,
+        handler: BatchHandler,
+        max_pending: Optional[Mapping[Priority, int]] = None,
+    ):
+        self.priorities = priorities
+        self.handler = handler
+        self._limits = dict(max_pending or {})
+        self._queues: Tuple[Deque[Tuple[float, Optional[float], Dict[int, Any]]], ...] = tuple(
+            deque() for _ in Priority
+        )
+        self._latency = tuple(QuantileSketch() for _ in Priority)
+        self._max = [0.0] * len(Priority)
+        self._processed = [0] * len(Priority)
+        self._dropped = [0] * len(Priority)
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._store: Optional[VersionedStore] = None
+
+    def submit(self, updates: Mapping[int, Any], timestamp: Optional[float] = None):
+        """Queue an update batch keyed by schema index."""
+        enqueued = time.monotonic()
+        with self._lock:
+            for priority, part in self.priorities.split(updates).items():
+                queue = self._queues[priority]
+                limit = self._limits.get(priority)
+                if limit is not None and len(queue) >= limit:
+                    queue.popleft()
+                    self._dropped[priority] += 1
+                queue.append((enqueued, timestamp, part))
+        # run() may end concurrently and reset these; setting a stale event is harmless.
+        wakeup, loop = self._wakeup, self._loop
+        if wakeup is not None:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                pass  # The loop has been closed since.
+
+    def _next(self) -> Optional[Tuple[Priority, Optional[float], Dict[int, Any]]]:
+        with self._lock:
+            for priority, queue in zip(Priority, self._queues):
+                if queue:
+                    enqueued, timestamp, updates = queue.popleft()
+                    break
+            else:
+                return None
+            latency = time.monotonic() - enqueued
+            self._latency[priority].add(latency)
+            self._max[priority] = max(self._max[priority], latency)
+            self._processed[priority] += 1
+        return priority, timestamp, updates
+
+    def pending(self) -> int:
+        with self._lock:
+            return sum(len(queue) for queue in self._queues)
+
+    def drain(self, max_batches: Optional[int] = None) -> int:
+        """Process queued batches, highest class first; return how many."""
+        done = 0
+        while max_batches is None or done < max_batches:
+            entry = self._next()
+            if entry is None:
+                break
+            try:
+                outcome = self.handler(entry[1], entry[2])
+                if inspect.isawaitable(outcome):
+                    asyncio.ensure_future(outcome)
+            except Exception:  # pylint: disable=W0703
+                logger.exception(
+                    "Priority handler %r failed on %s batch", self.handler, entry[0].name
+                )
+            done += 1
+        return done
+
+    async def run(self):
+        """Process batches as they are submitted until cancelled."""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        try:
+            while True:
+                self._wakeup.clear()
+                entry = self._next()
+                if entry is None:
+                    await self._wakeup.wait()
+                    continue
+                try:
+                    outcome = self.handler(entry[1], entry[2])
+                    if inspect.isawaitable(outcome):
+                        await outcome
+                except Exception:  # pylint: disable=W0703
+                    logger.exception(
+                        "Priority handler %r failed on %s batch", self.handler, entry[0].name
+                    )
+                await asyncio.sleep(0)
+        finally:
+            self._wakeup = None
+
+    def stats(self) -> Dict[Priority, ClassStats]:
+        """Queueing metrics by class."""
+        with self._lock:
+            return {
+                priority: ClassStats(
+                    len(self._queues[priority]),
+                    self._processed[priority],
+                    self._dropped[priority],
+                    self._latency[priority].quantile(0.5),
+                    self._latency[priority].quantile(0.99),
+                    self._max[priority],
+                )
+                for priority in Priority
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            for sketch in self._latency:
+                sketch.clear()
+            self._max = [0.0] * len(Priority)
+            self._processed = [0] * len(Priority)
+            self._dropped = [0] * len(Priority)
+
+    def attach(self, store: VersionedStore):
+        """Submit every commit of ``store``."""
+        self._store = store
+        store.add_listener(self._on_commit)
+
+    def _on_commit(self, snapshot: Snapshot, changed: Tuple[int, ...]):
+        self.submit(dict(zip(changed, snapshot.gather(changed))), snapshot.timestamp)
+
+    def close(self):
+        if self._store is not None:
+            self._store.remove_listener(self._on_commit)
+            self._store = None
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# source: vehicle.proto
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\rvehicle.proto\x12\x14sdv.model.vehicle.v1\"\xb4\xfb\x04\n\x0fVehicleSnapshot\x12\x11\n\ttimestamp\x18\x01 \x01(\x01\x12\x1e\n\x12schema_fingerprint\x18\xff\xff\xff\xff\x01 \x01(\x06\x12\x1d\n\x10VersionVSS_Major\x18\x02 \x01(\rH\x00\x88\x01\x01\x12\x1d\n\x10VersionVSS_Minor\x18\x03 \x01(\rH\x01\x88\x01\x01\x12\x1d\n\x10VersionVSS_Patch\x18\x04 \x01(\rH\x02\x88\x01\x01\x12\x1d\n\x10VersionVSS_Label\x18\x05 \x01(\tH\x03\x88\x01\x01\x12&\n\x19VehicleIdentification_VIN\x18\x06 \x01(\tH\x04\x88\x01\x01\x12&\n\x19VehicleIdentification_WMI\x18\x07 \x01(\tH\x05\x88\x01\x01\x12(\n\x1bVehicleIdentification_Brand\x18\x08 \x01(\tH\x06\x88\x01\x01\x12(\n\x1bVehicleIdentification_Model\x18\t \x01(\tH\x07\x88\x01\x01\x12\'\n\x1aVehicleIdentification_Year\x18\n \x01(\rH\x08\x88\x01\x01\x12-\n VehicleIdentification_AcrissCode\x18\x0b \x01(\tH\t\x88\x01\x01\x12+\n\x1eVehicleIdentification_BodyType\x18\x0c \x01(\tH\n\x88\x01\x01\x12=\n0VehicleIdentification_DateVehicleFirstRegistered\x18\r \x01(\tH\x0b\x88\x01\x01\x12\x38\n+VehicleIdentification_MeetsEmissionStandard\x18\x0e \x01(\tH\x0c\x88\x01\x01\x12\x31\n$VehicleIdentification_ProductionDate\x18\x0f \x01(\tH\r\x88\x01\x01\x12/\n\"VehicleIdentification_PurchaseDate\x18\x10 \x01(\tH\x0e\x88\x01\x01\x12\x33\n&VehicleIdentification_VehicleModelDate\x18\x11 \x01(\tH\x0f\x88\x01\x01\x12\x37\n*VehicleIdentification_VehicleConfiguration\x18\x12 \x01(\tH\x10\x88\x01\x01\x12\x39\n,VehicleIdentification_VehicleSeatingCapacity\x18\x13 \x01(\rH\x11\x88\x01\x01\x12\x36\n)VehicleIdentification_VehicleSpecialUsage\x18\x14 \x01(\tH\x12\x88\x01\x01\x12\x37\n*VehicleIdentification_VehicleInteriorColor\x18\x15 \x01(\tH\x13\x88\x01\x01\x12\x36\n)VehicleIdentification_VehicleInteriorType\x18\x16 \x01(\tH\x14\x88\x01\x01\x12\x36\n)VehicleIdentification_KnownVehicleDamages\x18\x17 \x01(\tH\x15\x88\x01\x01\x12,\n$VehicleIdentification_OptionalExtras\x18\x18 \x03(\t\x12\"\n\x15LowVoltageSystemState\x18\x19 \x01(\tH\x16\x88\x01\x01\x12-\n LowVoltageBattery_NominalVoltage\x18\x1a \x01(\rH\x17\x88\x01\x01\x12.\n!LowVoltageBattery_NominalCapacity\x18\x1b \x01(\rH\x18\x88\x01\x01\x12-\n LowVoltageBattery_CurrentVoltage\x18\x1c \x01(\x02H\x19\x88\x01\x01\x12-\n LowVoltageBattery_CurrentCurrent\x18\x1d \x01(\x02H\x1a\x88\x01\x01\x12\x12\n\x05Speed\x18\x1e \x01(\x02H\x1b\x88\x01\x01\x12\x1e\n\x11TravelledDistance\x18\x1f \x01(\x02H\x1c\x88\x01\x01\x12\x1d\n\x10TraveledDistance\x18  \x01(\x02H\x1d\x88\x01\x01\x12\'\n\x1aTraveledDistanceSinceStart\x18! \x01(\x02H\x1e\x88\x01\x01\x12\x16\n\tStartTime\x18\" \x01(\tH\x1f\x88\x01\x01\x12\x19\n\x0cTripDuration\x18# \x01(\x02H \x88\x01\x01\x12\x1d\n\x10TripMeterReading\x18$ \x01(\x02H!\x88\x01\x01\x12\x19\n\x0cIsBrokenDown\x18% \x01(\x08H\"\x88\x01\x01\x12\x15\n\x08IsMoving\x18& \x01(\x08H#\x88\x01\x01\x12\x19\n\x0c\x41verageSpeed\x18\' \x01(\x02H$\x88\x01\x01\x12&\n\x19\x41\x63\x63\x65leration_Longitudinal\x18( \x01(\x02H%\x88\x01\x01\x12!\n\x14\x41\x63\x63\x65leration_Lateral\x18) \x01(\x02H&\x88\x01\x01\x12\"\n\x15\x41\x63\x63\x65leration_Vertical\x18* \x01(\x02H\'\x88\x01\x01\x12!\n\x14\x41ngularVelocity_Roll\x18+ \x01(\x02H(\x88\x01\x01\x12\"\n\x15\x41ngularVelocity_Pitch\x18, \x01(\x02H)\x88\x01\x01\x12 \n\x13\x41ngularVelocity_Yaw\x18- \x01(\x02H*\x88\x01\x01\x12\x15\n\x08RoofLoad\x18. \x01(\x11H+\x88\x01\x01\x12\x18\n\x0b\x43\x61rgoVolume\x18/ \x01(\x02H,\x88\x01\x01\x12\x19\n\x0c\x45missionsCO2\x18\x30 \x01(\x11H-\x88\x01\x01\x12!\n\x14\x43urrentOverallWeight\x18\x31 \x01(\rH.\x88\x01\x01\x12\x17\n\nCurbWeight\x18\x32 \x01(\rH/\x88\x01\x01\x12\x18\n\x0bGrossWeight\x18\x33 \x01(\rH0\x88\x01\x01\x12\x19\n\x0cMaxTowWeight\x18\x34 \x01(\rH1\x88\x01\x01\x12\x1d\n\x10MaxTowBallWeight\x18\x35 \x01(\rH2\x88\x01\x01\x12\x13\n\x06Length\x18\x36 \x01(\rH3\x88\x01\x01\x12\x13\n\x06Height\x18\x37 \x01(\rH4\x88\x01\x01\x12\x12\n\x05Width\x18\x38 \x01(\rH5\x88\x01\x01\x12 \n\x13Trailer_IsConnected\x18\x39 \x01(\x08H6\x88\x01\x01\x12&\n\x19\x43urrentLocation_Timestamp\x18: \x01(\tH7\x88\x01\x01\x12%\n\x18\x43urrentLocation_Latitude\x18; \x01(\x01H8\x88\x01\x01\x12&\n\x19\x43urrentLocation_Longitude\x18< \x01(\x01H9\x88\x01\x01\x12$\n\x17\x43urrentLocation_Heading\x18= \x01(\x01H:\x88\x01\x01\x12/\n\"CurrentLocation_HorizontalAccuracy\x18> \x01(\x01H;\x88\x01\x01\x12%\n\x18\x43urrentLocation_Altitude\x18? \x01(\x01H<\x88\x01\x01\x12-\n CurrentLocation_VerticalAccuracy\x18@ \x01(\x01H=\x88\x01\x01\x12\x31\n$CurrentLocation_GNSSReceiver_FixType\x18\x41 \x01(\tH>\x88\x01\x01\x12<\n/CurrentLocation_GNSSReceiver_MountingPosition_X\x18\x42 \x01(\x11H?\x88\x01\x01\x12<\n/CurrentLocation_GNSSReceiver_MountingPosition_Y\x18\x43 \x01(\x11H@\x88\x01\x01\x12<\n/CurrentLocation_GNSSReceiver_MountingPosition_Z\x18\x44 \x01(\x11HA\x88\x01\x01\x12\x1f\n\x12PowerOptimizeLevel\x18\x45 \x01(\rHB\x88\x01\x01\x12\x30\n#Powertrain_AccumulatedBrakingEnergy\x18\x46 \x01(\x02HC\x88\x01\x01\x12\x1d\n\x10Powertrain_Range\x18G \x01(\rHD\x88\x01\x01\x12\x1c\n\x0fPowertrain_Type\x18H \x01(\tHE\x88\x01\x01\x12*\n\x1dPowertrain_PowerOptimizeLevel\x18I \x01(\rHF\x88\x01\x01\x12\x33\n&Powertrain_CombustionEngine_EngineCode\x18J \x01(\tHG\x88\x01\x01\x12\x35\n(Powertrain_CombustionEngine_Displacement\x18K \x01(\rHH\x88\x01\x01\x12\x35\n(Powertrain_CombustionEngine_StrokeLength\x18L \x01(\x02HI\x88\x01\x01\x12-\n Powertrain_CombustionEngine_Bore\x18M \x01(\x02HJ\x88\x01\x01\x12\x36\n)Powertrain_CombustionEngine_Configuration\x18N \x01(\tHK\x88\x01\x01\x12:\n-Powertrain_CombustionEngine_NumberOfCylinders\x18O \x01(\rHL\x88\x01\x01\x12\x42\n5Powertrain_CombustionEngine_NumberOfValvesPerCylinder\x18P \x01(\rHM\x88\x01\x01\x12\x39\n,Powertrain_CombustionEngine_CompressionRatio\x18Q \x01(\tHN\x88\x01\x01\x12:\n-Powertrain_CombustionEngine_EngineOilCapacity\x18R \x01(\x02HO\x88\x01\x01\x12>\n1Powertrain_CombustionEngine_EngineCoolantCapacity\x18S \x01(\x02HP\x88\x01\x01\x12\x31\n$Powertrain_CombustionEngine_MaxPower\x18T \x01(\rHQ\x88\x01\x01\x12\x32\n%Powertrain_CombustionEngine_MaxTorque\x18U \x01(\rHR\x88\x01\x01\x12\x37\n*Powertrain_CombustionEngine_AspirationType\x18V \x01(\tHS\x88\x01\x01\x12\x37\n*Powertrain_CombustionEngine_EngineOilLevel\x18W \x01(\tHT\x88\x01\x01\x12\x39\n,Powertrain_CombustionEngine_OilLifeRemaining\x18X \x01(\x11HU\x88\x01\x01\x12\x32\n%Powertrain_CombustionEngine_IsRunning\x18Y \x01(\x08HV\x88\x01\x01\x12.\n!Powertrain_CombustionEngine_Speed\x18Z \x01(\rHW\x88\x01\x01\x12\x34\n\'Powertrain_CombustionEngine_EngineHours\x18[ \x01(\x02HX\x88\x01\x01\x12\x32\n%Powertrain_CombustionEngine_IdleHours\x18\\ \x01(\x02HY\x88\x01\x01\x12,\n\x1fPowertrain_CombustionEngine_ECT\x18] \x01(\x11HZ\x88\x01\x01\x12,\n\x1fPowertrain_CombustionEngine_EOT\x18^ \x01(\x11H[\x88\x01\x01\x12,\n\x1fPowertrain_CombustionEngine_MAP\x18_ \x01(\rH\\\x88\x01\x01\x12,\n\x1fPowertrain_CombustionEngine_MAF\x18` \x01(\rH]\x88\x01\x01\x12,\n\x1fPowertrain_CombustionEngine_TPS\x18\x61 \x01(\rH^\x88\x01\x01\x12,\n\x1fPowertrain_CombustionEngine_EOP\x18\x62 \x01(\rH_\x88\x01\x01\x12.\n!Powertrain_CombustionEngine_Power\x18\x63 \x01(\rH`\x88\x01\x01\x12/\n\"Powertrain_CombustionEngine_Torque\x18\x64 \x01(\rHa\x88\x01\x01\x12\x44\n7Powertrain_CombustionEngine_DieselExhaustFluid_Capacity\x18\x65 \x01(\x02Hb\x88\x01\x01\x12\x41\n4Powertrain_CombustionEngine_DieselExhaustFluid_Level\x18\x66 \x01(\rHc\x88\x01\x01\x12\x41\n4Powertrain_CombustionEngine_DieselExhaustFluid_Range\x18g \x01(\rHd\x88\x01\x01\x12\x46\n9Powertrain_CombustionEngine_DieselExhaustFluid_IsLevelLow\x18h \x01(\x08He\x88\x01\x01\x12Q\nDPowertrain_CombustionEngine_DieselParticulateFilter_InletTemperature\x18i \x01(\x02Hf\x88\x01\x01\x12R\nEPowertrain_CombustionEngine_DieselParticulateFilter_OutletTemperature\x18j \x01(\x02Hg\x88\x01\x01\x12N\nAPowertrain_CombustionEngine_DieselParticulateFilter_DeltaPressure\x18k \x01(\x02Hh\x88\x01\x01\x12)\n\x1cPowertrain_Transmission_Type\x18l \x01(\tHi\x88\x01\x01\x12.\n!Powertrain_Transmission_GearCount\x18m \x01(\x11Hj\x88\x01\x01\x12.\n!Powertrain_Transmission_DriveType\x18n \x01(\tHk\x88\x01\x01\x12\x36\n)Powertrain_Transmission_TravelledDistance\x18o \x01(\x02Hl\x88\x01\x01\x12\x30\n#Powertrain_Transmission_CurrentGear\x18p \x01(\x11Hm\x88\x01\x01\x12\x31\n$Powertrain_Transmission_SelectedGear\x18q \x01(\x11Hn\x88\x01\x01\x12\x36\n)Powertrain_Transmission_IsParkLockEngaged\x18r \x01(\x08Ho\x88\x01\x01\x12\x36\n)Powertrain_Transmission_IsLowRangeEngaged\x18s \x01(\x08Hp\x88\x01\x01\x12\x42\n5Powertrain_Transmission_IsElectricalPowertrainEngaged\x18t \x01(\x08Hq\x88\x01\x01\x12\x34\n\'Powertrain_Transmission_PerformanceMode\x18u \x01(\tHr\x88\x01\x01\x12\x33\n&Powertrain_Transmission_GearChangeMode\x18v \x01(\tHs\x88\x01\x01\x12\x30\n#Powertrain_Transmission_Temperature\x18w \x01(\x11Ht\x88\x01\x01\x12\x35\n(Powertrain_Transmission_ClutchEngagement\x18x \x01(\x02Hu\x88\x01\x01\x12/\n\"Powertrain_Transmission_ClutchWear\x18y \x01(\rHv\x88\x01\x01\x12<\n/Powertrain_Transmission_DiffLockFrontEngagement\x18z \x01(\x02Hw\x88\x01\x01\x12;\n.Powertrain_Transmission_DiffLockRearEngagement\x18{ \x01(\x02Hx\x88\x01\x01\x12\x37\n*Powertrain_Transmission_TorqueDistribution\x18| \x01(\x02Hy\x88\x01\x01\x12\x30\n#Powertrain_ElectricMotor_EngineCode\x18} \x01(\tHz\x88\x01\x01\x12.\n!Powertrain_ElectricMotor_MaxPower\x18~ \x01(\rH{\x88\x01\x01\x12/\n\"Powertrain_ElectricMotor_MaxTorque\x18\x7f \x01(\rH|\x88\x01\x01\x12\x34\n&Powertrain_ElectricMotor_MaxRegenPower\x18\x80\x01 \x01(\rH}\x88\x01\x01\x12\x35\n\'Powertrain_ElectricMotor_MaxRegenTorque\x18\x81\x01 \x01(\rH~\x88\x01\x01\x12,\n\x1ePowertrain_ElectricMotor_Speed\x18\x82\x01 \x01(\x11H\x7f\x88\x01\x01\x12\x33\n$Powertrain_ElectricMotor_Temperature\x18\x83\x01 \x01(\x11H\x80\x01\x88\x01\x01\x12:\n+Powertrain_ElectricMotor_CoolantTemperature\x18\x84\x01 \x01(\x11H\x81\x01\x88\x01\x01\x12-\n\x1ePowertrain_ElectricMotor_Power\x18\x85\x01 \x01(\x11H\x82\x01\x88\x01\x01\x12.\n\x1fPowertrain_ElectricMotor_Torque\x18\x86\x01 \x01(\x11H\x83\x01\x88\x01\x01\x12,\n\x1dPowertrain_TractionBattery_Id\x18\x87\x01 \x01(\tH\x84\x01\x88\x01\x01\x12\x38\n)Powertrain_TractionBattery_ProductionDate\x18\x88\x01 \x01(\tH\x85\x01\x88\x01\x01\x12:\n+Powertrain_TractionBattery_IsPowerConnected\x18\x89\x01 \x01(\x08H\x86\x01\x88\x01\x01\x12;\n,Powertrain_TractionBattery_IsGroundConnected\x18\x8a\x01 \x01(\x08H\x87\x01\x88\x01\x01\x12=\n.Powertrain_TractionBattery_Temperature_Average\x18\x8b\x01 \x01(\x02H\x88\x01\x88\x01\x01\x12\x39\n*Powertrain_TractionBattery_Temperature_Min\x18\x8c\x01 \x01(\x02H\x89\x01\x88\x01\x01\x12\x39\n*Powertrain_TractionBattery_Temperature_Max\x18\x8d\x01 \x01(\x02H\x8a\x01\x88\x01\x01\x12\x37\n(Powertrain_TractionBattery_GrossCapacity\x18\x8e\x01 \x01(\rH\x8b\x01\x88\x01\x01\x12\x35\n&Powertrain_TractionBattery_NetCapacity\x18\x8f\x01 \x01(\rH\x8c\x01\x88\x01\x01\x12\x37\n(Powertrain_TractionBattery_StateOfHealth\x18\x90\x01 \x01(\x02H\x8d\x01\x88\x01\x01\x12?\n0Powertrain_TractionBattery_StateOfCharge_Current\x18\x91\x01 \x01(\x02H\x8e\x01\x88\x01\x01\x12\x41\n2Powertrain_TractionBattery_StateOfCharge_Displayed\x18\x92\x01 \x01(\x02H\x8f\x01\x88\x01\x01\x12\x38\n)Powertrain_TractionBattery_NominalVoltage\x18\x93\x01 \x01(\rH\x90\x01\x88\x01\x01\x12\x34\n%Powertrain_TractionBattery_MaxVoltage\x18\x94\x01 \x01(\rH\x91\x01\x88\x01\x01\x12\x38\n)Powertrain_TractionBattery_CurrentVoltage\x18\x95\x01 \x01(\x02H\x92\x01\x88\x01\x01\x12\x38\n)Powertrain_TractionBattery_CurrentCurrent\x18\x96\x01 \x01(\x02H\x93\x01\x88\x01\x01\x12\x36\n\'Powertrain_TractionBattery_CurrentPower\x18\x97\x01 \x01(\x02H\x94\x01\x88\x01\x01\x12\x42\n3Powertrain_TractionBattery_AccumulatedChargedEnergy\x18\x98\x01 \x01(\x02H\x95\x01\x88\x01\x01\x12\x43\n4Powertrain_TractionBattery_AccumulatedConsumedEnergy\x18\x99\x01 \x01(\x02H\x96\x01\x88\x01\x01\x12\x46\n7Powertrain_TractionBattery_AccumulatedChargedThroughput\x18\x9a\x01 \x01(\x02H\x97\x01\x88\x01\x01\x12G\n8Powertrain_TractionBattery_AccumulatedConsumedThroughput\x18\x9b\x01 \x01(\x02H\x98\x01\x88\x01\x01\x12\x33\n$Powertrain_TractionBattery_PowerLoss\x18\x9c\x01 \x01(\x02H\x99\x01\x88\x01\x01\x12/\n Powertrain_TractionBattery_Range\x18\x9d\x01 \x01(\rH\x9a\x01\x88\x01\x01\x12>\n/Powertrain_TractionBattery_Charging_ChargeLimit\x18\x9e\x01 \x01(\rH\x9b\x01\x88\x01\x01\x12L\n=Powertrain_TractionBattery_Charging_MaximumChargingCurrent_DC\x18\x9f\x01 \x01(\x02H\x9c\x01\x88\x01\x01\x12P\nAPowertrain_TractionBattery_Charging_MaximumChargingCurrent_Phase1\x18\xa0\x01 \x01(\x02H\x9d\x01\x88\x01\x01\x12P\nAPowertrain_TractionBattery_Charging_MaximumChargingCurrent_Phase2\x18\xa1\x01 \x01(\x02H\x9e\x01\x88\x01\x01\x12P\nAPowertrain_TractionBattery_Charging_MaximumChargingCurrent_Phase3\x18\xa2\x01 \x01(\x02H\x9f\x01\x88\x01\x01\x12\x41\n2Powertrain_TractionBattery_Charging_ChargePortFlap\x18\xa3\x01 \x01(\tH\xa0\x01\x88\x01\x01\x12K\n<Powertrain_TractionBattery_Charging_IsChargingCableConnected\x18\xa4\x01 \x01(\x08H\xa1\x01\x88\x01\x01\x12H\n9Powertrain_TractionBattery_Charging_IsChargingCableLocked\x18\xa5\x01 \x01(\x08H\xa2\x01\x88\x01\x01\x12;\n2Powertrain_TractionBattery_Charging_ChargePlugType\x18\xa6\x01 \x03(\t\x12\x37\n(Powertrain_TractionBattery_Charging_Mode\x18\xa7\x01 \x01(\tH\xa3\x01\x88\x01\x01\x12=\n.Powertrain_TractionBattery_Charging_IsCharging\x18\xa8\x01 \x01(\x08H\xa4\x01\x88\x01\x01\x12@\n1Powertrain_TractionBattery_Charging_IsDischarging\x18\xa9\x01 \x01(\x08H\xa5\x01\x88\x01\x01\x12\x44\n5Powertrain_TractionBattery_Charging_StartStopCharging\x18\xaa\x01 \x01(\tH\xa6\x01\x88\x01\x01\x12\x43\n4Powertrain_TractionBattery_Charging_ChargeCurrent_DC\x18\xab\x01 \x01(\x02H\xa7\x01\x88\x01\x01\x12G\n8Powertrain_TractionBattery_Charging_ChargeCurrent_Phase1\x18\xac\x01 \x01(\x02H\xa8\x01\x88\x01\x01\x12G\n8Powertrain_TractionBattery_Charging_ChargeCurrent_Phase2\x18\xad\x01 \x01(\x02H\xa9\x01\x88\x01\x01\x12G\n8Powertrain_TractionBattery_Charging_ChargeCurrent_Phase3\x18\xae\x01 \x01(\x02H\xaa\x01\x88\x01\x01\x12\x43\n4Powertrain_TractionBattery_Charging_ChargeVoltage_DC\x18\xaf\x01 \x01(\x02H\xab\x01\x88\x01\x01\x12G\n8Powertrain_TractionBattery_Charging_ChargeVoltage_Phase1\x18\xb0\x01 \x01(\x02H\xac\x01\x88\x01\x01\x12G\n8Powertrain_TractionBattery_Charging_ChargeVoltage_Phase2\x18\xb1\x01 \x01(\x02H\xad\x01\x88\x01\x01\x12G\n8Powertrain_TractionBattery_Charging_ChargeVoltage_Phase3\x18\xb2\x01 \x01(\x02H\xae\x01\x88\x01\x01\x12<\n-Powertrain_TractionBattery_Charging_PowerLoss\x18\xb3\x01 \x01(\x02H\xaf\x01\x88\x01\x01\x12>\n/Powertrain_TractionBattery_Charging_Temperature\x18\xb4\x01 \x01(\x02H\xb0\x01\x88\x01\x01\x12=\n.Powertrain_TractionBattery_Charging_ChargeRate\x18\xb5\x01 \x01(\x02H\xb1\x01\x88\x01\x01\x12\x41\n2Powertrain_TractionBattery_Charging_TimeToComplete\x18\xb6\x01 \x01(\rH\xb2\x01\x88\x01\x01\x12=\n.Powertrain_TractionBattery_Charging_Timer_Mode\x18\xb7\x01 \x01(\tH\xb3\x01\x88\x01\x01\x12=\n.Powertrain_TractionBattery_Charging_Timer_Time\x18\xb8\x01 \x01(\tH\xb4\x01\x88\x01\x01\x12\x38\n)Powertrain_TractionBattery_DCDC_PowerLoss\x18\xb9\x01 \x01(\x02H\xb5\x01\x88\x01\x01\x12:\n+Powertrain_TractionBattery_DCDC_Temperature\x18\xba\x01 \x01(\x02H\xb6\x01\x88\x01\x01\x12\x31\n(Powertrain_FuelSystem_SupportedFuelTypes\x18\xbb\x01 \x03(\t\x12,\n#Powertrain_FuelSystem_SupportedFuel\x18\xbc\x01 \x03(\t\x12/\n Powertrain_FuelSystem_HybridType\x18\xbd\x01 \x01(\tH\xb7\x01\x88\x01\x01\x12\x31\n\"Powertrain_FuelSystem_TankCapacity\x18\xbe\x01 \x01(\x02H\xb8\x01\x88\x01\x01\x12*\n\x1bPowertrain_FuelSystem_Level\x18\xbf\x01 \x01(\rH\xb9\x01\x88\x01\x01\x12*\n\x1bPowertrain_FuelSystem_Range\x18\xc0\x01 \x01(\rH\xba\x01\x88\x01\x01\x12\x37\n(Powertrain_FuelSystem_InstantConsumption\x18\xc1\x01 \x01(\x02H\xbb\x01\x88\x01\x01\x12\x37\n(Powertrain_FuelSystem_AverageConsumption\x18\xc2\x01 \x01(\x02H\xbc\x01\x88\x01\x01\x12:\n+Powertrain_FuelSystem_ConsumptionSinceStart\x18\xc3\x01 \x01(\x02H\xbd\x01\x88\x01\x01\x12\x33\n$Powertrain_FuelSystem_TimeSinceStart\x18\xc4\x01 \x01(\rH\xbe\x01\x88\x01\x01\x12=\n.Powertrain_FuelSystem_IsEngineStopStartEnabled\x18\xc5\x01 \x01(\x08H\xbf\x01\x88\x01\x01\x12\x33\n$Powertrain_FuelSystem_IsFuelLevelLow\x18\xc6\x01 \x01(\x08H\xc0\x01\x88\x01\x01\x12\x1c\n\rBody_BodyType\x18\xc7\x01 \x01(\tH\xc1\x01\x88\x01\x01\x12\"\n\x13\x42ody_RefuelPosition\x18\xc8\x01 \x01(\tH\xc2\x01\x88\x01\x01\x12\x1f\n\x10\x42ody_Hood_IsOpen\x18\xc9\x01 \x01(\x08H\xc3\x01\x88\x01\x01\x12&\n\x17\x42ody_Trunk_Front_IsOpen\x18\xca\x01 \x01(\x08H\xc4\x01\x88\x01\x01\x12(\n\x19\x42ody_Trunk_Front_IsLocked\x18\xcb\x01 \x01(\x08H\xc5\x01\x88\x01\x01\x12%\n\x16\x42ody_Trunk_Rear_IsOpen\x18\xcc\x01 \x01(\x08H\xc6\x01\x88\x01\x01\x12\'\n\x18\x42ody_Trunk_Rear_IsLocked\x18\xcd\x01 \x01(\x08H\xc7\x01\x88\x01\x01\x12!\n\x12\x42ody_Horn_IsActive\x18\xce\x01 \x01(\x08H\xc8\x01\x88\x01\x01\x12+\n\x1c\x42ody_Raindetection_Intensity\x18\xcf\x01 \x01(\rH\xc9\x01\x88\x01\x01\x12\x30\n!Body_Windshield_Front_Wiping_Mode\x18\xd0\x01 \x01(\tH\xca\x01\x88\x01\x01\x12\x35\n&Body_Windshield_Front_Wiping_Intensity\x18\xd1\x01 \x01(\rH\xcb\x01\x88\x01\x01\x12\x37\n(Body_Windshield_Front_Wiping_System_Mode\x18\xd2\x01 \x01(\tH\xcc\x01\x88\x01\x01\x12<\n-Body_Windshield_Front_Wiping_System_Frequency\x18\xd3\x01 \x01(\rH\xcd\x01\x88\x01\x01\x12\x41\n2Body_Windshield_Front_Wiping_System_TargetPosition\x18\xd4\x01 \x01(\x02H\xce\x01\x88\x01\x01\x12\x41\n2Body_Windshield_Front_Wiping_System_ActualPosition\x18\xd5\x01 \x01(\x02H\xcf\x01\x88\x01\x01\x12?\n0Body_Windshield_Front_Wiping_System_DriveCurrent\x18\xd6\x01 \x01(\x02H\xd0\x01\x88\x01\x01\x12;\n,Body_Windshield_Front_Wiping_System_IsWiping\x18\xd7\x01 \x01(\x08H\xd1\x01\x88\x01\x01\x12\x44\n5Body_Windshield_Front_Wiping_System_IsEndingWipeCycle\x18\xd8\x01 \x01(\x08H\xd2\x01\x88\x01\x01\x12?\n0Body_Windshield_Front_Wiping_System_IsWiperError\x18\xd9\x01 \x01(\x08H\xd3\x01\x88\x01\x01\x12\x44\n5Body_Windshield_Front_Wiping_System_IsPositionReached\x18\xda\x01 \x01(\x08H\xd4\x01\x88\x01\x01\x12<\n-Body_Windshield_Front_Wiping_System_IsBlocked\x18\xdb\x01 \x01(\x08H\xd5\x01\x88\x01\x01\x12?\n0Body_Windshield_Front_Wiping_System_IsOverheated\x18\xdc\x01 \x01(\x08H\xd6\x01\x88\x01\x01\x12\x35\n&Body_Windshield_Front_Wiping_WiperWear\x18\xdd\x01 \x01(\rH\xd7\x01\x88\x01\x01\x12\x38\n)Body_Windshield_Front_Wiping_IsWipersWorn\x18\xde\x01 \x01(\x08H\xd8\x01\x88\x01\x01\x12\x30\n!Body_Windshield_Front_IsHeatingOn\x18\xdf\x01 \x01(\x08H\xd9\x01\x88\x01\x01\x12;\n,Body_Windshield_Front_WasherFluid_IsLevelLow\x18\xe0\x01 \x01(\x08H\xda\x01\x88\x01\x01\x12\x36\n\'Body_Windshield_Front_WasherFluid_Level\x18\xe1\x01 \x01(\rH\xdb\x01\x88\x01\x01\x12/\n Body_Windshield_Rear_Wiping_Mode\x18\xe2\x01 \x01(\tH\xdc\x01\x88\x01\x01\x12\x34\n%Body_Windshield_Rear_Wiping_Intensity\x18\xe3\x01 \x01(\rH\xdd\x01\x88\x01\x01\x12\x36\n\'Body_Windshield_Rear_Wiping_System_Mode\x18\xe4\x01 \x01(\tH\xde\x01\x88\x01\x01\x12;\n,Body_Windshield_Rear_Wiping_System_Frequency\x18\xe5\x01 \x01(\rH\xdf\x01\x88\x01\x01\x12@\n1Body_Windshield_Rear_Wiping_System_TargetPosition\x18\xe6\x01 \x01(\x02H\xe0\x01\x88\x01\x01\x12@\n1Body_Windshield_Rear_Wiping_System_ActualPosition\x18\xe7\x01 \x01(\x02H\xe1\x01\x88\x01\x01\x12>\n/Body_Windshield_Rear_Wiping_System_DriveCurrent\x18\xe8\x01 \x01(\x02H\xe2\x01\x88\x01\x01\x12:\n+Body_Windshield_Rear_Wiping_System_IsWiping\x18\xe9\x01 \x01(\x08H\xe3\x01\x88\x01\x01\x12\x43\n4Body_Windshield_Rear_Wiping_System_IsEndingWipeCycle\x18\xea\x01 \x01(\x08H\xe4\x01\x88\x01\x01\x12>\n/Body_Windshield_Rear_Wiping_System_IsWiperError\x18\xeb\x01 \x01(\x08H\xe5\x01\x88\x01\x01\x12\x43\n4Body_Windshield_Rear_Wiping_System_IsPositionReached\x18\xec\x01 \x01(\x08H\xe6\x01\x88\x01\x01\x12;\n,Body_Windshield_Rear_Wiping_System_IsBlocked\x18\xed\x01 \x01(\x08H\xe7\x01\x88\x01\x01\x12>\n/Body_Windshield_Rear_Wiping_System_IsOverheated\x18\xee\x01 \x01(\x08H\xe8\x01\x88\x01\x01\x12\x34\n%Body_Windshield_Rear_Wiping_WiperWear\x18\xef\x01 \x01(\rH\xe9\x01\x88\x01\x01\x12\x37\n(Body_Windshield_Rear_Wiping_IsWipersWorn\x18\xf0\x01 \x01(\x08H\xea\x01\x88\x01\x01\x12/\n Body_Windshield_Rear_IsHeatingOn\x18\xf1\x01 \x01(\x08H\xeb\x01\x88\x01\x01\x12:\n+Body_Windshield_Rear_WasherFluid_IsLevelLow\x18\xf2\x01 \x01(\x08H\xec\x01\x88\x01\x01\x12\x35\n&Body_Windshield_Rear_WasherFluid_Level\x18\xf3\x01 \x01(\rH\xed\x01\x88\x01\x01\x12&\n\x17\x42ody_Lights_LightSwitch\x18\xf4\x01 \x01(\tH\xee\x01\x88\x01\x01\x12-\n\x1e\x42ody_Lights_IsHighBeamSwitchOn\x18\xf5\x01 \x01(\x08H\xef\x01\x88\x01\x01\x12(\n\x19\x42ody_Lights_Beam_Low_IsOn\x18\xf6\x01 \x01(\x08H\xf0\x01\x88\x01\x01\x12,\n\x1d\x42ody_Lights_Beam_Low_IsDefect\x18\xf7\x01 \x01(\x08H\xf1\x01\x88\x01\x01\x12)\n\x1a\x42ody_Lights_Beam_High_IsOn\x18\xf8\x01 \x01(\x08H\xf2\x01\x88\x01\x01\x12-\n\x1e\x42ody_Lights_Beam_High_IsDefect\x18\xf9\x01 \x01(\x08H\xf3\x01\x88\x01\x01\x12\'\n\x18\x42ody_Lights_Running_IsOn\x18\xfa\x01 \x01(\x08H\xf4\x01\x88\x01\x01\x12+\n\x1c\x42ody_Lights_Running_IsDefect\x18\xfb\x01 \x01(\x08H\xf5\x01\x88\x01\x01\x12&\n\x17\x42ody_Lights_Backup_IsOn\x18\xfc\x01 \x01(\x08H\xf6\x01\x88\x01\x01\x12*\n\x1b\x42ody_Lights_Backup_IsDefect\x18\xfd\x01 \x01(\x08H\xf7\x01\x88\x01\x01\x12\'\n\x18\x42ody_Lights_Parking_IsOn\x18\xfe\x01 \x01(\x08H\xf8\x01\x88\x01\x01\x12+\n\x1c\x42ody_Lights_Parking_IsDefect\x18\xff\x01 \x01(\x08H\xf9\x01\x88\x01\x01\x12(\n\x19\x42ody_Lights_Fog_Rear_IsOn\x18\x80\x02 \x01(\x08H\xfa\x01\x88\x01\x01\x12,\n\x1d\x42ody_Lights_Fog_Rear_IsDefect\x18\x81\x02 \x01(\x08H\xfb\x01\x88\x01\x01\x12)\n\x1a\x42ody_Lights_Fog_Front_IsOn\x18\x82\x02 \x01(\x08H\xfc\x01\x88\x01\x01\x12-\n\x1e\x42ody_Lights_Fog_Front_IsDefect\x18\x83\x02 \x01(\x08H\xfd\x01\x88\x01\x01\x12,\n\x1d\x42ody_Lights_LicensePlate_IsOn\x18\x84\x02 \x01(\x08H\xfe\x01\x88\x01\x01\x12\x30\n!Body_Lights_LicensePlate_IsDefect\x18\x85\x02 \x01(\x08H\xff\x01\x88\x01\x01\x12)\n\x1a\x42ody_Lights_Brake_IsActive\x18\x86\x02 \x01(\tH\x80\x02\x88\x01\x01\x12)\n\x1a\x42ody_Lights_Brake_IsDefect\x18\x87\x02 \x01(\x08H\x81\x02\x88\x01\x01\x12-\n\x1e\x42ody_Lights_Hazard_IsSignaling\x18\x88\x02 \x01(\x08H\x82\x02\x88\x01\x01\x12*\n\x1b\x42ody_Lights_Hazard_IsDefect\x18\x89\x02 \x01(\x08H\x83\x02\x88\x01\x01\x12>\n/Body_Lights_DirectionIndicator_Left_IsSignaling\x18\x8a\x02 \x01(\x08H\x84\x02\x88\x01\x01\x12;\n,Body_Lights_DirectionIndicator_Left_IsDefect\x18\x8b\x02 \x01(\x08H\x85\x02\x88\x01\x01\x12?\n0Body_Lights_DirectionIndicator_Right_IsSignaling\x18\x8c\x02 \x01(\x08H\x86\x02\x88\x01\x01\x12<\n-Body_Lights_DirectionIndicator_Right_IsDefect\x18\x8d\x02 \x01(\x08H\x87\x02\x88\x01\x01\x12%\n\x16\x42ody_Mirrors_Left_Tilt\x18\x8e\x02 \x01(\x11H\x88\x02\x88\x01\x01\x12$\n\x15\x42ody_Mirrors_Left_Pan\x18\x8f\x02 \x01(\x11H\x89\x02\x88\x01\x01\x12,\n\x1d\x42ody_Mirrors_Left_IsHeatingOn\x18\x90\x02 \x01(\x08H\x8a\x02\x88\x01\x01\x12&\n\x17\x42ody_Mirrors_Right_Tilt\x18\x91\x02 \x01(\x11H\x8b\x02\x88\x01\x01\x12%\n\x16\x42ody_Mirrors_Right_Pan\x18\x92\x02 \x01(\x11H\x8c\x02\x88\x01\x01\x12-\n\x1e\x42ody_Mirrors_Right_IsHeatingOn\x18\x93\x02 \x01(\x08H\x8d\x02\x88\x01\x01\x12+\n\x1c\x42ody_RearMainSpoilerPosition\x18\x94\x02 \x01(\x02H\x8e\x02\x88\x01\x01\x12&\n\x17\x42ody_PowerOptimizeLevel\x18\x95\x02 \x01(\rH\x8f\x02\x88\x01\x01\x12%\n\x16\x43\x61\x62in_RearShade_Switch\x18\x96\x02 \x01(\tH\x90\x02\x88\x01\x01\x12\'\n\x18\x43\x61\x62in_RearShade_Position\x18\x97\x02 \x01(\rH\x91\x02\x88\x01\x01\x12\x34\n%Cabin_HVAC_Station_Row1_Left_FanSpeed\x18\x98\x02 \x01(\rH\x92\x02\x88\x01\x01\x12\x37\n(Cabin_HVAC_Station_Row1_Left_Temperature\x18\x99\x02 \x01(\x11H\x93\x02\x88\x01\x01\x12;\n,Cabin_HVAC_Station_Row1_Left_AirDistribution\x18\x9a\x02 \x01(\tH\x94\x02\x88\x01\x01\x12\x35\n&Cabin_HVAC_Station_Row1_Right_FanSpeed\x18\x9b\x02 \x01(\rH\x95\x02\x88\x01\x01\x12\x38\n)Cabin_HVAC_Station_Row1_Right_Temperature\x18\x9c\x02 \x01(\x11H\x96\x02\x88\x01\x01\x12<\n-Cabin_HVAC_Station_Row1_Right_AirDistribution\x18\x9d\x02 \x01(\tH\x97\x02\x88\x01\x01\x12\x34\n%Cabin_HVAC_Station_Row2_Left_FanSpeed\x18\x9e\x02 \x01(\rH\x98\x02\x88\x01\x01\x12\x37\n(Cabin_HVAC_Station_Row2_Left_Temperature\x18\x9f\x02 \x01(\x11H\x99\x02\x88\x01\x01\x12;\n,Cabin_HVAC_Station_Row2_Left_AirDistribution\x18\xa0\x02 \x01(\tH\x9a\x02\x88\x01\x01\x12\x35\n&Cabin_HVAC_Station_Row2_Right_FanSpeed\x18\xa1\x02 \x01(\rH\x9b\x02\x88\x01\x01\x12\x38\n)Cabin_HVAC_Station_Row2_Right_Temperature\x18\xa2\x02 \x01(\x11H\x9c\x02\x88\x01\x01\x12<\n-Cabin_HVAC_Station_Row2_Right_AirDistribution\x18\xa3\x02 \x01(\tH\x9d\x02\x88\x01\x01\x12\x34\n%Cabin_HVAC_Station_Row3_Left_FanSpeed\x18\xa4\x02 \x01(\rH\x9e\x02\x88\x01\x01\x12\x37\n(Cabin_HVAC_Station_Row3_Left_Temperature\x18\xa5\x02 \x01(\x11H\x9f\x02\x88\x01\x01\x12;\n,Cabin_HVAC_Station_Row3_Left_AirDistribution\x18\xa6\x02 \x01(\tH\xa0\x02\x88\x01\x01\x12\x35\n&Cabin_HVAC_Station_Row3_Right_FanSpeed\x18\xa7\x02 \x01(\rH\xa1\x02\x88\x01\x01\x12\x38\n)Cabin_HVAC_Station_Row3_Right_Temperature\x18\xa8\x02 \x01(\x11H\xa2\x02\x88\x01\x01\x12<\n-Cabin_HVAC_Station_Row3_Right_AirDistribution\x18\xa9\x02 \x01(\tH\xa3\x02\x88\x01\x01\x12\x34\n%Cabin_HVAC_Station_Row4_Left_FanSpeed\x18\xaa\x02 \x01(\rH\xa4\x02\x88\x01\x01\x12\x37\n(Cabin_HVAC_Station_Row4_Left_Temperature\x18\xab\x02 \x01(\x11H\xa5\x02\x88\x01\x01\x12;\n,Cabin_HVAC_Station_Row4_Left_AirDistribution\x18\xac\x02 \x01(\tH\xa6\x02\x88\x01\x01\x12\x35\n&Cabin_HVAC_Station_Row4_Right_FanSpeed\x18\xad\x02 \x01(\rH\xa7\x02\x88\x01\x01\x12\x38\n)Cabin_HVAC_Station_Row4_Right_Temperature\x18\xae\x02 \x01(\x11H\xa8\x02\x88\x01\x01\x12<\n-Cabin_HVAC_Station_Row4_Right_AirDistribution\x18\xaf\x02 \x01(\tH\xa9\x02\x88\x01\x01\x12/\n Cabin_HVAC_IsRecirculationActive\x18\xb0\x02 \x01(\x08H\xaa\x02\x88\x01\x01\x12\x30\n!Cabin_HVAC_IsFrontDefrosterActive\x18\xb1\x02 \x01(\x08H\xab\x02\x88\x01\x01\x12/\n Cabin_HVAC_IsRearDefrosterActive\x18\xb2\x02 \x01(\x08H\xac\x02\x88\x01\x01\x12\x31\n\"Cabin_HVAC_IsAirConditioningActive\x18\xb3\x02 \x01(\x08H\xad\x02\x88\x01\x01\x12/\n Cabin_HVAC_AmbientAirTemperature\x18\xb4\x02 \x01(\x02H\xae\x02\x88\x01\x01\x12,\n\x1d\x43\x61\x62in_HVAC_PowerOptimizeLevel\x18\xb5\x02 \x01(\rH\xaf\x02\x88\x01\x01\x12.\n\x1f\x43\x61\x62in_Infotainment_Media_Action\x18\xb6\x02 \x01(\tH\xb0\x02\x88\x01\x01\x12\x35\n&Cabin_Infotainment_Media_Played_Source\x18\xb7\x02 \x01(\tH\xb1\x02\x88\x01\x01\x12\x35\n&Cabin_Infotainment_Media_Played_Artist\x18\xb8\x02 \x01(\tH\xb2\x02\x88\x01\x01\x12\x34\n%Cabin_Infotainment_Media_Played_Album\x18\xb9\x02 \x01(\tH\xb3\x02\x88\x01\x01\x12\x34\n%Cabin_Infotainment_Media_Played_Track\x18\xba\x02 \x01(\tH\xb4\x02\x88\x01\x01\x12\x32\n#Cabin_Infotainment_Media_Played_URI\x18\xbb\x02 \x01(\tH\xb5\x02\x88\x01\x01\x12;\n,Cabin_Infotainment_Media_Played_PlaybackRate\x18\xbc\x02 \x01(\x02H\xb6\x02\x88\x01\x01\x12\x33\n$Cabin_Infotainment_Media_DeclinedURI\x18\xbd\x02 \x01(\tH\xb7\x02\x88\x01\x01\x12\x33\n$Cabin_Infotainment_Media_SelectedURI\x18\xbe\x02 \x01(\tH\xb8\x02\x88\x01\x01\x12.\n\x1f\x43\x61\x62in_Infotainment_Media_Volume\x18\xbf\x02 \x01(\rH\xb9\x02\x88\x01\x01\x12\x44\n5Cabin_Infotainment_Navigation_DestinationSet_Latitude\x18\xc0\x02 \x01(\x01H\xba\x02\x88\x01\x01\x12\x45\n6Cabin_Infotainment_Navigation_DestinationSet_Longitude\x18\xc1\x02 \x01(\x01H\xbb\x02\x88\x01\x01\x12\x31\n\"Cabin_Infotainment_Navigation_Mute\x18\xc2\x02 \x01(\tH\xbc\x02\x88\x01\x01\x12\x33\n$Cabin_Infotainment_Navigation_Volume\x18\xc3\x02 \x01(\rH\xbd\x02\x88\x01\x01\x12\x35\n&Cabin_Infotainment_HMI_CurrentLanguage\x18\xc4\x02 \x01(\tH\xbe\x02\x88\x01\x01\x12\x30\n!Cabin_Infotainment_HMI_DateFormat\x18\xc5\x02 \x01(\tH\xbf\x02\x88\x01\x01\x12\x30\n!Cabin_Infotainment_HMI_TimeFormat\x18\xc6\x02 \x01(\tH\xc0\x02\x88\x01\x01\x12\x32\n#Cabin_Infotainment_HMI_DistanceUnit\x18\xc7\x02 \x01(\tH\xc1\x02\x88\x01\x01\x12\x34\n%Cabin_Infotainment_HMI_FuelVolumeUnit\x18\xc8\x02 \x01(\tH\xc2\x02\x88\x01\x01\x12\x36\n\'Cabin_Infotainment_HMI_FuelEconomyUnits\x18\xc9\x02 \x01(\tH\xc3\x02\x88\x01\x01\x12\x34\n%Cabin_Infotainment_HMI_EVEconomyUnits\x18\xca\x02 \x01(\tH\xc4\x02\x88\x01\x01\x12\x35\n&Cabin_Infotainment_HMI_TemperatureUnit\x18\xcb\x02 \x01(\tH\xc5\x02\x88\x01\x01\x12\x36\n\'Cabin_Infotainment_HMI_TirePressureUnit\x18\xcc\x02 \x01(\tH\xc6\x02\x88\x01\x01\x12\x30\n!Cabin_Infotainment_HMI_Brightness\x18\xcd\x02 \x01(\x02H\xc7\x02\x88\x01\x01\x12\x32\n#Cabin_Infotainment_HMI_DayNightMode\x18\xce\x02 \x01(\tH\xc8\x02\x88\x01\x01\x12=\n.Cabin_Infotainment_SmartphoneProjection_Active\x18\xcf\x02 \x01(\tH\xc9\x02\x88\x01\x01\x12=\n.Cabin_Infotainment_SmartphoneProjection_Source\x18\xd0\x02 \x01(\tH\xca\x02\x88\x01\x01\x12>\n5Cabin_Infotainment_SmartphoneProjection_SupportedMode\x18\xd1\x02 \x03(\t\x12\x34\n%Cabin_Infotainment_PowerOptimizeLevel\x18\xd2\x02 \x01(\rH\xcb\x02\x88\x01\x01\x12%\n\x16\x43\x61\x62in_Sunroof_Position\x18\xd3\x02 \x01(\x11H\xcc\x02\x88\x01\x01\x12#\n\x14\x43\x61\x62in_Sunroof_Switch\x18\xd4\x02 \x01(\tH\xcd\x02\x88\x01\x01\x12)\n\x1a\x43\x61\x62in_Sunroof_Shade_Switch\x18\xd5\x02 \x01(\tH\xce\x02\x88\x01\x01\x12+\n\x1c\x43\x61\x62in_Sunroof_Shade_Position\x18\xd6\x02 \x01(\rH\xcf\x02\x88\x01\x01\x12\x30\n!Cabin_RearviewMirror_DimmingLevel\x18\xd7\x02 \x01(\rH\xd0\x02\x88\x01\x01\x12(\n\x19\x43\x61\x62in_Lights_IsGloveBoxOn\x18\xd8\x02 \x01(\x08H\xd1\x02\x88\x01\x01\x12%\n\x16\x43\x61\x62in_Lights_IsTrunkOn\x18\xd9\x02 \x01(\x08H\xd2\x02\x88\x01\x01\x12$\n\x15\x43\x61\x62in_Lights_IsDomeOn\x18\xda\x02 \x01(\x08H\xd3\x02\x88\x01\x01\x12(\n\x19\x43\x61\x62in_Lights_AmbientLight\x18\xdb\x02 \x01(\rH\xd4\x02\x88\x01\x01\x12*\n\x1b\x43\x61\x62in_Lights_LightIntensity\x18\xdc\x02 \x01(\rH\xd5\x02\x88\x01\x01\x12\x35\n&Cabin_Lights_Spotlight_Row1_IsSharedOn\x18\xdd\x02 \x01(\x08H\xd6\x02\x88\x01\x01\x12\x33\n$Cabin_Lights_Spotlight_Row1_IsLeftOn\x18\xde\x02 \x01(\x08H\xd7\x02\x88\x01\x01\x12\x34\n%Cabin_Lights_Spotlight_Row1_IsRightOn\x18\xdf\x02 \x01(\x08H\xd8\x02\x88\x01\x01\x12\x35\n&Cabin_Lights_Spotlight_Row2_IsSharedOn\x18\xe0\x02 \x01(\x08H\xd9\x02\x88\x01\x01\x12\x33\n$Cabin_Lights_Spotlight_Row2_IsLeftOn\x18\xe1\x02 \x01(\x08H\xda\x02\x88\x01\x01\x12\x34\n%Cabin_Lights_Spotlight_Row2_IsRightOn\x18\xe2\x02 \x01(\x08H\xdb\x02\x88\x01\x01\x12\x35\n&Cabin_Lights_Spotlight_Row3_IsSharedOn\x18\xe3\x02 \x01(\x08H\xdc\x02\x88\x01\x01\x12\x33\n$Cabin_Lights_Spotlight_Row3_IsLeftOn\x18\xe4\x02 \x01(\x08H\xdd\x02\x88\x01\x01\x12\x34\n%Cabin_Lights_Spotlight_Row3_IsRightOn\x18\xe5\x02 \x01(\x08H\xde\x02\x88\x01\x01\x12\x35\n&Cabin_Lights_Spotlight_Row4_IsSharedOn\x18\xe6\x02 \x01(\x08H\xdf\x02\x88\x01\x01\x12\x33\n$Cabin_Lights_Spotlight_Row4_IsLeftOn\x18\xe7\x02 \x01(\x08H\xe0\x02\x88\x01\x01\x12\x34\n%Cabin_Lights_Spotlight_Row4_IsRightOn\x18\xe8\x02 \x01(\x08H\xe1\x02\x88\x01\x01\x12*\n\x1b\x43\x61\x62in_Door_Row1_Left_IsOpen\x18\xe9\x02 \x01(\x08H\xe2\x02\x88\x01\x01\x12,\n\x1d\x43\x61\x62in_Door_Row1_Left_IsLocked\x18\xea\x02 \x01(\x08H\xe3\x02\x88\x01\x01\x12\x31\n\"Cabin_Door_Row1_Left_Window_IsOpen\x18\xeb\x02 \x01(\x08H\xe4\x02\x88\x01\x01\x12\x33\n$Cabin_Door_Row1_Left_Window_Position\x18\xec\x02 \x01(\rH\xe5\x02\x88\x01\x01\x12=\n.Cabin_Door_Row1_Left_Window_IsChildLockEngaged\x18\xed\x02 \x01(\x08H\xe6\x02\x88\x01\x01\x12\x31\n\"Cabin_Door_Row1_Left_Window_Switch\x18\xee\x02 \x01(\tH\xe7\x02\x88\x01\x01\x12\x35\n&Cabin_Door_Row1_Left_IsChildLockActive\x18\xef\x02 \x01(\x08H\xe8\x02\x88\x01\x01\x12\x30\n!Cabin_Door_Row1_Left_Shade_Switch\x18\xf0\x02 \x01(\tH\xe9\x02\x88\x01\x01\x12\x32\n#Cabin_Door_Row1_Left_Shade_Position\x18\xf1\x02 \x01(\rH\xea\x02\x88\x01\x01\x12+\n\x1c\x43\x61\x62in_Door_Row1_Right_IsOpen\x18\xf2\x02 \x01(\x08H\xeb\x02\x88\x01\x01\x12-\n\x1e\x43\x61\x62in_Door_Row1_Right_IsLocked\x18\xf3\x02 \x01(\x08H\xec\x02\x88\x01\x01\x12\x32\n#Cabin_Door_Row1_Right_Window_IsOpen\x18\xf4\x02 \x01(\x08H\xed\x02\x88\x01\x01\x12\x34\n%Cabin_Door_Row1_Right_Window_Position\x18\xf5\x02 \x01(\rH\xee\x02\x88\x01\x01\x12>\n/Cabin_Door_Row1_Right_Window_IsChildLockEngaged\x18\xf6\x02 \x01(\x08H\xef\x02\x88\x01\x01\x12\x32\n#Cabin_Door_Row1_Right_Window_Switch\x18\xf7\x02 \x01(\tH\xf0\x02\x88\x01\x01\x12\x36\n\'Cabin_Door_Row1_Right_IsChildLockActive\x18\xf8\x02 \x01(\x08H\xf1\x02\x88\x01\x01\x12\x31\n\"Cabin_Door_Row1_Right_Shade_Switch\x18\xf9\x02 \x01(\tH\xf2\x02\x88\x01\x01\x12\x33\n$Cabin_Door_Row1_Right_Shade_Position\x18\xfa\x02 \x01(\rH\xf3\x02\x88\x01\x01\x12*\n\x1b\x43\x61\x62in_Door_Row2_Left_IsOpen\x18\xfb\x02 \x01(\x08H\xf4\x02\x88\x01\x01\x12,\n\x1d\x43\x61\x62in_Door_Row2_Left_IsLocked\x18\xfc\x02 \x01(\x08H\xf5\x02\x88\x01\x01\x12\x31\n\"Cabin_Door_Row2_Left_Window_IsOpen\x18\xfd\x02 \x01(\x08H\xf6\x02\x88\x01\x01\x12\x33\n$Cabin_Door_Row2_Left_Window_Position\x18\xfe\x02 \x01(\rH\xf7\x02\x88\x01\x01\x12=\n.Cabin_Door_Row2_Left_Window_IsChildLockEngaged\x18\xff\x02 \x01(\x08H\xf8\x02\x88\x01\x01\x12\x31\n\"Cabin_Door_Row2_Left_Window_Switch\x18\x80\x03 \x01(\tH\xf9\x02\x88\x01\x01\x12\x35\n&Cabin_Door_Row2_Left_IsChildLockActive\x18\x81\x03 \x01(\x08H\xfa\x02\x88\x01\x01\x12\x30\n!Cabin_Door_Row2_Left_Shade_Switch\x18\x82\x03 \x01(\tH\xfb\x02\x88\x01\x01\x12\x32\n#Cabin_Door_Row2_Left_Shade_Position\x18\x83\x03 \x01(\rH\xfc\x02\x88\x01\x01\x12+\n\x1c\x43\x61\x62in_Door_Row2_Right_IsOpen\x18\x84\x03 \x01(\x08H\xfd\x02\x88\x01\x01\x12-\n\x1e\x43\x61\x62in_Door_Row2_Right_IsLocked\x18\x85\x03 \x01(\x08H\xfe\x02\x88\x01\x01\x12\x32\n#Cabin_Door_Row2_Right_Window_IsOpen\x18\x86\x03 \x01(\x08H\xff\x02\x88\x01\x01\x12\x34\n%Cabin_Door_Row2_Right_Window_Position\x18\x87\x03 \x01(\rH\x80\x03\x88\x01\x01\x12>\n/Cabin_Door_Row2_Right_Window_IsChildLockEngaged\x18\x88\x03 \x01(\x08H\x81\x03\x88\x01\x01\x12\x32\n#Cabin_Door_Row2_Right_Window_Switch\x18\x89\x03 \x01(\tH\x82\x03\x88\x01\x01\x12\x36\n\'Cabin_Door_Row2_Right_IsChildLockActive\x18\x8a\x03 \x01(\x08H\x83\x03\x88\x01\x01\x12\x31\n\"Cabin_Door_Row2_Right_Shade_Switch\x18\x8b\x03 \x01(\tH\x84\x03\x88\x01\x01\x12\x33\n$Cabin_Door_Row2_Right_Shade_Position\x18\x8c\x03 \x01(\rH\x85\x03\x88\x01\x01\x12\x1e\n\x0f\x43\x61\x62in_DoorCount\x18\x8d\x03 \x01(\rH\x86\x03\x88\x01\x01\x12.\n\x1f\x43\x61\x62in_Seat_Row1_Pos1_IsOccupied\x18\x8e\x03 \x01(\x08H\x87\x03\x88\x01\x01\x12?\n0Cabin_Seat_Row1_Pos1_Occupant_Identifier_Subject\x18\x8f\x03 \x01(\tH\x88\x03\x88\x01\x01\x12>\n/Cabin_Seat_Row1_Pos1_Occupant_Identifier_Issuer\x18\x90\x03 \x01(\tH\x89\x03\x88\x01\x01\x12,\n\x1d\x43\x61\x62in_Seat_Row1_Pos1_IsBelted\x18\x91\x03 \x01(\x08H\x8a\x03\x88\x01\x01\x12+\n\x1c\x43\x61\x62in_Seat_Row1_Pos1_Heating\x18\x92\x03 \x01(\x11H\x8b\x03\x88\x01\x01\x12+\n\x1c\x43\x61\x62in_Seat_Row1_Pos1_Massage\x18\x93\x03 \x01(\rH\x8c\x03\x88\x01\x01\x12,\n\x1d\x43\x61\x62in_Seat_Row1_Pos1_Position\x18\x94\x03 \x01(\rH\x8d\x03\x88\x01\x01\x12*\n\x1b\x43\x61\x62in_Seat_Row1_Pos1_Height\x18\x95\x03 \x01(\rH\x8e\x03\x88\x01\x01\x12(\n\x19\x43\x61\x62in_Seat_Row1_Pos1_Tilt\x18\x96\x03 \x01(\x02H\x8f\x03\x88\x01\x01\x12\x34\n%Cabin_Seat_Row1_Pos1_Backrest_Recline\x18\x97\x03 \x01(\x02H\x90\x03\x88\x01\x01\x12;\n,Cabin_Seat_Row1_Pos1_Backrest_Lumbar_Support\x18\x98\x03 \x01(\x02H\x91\x03\x88\x01\x01\x12:\n+Cabin_Seat_Row1_Pos1_Backrest_Lumbar_Height\x18\x99\x03 \x01(\rH\x92\x03\x88\x01\x01\x12@\n1Cabin_Seat_Row1_Pos1_Backrest_SideBolster_Support\x18\x9a\x03 \x01(\x02H\x93\x03\x88\x01\x01\x12\x32\n#Cabin_Seat_Row1_Pos1_Seating_Length\x18\x9b\x03 \x01(\rH\x94\x03\x88\x01\x01\x12\x33\n$Cabin_Seat_Row1_Pos1_Headrest_Height\x18\x9c\x03 \x01(\rH\x95\x03\x88\x01\x01\x12\x32\n#Cabin_Seat_Row1_Pos1_Headrest_Angle\x18\x9d\x03 \x01(\x02H\x96\x03\x88\x01\x01\x12\x35\n&Cabin_Seat_Row1_Pos1_Airbag_IsDeployed\x18\x9e\x03 \x01(\x08H\x97\x03\x88\x01\x01\x12:\n+Cabin_Seat_Row1_Pos1_Switch_IsWarmerEngaged\x18\x9f\x03 \x01(\x08H\x98\x03\x88\x01\x01\x12:\n+Cabin_Seat_Row1_Pos1_Switch_IsCoolerEngaged\x18\xa0\x03 \x01(\x08H\x99\x03\x88\x01\x01\x12;\n,Cabin_Seat_Row1_Pos1_Switch_IsForwardEngaged\x18\xa1\x03 \x01(\x08H\x9a\x03\x88\x01\x01\x12<\n-Cabin_Seat_Row1_Pos1_Switch_IsBackwardEngaged\x18\xa2\x03 \x01(\x08H\x9b\x03\x88\x01\x01\x12\x36\n\'Cabin_Seat_Row1_Pos1_Switch_IsUpEngaged\x18\xa3\x03 \x01(\x08H\x9c\x03\x88\x01\x01\x12\x38\n)Cabin_Seat_Row1_Pos1_Switch_IsDownEngaged\x18\xa4\x03 \x01(\x08H\x9d\x03\x88\x01\x01\x12?\n0Cabin_Seat_Row1_Pos1_Switch_IsTiltForwardEngaged\x18\xa5\x03 \x01(\x08H\x9e\x03\x88\x01\x01\x12@\n1Cabin_Seat_Row1_Pos1_Switch_IsTiltBackwardEngaged\x18\xa6\x03 \x01(\x08H\x9f\x03\x88\x01\x01\x12K\n<Cabin_Seat_Row1_Pos1_Switch_Backrest_IsReclineForwardEngaged\x18\xa7\x03 \x01(\x08H\xa0\x03\x88\x01\x01\x12L\n=Cabin_Seat_Row1_Pos1_Switch_Backrest_IsReclineBackwardEngaged\x18\xa8\x03 \x01(\x08H\xa1\x03\x88\x01\x01\x12O\n@Cabin_Seat_Row1_Pos1_Switch_Backrest_Lumbar_IsMoreSupportEngaged\x18\xa9\x03 \x01(\x08H\xa2\x03\x88\x01\x01\x12O\n@Cabin_Seat_Row1_Pos1_Switch_Backrest_Lumbar_IsLessSupportEngaged\x18\xaa\x03 \x01(\x08H\xa3\x03\x88\x01\x01\x12\x46\n7Cabin_Seat_Row1_Pos1_Switch_Backrest_Lumbar_IsUpEngaged\x18\xab\x03 \x01(\x08H\xa4\x03\x88\x01\x01\x12H\n9Cabin_Seat_Row1_Pos1_Switch_Backrest_Lumbar_IsDownEngaged\x18\xac\x03 \x01(\x08H\xa5\x03\x88\x01\x01\x12T\nECabin_Seat_Row1_Pos1_Switch_Backrest_SideBolster_IsMoreSupportEngaged\x18\xad\x03 \x01(\x08H\xa6\x03\x88\x01\x01\x12T\nECabin_Seat_Row1_Pos1_Switch_Backrest_SideBolster_IsLessSupportEngaged\x18\xae\x03 \x01(\x08H\xa7\x03\x88\x01\x01\x12\x43\n4Cabin_Seat_Row1_Pos1_Switch_Seating_IsForwardEngaged\x18\xaf\x03 \x01(\x08H\xa8\x03\x88\x01\x01\x12\x44\n5Cabin_Seat_Row1_Pos1_Switch_Seating_IsBackwardEngaged\x18\xb0\x03 \x01(\x08H\xa9\x03\x88\x01\x01\x12?\n0Cabin_Seat_Row1_Pos1_Switch_Headrest_IsUpEngaged\x18\xb1\x03 \x01(\x08H\xaa\x03\x88\x01\x01\x12\x41\n2Cabin_Seat_Row1_Pos1_Switch_Headrest_IsDownEngaged\x18\xb2\x03 \x01(\x08H\xab\x03\x88\x01\x01\x12\x44\n5Cabin_Seat_Row1_Pos1_Switch_Headrest_IsForwardEngaged\x18\xb3\x03 \x01(\x08H\xac\x03\x88\x01\x01\x12\x45\n6Cabin_Seat_Row1_Pos1_Switch_Headrest_IsBackwardEngaged\x18\xb4\x03 \x01(\x08H\xad\x03\x88\x01\x01\x12\x44\n5Cabin_Seat_Row1_Pos1_Switch_Massage_IsIncreaseEngaged\x18\xb5\x03 \x01(\x08H\xae\x03\x88\x01\x01\x12\x44\n5Cabin_Seat_Row1_Pos1_Switch_Massage_IsDecreaseEngaged\x18\xb6\x03 \x01(\x08H\xaf\x03\x88\x01\x01\x12.\n\x1f\x43\x61\x62in_Seat_Row1_Pos2_IsOccupied\x18\xb7\x03 \x01(\x08H\xb0\x03\x88\x01\x01\x12?\n0Cabin_Seat_Row1_Pos2_Occupant_Identifier_Subject\x18\xb8\x03 \x01(\tH\xb1\x03\x88\x01\x01\x12>\n/Cabin_Seat_Row1_Pos2_Occupant_Identifier_Issuer\x18\xb9\x03 \x01(\tH\xb2\x03\x88\x01\x01\x12,\n\x1d\x43\x61\x62in_Seat_Row1_Pos2_IsBelted\x18\xba\x03 \x01(\x08H\xb3\x03\x88\x01\x01\x12+\n\x1c\x43\x61\x62in_Seat_Row1_Pos2_Heating\x18\xbb\x03 \x01(\x11H\xb4\x03\x88\x01\x01\x12+\n\x1c\x43\x61\x62in_Seat_Row1_Pos2_Massage\x18\xbc\x03 \x01(\rH\xb5\x03\x88\x01\x01\x12,\n\x1d\x43\x61\x62in_Seat_Row1_Pos2_Position\x18\xbd\x03 \x01(\rH\xb6\x03\x88\x01\x01\x12*\n\x1b\x43\x61\x62in_Seat_Row1_Pos2_Height\x18\xbe\x03 \x01(\rH\xb7\x03\x88\x01\x01\x12(\n\x19\x43\x61\x62in_Seat_Row1_Pos2_Tilt\x18\xbf\x03 \x01(\x02H\xb8\x03\x88\x01\x01\x12\x34\n%Cabin_Seat_Row1_Pos2_Backrest_Recline\x18\xc0\x03 \x01(\x02H\xb9\x03\x88\x01\x01\x12;\n,Cabin_Seat_Row1_Pos2_Backrest_Lumbar_Support\x18\xc1\x03 \x01(\x02H\xba\x03\x88\x01\x01\x12:\n+Cabin_Seat_Row1_Pos2_Backrest_Lumbar_Height\x18\xc2\x03 \x01(\rH\xbb\x03\x88\x01\x01\x12@\n1Cabin_Seat_Row1_Pos2_Backrest_SideBolster_Support\x18\xc3\x03 \x01(\x02H\xbc\x03\x88\x01\x01\x12\x32\n#Cabin_Seat_Row1_Pos2_Seating_Length\x18\xc4\x03 \x01(\rH\xbd\x03\x88\x01\x01\x12\x33\n$Cabin_Seat_Row1_Pos2_Headrest_Height\x18\xc5\x03 \x01(\rH\xbe\x03\x88\x01\x01\x12\x32\n#Cabin_Seat_Row1_Pos2_Headrest_Angle\x18\xc6\x03 \x01(\x02H\xbf\x03\x88\x01\x01\x12\x35\n&Cabin_Seat_Row1_Pos2_Airbag_IsDeployed\x18\xc7\x03 \x01(\x08H\xc0\x03\x88\x01\x01\x12:\n+Cabin_Seat_Row1_Pos2_Switch_IsWarmerEngaged\x18\xc8\x03 \x01(\x08H\xc1\x03\x88\x01\x01\x12:\n+Cabin_Seat_Row1_Pos2_Switch_IsCoolerEngaged\x18\xc9\x03 \x01(\x08H\xc2\x03\x88\x01\x01\x12;\n,Cabin_Seat_Row1_Pos2_Switch_IsForwardEngaged\x18\xca\x03 \x01(\x08H\xc3\x03\x88\x01\x01\x12<\n-Cabin_Seat_Row1_Pos2_Switch_IsBackwardEngaged\x18\xcb\x03 \x01(\x08H\xc4\x03\x88\x01\x01\x12\x36\n\'Cabin_Seat_Row1_Pos2_Switch_IsUpEngaged\x18\xcc\x03 \x01(\x08H\xc5\x03\x88\x01\x01\x12\x38\n)Cabin_Seat_Row1_Pos2_Switch_IsDownEngaged\x18\xcd\x03 \x01(\x08H\xc6\x03\x88\x01\x01\x12?\n0Cabin_Seat_Row1_Pos2_Switch_IsTiltForwardEngaged\x18\xce\x03 \x01(\x08H\xc7\x03\x88\x01\x01\x12@\n1Cabin_Seat_Row1_Pos2_Switch_IsTiltBackwardEngaged\x18\xcf\x03 \x01(\x08H\xc8\x03\x88\x01\x01\x12K\n<Cabin_Seat_Row1_Pos2_Switch_Backrest_IsReclineForwardEngaged\x18\xd0\x03 \x01(\x08H\xc9\x03\x88\x01\x01\x12L\n=Cabin_Seat_Row1_Pos2_Switch_Backrest_IsReclineBackwardEngaged\x18\xd1\x03 \x01(\x08H\xca\x03\x88\x01\x01\x12O\n@Cabin_Seat_Row1_Pos2_Switch_Backrest_Lumbar_IsMoreSupportEngaged\x18\xd2\x03 \x01(\x08H\xcb\x03\x88\x01\x01\x12O\n@Cabin_Seat_Row1_Pos2_Switch_Backrest_Lumbar_IsLessSupportEngaged\x18\xd3\x03 \x01(\x08H\xcc\x03\x88\x01\x01\x12\x46\n7Cabin_Seat_Row1_Pos2_Switch_Backrest_Lumbar_IsUpEngaged\x18\xd4\x03 \x01(\x08H\xcd\x03\x88\x01\x01\x12H\n9Cabin_Seat_Row1_Pos2_Switch_Backrest_Lumbar_IsDownEngaged\x18\xd5\x03 \x01(\x08H\xce\x03\x88\x01\x01\x12T\nECabin_Seat_Row1_Pos2_Switch_Backrest_SideBolster_IsMoreSupportEngaged\x18\xd6\x03 \x01(\x08H\xcf\x03\x88\x01\x01\x12T\nECabin_Seat_Row1_Pos2_Switch_Backrest_SideBolster_IsLessSupportEngaged\x18\xd7\x03 \x01(\x08H\xd0\x03\x88\x01\x01\x12\x43\n4Cabin_Seat_Row1_Pos2_Switch_Seating_IsForwardEngaged\x18\xd8\x03 \x01(\x08H\xd1\x03\x88\x01\x01\x12\x44\n5Cabin_Seat_Row1_Pos2_Switch_Seating_IsBackwardEngaged\x18\xd9\x03 \x01(\x08H\xd2\x03\x88\x01\x01\x12?\n0Cabin_Seat_Row1_Pos2_Switch_Headrest_IsUpEngaged\x18\xda\x03 \x01(\x08H\xd3\x03\x88\x01\x01\x12\x41\n2Cabin_Seat_Row1_Pos2_Switch_Headrest_IsDownEngaged\x18\xdb\x03 \x01(\x08H\xd4\x03\x88\x01\x01\x12\x44\n5Cabin_Seat_Row1_Pos2_Switch_Headrest_IsForwardEngaged\x18\xdc\x03 \x01(\x08H\xd5\x03\x88\x01\x01\x12\x45\n6Cabin_Seat_Row1_Pos2_Switch_Headrest_IsBackwardEngaged\x18\xdd\x03 \x01(\x08H\xd6\x03\x88\x01\x01\x12\x44\n5Cabin_Seat_Row1_Pos2_Switch_Massage_IsIncreaseEngaged\x18\xde\x03 \x01(\x08H\xd7\x03\x88\x01\x01\x12\x44\n5Cabin_Seat_Row1_Pos2_Switch_Massage_IsDecreaseEngaged\x18\xdf\x03 \x01(\x08H\xd8\x03\x88\x01\x01\x12.\n\x1f\x43\x61\x62in_Seat_Row1_Pos3_IsOccupied\x18\xe0\x03 \x01(\x08H\xd9\x03\x88\x01\x01\x12?\n0Cabin_Seat_Row1_Pos3_Occupant_Identifier_Subject\x18\xe1\x03 \x01(\tH\xda\x03\x88\x01\x01\x12>\n/Cabin_Seat_Row1_Pos3_Occupant_Identifier_Issuer\x18\xe2\x03 \x01(\tH\xdb\x03\x88\x01\x01\x12,\n\x1d\x43\x61\x62in_Seat_Row1_Pos3_IsBelted\x18\xe3\x03 \x01(\x08H\xdc\x03\x88\x01\x01\x12+\n\x1c\x43\x61\x62in_Seat_Row1_Pos3_Heating\x18\xe4\x03 \x01(\x11H\xdd\x03\x88\x01\x01\x12+\n\x1c\x43\x61\x62in_Seat_Row1_Pos3_Massage\x18\xe5\x03 \x01(\rH\xde\x03\x88\x01\x01\x12,\n\x1d\x43\x61\x62in_Seat_Row1_Pos3_Position\x18\xe6\x03 \x01(\rH\xdf\x03\x88\x01\x01\x12*\n\x1b\x43\x61\x62in_Seat_Row1_Pos3_Height\x18\xe7\x03 \x01(\rH\xe0\x03\x88\x01\x01\x12(\n\x19\x43\x61\x62in_Seat_Row1_Pos3_Tilt\x18\xe8\x03 \x01(\x02H\xe1\x03\x88\x01\x01\x12\x34\n%Cabin_Seat_Row1_Pos3_Backrest_Recline\x18\xe9\x03 \x01(\x02H\xe2\x03\x88\x01\x01\x12;\n,Cabin_Seat_Row1_Pos3_Backrest_Lumbar_Support\x18\xea\x03 \x01(\x02H\xe3\x03\x88\x01\x01\x12:\n+Cabin_Seat_Row1_Pos3_Backrest_Lumbar_Height\x18\xeb\x03 \x01(\rH\xe4\x03\x88\x01\x01\x12@\n1Cabin_Seat_Row1_Pos3_Backrest_SideBolster_Support\x18\xec\x03 \x01(\x02H\xe5\x03\x88\x01\x01\x12\x32\n#Cabin_Seat_Row1_Pos3_Seating_Length\x18\xed\x03 \x01(\rH\xe6\x03\x88\x01\x01\x12\x33\n$Cabin_Seat_Row1_Pos3_Headrest_Height\x18\xee\x03 \x01(\rH\xe7\x03\x88\x01\x01\x12\x32\n#Cabin_Seat_Row1_Pos3_Headrest_Angle\x18\xef\x03 \x01(\x02H\xe8\x03\x88\x01\x01\x12\x35\n&Cabin_Seat_Row1_Pos3_Airbag_IsDeployed\x18\xf0\x03 \x01(\x08H\xe9\x03\x88\x01\x01\x12:\n+Cabin_Seat_Row1_Pos3_Switch_IsWarmerEngaged\x18\xf1\x03 \x01(\x08H\xea\x03\x88\x01\x01\x12:\n+Cabin_Seat_Row1_Pos3_Switch_IsCoolerEngaged\x18\xf2\x03 \x01(\x08H\xeb\x03\x88\x01\x01\x12;\n,Cabin_Seat_Row1_Pos3_Switch_IsForwardEngaged\x18\xf3\x03 \x01(\x08H\xec\x03\x88\x01\x01\x12<\n-Cabin_Seat_Row1_Pos3_Switch_IsBackwardEngaged\x18\xf4\x03 \x01(\x08H\xed\x03\x88\x01\x01\x12\x36\n\'Cabin_Seat_Row1_Pos3_Switch_IsUpEngaged\x18\xf5\x03 \x01(\x08H\xee\x03\x88\x01\x01\x12\x38\n)Cabin_Seat_Row1_Pos3_Switch_IsDownEngaged\x18\xf6\x03 \x01(\x08H\xef\x03\x88\x01\x01\x12?\n0Cabin_Seat_Row1_Pos3_Switch_IsTiltForwardEngaged\x18\xf7\x03 \x01(\x08H\xf0\x03\x88\x01\x01\x12@\n1Cabin_Seat_Row1_Pos3_Switch_IsTiltBackwardEngaged\x18\xf8\x03 \x01(\x08H\xf1\x03\x88\x01\x01\x12K\n<Cabin_Seat_Row1_Pos3_Switch_Backrest_IsReclineForwardEngaged\x18\xf9\x03 \x01(\x08H\xf2\x03\x88\x01\x01\x12L\n=Cabin_Seat_Row1_Pos3_Switch_Backrest_IsReclineBackwardEngaged\x18\xfa\x03 \x01(\x08H\xf3\x03\x88\x01\x01\x12O\n@Cabin_Seat_Row1_Pos3_Switch_Backrest_Lumbar_IsMoreSupportEngaged\x18\xfb\x03 \x01(\x08H\xf4\x03\x88\x01\x01\x12O\n@Cabin_Seat_Row1_Pos3_Switch_Backrest_Lumbar_IsLessSupportEngaged\x18\xfc\x03 \x01(\x08H\xf5\x03\x88\x01\x01\x12\x46\n7Cabin_Seat_Row1_Pos3_Switch_Backrest_Lumbar_IsUpEngaged\x18\xfd\x03 \x01(\x08H\xf6\x03\x88\x01\x01\x12H\n9Cabin_Seat_Row1_Pos3_Switch_Backrest_Lumbar_IsDownEngaged\x18\xfe\x03 \x01(\x08H\xf7\x03\x88\x01\x01\x12T\nECabin_Seat_Row1_Pos3_Switch_Backrest_SideBolster_IsMoreSupportEngaged\x18\xff\x03 \x01(\x08H\xf8\x03\x88\x01\x01\x12T\nECabin_Seat_Row1_Pos3_Switch_Backrest_SideBolster_IsLessSupportEngaged\x18\x80\x04 \x01(\x08H\xf9\x03\x88\x01\x01\x12\x43\n4Cabin_Seat_Row1_Pos3_Switch_Seating_IsForwardEngaged\x18\x81\x04 \x01(\x08H\xfa\x03\x88\x01\x01\x12\x44\n5Cabin_Seat_Row1_Pos3_Switch_Seating_IsBackwardEngaged\x18\x82\x04 \x01(\x08H\xfb\x03\x88\x01\x01\x12?\n0Cabin_Seat_Row1_Pos3_Switch_Headrest_IsUpEngaged\x18\x83\x04 \x01(\x08H\xfc\x03\x88\x01\x01\x12\x41\n2Cabin_Seat_Row1_Pos3_Switch_Headrest_IsDownEngaged\x18\x84\x04 \x01(\x08H\xfd\x03\x88\x01\x01\x12\x44\n5Cabin_Seat_Row1_Pos3_Switch_Headrest_IsForwardEngaged\x18\x85\x04 \x01(\x08H\xfe\x03\x88\x01\x01\x12\x45\n6Cabin_Seat_Row1_Pos3_Switch_Headrest_IsBackwardEngaged\x18\x86\x04 \x01(\x08H\xff\x03\x88\x01\x01\x12\x44\n5Cabin_Seat_Row1_Pos3_Switch_Massage_IsIncreaseEngaged\x18\x87\x04 \x01(\x08H\x80\x04\x88\x01\x01\x12\x44\n5Cabin_Seat_Row1_Pos3_Switch_Massage_IsDecreaseEngaged\x18\x88\x04 \x01(\x08H\x81\x04\x88\x01\x01\x12.\n\x1f\x43\x61\x62in_Seat_Row2_Pos1_IsOccupied\x18\x89\x04 \x01(\x08H\x82\x04\x88\x01\x01\x12?\n0Cabin_Seat_Row2_Pos1_Occupant_Identifier_Subject\x18\x8a\x04 \x01(\tH\x83\x04\x88\x01\x01\x12>\n/Cabin_Seat_Row2_Pos1_Occupant_Identifier_Issuer\x18\x8b\x04 \x01(\tH\x84\x04\x88\x01\x01\x12,\n\x1d\x43\x61\x62in_Seat_Row2_Pos1_IsBelted\x18\x8c\x04 \x01(\x08H\x85\x04\x88\x01\x01\x12+\n\x1c\x43\x61\x62in_Seat_Row2_Pos1_Heating\x18\x8d\x04 \x01(\x11H\x86\x04\x88\x01\x01\x12+\n\x1c\x43\x61\x62in_Seat_Row2_Pos1_Massage\x18\x8e\x04 \x01(\rH\x87\x04\x88\x01\x01\x12,\n\x1d\x43\x61\x62in_Seat_Row2_Pos1_Position\x18\x8f\x04 \x01(\rH\x88\x04\x88\x01\x01\x12*\n\x1b\x43\x61\x62in_Seat_Row2_Pos1_Height\x18\x90\x04 \x01(\rH\x89\x04\x88\x01\x01\x12(\n\x19\x43\x61\x62in_Seat_Row2_Pos1_Tilt\x18\x91\x04 \x01(\x02H\x8a\x04\x88\x01\x01\x12\x34\n%Cabin_Seat_Row2_Pos1_Backrest_Recline\x18\x92\x04 \x01(\x02H\x8b\x04\x88\x01\x01\x12;\n,Cabin_Seat_Row2_Pos1_Backrest_Lumbar_Support\x18\x93\x04 \x01(\x02H\x8c\x04\x88\x01\x01\x12:\n+Cabin_Seat_Row2_Pos1_Backrest_Lumbar_Height\x18\x94\x04 \x01(\rH\x8d\x04\x88\x01\x01\x12@\n1Cabin_Seat_Row2_Pos1_Backrest_SideBolster_Support\x18\x95\x04 \x01(\x02H\x8e\x04\x88\x01\x01\x12\x32\n#Cabin_Seat_Row2_Pos1_Seating_Length\x18\x96\x04 \x01(\rH\x8f\x04\x88\x01\x01\x12\x33\n$Cabin_Seat_Row2_Pos1_Headrest_Height\x18\x97\x04 \x01(\rH\x90\x04\x88\x01\x01\x12\x32\n#Cabin_Seat_Row2_Pos1_Headrest_Angle\x18\x98\x04 \x01(\x02H\x91\x04\x88\x01\x01\x12\x35\n&Cabin_Seat_Row2_Pos1_Airbag_IsDeployed\x18\x99\x04 \x01(\x08H\x92\x04\x88\x01\x01\x12:\n+Cabin_Seat_Row2_Pos1_Switch_IsWarmerEngaged\x18\x9a\x04 \x01(\x08H\x93\x04\x88\x01\x01\x12:\n+Cabin_Seat_Row2_Pos1_Switch_IsCoolerEngaged\x18\x9b\x04 \x01(\x08H\x94\x04\x88\x01\x01\x12;\n,Cabin_Seat_Row2_Pos1_Switch_IsForwardEngaged\x18\x9c\x04 \x01(\x08H\x95\x04\x88\x01\x01\x12<\n-Cabin_Seat_Row2_Pos1_Switch_IsBackwardEngaged\x18\x9d\x04 \x01(\x08H\x96\x04\x88\x01\x01\x12\x36\n\'Cabin_Seat_Row2_Pos1_Switch_IsUpEngaged\x18\x9e\x04 \x01(\x08H\x97\x04\x88\x01\x01\x12\x38\n)Cabin_Seat_Row2_Pos1_Switch_IsDownEngaged\x18\x9f\x04 \x01(\x08H\x98\x04\x88\x01\x01\x12?\n0Cabin_Seat_Row2_Pos1_Switch_IsTiltForwardEngaged\x18\xa0\x04 \x01(\x08H\x99\x04\x88\x01\x01\x12@\n1Cabin_Seat_Row2_Pos1_Switch_IsTiltBackwardEngaged\x18\xa1\x04 \x01(\x08H\x9a\x04\x88\x01\x01\x12K\n<Cabin_Seat_Row2_Pos1_Switch_Backrest_IsReclineForwardEngaged\x18\xa2\x04 \x01(\x08H\x9b\x04\x88\x01\x01\x12L\n=Cabin_Seat_Row2_Pos1_Switch_Backrest_IsReclineBackwardEngaged\x18\xa3\x04 \x01(\x08H\x9c\x04\x88\x01\x01\x12O\n@Cabin_Seat_Row2_Pos1_Switch_Backrest_Lumbar_IsMoreSupportEngaged\x18\xa4\x04 \x01(\x08H\x9d\x04\x88\x01\x01\x12O\n@Cabin_Seat_Row2_Pos1_Switch_Backrest_Lumbar_IsLessSupportEngaged\x18\xa5\x04 \x01(\x08H\x9e\x04\x88\x01\x01\x12\x46\n7Cabin_Seat_Row2_Pos1_Switch_Backrest_Lumbar_IsUpEngaged\x18\xa6\x04 \x01(\x08H\x9f\x04\x88\x01\x01\x12H\n9Cabin_Seat_Row2_Pos1_Switch_Backrest_Lumbar_IsDownEngaged\x18\xa7\x04 \x01(\x08H\xa0\x04\x88\x01\x01\x12T\nECabin_Seat_Row2_Pos1_Switch_Backrest_SideBolster_IsMoreSupportEngaged\x18\xa8\x04 \x01(\x08H\xa1\x04\x88\x01\x01\x12T\nECabin_Seat_Row2_Pos1_Switch_Backrest_SideBolster_IsLessSupportEngaged\x18\xa9\x04 \x01(\x08H\xa2\x04\x88\x01\x01\x12\x43\n4Cabin_Seat_Row2_Pos1_Switch_Seating_IsForwardEngaged\x18\xaa\x04 \x01(\x08H\xa3\x04\x88\x01\x01\x12\x44\n5Cabin_Seat_Row2_Pos1_Switch_Seating_IsBackwardEngaged\x18\xab\x04 \x01(\x08H\xa4\x04\x88\x01\x01\x12?\n0Cabin_Seat_Row2_Pos1_Switch_Headrest_IsUpEngaged\x18\xac\x04 \x01(\x08H\xa5\x04\x88\x01\x01\x12\x41\n2Cabin_Seat_Row2_Pos1_Switch_Headrest_IsDownEngaged\x18\xad\x04 \x01(\x08H\xa6\x04\x88\x01\x01\x12\x44\n5Cabin_Seat_Row2_Pos1_Switch_Headrest_IsForwardEngaged\x18\xae\x04 \x01(\x08H\xa7\x04\x88\x01\x01\x12\x45\n6Cabin_Seat_Row2_Pos1_Switch_Headrest_IsBackwardEngaged\x18\xaf\x04 \x01(\x08H\xa8\x04\x88\x01\x01\x12\x44\n5Cabin_Seat_Row2_Pos1_Switch_Massage_IsIncreaseEngaged\x18\xb0\x04 \x01(\x08H\xa9\x04\x88\x01\x01\x12\x44\n5Cabin_Seat_Row2_Pos1_Switch_Massage_IsDecreaseEngaged\x18\xb1\x04 \x01(\x08H\xaa\x04\x88\x01\x01\x12.\n\x1f\x43\x61\x62in_Seat_Row2_Pos2_IsOccupied\x18\xb2\x04 \x01(\x08H\xab\x04\x88\x01\x01\x12?\n0Cabin_Seat_Row2_Pos2_Occupant_Identifier_Subject\x18\xb3\x04 \x01(\tH\xac\x04\x88\x01\x01\x12>\n/Cabin_Seat_Row2_Pos2_Occupant_Identifier_Issuer\x18\xb4\x04 \x01(\tH\xad\x04\x88\x01\x01\x12,\n\x1d\x43\x61\x62in_Seat_Row2_Pos2_IsBelted\x18\xb5\x04 \x01(\x08H\xae\x04\x88\x01\x01\x12+\n\x1c\x43\x61\x62in_Seat_Row2_Pos2_Heating\x18\xb6\x04 \x01(\x11H\xaf\x04\x88\x01\x01\x12+\n\x1c\x43\x61\x62in_Seat_Row2_Pos2_Massage\x18\xb7\x04 \x01(\rH\xb0\x04\x88\x01\x01\x12,\n\x1d\x43\x61\x62in_Seat_Row2_Pos2_Position\x18\xb8\x04 \x01(\rH\xb1\x04\x88\x01\x01\x12*\n\x1b\x43\x61\x62in_Seat_Row2_Pos2_Height\x18\xb9\x04 \x01(\rH\xb2\x04\x88\x01\x01\x12(\n\x19\x43\x61\x62in_Seat_Row2_Pos2_Tilt\x18\xba\x04 \x01(\x02H\xb3\x04\x88\x01\x01\x12\x34\n%Cabin_Seat_Row2_Pos2_Backrest_Recline\x18\xbb\x04 \x01(\x02H\xb4\x04\x88\x01\x01\x12;\n,Cabin_Seat_Row2_Pos2_Backrest_Lumbar_Support\x18\xbc\x04 \x01(\x02H\xb5\x04\x88\x01\x01\x12:\n+Cabin_Seat_Row2_Pos2_Backrest_Lumbar_Height\x18\xbd\x04 \x01(\rH\xb6\x04\x88\x01\x01\x12@\n1Cabin_Seat_Row2_Pos2_Backrest_SideBolster_Support\x18\xbe\x04 \x01(\x02H\xb7\x04\x88\x01\x01\x12\x32\n#Cabin_Seat_Row2_Pos2_Seating_Length\x18\xbf\x04 \x01(\rH\xb8\x04\x88\x01\x01\x12\x33\n$Cabin_Seat_Row2_Pos2_Headrest_Height\x18\xc0\x04 \x01(\rH\xb9\x04\x88\x01\x01\x12\x32\n#Cabin_Seat_Row2_Pos2_Headrest_Angle\x18\xc1\x04 \x01(\x02H\xba\x04\x88\x01\x01\x12\x35\n&Cabin_Seat_Row2_Pos2_Airbag_IsDeployed\x18\xc2\x04 \x01(\x08H\xbb\x04\x88\x01\x01\x12:\n+Cabin_Seat_Row2_Pos2_Switch_IsWarmerEngaged\x18\xc3\x04 \x01(\x08H\xbc\x04\x88\x01\x01\x12:\n+Cabin_Seat_Row2_Pos2_Switch_IsCoolerEngaged\x18\xc4\x04 \x01(\x08H\xbd\x04\x88\x01\x01\x12;\n,Cabin_Seat_Row2_Pos2_Switch_IsForwardEngaged\x18\xc5\x04 \x01(\x08H\xbe\x04\x88\x01\x01\x12<\n-Cabin_Seat_Row2_Pos2_Switch_IsBackwardEngaged\x18\xc6\x04 \x01(\x08H\xbf\x04\x88\x01\x01\x12\x36\n\'Cabin_Seat_Row2_Pos2_Switch_IsUpEngaged\x18\xc7\x04 \x01(\x08H\xc0\x04\x88\x01\x01\x12\x38\n)Cabin_Seat_Row2_Pos2_Switch_IsDownEngaged\x18\xc8\x04 \x01(\x08H\xc1\x04\x88\x01\x01\x12?\n0Cabin_Seat_Row2_Pos2_Switch_IsTiltForwardEngaged\x18\xc9\x04 \x01(\x08H\xc2\x04\x88\x01\x01\x12@\n1Cabin_Seat_Row2_Pos2_Switch_IsTiltBackwardEngaged\x18\xca\x04 \x01(\x08H\xc3\x04\x88\x01\x01\x12K\n<Cabin_Seat_Row2_Pos2_Switch_Backrest_IsReclineForwardEngaged\x18\xcb\x04 \x01(\x08H\xc4\x04\x88\x01\x01\x12L\n=Cabin_Seat_Row2_Pos2_Switch_Backrest_IsReclineBackwardEngaged\x18\xcc\x04 \x01(\x08H\xc5\x04\x88\x01\x01\x12O\n@Cabin_Seat_Row2_Pos2_Switch_Backrest_Lumbar_IsMoreSupportEngaged\x18\xcd\x04 \x01(\x08H\xc6\x04\x88\x01\x01\x12O\n@Cabin_Seat_Row2_Pos2_Switch_Backrest_Lumbar_IsLessSupportEngaged\x18\xce\x04 \x01(\x08H\xc7\x04\x88\x01\x01\x12\x46\n7Cabin_Seat_Row2_Pos2_Switch_Backrest_Lumbar_IsUpEngaged\x18\xcf\x04 \x01(\x08H\xc8\x04\x88\x01\x01\x12H\n9Cabin_Seat_Row2_Pos2_Switch_Backrest_Lumbar_IsDownEngaged\x18\xd0\x04 \x01(\x08H\xc9\x04\x88\x01\x01\x12T\nECabin_Seat_Row2_Pos2_Switch_Backrest_SideBolster_IsMoreSupportEngaged\x18\xd1\x04 \x01(\x08H\xca\x04\x88\x01\x01\x12T\nECabin_Seat_Row2_Pos2_Switch_Backrest_SideBolster_IsLessSupportEngaged\x18\xd2\x04 \x01(\x08H\xcb\x04\x88\x01\x01\x12\x43\n4Cabin_Seat_Row2_Pos2_Switch_Seating_IsForwardEngaged\x18\xd3\x04 \x01(\x08H\xcc\x04\x88\x01\x01\x12\x44\n5Cabin_Seat_Row2_Pos2_Switch_Seating_IsBackwardEngaged\x18\xd4\x04 \x01(\x08H\xcd\x04\x88\x01\x01\x12?\n0Cabin_Seat_Row2_Pos2_Switch_Headrest_IsUpEngaged\x18\xd5\x04 \x01(\x08H\xce\x04\x88\x01\x01\x12\x41\n2Cabin_Seat_Row2_Pos2_Switch_Headrest_IsDownEngaged\x18\xd6\x04 \x01(\x08H\xcf\x04\x88\x01\x01\x12\x44\n5Cabin_Seat_Row2_Pos2_Switch_Headrest_IsForwardEngaged\x18\xd7\x04 \x01(\x08H\xd0\x04\x88\x01\x01\x12\x45\n6Cabin_Seat_Row2_Pos2_Switch_Headrest_IsBackwardEngaged\x18\xd8\x04 \x01(\x08H\xd1\x04\x88\x01\x01\x12\x44\n5Cabin_Seat_Row2_Pos2_Switch_Massage_IsIncreaseEngaged\x18\xd9\x04 \x01(\x08H\xd2\x04\x88\x01\x01\x12\x44\n5Cabin_Seat_Row2_Pos2_Switch_Massage_IsDecreaseEngaged\x18\xda\x04 \x01(\x08H\xd3\x04\x88\x01\x01\x12.\n\x1f\x43\x61\x62in_Seat_Row2_Pos3_IsOccupied\x18\xdb\x04 \x01(\x08H\xd4\x04\x88\x01\x01\x12?\n0Cabin_Seat_Row2_Pos3_Occupant_Identifier_Subject\x18\xdc\x04 \x01(\tH\xd5\x04\x88\x01\x01\x12>\n/Cabin_Seat_Row2_Pos3_Occupant_Identifier_Issuer\x18\xdd\x04 \x01(\tH\xd6\x04\x88\x01\x01\x12,\n\x1d\x43\x61\x62in_Seat_Row2_Pos3_IsBelted\x18\xde\x04 \x01(\x08H\xd7\x04\x88\x01\x01\x12+\n\x1c\x43\x61\x62in_Seat_Row2_Pos3_Heating\x18\xdf\x04 \x01(\x11H\xd8\x04\x88\x01\x01\x12+\n\x1c\x43\x61\x62in_Seat_Row2_Pos3_Massage\x18\xe0\x04 \x01(\rH\xd9\x04\x88\x01\x01\x12,\n\x1d\x43\x61\x62in_Seat_Row2_Pos3_Position\x18\xe1\x04 \x01(\rH\xda\x04\x88\x01\x01\x12*\n\x1b\x43\x61\x62in_Seat_Row2_Pos3_Height\x18\xe2\x04 \x01(\rH\xdb\x04\x88\x01\x01\x12(\n\x19\x43\x61\x62in_Seat_Row2_Pos3_Tilt\x18\xe3\x04 \x01(\x02H\xdc\x04\x88\x01\x01\x12\x34\n%Cabin_Seat_Row2_Pos3_Backrest_Recline\x18\xe4\x04 \x01(\x02H\xdd\x04\x88\x01\x01\x12;\n,Cabin_Seat_Row2_Pos3_Backrest_Lumbar_Support\x18\xe5\x04 \x01(\x02H\xde\x04\x88\x01\x01\x12:\n+Cabin_Seat_Row2_Pos3_Backrest_Lumbar_Height\x18\xe6\x04 \x01(\rH\xdf\x04\x88\x01\x01\x12@\n1Cabin_Seat_Row2_Pos3_Backrest_SideBolster_Support\x18\xe7\x04 \x01(\x02H\xe0\x04\x88\x01\x01\x12\x32\n#Cabin_Seat_Row2_Pos3_Seating_Length\x18\xe8\x04 \x01(\rH\xe1\x04\x88\x01\x01\x12\x33\n$Cabin_Seat_Row2_Pos3_Headrest_Height\x18\xe9\x04 \x01(\rH\xe2\x04\x88\x01\x01\x12\x32\n#Cabin_Seat_Row2_Pos3_Headrest_Angle\x18\xea\x04 \x01(\x02H\xe3\x04\x88\x01\x01\x12\x35\n&Cabin_Seat_Row2_Pos3_Airbag_IsDeployed\x18\xeb\x04 \x01(\x08H\xe4\x04\x88\x01\x01\x12:\n+Cabin_Seat_Row2_Pos3_Switch_IsWarmerEngaged\x18\xec\x04 \x01(\x08H\xe5\x04\x88\x01\x01\x12:\n+Cabin_Seat_Row2_Pos3_Switch_IsCoolerEngaged\x18\xed\x04 \x01(\x08H\xe6\x04\x88\x01\x01\x12;\n,Cabin_Seat_Row2_Pos3_Switch_IsForwardEngaged\x18\xee\x04 \x01(\x08H\xe7\x04\x88\x01\x01\x12<\n-Cabin_Seat_Row2_Pos3_Switch_IsBackwardEngaged\x18\xef\x04 \x01(\x08H\xe8\x04\x88\x01\x01\x12\x36\n\'Cabin_Seat_Row2_Pos3_Switch_IsUpEngaged\x18\xf0\x04 \x01(\x08H\xe9\x04\x88\x01\x01\x12\x38\n)Cabin_Seat_Row2_Pos3_Switch_IsDownEngaged\x18\xf1\x04 \x01(\x08H\xea\x04\x88\x01\x01\x12?\n0Cabin_Seat_Row2_Pos3_Switch_IsTiltForwardEngaged\x18\xf2\x04 \x01(\x08H\xeb\x04\x88\x01\x01\x12@\n1Cabin_Seat_Row2_Pos3_Switch_IsTiltBackwardEngaged\x18\xf3\x04 \x01(\x08H\xec\x04\x88\x01\x01\x12K\n<Cabin_Seat_Row2_Pos3_Switch_Backrest_IsReclineForwardEngaged\x18\xf4\x04 \x01(\x08H\xed\x04\x88\x01\x01\x12L\n=Cabin_Seat_Row2_Pos3_Switch_Backrest_IsReclineBackwardEngaged\x18\xf5\x04 \x01(\x08H\xee\x04\x88\x01\x01\x12O\n@Cabin_Seat_Row2_Pos3_Switch_Backrest_Lumbar_IsMoreSupportEngaged\x18\xf6\x04 \x01(\x08H\xef\x04\x88\x01\x01\x12O\n@Cabin_Seat_Row2_Pos3_Switch_Backrest_Lumbar_IsLessSupportEngaged\x18\xf7\x04 \x01(\x08H\xf0\x04\x88\x01\x01\x12\x46\n7Cabin_Seat_Row2_Pos3_Switch_Backrest_Lumbar_IsUpEngaged\x18\xf8\x04 \x01(\x08H\xf1\x04\x88\x01\x01\x12H\n9Cabin_Seat_Row2_Pos3_Switch_Backrest_Lumbar_IsDownEngaged\x18\xf9\x04 \x01(\x08H\xf2\x04\x88\x01\x01\x12T\nECabin_Seat_Row2_Pos3_Switch_Backrest_SideBolster_IsMoreSupportEngaged\x18\xfa\x04 \x01(\x08H\xf3\x04\x88\x01\x01\x12T\nECabin_Seat_Row2_Pos3_Switch_Backrest_SideBolster_IsLessSupportEngaged\x18\xfb\x04 \x01(\x08H\xf4\x04\x88\x01\x01\x12\x43\n4Cabin_Seat_Row2_Pos3_Switch_Seating_IsForwardEngaged\x18\xfc\x04 \x01(\x08H\xf5\x04\x88\x01\x01\x12\x44\n5Cabin_Seat_Row2_Pos3_Switch_Seating_IsBackwardEngaged\x18\xfd\x04 \x01(\x08H\xf6\x04\x88\x01\x01\x12?\n0Cabin_Seat_Row2_Pos3_Switch_Headrest_IsUpEngaged\x18\xfe\x04 \x01(\x08H\xf7\x04\x88\x01\x01\x12\x41\n2Cabin_Seat_Row2_Pos3_Switch_Headrest_IsDownEngaged\x18\xff\x04 \x01(\x08H\xf8\x04\x88\x01\x01\x12\x44\n5Cabin_Seat_Row2_Pos3_Switch_Headrest_IsForwardEngaged\x18\x80\x05 \x01(\x08H\xf9\x04\x88\x01\x01\x12\x45\n6Cabin_Seat_Row2_Pos3_Switch_Headrest_IsBackwardEngaged\x18\x81\x05 \x01(\x08H\xfa\x04\x88\x01\x01\x12\x44\n5Cabin_Seat_Row2_Pos3_Switch_Massage_IsIncreaseEngaged\x18\x82\x05 \x01(\x08H\xfb\x04\x88\x01\x01\x12\x44\n5Cabin_Seat_Row2_Pos3_Switch_Massage_IsDecreaseEngaged\x18\x83\x05 \x01(\x08H\xfc\x04\x88\x01\x01\x12#\n\x14\x43\x61\x62in_DriverPosition\x18\x84\x05 \x01(\rH\xfd\x04\x88\x01\x01\x12!\n\x12\x43\x61\x62in_SeatRowCount\x18\x85\x05 \x01(\rH\xfe\x04\x88\x01\x01\x12\x1b\n\x12\x43\x61\x62in_SeatPosCount\x18\x86\x05 \x03(\r\x12\'\n\x18\x43\x61\x62in_Convertible_Status\x18\x87\x05 \x01(\tH\xff\x04\x88\x01\x01\x12\'\n\x18\x43\x61\x62in_PowerOptimizeLevel\x18\x88\x05 \x01(\rH\x80\x05\x88\x01\x01\x12\'\n\x18\x41\x44\x41S_ActiveAutonomyLevel\x18\x89\x05 \x01(\tH\x81\x05\x88\x01\x01\x12*\n\x1b\x41\x44\x41S_SupportedAutonomyLevel\x18\x8a\x05 \x01(\tH\x82\x05\x88\x01\x01\x12+\n\x1c\x41\x44\x41S_CruiseControl_IsEnabled\x18\x8b\x05 \x01(\x08H\x83\x05\x88\x01\x01\x12*\n\x1b\x41\x44\x41S_CruiseControl_IsActive\x18\x8c\x05 \x01(\x08H\x84\x05\x88\x01\x01\x12*\n\x1b\x41\x44\x41S_CruiseControl_SpeedSet\x18\x8d\x05 \x01(\x02H\x85\x05\x88\x01\x01\x12)\n\x1a\x41\x44\x41S_CruiseControl_IsError\x18\x8e\x05 \x01(\x08H\x86\x05\x88\x01\x01\x12\x34\n%ADAS_LaneDepartureDetection_IsEnabled\x18\x8f\x05 \x01(\x08H\x87\x05\x88\x01\x01\x12\x34\n%ADAS_LaneDepartureDetection_IsWarning\x18\x90\x05 \x01(\x08H\x88\x05\x88\x01\x01\x12\x32\n#ADAS_LaneDepartureDetection_IsError\x18\x91\x05 \x01(\x08H\x89\x05\x88\x01\x01\x12/\n ADAS_ObstacleDetection_IsEnabled\x18\x92\x05 \x01(\x08H\x8a\x05\x88\x01\x01\x12/\n ADAS_ObstacleDetection_IsWarning\x18\x93\x05 \x01(\x08H\x8b\x05\x88\x01\x01\x12-\n\x1e\x41\x44\x41S_ObstacleDetection_IsError\x18\x94\x05 \x01(\x08H\x8c\x05\x88\x01\x01\x12!\n\x12\x41\x44\x41S_ABS_IsEnabled\x18\x95\x05 \x01(\x08H\x8d\x05\x88\x01\x01\x12\x1f\n\x10\x41\x44\x41S_ABS_IsError\x18\x96\x05 \x01(\x08H\x8e\x05\x88\x01\x01\x12!\n\x12\x41\x44\x41S_ABS_IsEngaged\x18\x97\x05 \x01(\x08H\x8f\x05\x88\x01\x01\x12!\n\x12\x41\x44\x41S_TCS_IsEnabled\x18\x98\x05 \x01(\x08H\x90\x05\x88\x01\x01\x12\x1f\n\x10\x41\x44\x41S_TCS_IsError\x18\x99\x05 \x01(\x08H\x91\x05\x88\x01\x01\x12!\n\x12\x41\x44\x41S_TCS_IsEngaged\x18\x9a\x05 \x01(\x08H\x92\x05\x88\x01\x01\x12!\n\x12\x41\x44\x41S_ESC_IsEnabled\x18\x9b\x05 \x01(\x08H\x93\x05\x88\x01\x01\x12\x1f\n\x10\x41\x44\x41S_ESC_IsError\x18\x9c\x05 \x01(\x08H\x94\x05\x88\x01\x01\x12!\n\x12\x41\x44\x41S_ESC_IsEngaged\x18\x9d\x05 \x01(\x08H\x95\x05\x88\x01\x01\x12\x31\n\"ADAS_ESC_IsStrongCrossWindDetected\x18\x9e\x05 \x01(\x08H\x96\x05\x88\x01\x01\x12\x31\n\"ADAS_ESC_RoadFriction_MostProbable\x18\x9f\x05 \x01(\x02H\x97\x05\x88\x01\x01\x12/\n ADAS_ESC_RoadFriction_LowerBound\x18\xa0\x05 \x01(\x02H\x98\x05\x88\x01\x01\x12/\n ADAS_ESC_RoadFriction_UpperBound\x18\xa1\x05 \x01(\x02H\x99\x05\x88\x01\x01\x12!\n\x12\x41\x44\x41S_EBD_IsEnabled\x18\xa2\x05 \x01(\x08H\x9a\x05\x88\x01\x01\x12\x1f\n\x10\x41\x44\x41S_EBD_IsError\x18\xa3\x05 \x01(\x08H\x9b\x05\x88\x01\x01\x12!\n\x12\x41\x44\x41S_EBD_IsEngaged\x18\xa4\x05 \x01(\x08H\x9c\x05\x88\x01\x01\x12!\n\x12\x41\x44\x41S_EBA_IsEnabled\x18\xa5\x05 \x01(\x08H\x9d\x05\x88\x01\x01\x12\x1f\n\x10\x41\x44\x41S_EBA_IsError\x18\xa6\x05 \x01(\x08H\x9e\x05\x88\x01\x01\x12!\n\x12\x41\x44\x41S_EBA_IsEngaged\x18\xa7\x05 \x01(\x08H\x9f\x05\x88\x01\x01\x12&\n\x17\x41\x44\x41S_PowerOptimizeLevel\x18\xa8\x05 \x01(\rH\xa0\x05\x88\x01\x01\x12 \n\x11\x43hassis_Wheelbase\x18\xa9\x05 \x01(\rH\xa1\x05\x88\x01\x01\x12\x1c\n\rChassis_Track\x18\xaa\x05 \x01(\rH\xa2\x05\x88\x01\x01\x12+\n\x1c\x43hassis_Axle_Row1_WheelCount\x18\xab\x05 \x01(\rH\xa3\x05\x88\x01\x01\x12.\n\x1f\x43hassis_Axle_Row1_WheelDiameter\x18\xac\x05 \x01(\x02H\xa4\x05\x88\x01\x01\x12+\n\x1c\x43hassis_Axle_Row1_WheelWidth\x18\xad\x05 \x01(\x02H\xa5\x05\x88\x01\x01\x12.\n\x1f\x43hassis_Axle_Row1_SteeringAngle\x18\xae\x05 \x01(\x02H\xa6\x05\x88\x01\x01\x12-\n\x1e\x43hassis_Axle_Row1_TireDiameter\x18\xaf\x05 \x01(\x02H\xa7\x05\x88\x01\x01\x12*\n\x1b\x43hassis_Axle_Row1_TireWidth\x18\xb0\x05 \x01(\rH\xa8\x05\x88\x01\x01\x12\x30\n!Chassis_Axle_Row1_TireAspectRatio\x18\xb1\x05 \x01(\rH\xa9\x05\x88\x01\x01\x12<\n-Chassis_Axle_Row1_Wheel_Left_Brake_FluidLevel\x18\xb2\x05 \x01(\rH\xaa\x05\x88\x01\x01\x12\x41\n2Chassis_Axle_Row1_Wheel_Left_Brake_IsFluidLevelLow\x18\xb3\x05 \x01(\x08H\xab\x05\x88\x01\x01\x12\x39\n*Chassis_Axle_Row1_Wheel_Left_Brake_PadWear\x18\xb4\x05 \x01(\rH\xac\x05\x88\x01\x01\x12>\n/Chassis_Axle_Row1_Wheel_Left_Brake_IsBrakesWorn\x18\xb5\x05 \x01(\x08H\xad\x05\x88\x01\x01\x12\x39\n*Chassis_Axle_Row1_Wheel_Left_Tire_Pressure\x18\xb6\x05 \x01(\rH\xae\x05\x88\x01\x01\x12>\n/Chassis_Axle_Row1_Wheel_Left_Tire_IsPressureLow\x18\xb7\x05 \x01(\x08H\xaf\x05\x88\x01\x01\x12<\n-Chassis_Axle_Row1_Wheel_Left_Tire_Temperature\x18\xb8\x05 \x01(\x02H\xb0\x05\x88\x01\x01\x12\x31\n\"Chassis_Axle_Row1_Wheel_Left_Speed\x18\xb9\x05 \x01(\x02H\xb1\x05\x88\x01\x01\x12=\n.Chassis_Axle_Row1_Wheel_Right_Brake_FluidLevel\x18\xba\x05 \x01(\rH\xb2\x05\x88\x01\x01\x12\x42\n3Chassis_Axle_Row1_Wheel_Right_Brake_IsFluidLevelLow\x18\xbb\x05 \x01(\x08H\xb3\x05\x88\x01\x01\x12:\n+Chassis_Axle_Row1_Wheel_Right_Brake_PadWear\x18\xbc\x05 \x01(\rH\xb4\x05\x88\x01\x01\x12?\n0Chassis_Axle_Row1_Wheel_Right_Brake_IsBrakesWorn\x18\xbd\x05 \x01(\x08H\xb5\x05\x88\x01\x01\x12:\n+Chassis_Axle_Row1_Wheel_Right_Tire_Pressure\x18\xbe\x05 \x01(\rH\xb6\x05\x88\x01\x01\x12?\n0Chassis_Axle_Row1_Wheel_Right_Tire_IsPressureLow\x18\xbf\x05 \x01(\x08H\xb7\x05\x88\x01\x01\x12=\n.Chassis_Axle_Row1_Wheel_Right_Tire_Temperature\x18\xc0\x05 \x01(\x02H\xb8\x05\x88\x01\x01\x12\x32\n#Chassis_Axle_Row1_Wheel_Right_Speed\x18\xc1\x05 \x01(\x02H\xb9\x05\x88\x01\x01\x12+\n\x1c\x43hassis_Axle_Row2_WheelCount\x18\xc2\x05 \x01(\rH\xba\x05\x88\x01\x01\x12.\n\x1f\x43hassis_Axle_Row2_WheelDiameter\x18\xc3\x05 \x01(\x02H\xbb\x05\x88\x01\x01\x12+\n\x1c\x43hassis_Axle_Row2_WheelWidth\x18\xc4\x05 \x01(\x02H\xbc\x05\x88\x01\x01\x12.\n\x1f\x43hassis_Axle_Row2_SteeringAngle\x18\xc5\x05 \x01(\x02H\xbd\x05\x88\x01\x01\x12-\n\x1e\x43hassis_Axle_Row2_TireDiameter\x18\xc6\x05 \x01(\x02H\xbe\x05\x88\x01\x01\x12*\n\x1b\x43hassis_Axle_Row2_TireWidth\x18\xc7\x05 \x01(\rH\xbf\x05\x88\x01\x01\x12\x30\n!Chassis_Axle_Row2_TireAspectRatio\x18\xc8\x05 \x01(\rH\xc0\x05\x88\x01\x01\x12<\n-Chassis_Axle_Row2_Wheel_Left_Brake_FluidLevel\x18\xc9\x05 \x01(\rH\xc1\x05\x88\x01\x01\x12\x41\n2Chassis_Axle_Row2_Wheel_Left_Brake_IsFluidLevelLow\x18\xca\x05 \x01(\x08H\xc2\x05\x88\x01\x01\x12\x39\n*Chassis_Axle_Row2_Wheel_Left_Brake_PadWear\x18\xcb\x05 \x01(\rH\xc3\x05\x88\x01\x01\x12>\n/Chassis_Axle_Row2_Wheel_Left_Brake_IsBrakesWorn\x18\xcc\x05 \x01(\x08H\xc4\x05\x88\x01\x01\x12\x39\n*Chassis_Axle_Row2_Wheel_Left_Tire_Pressure\x18\xcd\x05 \x01(\rH\xc5\x05\x88\x01\x01\x12>\n/Chassis_Axle_Row2_Wheel_Left_Tire_IsPressureLow\x18\xce\x05 \x01(\x08H\xc6\x05\x88\x01\x01\x12<\n-Chassis_Axle_Row2_Wheel_Left_Tire_Temperature\x18\xcf\x05 \x01(\x02H\xc7\x05\x88\x01\x01\x12\x31\n\"Chassis_Axle_Row2_Wheel_Left_Speed\x18\xd0\x05 \x01(\x02H\xc8\x05\x88\x01\x01\x12=\n.Chassis_Axle_Row2_Wheel_Right_Brake_FluidLevel\x18\xd1\x05 \x01(\rH\xc9\x05\x88\x01\x01\x12\x42\n3Chassis_Axle_Row2_Wheel_Right_Brake_IsFluidLevelLow\x18\xd2\x05 \x01(\x08H\xca\x05\x88\x01\x01\x12:\n+Chassis_Axle_Row2_Wheel_Right_Brake_PadWear\x18\xd3\x05 \x01(\rH\xcb\x05\x88\x01\x01\x12?\n0Chassis_Axle_Row2_Wheel_Right_Brake_IsBrakesWorn\x18\xd4\x05 \x01(\x08H\xcc\x05\x88\x01\x01\x12:\n+Chassis_Axle_Row2_Wheel_Right_Tire_Pressure\x18\xd5\x05 \x01(\rH\xcd\x05\x88\x01\x01\x12?\n0Chassis_Axle_Row2_Wheel_Right_Tire_IsPressureLow\x18\xd6\x05 \x01(\x08H\xce\x05\x88\x01\x01\x12=\n.Chassis_Axle_Row2_Wheel_Right_Tire_Temperature\x18\xd7\x05 \x01(\x02H\xcf\x05\x88\x01\x01\x12\x32\n#Chassis_Axle_Row2_Wheel_Right_Speed\x18\xd8\x05 \x01(\x02H\xd0\x05\x88\x01\x01\x12 \n\x11\x43hassis_AxleCount\x18\xd9\x05 \x01(\rH\xd1\x05\x88\x01\x01\x12-\n\x1e\x43hassis_ParkingBrake_IsEngaged\x18\xda\x05 \x01(\x08H\xd2\x05\x88\x01\x01\x12*\n\x1b\x43hassis_SteeringWheel_Angle\x18\xdb\x05 \x01(\x11H\xd3\x05\x88\x01\x01\x12)\n\x1a\x43hassis_SteeringWheel_Tilt\x18\xdc\x05 \x01(\rH\xd4\x05\x88\x01\x01\x12.\n\x1f\x43hassis_SteeringWheel_Extension\x18\xdd\x05 \x01(\rH\xd5\x05\x88\x01\x01\x12-\n\x1e\x43hassis_SteeringWheel_Position\x18\xde\x05 \x01(\tH\xd6\x05\x88\x01\x01\x12\x30\n!Chassis_Accelerator_PedalPosition\x18\xdf\x05 \x01(\rH\xd7\x05\x88\x01\x01\x12*\n\x1b\x43hassis_Brake_PedalPosition\x18\xe0\x05 \x01(\rH\xd8\x05\x88\x01\x01\x12=\n.Chassis_Brake_IsDriverEmergencyBrakingDetected\x18\xe1\x05 \x01(\x08H\xd9\x05\x88\x01\x01\x12\x18\n\tOBD_PidsA\x18\xe2\x05 \x01(\rH\xda\x05\x88\x01\x01\x12!\n\x12OBD_Status_IsMILOn\x18\xe3\x05 \x01(\x08H\xdb\x05\x88\x01\x01\x12\"\n\x13OBD_Status_DTCCount\x18\xe4\x05 \x01(\rH\xdc\x05\x88\x01\x01\x12&\n\x17OBD_Status_IgnitionType\x18\xe5\x05 \x01(\tH\xdd\x05\x88\x01\x01\x12\x14\n\x0bOBD_DTCList\x18\xe6\x05 \x03(\t\x12\x1c\n\rOBD_FreezeDTC\x18\xe7\x05 \x01(\tH\xde\x05\x88\x01\x01\x12\x1d\n\x0eOBD_FuelStatus\x18\xe8\x05 \x01(\tH\xdf\x05\x88\x01\x01\x12\x1d\n\x0eOBD_EngineLoad\x18\xe9\x05 \x01(\x02H\xe0\x05\x88\x01\x01\x12%\n\x16OBD_CoolantTemperature\x18\xea\x05 \x01(\x02H\xe1\x05\x88\x01\x01\x12%\n\x16OBD_ShortTermFuelTrim1\x18\xeb\x05 \x01(\x02H\xe2\x05\x88\x01\x01\x12$\n\x15OBD_LongTermFuelTrim1\x18\xec\x05 \x01(\x02H\xe3\x05\x88\x01\x01\x12%\n\x16OBD_ShortTermFuelTrim2\x18\xed\x05 \x01(\x02H\xe4\x05\x88\x01\x01\x12$\n\x15OBD_LongTermFuelTrim2\x18\xee\x05 \x01(\x02H\xe5\x05\x88\x01\x01\x12\x1f\n\x10OBD_FuelPressure\x18\xef\x05 \x01(\x02H\xe6\x05\x88\x01\x01\x12\x16\n\x07OBD_MAP\x18\xf0\x05 \x01(\x02H\xe7\x05\x88\x01\x01\x12\x1e\n\x0fOBD_EngineSpeed\x18\xf1\x05 \x01(\x02H\xe8\x05\x88\x01\x01\x12\x18\n\tOBD_Speed\x18\xf2\x05 \x01(\x02H\xe9\x05\x88\x01\x01\x12 \n\x11OBD_TimingAdvance\x18\xf3\x05 \x01(\x02H\xea\x05\x88\x01\x01\x12\x1d\n\x0eOBD_IntakeTemp\x18\xf4\x05 \x01(\x02H\xeb\x05\x88\x01\x01\x12\x16\n\x07OBD_MAF\x18\xf5\x05 \x01(\x02H\xec\x05\x88\x01\x01\x12#\n\x14OBD_ThrottlePosition\x18\xf6\x05 \x01(\x02H\xed\x05\x88\x01\x01\x12\x1c\n\rOBD_AirStatus\x18\xf7\x05 \x01(\tH\xee\x05\x88\x01\x01\x12(\n\x19OBD_OxygenSensorsIn2Banks\x18\xf8\x05 \x01(\rH\xef\x05\x88\x01\x01\x12%\n\x16OBD_O2_Sensor1_Voltage\x18\xf9\x05 \x01(\x02H\xf0\x05\x88\x01\x01\x12/\n OBD_O2_Sensor1_ShortTermFuelTrim\x18\xfa\x05 \x01(\x02H\xf1\x05\x88\x01\x01\x12%\n\x16OBD_O2_Sensor2_Voltage\x18\xfb\x05 \x01(\x02H\xf2\x05\x88\x01\x01\x12/\n OBD_O2_Sensor2_ShortTermFuelTrim\x18\xfc\x05 \x01(\x02H\xf3\x05\x88\x01\x01\x12%\n\x16OBD_O2_Sensor3_Voltage\x18\xfd\x05 \x01(\x02H\xf4\x05\x88\x01\x01\x12/\n OBD_O2_Sensor3_ShortTermFuelTrim\x18\xfe\x05 \x01(\x02H\xf5\x05\x88\x01\x01\x12%\n\x16OBD_O2_Sensor4_Voltage\x18\xff\x05 \x01(\x02H\xf6\x05\x88\x01\x01\x12/\n OBD_O2_Sensor4_ShortTermFuelTrim\x18\x80\x06 \x01(\x02H\xf7\x05\x88\x01\x01\x12%\n\x16OBD_O2_Sensor5_Voltage\x18\x81\x06 \x01(\x02H\xf8\x05\x88\x01\x01\x12/\n OBD_O2_Sensor5_ShortTermFuelTrim\x18\x82\x06 \x01(\x02H\xf9\x05\x88\x01\x01\x12%\n\x16OBD_O2_Sensor6_Voltage\x18\x83\x06 \x01(\x02H\xfa\x05\x88\x01\x01\x12/\n OBD_O2_Sensor6_ShortTermFuelTrim\x18\x84\x06 \x01(\x02H\xfb\x05\x88\x01\x01\x12%\n\x16OBD_O2_Sensor7_Voltage\x18\x85\x06 \x01(\x02H\xfc\x05\x88\x01\x01\x12/\n OBD_O2_Sensor7_ShortTermFuelTrim\x18\x86\x06 \x01(\x02H\xfd\x05\x88\x01\x01\x12%\n\x16OBD_O2_Sensor8_Voltage\x18\x87\x06 \x01(\x02H\xfe\x05\x88\x01\x01\x12/\n OBD_O2_Sensor8_ShortTermFuelTrim\x18\x88\x06 \x01(\x02H\xff\x05\x88\x01\x01\x12\x1f\n\x10OBD_OBDStandards\x18\x89\x06 \x01(\rH\x80\x06\x88\x01\x01\x12(\n\x19OBD_OxygenSensorsIn4Banks\x18\x8a\x06 \x01(\rH\x81\x06\x88\x01\x01\x12\x1e\n\x0fOBD_IsPTOActive\x18\x8b\x06 \x01(\x08H\x82\x06\x88\x01\x01\x12\x1a\n\x0bOBD_RunTime\x18\x8c\x06 \x01(\x02H\x83\x06\x88\x01\x01\x12\x18\n\tOBD_PidsB\x18\x8d\x06 \x01(\rH\x84\x06\x88\x01\x01\x12\"\n\x13OBD_DistanceWithMIL\x18\x8e\x06 \x01(\x02H\x85\x06\x88\x01\x01\x12&\n\x17OBD_FuelRailPressureVac\x18\x8f\x06 \x01(\x02H\x86\x06\x88\x01\x01\x12)\n\x1aOBD_FuelRailPressureDirect\x18\x90\x06 \x01(\x02H\x87\x06\x88\x01\x01\x12&\n\x17OBD_O2WR_Sensor1_Lambda\x18\x91\x06 \x01(\x02H\x88\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor1_Voltage\x18\x92\x06 \x01(\x02H\x89\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor1_Current\x18\x93\x06 \x01(\x02H\x8a\x06\x88\x01\x01\x12&\n\x17OBD_O2WR_Sensor2_Lambda\x18\x94\x06 \x01(\x02H\x8b\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor2_Voltage\x18\x95\x06 \x01(\x02H\x8c\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor2_Current\x18\x96\x06 \x01(\x02H\x8d\x06\x88\x01\x01\x12&\n\x17OBD_O2WR_Sensor3_Lambda\x18\x97\x06 \x01(\x02H\x8e\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor3_Voltage\x18\x98\x06 \x01(\x02H\x8f\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor3_Current\x18\x99\x06 \x01(\x02H\x90\x06\x88\x01\x01\x12&\n\x17OBD_O2WR_Sensor4_Lambda\x18\x9a\x06 \x01(\x02H\x91\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor4_Voltage\x18\x9b\x06 \x01(\x02H\x92\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor4_Current\x18\x9c\x06 \x01(\x02H\x93\x06\x88\x01\x01\x12&\n\x17OBD_O2WR_Sensor5_Lambda\x18\x9d\x06 \x01(\x02H\x94\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor5_Voltage\x18\x9e\x06 \x01(\x02H\x95\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor5_Current\x18\x9f\x06 \x01(\x02H\x96\x06\x88\x01\x01\x12&\n\x17OBD_O2WR_Sensor6_Lambda\x18\xa0\x06 \x01(\x02H\x97\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor6_Voltage\x18\xa1\x06 \x01(\x02H\x98\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor6_Current\x18\xa2\x06 \x01(\x02H\x99\x06\x88\x01\x01\x12&\n\x17OBD_O2WR_Sensor7_Lambda\x18\xa3\x06 \x01(\x02H\x9a\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor7_Voltage\x18\xa4\x06 \x01(\x02H\x9b\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor7_Current\x18\xa5\x06 \x01(\x02H\x9c\x06\x88\x01\x01\x12&\n\x17OBD_O2WR_Sensor8_Lambda\x18\xa6\x06 \x01(\x02H\x9d\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor8_Voltage\x18\xa7\x06 \x01(\x02H\x9e\x06\x88\x01\x01\x12\'\n\x18OBD_O2WR_Sensor8_Current\x18\xa8\x06 \x01(\x02H\x9f\x06\x88\x01\x01\x12\x1f\n\x10OBD_CommandedEGR\x18\xa9\x06 \x01(\x02H\xa0\x06\x88\x01\x01\x12\x1b\n\x0cOBD_EGRError\x18\xaa\x06 \x01(\x02H\xa1\x06\x88\x01\x01\x12 \n\x11OBD_CommandedEVAP\x18\xab\x06 \x01(\x02H\xa2\x06\x88\x01\x01\x12\x1c\n\rOBD_FuelLevel\x18\xac\x06 \x01(\x02H\xa3\x06\x88\x01\x01\x12\'\n\x18OBD_WarmupsSinceDTCClear\x18\xad\x06 \x01(\rH\xa4\x06\x88\x01\x01\x12(\n\x19OBD_DistanceSinceDTCClear\x18\xae\x06 \x01(\x02H\xa5\x06\x88\x01\x01\x12$\n\x15OBD_EVAPVaporPressure\x18\xaf\x06 \x01(\x02H\xa6\x06\x88\x01\x01\x12%\n\x16OBD_BarometricPressure\x18\xb0\x06 \x01(\x02H\xa7\x06\x88\x01\x01\x12.\n\x1fOBD_Catalyst_Bank1_Temperature1\x18\xb1\x06 \x01(\x02H\xa8\x06\x88\x01\x01\x12.\n\x1fOBD_Catalyst_Bank1_Temperature2\x18\xb2\x06 \x01(\x02H\xa9\x06\x88\x01\x01\x12.\n\x1fOBD_Catalyst_Bank2_Temperature1\x18\xb3\x06 \x01(\x02H\xaa\x06\x88\x01\x01\x12.\n\x1fOBD_Catalyst_Bank2_Temperature2\x18\xb4\x06 \x01(\x02H\xab\x06\x88\x01\x01\x12\x18\n\tOBD_PidsC\x18\xb5\x06 \x01(\rH\xac\x06\x88\x01\x01\x12+\n\x1cOBD_DriveCycleStatus_IsMILOn\x18\xb6\x06 \x01(\x08H\xad\x06\x88\x01\x01\x12,\n\x1dOBD_DriveCycleStatus_DTCCount\x18\xb7\x06 \x01(\rH\xae\x06\x88\x01\x01\x12\x30\n!OBD_DriveCycleStatus_IgnitionType\x18\xb8\x06 \x01(\tH\xaf\x06\x88\x01\x01\x12\'\n\x18OBD_ControlModuleVoltage\x18\xb9\x06 \x01(\x02H\xb0\x06\x88\x01\x01\x12\x1f\n\x10OBD_AbsoluteLoad\x18\xba\x06 \x01(\x02H\xb1\x06\x88\x01\x01\x12,\n\x1dOBD_CommandedEquivalenceRatio\x18\xbb\x06 \x01(\x02H\xb2\x06\x88\x01\x01\x12+\n\x1cOBD_RelativeThrottlePosition\x18\xbc\x06 \x01(\x02H\xb3\x06\x88\x01\x01\x12(\n\x19OBD_AmbientAirTemperature\x18\xbd\x06 \x01(\x02H\xb4\x06\x88\x01\x01\x12$\n\x15OBD_ThrottlePositionB\x18\xbe\x06 \x01(\x02H\xb5\x06\x88\x01\x01\x12$\n\x15OBD_ThrottlePositionC\x18\xbf\x06 \x01(\x02H\xb6\x06\x88\x01\x01\x12\'\n\x18OBD_AcceleratorPositionD\x18\xc0\x06 \x01(\x02H\xb7\x06\x88\x01\x01\x12\'\n\x18OBD_AcceleratorPositionE\x18\xc1\x06 \x01(\x02H\xb8\x06\x88\x01\x01\x12\'\n\x18OBD_AcceleratorPositionF\x18\xc2\x06 \x01(\x02H\xb9\x06\x88\x01\x01\x12#\n\x14OBD_ThrottleActuator\x18\xc3\x06 \x01(\x02H\xba\x06\x88\x01\x01\x12\x1d\n\x0eOBD_RunTimeMIL\x18\xc4\x06 \x01(\x02H\xbb\x06\x88\x01\x01\x12&\n\x17OBD_TimeSinceDTCCleared\x18\xc5\x06 \x01(\x02H\xbc\x06\x88\x01\x01\x12\x19\n\nOBD_MaxMAF\x18\xc6\x06 \x01(\x02H\xbd\x06\x88\x01\x01\x12\x1b\n\x0cOBD_FuelType\x18\xc7\x06 \x01(\tH\xbe\x06\x88\x01\x01\x12!\n\x12OBD_EthanolPercent\x18\xc8\x06 \x01(\x02H\xbf\x06\x88\x01\x01\x12,\n\x1dOBD_EVAPVaporPressureAbsolute\x18\xc9\x06 \x01(\x02H\xc0\x06\x88\x01\x01\x12-\n\x1eOBD_EVAPVaporPressureAlternate\x18\xca\x06 \x01(\x02H\xc1\x06\x88\x01\x01\x12#\n\x14OBD_ShortTermO2Trim1\x18\xcb\x06 \x01(\x02H\xc2\x06\x88\x01\x01\x12#\n\x14OBD_ShortTermO2Trim3\x18\xcc\x06 \x01(\x02H\xc3\x06\x88\x01\x01\x12\"\n\x13OBD_LongTermO2Trim1\x18\xcd\x06 \x01(\x02H\xc4\x06\x88\x01\x01\x12\"\n\x13OBD_LongTermO2Trim3\x18\xce\x06 \x01(\x02H\xc5\x06\x88\x01\x01\x12#\n\x14OBD_ShortTermO2Trim2\x18\xcf\x06 \x01(\x02H\xc6\x06\x88\x01\x01\x12#\n\x14OBD_ShortTermO2Trim4\x18\xd0\x06 \x01(\x02H\xc7\x06\x88\x01\x01\x12\"\n\x13OBD_LongTermO2Trim2\x18\xd1\x06 \x01(\x02H\xc8\x06\x88\x01\x01\x12\"\n\x13OBD_LongTermO2Trim4\x18\xd2\x06 \x01(\x02H\xc9\x06\x88\x01\x01\x12+\n\x1cOBD_FuelRailPressureAbsolute\x18\xd3\x06 \x01(\x02H\xca\x06\x88\x01\x01\x12.\n\x1fOBD_RelativeAcceleratorPosition\x18\xd4\x06 \x01(\x02H\xcb\x06\x88\x01\x01\x12)\n\x1aOBD_HybridBatteryRemaining\x18\xd5\x06 \x01(\x02H\xcc\x06\x88\x01\x01\x12!\n\x12OBD_OilTemperature\x18\xd6\x06 \x01(\x02H\xcd\x06\x88\x01\x01\x12&\n\x17OBD_FuelInjectionTiming\x18\xd7\x06 \x01(\x02H\xce\x06\x88\x01\x01\x12\x1b\n\x0cOBD_FuelRate\x18\xd8\x06 \x01(\x02H\xcf\x06\x88\x01\x01\x12(\n\x19\x44river_Identifier_Subject\x18\xd9\x06 \x01(\tH\xd0\x06\x88\x01\x01\x12\'\n\x18\x44river_Identifier_Issuer\x18\xda\x06 \x01(\tH\xd1\x06\x88\x01\x01\x12&\n\x17\x44river_DistractionLevel\x18\xdb\x06 \x01(\x02H\xd2\x06\x88\x01\x01\x12\"\n\x13\x44river_IsEyesOnRoad\x18\xdc\x06 \x01(\x08H\xd3\x06\x88\x01\x01\x12*\n\x1b\x44river_AttentiveProbability\x18\xdd\x06 \x01(\x02H\xd4\x06\x88\x01\x01\x12\"\n\x13\x44river_FatigueLevel\x18\xde\x06 \x01(\x02H\xd5\x06\x88\x01\x01\x12\x1f\n\x10\x44river_HeartRate\x18\xdf\x06 \x01(\rH\xd6\x06\x88\x01\x01\x12&\n\x17\x45xterior_AirTemperature\x18\xe0\x06 \x01(\x02H\xd7\x06\x88\x01\x01\x12 \n\x11\x45xterior_Humidity\x18\xe1\x06 \x01(\x02H\xd8\x06\x88\x01\x01\x12&\n\x17\x45xterior_LightIntensity\x18\xe2\x06 \x01(\x02H\xd9\x06\x88\x01\x01\x12#\n\x14Service_IsServiceDue\x18\xe3\x06 \x01(\x08H\xda\x06\x88\x01\x01\x12(\n\x19Service_DistanceToService\x18\xe4\x06 \x01(\x02H\xdb\x06\x88\x01\x01\x12$\n\x15Service_TimeToService\x18\xe5\x06 \x01(\x11H\xdc\x06\x88\x01\x01\x12\x33\n$Connectivity_IsConnectivityAvailable\x18\xe6\x06 \x01(\x08H\xdd\x06\x88\x01\x01\x42\x13\n\x11_VersionVSS_MajorB\x13\n\x11_VersionVSS_MinorB\x13\n\x11_VersionVSS_PatchB\x13\n\x11_VersionVSS_LabelB\x1c\n\x1a_VehicleIdentification_VINB\x1c\n\x1a_VehicleIdentification_WMIB\x1e\n\x1c_VehicleIdentification_BrandB\x1e\n\x1c_VehicleIdentification_ModelB\x1d\n\x1b_VehicleIdentification_YearB#\n!_VehicleIdentification_AcrissCodeB!\n\x1f_VehicleIdentification_BodyTypeB3\n1_VehicleIdentification_DateVehicleFirstRegisteredB.\n,_VehicleIdentification_MeetsEmissionStandardB\'\n%_VehicleIdentification_ProductionDateB%\n#_VehicleIdentification_PurchaseDateB)\n\'_VehicleIdentification_VehicleModelDateB-\n+_VehicleIdentification_VehicleConfigurationB/\n-_VehicleIdentification_VehicleSeatingCapacityB,\n*_VehicleIdentification_VehicleSpecialUsageB-\n+_VehicleIdentification_VehicleInteriorColorB,\n*_VehicleIdentification_VehicleInteriorTypeB,\n*_VehicleIdentification_KnownVehicleDamagesB\x18\n\x16_LowVoltageSystemStateB#\n!_LowVoltageBattery_NominalVoltageB$\n\"_LowVoltageBattery_NominalCapacityB#\n!_LowVoltageBattery_CurrentVoltageB#\n!_LowVoltageBattery_CurrentCurrentB\x08\n\x06_SpeedB\x14\n\x12_TravelledDistanceB\x13\n\x11_TraveledDistanceB\x1d\n\x1b_TraveledDistanceSinceStartB\x0c\n\n_StartTimeB\x0f\n\r_TripDurationB\x13\n\x11_TripMeterReadingB\x0f\n\r_IsBrokenDownB\x0b\n\t_IsMovingB\x0f\n\r_AverageSpeedB\x1c\n\x1a_Acceleration_LongitudinalB\x17\n\x15_Acceleration_LateralB\x18\n\x16_Acceleration_VerticalB\x17\n\x15_AngularVelocity_RollB\x18\n\x16_AngularVelocity_PitchB\x16\n\x14_AngularVelocity_YawB\x0b\n\t_RoofLoadB\x0e\n\x0c_CargoVolumeB\x0f\n\r_EmissionsCO2B\x17\n\x15_CurrentOverallWeightB\r\n\x0b_CurbWeightB\x0e\n\x0c_GrossWeightB\x0f\n\r_MaxTowWeightB\x13\n\x11_MaxTowBallWeightB\t\n\x07_LengthB\t\n\x07_HeightB\x08\n\x06_WidthB\x16\n\x14_Trailer_IsConnectedB\x1c\n\x1a_CurrentLocation_TimestampB\x1b\n\x19_CurrentLocation_LatitudeB\x1c\n\x1a_CurrentLocation_LongitudeB\x1a\n\x18_CurrentLocation_HeadingB%\n#_CurrentLocation_HorizontalAccuracyB\x1b\n\x19_CurrentLocation_AltitudeB#\n!_CurrentLocation_VerticalAccuracyB\'\n%_CurrentLocation_GNSSReceiver_FixTypeB2\n0_CurrentLocation_GNSSReceiver_MountingPosition_XB2\n0_CurrentLocation_GNSSReceiver_MountingPosition_YB2\n0_CurrentLocation_GNSSReceiver_MountingPosition_ZB\x15\n\x13_PowerOptimizeLevelB&\n$_Powertrain_AccumulatedBrakingEnergyB\x13\n\x11_Powertrain_RangeB\x12\n\x10_Powertrain_TypeB \n\x1e_Powertrain_PowerOptimizeLevelB)\n\'_Powertrain_CombustionEngine_EngineCodeB+\n)_Powertrain_CombustionEngine_DisplacementB+\n)_Powertrain_CombustionEngine_StrokeLengthB#\n!_Powertrain_CombustionEngine_BoreB,\n*_Powertrain_CombustionEngine_ConfigurationB0\n._Powertrain_CombustionEngine_NumberOfCylindersB8\n6_Powertrain_CombustionEngine_NumberOfValvesPerCylinderB/\n-_Powertrain_CombustionEngine_CompressionRatioB0\n._Powertrain_CombustionEngine_EngineOilCapacityB4\n2_Powertrain_CombustionEngine_EngineCoolantCapacityB\'\n%_Powertrain_CombustionEngine_MaxPowerB(\n&_Powertrain_CombustionEngine_MaxTorqueB-\n+_Powertrain_CombustionEngine_AspirationTypeB-\n+_Powertrain_CombustionEngine_EngineOilLevelB/\n-_Powertrain_CombustionEngine_OilLifeRemainingB(\n&_Powertrain_CombustionEngine_IsRunningB$\n\"_Powertrain_CombustionEngine_SpeedB*\n(_Powertrain_CombustionEngine_EngineHoursB(\n&_Powertrain_CombustionEngine_IdleHoursB\"\n _Powertrain_CombustionEngine_ECTB\"\n _Powertrain_CombustionEngine_EOTB\"\n _Powertrain_CombustionEngine_MAPB\"\n _Powertrain_CombustionEngine_MAFB\"\n _Powertrain_CombustionEngine_TPSB\"\n _Powertrain_CombustionEngine_EOPB$\n\"_Powertrain_CombustionEngine_PowerB%\n#_Powertrain_CombustionEngine_TorqueB:\n8_Powertrain_CombustionEngine_DieselExhaustFluid_CapacityB7\n5_Powertrain_CombustionEngine_DieselExhaustFluid_LevelB7\n5_Powertrain_CombustionEngine_DieselExhaustFluid_RangeB<\n:_Powertrain_CombustionEngine_DieselExhaustFluid_IsLevelLowBG\nE_Powertrain_CombustionEngine_DieselParticulateFilter_InletTemperatureBH\nF_Powertrain_CombustionEngine_DieselParticulateFilter_OutletTemperatureBD\nB_Powertrain_CombustionEngine_DieselParticulateFilter_DeltaPressureB\x1f\n\x1d_Powertrain_Transmission_TypeB$\n\"_Powertrain_Transmission_GearCountB$\n\"_Powertrain_Transmission_DriveTypeB,\n*_Powertrain_Transmission_TravelledDistanceB&\n$_Powertrain_Transmission_CurrentGearB\'\n%_Powertrain_Transmission_SelectedGearB,\n*_Powertrain_Transmission_IsParkLockEngagedB,\n*_Powertrain_Transmission_IsLowRangeEngagedB8\n6_Powertrain_Transmission_IsElectricalPowertrainEngagedB*\n(_Powertrain_Transmission_PerformanceModeB)\n\'_Powertrain_Transmission_GearChangeModeB&\n$_Powertrain_Transmission_TemperatureB+\n)_Powertrain_Transmission_ClutchEngagementB%\n#_Powertrain_Transmission_ClutchWearB2\n0_Powertrain_Transmission_DiffLockFrontEngagementB1\n/_Powertrain_Transmission_DiffLockRearEngagementB-\n+_Powertrain_Transmission_TorqueDistributionB&\n$_Powertrain_ElectricMotor_EngineCodeB$\n\"_Powertrain_ElectricMotor_MaxPowerB%\n#_Powertrain_ElectricMotor_MaxTorqueB)\n\'_Powertrain_ElectricMotor_MaxRegenPowerB*\n(_Powertrain_ElectricMotor_MaxRegenTorqueB!\n\x1f_Powertrain_ElectricMotor_SpeedB\'\n%_Powertrain_ElectricMotor_TemperatureB.\n,_Powertrain_ElectricMotor_CoolantTemperatureB!\n\x1f_Powertrain_ElectricMotor_PowerB\"\n _Powertrain_ElectricMotor_TorqueB \n\x1e_Powertrain_TractionBattery_IdB,\n*_Powertrain_TractionBattery_ProductionDateB.\n,_Powertrain_TractionBattery_IsPowerConnectedB/\n-_Powertrain_TractionBattery_IsGroundConnectedB1\n/_Powertrain_TractionBattery_Temperature_AverageB-\n+_Powertrain_TractionBattery_Temperature_MinB-\n+_Powertrain_TractionBattery_Temperature_MaxB+\n)_Powertrain_TractionBattery_GrossCapacityB)\n\'_Powertrain_TractionBattery_NetCapacityB+\n)_Powertrain_TractionBattery_StateOfHealthB3\n1_Powertrain_TractionBattery_StateOfCharge_CurrentB5\n3_Powertrain_TractionBattery_StateOfCharge_DisplayedB,\n*_Powertrain_TractionBattery_NominalVoltageB(\n&_Powertrain_TractionBattery_MaxVoltageB,\n*_Powertrain_TractionBattery_CurrentVoltageB,\n*_Powertrain_TractionBattery_CurrentCurrentB*\n(_Powertrain_TractionBattery_CurrentPowerB6\n4_Powertrain_TractionBattery_AccumulatedChargedEnergyB7\n5_Powertrain_TractionBattery_AccumulatedConsumedEnergyB:\n8_Powertrain_TractionBattery_AccumulatedChargedThroughputB;\n9_Powertrain_TractionBattery_AccumulatedConsumedThroughputB\'\n%_Powertrain_TractionBattery_PowerLossB#\n!_Powertrain_TractionBattery_RangeB2\n0_Powertrain_TractionBattery_Charging_ChargeLimitB@\n>_Powertrain_TractionBattery_Charging_MaximumChargingCurrent_DCBD\nB_Powertrain_TractionBattery_Charging_MaximumChargingCurrent_Phase1BD\nB_Powertrain_TractionBattery_Charging_MaximumChargingCurrent_Phase2BD\nB_Powertrain_TractionBattery_Charging_MaximumChargingCurrent_Phase3B5\n3_Powertrain_TractionBattery_Charging_ChargePortFlapB?\n=_Powertrain_TractionBattery_Charging_IsChargingCableConnectedB<\n:_Powertrain_TractionBattery_Charging_IsChargingCableLockedB+\n)_Powertrain_TractionBattery_Charging_ModeB1\n/_Powertrain_TractionBattery_Charging_IsChargingB4\n2_Powertrain_TractionBattery_Charging_IsDischargingB8\n6_Powertrain_TractionBattery_Charging_StartStopChargingB7\n5_Powertrain_TractionBattery_Charging_ChargeCurrent_DCB;\n9_Powertrain_TractionBattery_Charging_ChargeCurrent_Phase1B;\n9_Powertrain_TractionBattery_Charging_ChargeCurrent_Phase2B;\n9_Powertrain_TractionBattery_Charging_ChargeCurrent_Phase3B7\n5_Powertrain_TractionBattery_Charging_ChargeVoltage_DCB;\n9_Powertrain_TractionBattery_Charging_ChargeVoltage_Phase1B;\n9_Powertrain_TractionBattery_Charging_ChargeVoltage_Phase2B;\n9_Powertrain_TractionBattery_Charging_ChargeVoltage_Phase3B0\n._Powertrain_TractionBattery_Charging_PowerLossB2\n0_Powertrain_TractionBattery_Charging_TemperatureB1\n/_Powertrain_TractionBattery_Charging_ChargeRateB5\n3_Powertrain_TractionBattery_Charging_TimeToCompleteB1\n/_Powertrain_TractionBattery_Charging_Timer_ModeB1\n/_Powertrain_TractionBattery_Charging_Timer_TimeB,\n*_Powertrain_TractionBattery_DCDC_PowerLossB.\n,_Powertrain_TractionBattery_DCDC_TemperatureB#\n!_Powertrain_FuelSystem_HybridTypeB%\n#_Powertrain_FuelSystem_TankCapacityB\x1e\n\x1c_Powertrain_FuelSystem_LevelB\x1e\n\x1c_Powertrain_FuelSystem_RangeB+\n)_Powertrain_FuelSystem_InstantConsumptionB+\n)_Powertrain_FuelSystem_AverageConsumptionB.\n,_Powertrain_FuelSystem_ConsumptionSinceStartB\'\n%_Powertrain_FuelSystem_TimeSinceStartB1\n/_Powertrain_FuelSystem_IsEngineStopStartEnabledB\'\n%_Powertrain_FuelSystem_IsFuelLevelLowB\x10\n\x0e_Body_BodyTypeB\x16\n\x14_Body_RefuelPositionB\x13\n\x11_Body_Hood_IsOpenB\x1a\n\x18_Body_Trunk_Front_IsOpenB\x1c\n\x1a_Body_Trunk_Front_IsLockedB\x19\n\x17_Body_Trunk_Rear_IsOpenB\x1b\n\x19_Body_Trunk_Rear_IsLockedB\x15\n\x13_Body_Horn_IsActiveB\x1f\n\x1d_Body_Raindetection_IntensityB$\n\"_Body_Windshield_Front_Wiping_ModeB)\n\'_Body_Windshield_Front_Wiping_IntensityB+\n)_Body_Windshield_Front_Wiping_System_ModeB0\n._Body_Windshield_Front_Wiping_System_FrequencyB5\n3_Body_Windshield_Front_Wiping_System_TargetPositionB5\n3_Body_Windshield_Front_Wiping_System_ActualPositionB3\n1_Body_Windshield_Front_Wiping_System_DriveCurrentB/\n-_Body_Windshield_Front_Wiping_System_IsWipingB8\n6_Body_Windshield_Front_Wiping_System_IsEndingWipeCycleB3\n1_Body_Windshield_Front_Wiping_System_IsWiperErrorB8\n6_Body_Windshield_Front_Wiping_System_IsPositionReachedB0\n._Body_Windshield_Front_Wiping_System_IsBlockedB3\n1_Body_Windshield_Front_Wiping_System_IsOverheatedB)\n\'_Body_Windshield_Front_Wiping_WiperWearB,\n*_Body_Windshield_Front_Wiping_IsWipersWornB$\n\"_Body_Windshield_Front_IsHeatingOnB/\n-_Body_Windshield_Front_WasherFluid_IsLevelLowB*\n(_Body_Windshield_Front_WasherFluid_LevelB#\n!_Body_Windshield_Rear_Wiping_ModeB(\n&_Body_Windshield_Rear_Wiping_IntensityB*\n(_Body_Windshield_Rear_Wiping_System_ModeB/\n-_Body_Windshield_Rear_Wiping_System_FrequencyB4\n2_Body_Windshield_Rear_Wiping_System_TargetPositionB4\n2_Body_Windshield_Rear_Wiping_System_ActualPositionB2\n0_Body_Windshield_Rear_Wiping_System_DriveCurrentB.\n,_Body_Windshield_Rear_Wiping_System_IsWipingB7\n5_Body_Windshield_Rear_Wiping_System_IsEndingWipeCycleB2\n0_Body_Windshield_Rear_Wiping_System_IsWiperErrorB7\n5_Body_Windshield_Rear_Wiping_System_IsPositionReachedB/\n-_Body_Windshield_Rear_Wiping_System_IsBlockedB2\n0_Body_Windshield_Rear_Wiping_System_IsOverheatedB(\n&_Body_Windshield_Rear_Wiping_WiperWearB+\n)_Body_Windshield_Rear_Wiping_IsWipersWornB#\n!_Body_Windshield_Rear_IsHeatingOnB.\n,_Body_Windshield_Rear_WasherFluid_IsLevelLowB)\n\'_Body_Windshield_Rear_WasherFluid_LevelB\x1a\n\x18_Body_Lights_LightSwitchB!\n\x1f_Body_Lights_IsHighBeamSwitchOnB\x1c\n\x1a_Body_Lights_Beam_Low_IsOnB \n\x1e_Body_Lights_Beam_Low_IsDefectB\x1d\n\x1b_Body_Lights_Beam_High_IsOnB!\n\x1f_Body_Lights_Beam_High_IsDefectB\x1b\n\x19_Body_Lights_Running_IsOnB\x1f\n\x1d_Body_Lights_Running_IsDefectB\x1a\n\x18_Body_Lights_Backup_IsOnB\x1e\n\x1c_Body_Lights_Backup_IsDefectB\x1b\n\x19_Body_Lights_Parking_IsOnB\x1f\n\x1d_Body_Lights_Parking_IsDefectB\x1c\n\x1a_Body_Lights_Fog_Rear_IsOnB \n\x1e_Body_Lights_Fog_Rear_IsDefectB\x1d\n\x1b_Body_Lights_Fog_Front_IsOnB!\n\x1f_Body_Lights_Fog_Front_IsDefectB \n\x1e_Body_Lights_LicensePlate_IsOnB$\n\"_Body_Lights_LicensePlate_IsDefectB\x1d\n\x1b_Body_Lights_Brake_IsActiveB\x1d\n\x1b_Body_Lights_Brake_IsDefectB!\n\x1f_Body_Lights_Hazard_IsSignalingB\x1e\n\x1c_Body_Lights_Hazard_IsDefectB2\n0_Body_Lights_DirectionIndicator_Left_IsSignalingB/\n-_Body_Lights_DirectionIndicator_Left_IsDefectB3\n1_Body_Lights_DirectionIndicator_Right_IsSignalingB0\n._Body_Lights_DirectionIndicator_Right_IsDefectB\x19\n\x17_Body_Mirrors_Left_TiltB\x18\n\x16_Body_Mirrors_Left_PanB \n\x1e_Body_Mirrors_Left_IsHeatingOnB\x1a\n\x18_Body_Mirrors_Right_TiltB\x19\n\x17_Body_Mirrors_Right_PanB!\n\x1f_Body_Mirrors_Right_IsHeatingOnB\x1f\n\x1d_Body_RearMainSpoilerPositionB\x1a\n\x18_Body_PowerOptimizeLevelB\x19\n\x17_Cabin_RearShade_SwitchB\x1b\n\x19_Cabin_RearShade_PositionB(\n&_Cabin_HVAC_Station_Row1_Left_FanSpeedB+\n)_Cabin_HVAC_Station_Row1_Left_TemperatureB/\n-_Cabin_HVAC_Station_Row1_Left_AirDistributionB)\n\'_Cabin_HVAC_Station_Row1_Right_FanSpeedB,\n*_Cabin_HVAC_Station_Row1_Right_TemperatureB0\n._Cabin_HVAC_Station_Row1_Right_AirDistributionB(\n&_Cabin_HVAC_Station_Row2_Left_FanSpeedB+\n)_Cabin_HVAC_Station_Row2_Left_TemperatureB/\n-_Cabin_HVAC_Station_Row2_Left_AirDistributionB)\n\'_Cabin_HVAC_Station_Row2_Right_FanSpeedB,\n*_Cabin_HVAC_Station_Row2_Right_TemperatureB0\n._Cabin_HVAC_Station_Row2_Right_AirDistributionB(\n&_Cabin_HVAC_Station_Row3_Left_FanSpeedB+\n)_Cabin_HVAC_Station_Row3_Left_TemperatureB/\n-_Cabin_HVAC_Station_Row3_Left_AirDistributionB)\n\'_Cabin_HVAC_Station_Row3_Right_FanSpeedB,\n*_Cabin_HVAC_Station_Row3_Right_TemperatureB0\n._Cabin_HVAC_Station_Row3_Right_AirDistributionB(\n&_Cabin_HVAC_Station_Row4_Left_FanSpeedB+\n)_Cabin_HVAC_Station_Row4_Left_TemperatureB/\n-_Cabin_HVAC_Station_Row4_Left_AirDistributionB)\n\'_Cabin_HVAC_Station_Row4_Right_FanSpeedB,\n*_Cabin_HVAC_Station_Row4_Right_TemperatureB0\n._Cabin_HVAC_Station_Row4_Right_AirDistributionB#\n!_Cabin_HVAC_IsRecirculationActiveB$\n\"_Cabin_HVAC_IsFrontDefrosterActiveB#\n!_Cabin_HVAC_IsRearDefrosterActiveB%\n#_Cabin_HVAC_IsAirConditioningActiveB#\n!_Cabin_HVAC_AmbientAirTemperatureB \n\x1e_Cabin_HVAC_PowerOptimizeLevelB\"\n _Cabin_Infotainment_Media_ActionB)\n\'_Cabin_Infotainment_Media_Played_SourceB)\n\'_Cabin_Infotainment_Media_Played_ArtistB(\n&_Cabin_Infotainment_Media_Played_AlbumB(\n&_Cabin_Infotainment_Media_Played_TrackB&\n$_Cabin_Infotainment_Media_Played_URIB/\n-_Cabin_Infotainment_Media_Played_PlaybackRateB\'\n%_Cabin_Infotainment_Media_DeclinedURIB\'\n%_Cabin_Infotainment_Media_SelectedURIB\"\n _Cabin_Infotainment_Media_VolumeB8\n6_Cabin_Infotainment_Navigation_DestinationSet_LatitudeB9\n7_Cabin_Infotainment_Navigation_DestinationSet_LongitudeB%\n#_Cabin_Infotainment_Navigation_MuteB\'\n%_Cabin_Infotainment_Navigation_VolumeB)\n\'_Cabin_Infotainment_HMI_CurrentLanguageB$\n\"_Cabin_Infotainment_HMI_DateFormatB$\n\"_Cabin_Infotainment_HMI_TimeFormatB&\n$_Cabin_Infotainment_HMI_DistanceUnitB(\n&_Cabin_Infotainment_HMI_FuelVolumeUnitB*\n(_Cabin_Infotainment_HMI_FuelEconomyUnitsB(\n&_Cabin_Infotainment_HMI_EVEconomyUnitsB)\n\'_Cabin_Infotainment_HMI_TemperatureUnitB*\n(_Cabin_Infotainment_HMI_TirePressureUnitB$\n\"_Cabin_Infotainment_HMI_BrightnessB&\n$_Cabin_Infotainment_HMI_DayNightModeB1\n/_Cabin_Infotainment_SmartphoneProjection_ActiveB1\n/_Cabin_Infotainment_SmartphoneProjection_SourceB(\n&_Cabin_Infotainment_PowerOptimizeLevelB\x19\n\x17_Cabin_Sunroof_PositionB\x17\n\x15_Cabin_Sunroof_SwitchB\x1d\n\x1b_Cabin_Sunroof_Shade_SwitchB\x1f\n\x1d_Cabin_Sunroof_Shade_PositionB$\n\"_Cabin_RearviewMirror_DimmingLevelB\x1c\n\x1a_Cabin_Lights_IsGloveBoxOnB\x19\n\x17_Cabin_Lights_IsTrunkOnB\x18\n\x16_Cabin_Lights_IsDomeOnB\x1c\n\x1a_Cabin_Lights_AmbientLightB\x1e\n\x1c_Cabin_Lights_LightIntensityB)\n\'_Cabin_Lights_Spotlight_Row1_IsSharedOnB\'\n%_Cabin_Lights_Spotlight_Row1_IsLeftOnB(\n&_Cabin_Lights_Spotlight_Row1_IsRightOnB)\n\'_Cabin_Lights_Spotlight_Row2_IsSharedOnB\'\n%_Cabin_Lights_Spotlight_Row2_IsLeftOnB(\n&_Cabin_Lights_Spotlight_Row2_IsRightOnB)\n\'_Cabin_Lights_Spotlight_Row3_IsSharedOnB\'\n%_Cabin_Lights_Spotlight_Row3_IsLeftOnB(\n&_Cabin_Lights_Spotlight_Row3_IsRightOnB)\n\'_Cabin_Lights_Spotlight_Row4_IsSharedOnB\'\n%_Cabin_Lights_Spotlight_Row4_IsLeftOnB(\n&_Cabin_Lights_Spotlight_Row4_IsRightOnB\x1e\n\x1c_Cabin_Door_Row1_Left_IsOpenB \n\x1e_Cabin_Door_Row1_Left_IsLockedB%\n#_Cabin_Door_Row1_Left_Window_IsOpenB\'\n%_Cabin_Door_Row1_Left_Window_PositionB1\n/_Cabin_Door_Row1_Left_Window_IsChildLockEngagedB%\n#_Cabin_Door_Row1_Left_Window_SwitchB)\n\'_Cabin_Door_Row1_Left_IsChildLockActiveB$\n\"_Cabin_Door_Row1_Left_Shade_SwitchB&\n$_Cabin_Door_Row1_Left_Shade_PositionB\x1f\n\x1d_Cabin_Door_Row1_Right_IsOpenB!\n\x1f_Cabin_Door_Row1_Right_IsLockedB&\n$_Cabin_Door_Row1_Right_Window_IsOpenB(\n&_Cabin_Door_Row1_Right_Window_PositionB2\n0_Cabin_Door_Row1_Right_Window_IsChildLockEngagedB&\n$_Cabin_Door_Row1_Right_Window_SwitchB*\n(_Cabin_Door_Row1_Right_IsChildLockActiveB%\n#_Cabin_Door_Row1_Right_Shade_SwitchB\'\n%_Cabin_Door_Row1_Right_Shade_PositionB\x1e\n\x1c_Cabin_Door_Row2_Left_IsOpenB \n\x1e_Cabin_Door_Row2_Left_IsLockedB%\n#_Cabin_Door_Row2_Left_Window_IsOpenB\'\n%_Cabin_Door_Row2_Left_Window_PositionB1\n/_Cabin_Door_Row2_Left_Window_IsChildLockEngagedB%\n#_Cabin_Door_Row2_Left_Window_SwitchB)\n\'_Cabin_Door_Row2_Left_IsChildLockActiveB$\n\"_Cabin_Door_Row2_Left_Shade_SwitchB&\n$_Cabin_Door_Row2_Left_Shade_PositionB\x1f\n\x1d_Cabin_Door_Row2_Right_IsOpenB!\n\x1f_Cabin_Door_Row2_Right_IsLockedB&\n$_Cabin_Door_Row2_Right_Window_IsOpenB(\n&_Cabin_Door_Row2_Right_Window_PositionB2\n0_Cabin_Door_Row2_Right_Window_IsChildLockEngagedB&\n$_Cabin_Door_Row2_Right_Window_SwitchB*\n(_Cabin_Door_Row2_Right_IsChildLockActiveB%\n#_Cabin_Door_Row2_Right_Shade_SwitchB\'\n%_Cabin_Door_Row2_Right_Shade_PositionB\x12\n\x10_Cabin_DoorCountB\"\n _Cabin_Seat_Row1_Pos1_IsOccupiedB3\n1_Cabin_Seat_Row1_Pos1_Occupant_Identifier_SubjectB2\n0_Cabin_Seat_Row1_Pos1_Occupant_Identifier_IssuerB \n\x1e_Cabin_Seat_Row1_Pos1_IsBeltedB\x1f\n\x1d_Cabin_Seat_Row1_Pos1_HeatingB\x1f\n\x1d_Cabin_Seat_Row1_Pos1_MassageB \n\x1e_Cabin_Seat_Row1_Pos1_PositionB\x1e\n\x1c_Cabin_Seat_Row1_Pos1_HeightB\x1c\n\x1a_Cabin_Seat_Row1_Pos1_TiltB(\n&_Cabin_Seat_Row1_Pos1_Backrest_ReclineB/\n-_Cabin_Seat_Row1_Pos1_Backrest_Lumbar_SupportB.\n,_Cabin_Seat_Row1_Pos1_Backrest_Lumbar_HeightB4\n2_Cabin_Seat_Row1_Pos1_Backrest_SideBolster_SupportB&\n$_Cabin_Seat_Row1_Pos1_Seating_LengthB\'\n%_Cabin_Seat_Row1_Pos1_Headrest_HeightB&\n$_Cabin_Seat_Row1_Pos1_Headrest_AngleB)\n\'_Cabin_Seat_Row1_Pos1_Airbag_IsDeployedB.\n,_Cabin_Seat_Row1_Pos1_Switch_IsWarmerEngagedB.\n,_Cabin_Seat_Row1_Pos1_Switch_IsCoolerEngagedB/\n-_Cabin_Seat_Row1_Pos1_Switch_IsForwardEngagedB0\n._Cabin_Seat_Row1_Pos1_Switch_IsBackwardEngagedB*\n(_Cabin_Seat_Row1_Pos1_Switch_IsUpEngagedB,\n*_Cabin_Seat_Row1_Pos1_Switch_IsDownEngagedB3\n1_Cabin_Seat_Row1_Pos1_Switch_IsTiltForwardEngagedB4\n2_Cabin_Seat_Row1_Pos1_Switch_IsTiltBackwardEngagedB?\n=_Cabin_Seat_Row1_Pos1_Switch_Backrest_IsReclineForwardEngagedB@\n>_Cabin_Seat_Row1_Pos1_Switch_Backrest_IsReclineBackwardEngagedBC\nA_Cabin_Seat_Row1_Pos1_Switch_Backrest_Lumbar_IsMoreSupportEngagedBC\nA_Cabin_Seat_Row1_Pos1_Switch_Backrest_Lumbar_IsLessSupportEngagedB:\n8_Cabin_Seat_Row1_Pos1_Switch_Backrest_Lumbar_IsUpEngagedB<\n:_Cabin_Seat_Row1_Pos1_Switch_Backrest_Lumbar_IsDownEngagedBH\nF_Cabin_Seat_Row1_Pos1_Switch_Backrest_SideBolster_IsMoreSupportEngagedBH\nF_Cabin_Seat_Row1_Pos1_Switch_Backrest_SideBolster_IsLessSupportEngagedB7\n5_Cabin_Seat_Row1_Pos1_Switch_Seating_IsForwardEngagedB8\n6_Cabin_Seat_Row1_Pos1_Switch_Seating_IsBackwardEngagedB3\n1_Cabin_Seat_Row1_Pos1_Switch_Headrest_IsUpEngagedB5\n3_Cabin_Seat_Row1_Pos1_Switch_Headrest_IsDownEngagedB8\n6_Cabin_Seat_Row1_Pos1_Switch_Headrest_IsForwardEngagedB9\n7_Cabin_Seat_Row1_Pos1_Switch_Headrest_IsBackwardEngagedB8\n6_Cabin_Seat_Row1_Pos1_Switch_Massage_IsIncreaseEngagedB8\n6_Cabin_Seat_Row1_Pos1_Switch_Massage_IsDecreaseEngagedB\"\n _Cabin_Seat_Row1_Pos2_IsOccupiedB3\n1_Cabin_Seat_Row1_Pos2_Occupant_Identifier_SubjectB2\n0_Cabin_Seat_Row1_Pos2_Occupant_Identifier_IssuerB \n\x1e_Cabin_Seat_Row1_Pos2_IsBeltedB\x1f\n\x1d_Cabin_Seat_Row1_Pos2_HeatingB\x1f\n\x1d_Cabin_Seat_Row1_Pos2_MassageB \n\x1e_Cabin_Seat_Row1_Pos2_PositionB\x1e\n\x1c_Cabin_Seat_Row1_Pos2_HeightB\x1c\n\x1a_Cabin_Seat_Row1_Pos2_TiltB(\n&_Cabin_Seat_Row1_Pos2_Backrest_ReclineB/\n-_Cabin_Seat_Row1_Pos2_Backrest_Lumbar_SupportB.\n,_Cabin_Seat_Row1_Pos2_Backrest_Lumbar_HeightB4\n2_Cabin_Seat_Row1_Pos2_Backrest_SideBolster_SupportB&\n$_Cabin_Seat_Row1_Pos2_Seating_LengthB\'\n%_Cabin_Seat_Row1_Pos2_Headrest_HeightB&\n$_Cabin_Seat_Row1_Pos2_Headrest_AngleB)\n\'_Cabin_Seat_Row1_Pos2_Airbag_IsDeployedB.\n,_Cabin_Seat_Row1_Pos2_Switch_IsWarmerEngagedB.\n,_Cabin_Seat_Row1_Pos2_Switch_IsCoolerEngagedB/\n-_Cabin_Seat_Row1_Pos2_Switch_IsForwardEngagedB0\n._Cabin_Seat_Row1_Pos2_Switch_IsBackwardEngagedB*\n(_Cabin_Seat_Row1_Pos2_Switch_IsUpEngagedB,\n*_Cabin_Seat_Row1_Pos2_Switch_IsDownEngagedB3\n1_Cabin_Seat_Row1_Pos2_Switch_IsTiltForwardEngagedB4\n2_Cabin_Seat_Row1_Pos2_Switch_IsTiltBackwardEngagedB?\n=_Cabin_Seat_Row1_Pos2_Switch_Backrest_IsReclineForwardEngagedB@\n>_Cabin_Seat_Row1_Pos2_Switch_Backrest_IsReclineBackwardEngagedBC\nA_Cabin_Seat_Row1_Pos2_Switch_Backrest_Lumbar_IsMoreSupportEngagedBC\nA_Cabin_Seat_Row1_Pos2_Switch_Backrest_Lumbar_IsLessSupportEngagedB:\n8_Cabin_Seat_Row1_Pos2_Switch_Backrest_Lumbar_IsUpEngagedB<\n:_Cabin_Seat_Row1_Pos2_Switch_Backrest_Lumbar_IsDownEngagedBH\nF_Cabin_Seat_Row1_Pos2_Switch_Backrest_SideBolster_IsMoreSupportEngagedBH\nF_Cabin_Seat_Row1_Pos2_Switch_Backrest_SideBolster_IsLessSupportEngagedB7\n5_Cabin_Seat_Row1_Pos2_Switch_Seating_IsForwardEngagedB8\n6_Cabin_Seat_Row1_Pos2_Switch_Seating_IsBackwardEngagedB3\n1_Cabin_Seat_Row1_Pos2_Switch_Headrest_IsUpEngagedB5\n3_Cabin_Seat_Row1_Pos2_Switch_Headrest_IsDownEngagedB8\n6_Cabin_Seat_Row1_Pos2_Switch_Headrest_IsForwardEngagedB9\n7_Cabin_Seat_Row1_Pos2_Switch_Headrest_IsBackwardEngagedB8\n6_Cabin_Seat_Row1_Pos2_Switch_Massage_IsIncreaseEngagedB8\n6_Cabin_Seat_Row1_Pos2_Switch_Massage_IsDecreaseEngagedB\"\n _Cabin_Seat_Row1_Pos3_IsOccupiedB3\n1_Cabin_Seat_Row1_Pos3_Occupant_Identifier_SubjectB2\n0_Cabin_Seat_Row1_Pos3_Occupant_Identifier_IssuerB \n\x1e_Cabin_Seat_Row1_Pos3_IsBeltedB\x1f\n\x1d_Cabin_Seat_Row1_Pos3_HeatingB\x1f\n\x1d_Cabin_Seat_Row1_Pos3_MassageB \n\x1e_Cabin_Seat_Row1_Pos3_PositionB\x1e\n\x1c_Cabin_Seat_Row1_Pos3_HeightB\x1c\n\x1a_Cabin_Seat_Row1_Pos3_TiltB(\n&_Cabin_Seat_Row1_Pos3_Backrest_ReclineB/\n-_Cabin_Seat_Row1_Pos3_Backrest_Lumbar_SupportB.\n,_Cabin_Seat_Row1_Pos3_Backrest_Lumbar_HeightB4\n2_Cabin_Seat_Row1_Pos3_Backrest_SideBolster_SupportB&\n$_Cabin_Seat_Row1_Pos3_Seating_LengthB\'\n%_Cabin_Seat_Row1_Pos3_Headrest_HeightB&\n$_Cabin_Seat_Row1_Pos3_Headrest_AngleB)\n\'_Cabin_Seat_Row1_Pos3_Airbag_IsDeployedB.\n,_Cabin_Seat_Row1_Pos3_Switch_IsWarmerEngagedB.\n,_Cabin_Seat_Row1_Pos3_Switch_IsCoolerEngagedB/\n-_Cabin_Seat_Row1_Pos3_Switch_IsForwardEngagedB0\n._Cabin_Seat_Row1_Pos3_Switch_IsBackwardEngagedB*\n(_Cabin_Seat_Row1_Pos3_Switch_IsUpEngagedB,\n*_Cabin_Seat_Row1_Pos3_Switch_IsDownEngagedB3\n1_Cabin_Seat_Row1_Pos3_Switch_IsTiltForwardEngagedB4\n2_Cabin_Seat_Row1_Pos3_Switch_IsTiltBackwardEngagedB?\n=_Cabin_Seat_Row1_Pos3_Switch_Backrest_IsReclineForwardEngagedB@\n>_Cabin_Seat_Row1_Pos3_Switch_Backrest_IsReclineBackwardEngagedBC\nA_Cabin_Seat_Row1_Pos3_Switch_Backrest_Lumbar_IsMoreSupportEngagedBC\nA_Cabin_Seat_Row1_Pos3_Switch_Backrest_Lumbar_IsLessSupportEngagedB:\n8_Cabin_Seat_Row1_Pos3_Switch_Backrest_Lumbar_IsUpEngagedB<\n:_Cabin_Seat_Row1_Pos3_Switch_Backrest_Lumbar_IsDownEngagedBH\nF_Cabin_Seat_Row1_Pos3_Switch_Backrest_SideBolster_IsMoreSupportEngagedBH\nF_Cabin_Seat_Row1_Pos3_Switch_Backrest_SideBolster_IsLessSupportEngagedB7\n5_Cabin_Seat_Row1_Pos3_Switch_Seating_IsForwardEngagedB8\n6_Cabin_Seat_Row1_Pos3_Switch_Seating_IsBackwardEngagedB3\n1_Cabin_Seat_Row1_Pos3_Switch_Headrest_IsUpEngagedB5\n3_Cabin_Seat_Row1_Pos3_Switch_Headrest_IsDownEngagedB8\n6_Cabin_Seat_Row1_Pos3_Switch_Headrest_IsForwardEngagedB9\n7_Cabin_Seat_Row1_Pos3_Switch_Headrest_IsBackwardEngagedB8\n6_Cabin_Seat_Row1_Pos3_Switch_Massage_IsIncreaseEngagedB8\n6_Cabin_Seat_Row1_Pos3_Switch_Massage_IsDecreaseEngagedB\"\n _Cabin_Seat_Row2_Pos1_IsOccupiedB3\n1_Cabin_Seat_Row2_Pos1_Occupant_Identifier_SubjectB2\n0_Cabin_Seat_Row2_Pos1_Occupant_Identifier_IssuerB \n\x1e_Cabin_Seat_Row2_Pos1_IsBeltedB\x1f\n\x1d_Cabin_Seat_Row2_Pos1_HeatingB\x1f\n\x1d_Cabin_Seat_Row2_Pos1_MassageB \n\x1e_Cabin_Seat_Row2_Pos1_PositionB\x1e\n\x1c_Cabin_Seat_Row2_Pos1_HeightB\x1c\n\x1a_Cabin_Seat_Row2_Pos1_TiltB(\n&_Cabin_Seat_Row2_Pos1_Backrest_ReclineB/\n-_Cabin_Seat_Row2_Pos1_Backrest_Lumbar_SupportB.\n,_Cabin_Seat_Row2_Pos1_Backrest_Lumbar_HeightB4\n2_Cabin_Seat_Row2_Pos1_Backrest_SideBolster_SupportB&\n$_Cabin_Seat_Row2_Pos1_Seating_LengthB\'\n%_Cabin_Seat_Row2_Pos1_Headrest_HeightB&\n$_Cabin_Seat_Row2_Pos1_Headrest_AngleB)\n\'_Cabin_Seat_Row2_Pos1_Airbag_IsDeployedB.\n,_Cabin_Seat_Row2_Pos1_Switch_IsWarmerEngagedB.\n,_Cabin_Seat_Row2_Pos1_Switch_IsCoolerEngagedB/\n-_Cabin_Seat_Row2_Pos1_Switch_IsForwardEngagedB0\n._Cabin_Seat_Row2_Pos1_Switch_IsBackwardEngagedB*\n(_Cabin_Seat_Row2_Pos1_Switch_IsUpEngagedB,\n*_Cabin_Seat_Row2_Pos1_Switch_IsDownEngagedB3\n1_Cabin_Seat_Row2_Pos1_Switch_IsTiltForwardEngagedB4\n2_Cabin_Seat_Row2_Pos1_Switch_IsTiltBackwardEngagedB?\n=_Cabin_Seat_Row2_Pos1_Switch_Backrest_IsReclineForwardEngagedB@\n>_Cabin_Seat_Row2_Pos1_Switch_Backrest_IsReclineBackwardEngagedBC\nA_Cabin_Seat_Row2_Pos1_Switch_Backrest_Lumbar_IsMoreSupportEngagedBC\nA_Cabin_Seat_Row2_Pos1_Switch_Backrest_Lumbar_IsLessSupportEngagedB:\n8_Cabin_Seat_Row2_Pos1_Switch_Backrest_Lumbar_IsUpEngagedB<\n:_Cabin_Seat_Row2_Pos1_Switch_Backrest_Lumbar_IsDownEngagedBH\nF_Cabin_Seat_Row2_Pos1_Switch_Backrest_SideBolster_IsMoreSupportEngagedBH\nF_Cabin_Seat_Row2_Pos1_Switch_Backrest_SideBolster_IsLessSupportEngagedB7\n5_Cabin_Seat_Row2_Pos1_Switch_Seating_IsForwardEngagedB8\n6_Cabin_Seat_Row2_Pos1_Switch_Seating_IsBackwardEngagedB3\n1_Cabin_Seat_Row2_Pos1_Switch_Headrest_IsUpEngagedB5\n3_Cabin_Seat_Row2_Pos1_Switch_Headrest_IsDownEngagedB8\n6_Cabin_Seat_Row2_Pos1_Switch_Headrest_IsForwardEngagedB9\n7_Cabin_Seat_Row2_Pos1_Switch_Headrest_IsBackwardEngagedB8\n6_Cabin_Seat_Row2_Pos1_Switch_Massage_IsIncreaseEngagedB8\n6_Cabin_Seat_Row2_Pos1_Switch_Massage_IsDecreaseEngagedB\"\n _Cabin_Seat_Row2_Pos2_IsOccupiedB3\n1_Cabin_Seat_Row2_Pos2_Occupant_Identifier_SubjectB2\n0_Cabin_Seat_Row2_Pos2_Occupant_Identifier_IssuerB \n\x1e_Cabin_Seat_Row2_Pos2_IsBeltedB\x1f\n\x1d_Cabin_Seat_Row2_Pos2_HeatingB\x1f\n\x1d_Cabin_Seat_Row2_Pos2_MassageB \n\x1e_Cabin_Seat_Row2_Pos2_PositionB\x1e\n\x1c_Cabin_Seat_Row2_Pos2_HeightB\x1c\n\x1a_Cabin_Seat_Row2_Pos2_TiltB(\n&_Cabin_Seat_Row2_Pos2_Backrest_ReclineB/\n-_Cabin_Seat_Row2_Pos2_Backrest_Lumbar_SupportB.\n,_Cabin_Seat_Row2_Pos2_Backrest_Lumbar_HeightB4\n2_Cabin_Seat_Row2_Pos2_Backrest_SideBolster_SupportB&\n$_Cabin_Seat_Row2_Pos2_Seating_LengthB\'\n%_Cabin_Seat_Row2_Pos2_Headrest_HeightB&\n$_Cabin_Seat_Row2_Pos2_Headrest_AngleB)\n\'_Cabin_Seat_Row2_Pos2_Airbag_IsDeployedB.\n,_Cabin_Seat_Row2_Pos2_Switch_IsWarmerEngagedB.\n,_Cabin_Seat_Row2_Pos2_Switch_IsCoolerEngagedB/\n-_Cabin_Seat_Row2_Pos2_Switch_IsForwardEngagedB0\n._Cabin_Seat_Row2_Pos2_Switch_IsBackwardEngagedB*\n(_Cabin_Seat_Row2_Pos2_Switch_IsUpEngagedB,\n*_Cabin_Seat_Row2_Pos2_Switch_IsDownEngagedB3\n1_Cabin_Seat_Row2_Pos2_Switch_IsTiltForwardEngagedB4\n2_Cabin_Seat_Row2_Pos2_Switch_IsTiltBackwardEngagedB?\n=_Cabin_Seat_Row2_Pos2_Switch_Backrest_IsReclineForwardEngagedB@\n>_Cabin_Seat_Row2_Pos2_Switch_Backrest_IsReclineBackwardEngagedBC\nA_Cabin_Seat_Row2_Pos2_Switch_Backrest_Lumbar_IsMoreSupportEngagedBC\nA_Cabin_Seat_Row2_Pos2_Switch_Backrest_Lumbar_IsLessSupportEngagedB:\n8_Cabin_Seat_Row2_Pos2_Switch_Backrest_Lumbar_IsUpEngagedB<\n:_Cabin_Seat_Row2_Pos2_Switch_Backrest_Lumbar_IsDownEngagedBH\nF_Cabin_Seat_Row2_Pos2_Switch_Backrest_SideBolster_IsMoreSupportEngagedBH\nF_Cabin_Seat_Row2_Pos2_Switch_Backrest_SideBolster_IsLessSupportEngagedB7\n5_Cabin_Seat_Row2_Pos2_Switch_Seating_IsForwardEngagedB8\n6_Cabin_Seat_Row2_Pos2_Switch_Seating_IsBackwardEngagedB3\n1_Cabin_Seat_Row2_Pos2_Switch_Headrest_IsUpEngagedB5\n3_Cabin_Seat_Row2_Pos2_Switch_Headrest_IsDownEngagedB8\n6_Cabin_Seat_Row2_Pos2_Switch_Headrest_IsForwardEngagedB9\n7_Cabin_Seat_Row2_Pos2_Switch_Headrest_IsBackwardEngagedB8\n6_Cabin_Seat_Row2_Pos2_Switch_Massage_IsIncreaseEngagedB8\n6_Cabin_Seat_Row2_Pos2_Switch_Massage_IsDecreaseEngagedB\"\n _Cabin_Seat_Row2_Pos3_IsOccupiedB3\n1_Cabin_Seat_Row2_Pos3_Occupant_Identifier_SubjectB2\n0_Cabin_Seat_Row2_Pos3_Occupant_Identifier_IssuerB \n\x1e_Cabin_Seat_Row2_Pos3_IsBeltedB\x1f\n\x1d_Cabin_Seat_Row2_Pos3_HeatingB\x1f\n\x1d_Cabin_Seat_Row2_Pos3_MassageB \n\x1e_Cabin_Seat_Row2_Pos3_PositionB\x1e\n\x1c_Cabin_Seat_Row2_Pos3_HeightB\x1c\n\x1a_Cabin_Seat_Row2_Pos3_TiltB(\n&_Cabin_Seat_Row2_Pos3_Backrest_ReclineB/\n-_Cabin_Seat_Row2_Pos3_Backrest_Lumbar_SupportB.\n,_Cabin_Seat_Row2_Pos3_Backrest_Lumbar_HeightB4\n2_Cabin_Seat_Row2_Pos3_Backrest_SideBolster_SupportB&\n$_Cabin_Seat_Row2_Pos3_Seating_LengthB\'\n%_Cabin_Seat_Row2_Pos3_Headrest_HeightB&\n$_Cabin_Seat_Row2_Pos3_Headrest_AngleB)\n\'_Cabin_Seat_Row2_Pos3_Airbag_IsDeployedB.\n,_Cabin_Seat_Row2_Pos3_Switch_IsWarmerEngagedB.\n,_Cabin_Seat_Row2_Pos3_Switch_IsCoolerEngagedB/\n-_Cabin_Seat_Row2_Pos3_Switch_IsForwardEngagedB0\n._Cabin_Seat_Row2_Pos3_Switch_IsBackwardEngagedB*\n(_Cabin_Seat_Row2_Pos3_Switch_IsUpEngagedB,\n*_Cabin_Seat_Row2_Pos3_Switch_IsDownEngagedB3\n1_Cabin_Seat_Row2_Pos3_Switch_IsTiltForwardEngagedB4\n2_Cabin_Seat_Row2_Pos3_Switch_IsTiltBackwardEngagedB?\n=_Cabin_Seat_Row2_Pos3_Switch_Backrest_IsReclineForwardEngagedB@\n>_Cabin_Seat_Row2_Pos3_Switch_Backrest_IsReclineBackwardEngagedBC\nA_Cabin_Seat_Row2_Pos3_Switch_Backrest_Lumbar_IsMoreSupportEngagedBC\nA_Cabin_Seat_Row2_Pos3_Switch_Backrest_Lumbar_IsLessSupportEngagedB:\n8_Cabin_Seat_Row2_Pos3_Switch_Backrest_Lumbar_IsUpEngagedB<\n:_Cabin_Seat_Row2_Pos3_Switch_Backrest_Lumbar_IsDownEngagedBH\nF_Cabin_Seat_Row2_Pos3_Switch_Backrest_SideBolster_IsMoreSupportEngagedBH\nF_Cabin_Seat_Row2_Pos3_Switch_Backrest_SideBolster_IsLessSupportEngagedB7\n5_Cabin_Seat_Row2_Pos3_Switch_Seating_IsForwardEngagedB8\n6_Cabin_Seat_Row2_Pos3_Switch_Seating_IsBackwardEngagedB3\n1_Cabin_Seat_Row2_Pos3_Switch_Headrest_IsUpEngagedB5\n3_Cabin_Seat_Row2_Pos3_Switch_Headrest_IsDownEngagedB8\n6_Cabin_Seat_Row2_Pos3_Switch_Headrest_IsForwardEngagedB9\n7_Cabin_Seat_Row2_Pos3_Switch_Headrest_IsBackwardEngagedB8\n6_Cabin_Seat_Row2_Pos3_Switch_Massage_IsIncreaseEngagedB8\n6_Cabin_Seat_Row2_Pos3_Switch_Massage_IsDecreaseEngagedB\x17\n\x15_Cabin_DriverPositionB\x15\n\x13_Cabin_SeatRowCountB\x1b\n\x19_Cabin_Convertible_StatusB\x1b\n\x19_Cabin_PowerOptimizeLevelB\x1b\n\x19_ADAS_ActiveAutonomyLevelB\x1e\n\x1c_ADAS_SupportedAutonomyLevelB\x1f\n\x1d_ADAS_CruiseControl_IsEnabledB\x1e\n\x1c_ADAS_CruiseControl_IsActiveB\x1e\n\x1c_ADAS_CruiseControl_SpeedSetB\x1d\n\x1b_ADAS_CruiseControl_IsErrorB(\n&_ADAS_LaneDepartureDetection_IsEnabledB(\n&_ADAS_LaneDepartureDetection_IsWarningB&\n$_ADAS_LaneDepartureDetection_IsErrorB#\n!_ADAS_ObstacleDetection_IsEnabledB#\n!_ADAS_ObstacleDetection_IsWarningB!\n\x1f_ADAS_ObstacleDetection_IsErrorB\x15\n\x13_ADAS_ABS_IsEnabledB\x13\n\x11_ADAS_ABS_IsErrorB\x15\n\x13_ADAS_ABS_IsEngagedB\x15\n\x13_ADAS_TCS_IsEnabledB\x13\n\x11_ADAS_TCS_IsErrorB\x15\n\x13_ADAS_TCS_IsEngagedB\x15\n\x13_ADAS_ESC_IsEnabledB\x13\n\x11_ADAS_ESC_IsErrorB\x15\n\x13_ADAS_ESC_IsEngagedB%\n#_ADAS_ESC_IsStrongCrossWindDetectedB%\n#_ADAS_ESC_RoadFriction_MostProbableB#\n!_ADAS_ESC_RoadFriction_LowerBoundB#\n!_ADAS_ESC_RoadFriction_UpperBoundB\x15\n\x13_ADAS_EBD_IsEnabledB\x13\n\x11_ADAS_EBD_IsErrorB\x15\n\x13_ADAS_EBD_IsEngagedB\x15\n\x13_ADAS_EBA_IsEnabledB\x13\n\x11_ADAS_EBA_IsErrorB\x15\n\x13_ADAS_EBA_IsEngagedB\x1a\n\x18_ADAS_PowerOptimizeLevelB\x14\n\x12_Chassis_WheelbaseB\x10\n\x0e_Chassis_TrackB\x1f\n\x1d_Chassis_Axle_Row1_WheelCountB\"\n _Chassis_Axle_Row1_WheelDiameterB\x1f\n\x1d_Chassis_Axle_Row1_WheelWidthB\"\n _Chassis_Axle_Row1_SteeringAngleB!\n\x1f_Chassis_Axle_Row1_TireDiameterB\x1e\n\x1c_Chassis_Axle_Row1_TireWidthB$\n\"_Chassis_Axle_Row1_TireAspectRatioB0\n._Chassis_Axle_Row1_Wheel_Left_Brake_FluidLevelB5\n3_Chassis_Axle_Row1_Wheel_Left_Brake_IsFluidLevelLowB-\n+_Chassis_Axle_Row1_Wheel_Left_Brake_PadWearB2\n0_Chassis_Axle_Row1_Wheel_Left_Brake_IsBrakesWornB-\n+_Chassis_Axle_Row1_Wheel_Left_Tire_PressureB2\n0_Chassis_Axle_Row1_Wheel_Left_Tire_IsPressureLowB0\n._Chassis_Axle_Row1_Wheel_Left_Tire_TemperatureB%\n#_Chassis_Axle_Row1_Wheel_Left_SpeedB1\n/_Chassis_Axle_Row1_Wheel_Right_Brake_FluidLevelB6\n4_Chassis_Axle_Row1_Wheel_Right_Brake_IsFluidLevelLowB.\n,_Chassis_Axle_Row1_Wheel_Right_Brake_PadWearB3\n1_Chassis_Axle_Row1_Wheel_Right_Brake_IsBrakesWornB.\n,_Chassis_Axle_Row1_Wheel_Right_Tire_PressureB3\n1_Chassis_Axle_Row1_Wheel_Right_Tire_IsPressureLowB1\n/_Chassis_Axle_Row1_Wheel_Right_Tire_TemperatureB&\n$_Chassis_Axle_Row1_Wheel_Right_SpeedB\x1f\n\x1d_Chassis_Axle_Row2_WheelCountB\"\n _Chassis_Axle_Row2_WheelDiameterB\x1f\n\x1d_Chassis_Axle_Row2_WheelWidthB\"\n _Chassis_Axle_Row2_SteeringAngleB!\n\x1f_Chassis_Axle_Row2_TireDiameterB\x1e\n\x1c_Chassis_Axle_Row2_TireWidthB$\n\"_Chassis_Axle_Row2_TireAspectRatioB0\n._Chassis_Axle_Row2_Wheel_Left_Brake_FluidLevelB5\n3_Chassis_Axle_Row2_Wheel_Left_Brake_IsFluidLevelLowB-\n+_Chassis_Axle_Row2_Wheel_Left_Brake_PadWearB2\n0_Chassis_Axle_Row2_Wheel_Left_Brake_IsBrakesWornB-\n+_Chassis_Axle_Row2_Wheel_Left_Tire_PressureB2\n0_Chassis_Axle_Row2_Wheel_Left_Tire_IsPressureLowB0\n._Chassis_Axle_Row2_Wheel_Left_Tire_TemperatureB%\n#_Chassis_Axle_Row2_Wheel_Left_SpeedB1\n/_Chassis_Axle_Row2_Wheel_Right_Brake_FluidLevelB6\n4_Chassis_Axle_Row2_Wheel_Right_Brake_IsFluidLevelLowB.\n,_Chassis_Axle_Row2_Wheel_Right_Brake_PadWearB3\n1_Chassis_Axle_Row2_Wheel_Right_Brake_IsBrakesWornB.\n,_Chassis_Axle_Row2_Wheel_Right_Tire_PressureB3\n1_Chassis_Axle_Row2_Wheel_Right_Tire_IsPressureLowB1\n/_Chassis_Axle_Row2_Wheel_Right_Tire_TemperatureB&\n$_Chassis_Axle_Row2_Wheel_Right_SpeedB\x14\n\x12_Chassis_AxleCountB!\n\x1f_Chassis_ParkingBrake_IsEngagedB\x1e\n\x1c_Chassis_SteeringWheel_AngleB\x1d\n\x1b_Chassis_SteeringWheel_TiltB\"\n _Chassis_SteeringWheel_ExtensionB!\n\x1f_Chassis_SteeringWheel_PositionB$\n\"_Chassis_Accelerator_PedalPositionB\x1e\n\x1c_Chassis_Brake_PedalPositionB1\n/_Chassis_Brake_IsDriverEmergencyBrakingDetectedB\x0c\n\n_OBD_PidsAB\x15\n\x13_OBD_Status_IsMILOnB\x16\n\x14_OBD_Status_DTCCountB\x1a\n\x18_OBD_Status_IgnitionTypeB\x10\n\x0e_OBD_FreezeDTCB\x11\n\x0f_OBD_FuelStatusB\x11\n\x0f_OBD_EngineLoadB\x19\n\x17_OBD_CoolantTemperatureB\x19\n\x17_OBD_ShortTermFuelTrim1B\x18\n\x16_OBD_LongTermFuelTrim1B\x19\n\x17_OBD_ShortTermFuelTrim2B\x18\n\x16_OBD_LongTermFuelTrim2B\x13\n\x11_OBD_FuelPressureB\n\n\x08_OBD_MAPB\x12\n\x10_OBD_EngineSpeedB\x0c\n\n_OBD_SpeedB\x14\n\x12_OBD_TimingAdvanceB\x11\n\x0f_OBD_IntakeTempB\n\n\x08_OBD_MAFB\x17\n\x15_OBD_ThrottlePositionB\x10\n\x0e_OBD_AirStatusB\x1c\n\x1a_OBD_OxygenSensorsIn2BanksB\x19\n\x17_OBD_O2_Sensor1_VoltageB#\n!_OBD_O2_Sensor1_ShortTermFuelTrimB\x19\n\x17_OBD_O2_Sensor2_VoltageB#\n!_OBD_O2_Sensor2_ShortTermFuelTrimB\x19\n\x17_OBD_O2_Sensor3_VoltageB#\n!_OBD_O2_Sensor3_ShortTermFuelTrimB\x19\n\x17_OBD_O2_Sensor4_VoltageB#\n!_OBD_O2_Sensor4_ShortTermFuelTrimB\x19\n\x17_OBD_O2_Sensor5_VoltageB#\n!_OBD_O2_Sensor5_ShortTermFuelTrimB\x19\n\x17_OBD_O2_Sensor6_VoltageB#\n!_OBD_O2_Sensor6_ShortTermFuelTrimB\x19\n\x17_OBD_O2_Sensor7_VoltageB#\n!_OBD_O2_Sensor7_ShortTermFuelTrimB\x19\n\x17_OBD_O2_Sensor8_VoltageB#\n!_OBD_O2_Sensor8_ShortTermFuelTrimB\x13\n\x11_OBD_OBDStandardsB\x1c\n\x1a_OBD_OxygenSensorsIn4BanksB\x12\n\x10_OBD_IsPTOActiveB\x0e\n\x0c_OBD_RunTimeB\x0c\n\n_OBD_PidsBB\x16\n\x14_OBD_DistanceWithMILB\x1a\n\x18_OBD_FuelRailPressureVacB\x1d\n\x1b_OBD_FuelRailPressureDirectB\x1a\n\x18_OBD_O2WR_Sensor1_LambdaB\x1b\n\x19_OBD_O2WR_Sensor1_VoltageB\x1b\n\x19_OBD_O2WR_Sensor1_CurrentB\x1a\n\x18_OBD_O2WR_Sensor2_LambdaB\x1b\n\x19_OBD_O2WR_Sensor2_VoltageB\x1b\n\x19_OBD_O2WR_Sensor2_CurrentB\x1a\n\x18_OBD_O2WR_Sensor3_LambdaB\x1b\n\x19_OBD_O2WR_Sensor3_VoltageB\x1b\n\x19_OBD_O2WR_Sensor3_CurrentB\x1a\n\x18_OBD_O2WR_Sensor4_LambdaB\x1b\n\x19_OBD_O2WR_Sensor4_VoltageB\x1b\n\x19_OBD_O2WR_Sensor4_CurrentB\x1a\n\x18_OBD_O2WR_Sensor5_LambdaB\x1b\n\x19_OBD_O2WR_Sensor5_VoltageB\x1b\n\x19_OBD_O2WR_Sensor5_CurrentB\x1a\n\x18_OBD_O2WR_Sensor6_LambdaB\x1b\n\x19_OBD_O2WR_Sensor6_VoltageB\x1b\n\x19_OBD_O2WR_Sensor6_CurrentB\x1a\n\x18_OBD_O2WR_Sensor7_LambdaB\x1b\n\x19_OBD_O2WR_Sensor7_VoltageB\x1b\n\x19_OBD_O2WR_Sensor7_CurrentB\x1a\n\x18_OBD_O2WR_Sensor8_LambdaB\x1b\n\x19_OBD_O2WR_Sensor8_VoltageB\x1b\n\x19_OBD_O2WR_Sensor8_CurrentB\x13\n\x11_OBD_CommandedEGRB\x0f\n\r_OBD_EGRErrorB\x14\n\x12_OBD_CommandedEVAPB\x10\n\x0e_OBD_FuelLevelB\x1b\n\x19_OBD_WarmupsSinceDTCClearB\x1c\n\x1a_OBD_DistanceSinceDTCClearB\x18\n\x16_OBD_EVAPVaporPressureB\x19\n\x17_OBD_BarometricPressureB\"\n _OBD_Catalyst_Bank1_Temperature1B\"\n _OBD_Catalyst_Bank1_Temperature2B\"\n _OBD_Catalyst_Bank2_Temperature1B\"\n _OBD_Catalyst_Bank2_Temperature2B\x0c\n\n_OBD_PidsCB\x1f\n\x1d_OBD_DriveCycleStatus_IsMILOnB \n\x1e_OBD_DriveCycleStatus_DTCCountB$\n\"_OBD_DriveCycleStatus_IgnitionTypeB\x1b\n\x19_OBD_ControlModuleVoltageB\x13\n\x11_OBD_AbsoluteLoadB \n\x1e_OBD_CommandedEquivalenceRatioB\x1f\n\x1d_OBD_RelativeThrottlePositionB\x1c\n\x1a_OBD_AmbientAirTemperatureB\x18\n\x16_OBD_ThrottlePositionBB\x18\n\x16_OBD_ThrottlePositionCB\x1b\n\x19_OBD_AcceleratorPositionDB\x1b\n\x19_OBD_AcceleratorPositionEB\x1b\n\x19_OBD_AcceleratorPositionFB\x17\n\x15_OBD_ThrottleActuatorB\x11\n\x0f_OBD_RunTimeMILB\x1a\n\x18_OBD_TimeSinceDTCClearedB\r\n\x0b_OBD_MaxMAFB\x0f\n\r_OBD_FuelTypeB\x15\n\x13_OBD_EthanolPercentB \n\x1e_OBD_EVAPVaporPressureAbsoluteB!\n\x1f_OBD_EVAPVaporPressureAlternateB\x17\n\x15_OBD_ShortTermO2Trim1B\x17\n\x15_OBD_ShortTermO2Trim3B\x16\n\x14_OBD_LongTermO2Trim1B\x16\n\x14_OBD_LongTermO2Trim3B\x17\n\x15_OBD_ShortTermO2Trim2B\x17\n\x15_OBD_ShortTermO2Trim4B\x16\n\x14_OBD_LongTermO2Trim2B\x16\n\x14_OBD_LongTermO2Trim4B\x1f\n\x1d_OBD_FuelRailPressureAbsoluteB\"\n _OBD_RelativeAcceleratorPositionB\x1d\n\x1b_OBD_HybridBatteryRemainingB\x15\n\x13_OBD_OilTemperatureB\x1a\n\x18_OBD_FuelInjectionTimingB\x0f\n\r_OBD_FuelRateB\x1c\n\x1a_Driver_Identifier_SubjectB\x1b\n\x19_Driver_Identifier_IssuerB\x1a\n\x18_Driver_DistractionLevelB\x16\n\x14_Driver_IsEyesOnRoadB\x1e\n\x1c_Driver_AttentiveProbabilityB\x16\n\x14_Driver_FatigueLevelB\x13\n\x11_Driver_HeartRateB\x1a\n\x18_Exterior_AirTemperatureB\x14\n\x12_Exterior_HumidityB\x1a\n\x18_Exterior_LightIntensityB\x17\n\x15_Service_IsServiceDueB\x1c\n\x1a_Service_DistanceToServiceB\x18\n\x16_Service_TimeToServiceB\'\n%_Connectivity_IsConnectivityAvailable\"\x1b\n\tBoolArray\x12\x0e\n\x06values\x18\x01 \x03(\x08\"\x1a\n\x08IntArray\x12\x0e\n\x06values\x18\x01 \x03(\x12\"\x1b\n\tUintArray\x12\x0e\n\x06values\x18\x01 \x03(\x04\"\x1c\n\nFloatArray\x12\x0e\n\x06values\x18\x01 \x03(\x02\"\x1d\n\x0b\x44oubleArray\x12\x0e\n\x06values\x18\x01 \x03(\x01\"\x1d\n\x0bStringArray\x12\x0e\n\x06values\x18\x01 \x03(\t\"\x80\x04\n\x0f\x44\x61tapointUpdate\x12\n\n\x02id\x18\x01 \x01(\r\x12\x14\n\nbool_value\x18\x02 \x01(\x08H\x00\x12\x13\n\tint_value\x18\x03 \x01(\x12H\x00\x12\x14\n\nuint_value\x18\x04 \x01(\x04H\x00\x12\x15\n\x0b\x66loat_value\x18\x05 \x01(\x02H\x00\x12\x16\n\x0c\x64ouble_value\x18\x06 \x01(\x01H\x00\x12\x16\n\x0cstring_value\x18\x07 \x01(\tH\x00\x12\x35\n\nbool_array\x18\x08 \x01(\x0b\x32\x1f.sdv.model.vehicle.v1.BoolArrayH\x00\x12\x33\n\tint_array\x18\t \x01(\x0b\x32\x1e.sdv.model.vehicle.v1.IntArrayH\x00\x12\x35\n\nuint_array\x18\n \x01(\x0b\x32\x1f.sdv.model.vehicle.v1.UintArrayH\x00\x12\x37\n\x0b\x66loat_array\x18\x0b \x01(\x0b\x32 .sdv.model.vehicle.v1.FloatArrayH\x00\x12\x39\n\x0c\x64ouble_array\x18\x0c \x01(\x0b\x32!.sdv.model.vehicle.v1.DoubleArrayH\x00\x12\x39\n\x0cstring_array\x18\r \x01(\x0b\x32!.sdv.model.vehicle.v1.StringArrayH\x00\x42\x07\n\x05value\"{\n\x12VehicleUpdateBatch\x12\x11\n\ttimestamp\x18\x01 \x01(\x01\x12\x36\n\x07updates\x18\x02 \x03(\x0b\x32%.sdv.model.vehicle.v1.DatapointUpdate\x12\x1a\n\x12schema_fingerprint\x18\x03 \x01(\x06\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'vehicle_pb2', _globals)
+if _descriptor._USE_C_DESCRIPTORS == False:
+  DESCRIPTOR._options = None
+  _globals['_VEHICLESNAPSHOT']._serialized_start=41
+  _globals['_VEHICLESNAPSHOT']._serialized_end=81373
+  _globals['_BOOLARRAY']._serialized_start=81375
+  _globals['_BOOLARRAY']._serialized_end=81402
+  _globals['_INTARRAY']._serialized_start=81404
+  _globals['_INTARRAY']._serialized_end=81430
+  _globals['_UINTARRAY']._serialized_start=81432
+  _globals['_UINTARRAY']._serialized_end=81459
+  _globals['_FLOATARRAY']._serialized_start=81461
+  _globals['_FLOATARRAY']._serialized_end=81489
+  _globals['_DOUBLEARRAY']._serialized_start=81491
+  _globals['_DOUBLEARRAY']._serialized_end=81520
+  _globals['_STRINGARRAY']._serialized_start=81522
+  _globals['_STRINGARRAY']._serialized_end=81551
+  _globals['_DATAPOINTUPDATE']._serialized_start=81554
+  _globals['_DATAPOINTUPDATE']._serialized_end=82066
+  _globals['_VEHICLEUPDATEBATCH']._serialized_start=82068
+  _globals['_VEHICLEUPDATEBATCH']._serialized_end=82191
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+
+"""Rate limiting and sampling of datapoint updates.
+
+A :class:`RateLimit` declares how often updates may pass: at most one per
+``min_interval``, optionally only every n-th update, emitting the first
+update of an interval right away (leading), the last one when it ends
+(trailing), or the mean of all of them. A :class:`RateLimiter` applies it
+to one stream of updates and decides before the update is even decoded,
+so discarded updates cost a counter increment and a clock read.
+"""
+
+import asyncio
+import copy
+import math
+import time
+from typing import Any, Callable, NamedTuple, Optional
+
+
+class RateLimit(NamedTuple):
+    """Sampling policy of a subscription.
+
+    Attributes
+    ----------
+    min_interval: float
+        Minimum seconds between two emitted updates.
+    leading: bool
+        Emit the first update of an interval immediately.
+    trailing: bool
+        Emit the latest held update when the interval ends.
+    decimate: int
+        Only consider every n-th update.
+    average: bool
+        Emit the mean of the values of all considered updates since the
+        last emission instead of the latest value.
+    """
+
+    min_interval: float = 0.0
+    leading: bool = True
+    trailing: bool = True
+    decimate: int = 1
+    average: bool = False
+
+    @classmethod
+    def max_rate(cls, hertz: float, **options) -> "RateLimit":
+        """Limit to at most ``hertz`` updates per second."""
+        if hertz <= 0:
+            raise ValueError("Rate must be positive")
+        return cls(1.0 / hertz, **options)
+
+
+class RateLimiter:
+    """Applies a :class:`RateLimit` to one stream of updates.
+
+    Items are values, or result objects with a ``value`` attribute such as
+    ``TypedDataPointResult``. Averaged items are copies with the mean as
+    their value. Policies that could never emit, and averaging of a
+    non-numeric datatype, raise a ValueError.
+
+    Parameters
+    ----------
+    limit: RateLimit
+        Policy to apply.
+    on_trailing: Optional[Callable[[Any], Any]]
+        Called with items emitted when an interval ends; required for
+        trailing emission, which needs a running event loop.
+    clock: Callable[[], float]
+        Monotonic clock in seconds.
+    datatype: Optional[str]
+        VSS datatype of the updates, checked against ``average``.
+    """
+
+    def __init__(
+        self,
+        limit: RateLimit,
+        on_trailing: Optional[Callable[[Any], Any]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        datatype: Optional[str] = None,
+    ):
+        if limit.min_interval < 0 or limit.decimate < 1:
+            raise ValueError(f"Invalid rate limit {limit}")
+        if not (limit.leading or limit.trailing):
+            raise ValueError(f"Rate limit {limit} never emits; set leading or trailing")
+        if limit.trailing and on_trailing is None:
+            raise ValueError("Trailing emission needs an on_trailing callback")
+        if limit.average and datatype is not None:
+            if datatype == "string" or datatype.endswith("[]"):
+                raise ValueError(f"Cannot average non-numeric datatype {datatype}")
+        self.limit = limit
+        self.on_trailing = on_trailing
+        self._clock = clock
+        self._trailing = limit.trailing
+        self._last_emit = -math.inf
+        self._count = 0
+        self._pending: Any = None
+        self._has_pending = False
+        self._sum = 0.0
+        self._samples = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self.passed = 0
+        self.dropped = 0
+
+    def offer(self, make: Callable[[], Any]) -> Optional[Any]:
+        """Offer an update; return the item to emit now, or None.
+
+        ``make`` builds the item and is only called if the update is kept.
+        """
+        limit = self.limit
+        if limit.decimate > 1:
+            self._count += 1
+            if self._count % limit.decimate:
+                self.dropped += 1
+                return None
+        now = self._clock()
+        elapsed = now - self._last_emit
+        if elapsed >= limit.min_interval and self._timer is None and limit.leading:
+            self._last_emit = now
+            return self._emit(make())
+        if not (self._trailing or limit.average):
+            self.dropped += 1
+            return None
+        item = make()
+        if limit.average:
+            self._sum += getattr(item, "value", item)
+            self._samples += 1
+        if not self._trailing:
+            self.dropped += 1
+            return None
+        if self._has_pending and not limit.average:
+            self.dropped += 1
+        self._pending, self._has_pending = item, True
+        if self._timer is None:
+            if elapsed < limit.min_interval:
+                delay = limit.min_interval - elapsed
+            else:
+                delay = limit.min_interval
+            self._timer = asyncio.get_running_loop().call_later(delay, self._flush)
+        return None
+
+    def _emit(self, item: Any) -> Any:
+        self.passed += 1
+        if not self.limit.average:
+            return item
+        self._sum += getattr(item, "value", item)
+        self._samples += 1
+        mean = self._sum / self._samples
+        self._sum, self._samples = 0.0, 0
+        if not hasattr(item, "value"):
+            return mean
+        item = copy.copy(item)
+        item.value = mean
+        return item
+
+    def _flush(self):
+        self._timer = None
+        if not self._has_pending:
+            return
+        item, self._pending, self._has_pending = self._pending, None, False
+        if self.limit.average:
+            # The held item's value is already part of the sum.
+            self._sum -= getattr(item, "value", item)
+            self._samples -= 1
+        self._last_emit = self._clock()
+        self.on_trailing(self._emit(item))
+
+    def cancel(self):
+        """Drop a held update and its pending trailing emission."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pending, self._has_pending = None, False
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+"""Replay of recorded traces into a store at real time, N times faster or at full speed."""
+
+import asyncio
+import time
+from typing import Any, Dict, Iterable, Iterator, Mapping, NamedTuple, Optional, Tuple
+
+from sdv_model.schema import Target
+from sdv_model.snapshot import VersionedStore
+
+Batch = Tuple[float, Mapping[Target, Any]]
+
+
+class MonotonicClock:
+    """Wall clock pacing with :func:`time.monotonic` and :func:`asyncio.sleep`."""
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    async def sleep(self, seconds: float):
+        await asyncio.sleep(seconds)
+
+
+class VirtualClock:
+    """Clock that jumps ahead instead of waiting, for deterministic tests."""
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+
+    def now(self) -> float:
+        return self._now
+
+    async def sleep(self, seconds: float):
+        self._now += seconds
+        await asyncio.sleep(0)
+
+
+class ReplayStats(NamedTuple):
+    """Outcome of a replay."""
+
+    updates: int
+    batches: int
+    elapsed: float
+    trace_duration: float
+
+    @property
+    def updates_per_second(self) -> float:
+        return self.updates / self.elapsed if self.elapsed > 0 else float("inf")
+
+    @property
+    def speedup(self) -> float:
+        """Trace time replayed per second of wall time."""
+        return self.trace_duration / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+def group_updates(updates: Iterable[Tuple[float, Target, Any]]) -> Iterator[Batch]:
+    """Group consecutive ``(timestamp, target, value)`` updates by timestamp."""
+    batch: Dict[Target, Any] = {}
+    current: Optional[float] = None
+    for timestamp, target, value in updates:
+        if batch and timestamp != current:
+            yield current, batch
+            batch = {}
+        current = timestamp
+        batch[target] = value
+    if batch:
+        yield current, batch
+
+
+class TraceReplayer:
+    """Streams timestamped update batches into a store.
+
+    Each batch is committed as a single store update with its recorded
+    timestamp. With a ``speed`` the replay is paced so that trace time runs
+    ``speed`` times faster than the clock and yields to the event loop
+    before every batch, even when it has fallen behind schedule; without
+    one it runs as fast as possible and only yields every ``yield_every``
+    batches. :meth:`stop` ends the current run before its next commit; a
+    later :meth:`run` resumes with the batch that was not committed, so
+    one-shot iterables such as :func:`~sdv_model.codec.jsonl.read_batches`
+    lose nothing. Replaying from the start needs a new replayer.
+
+    Parameters
+    ----------
+    store: VersionedStore
+        Store to write to.
+    trace: Iterable[Batch]
+        ``(timestamp, updates)`` pairs in timestamp order, e.g. from
+        :func:`sdv_model.codec.jsonl.read_batches`.
+    speed: Optional[float]
+        Replay speed factor, 1.0 for real time, None for maximum speed.
+    clock: Optional[MonotonicClock]
+        Clock providing ``now()`` and ``async sleep()``.
+    """
+
+    def __init__(
+        self,
+        store: VersionedStore,
+        trace: Iterable[Batch],
+        speed: Optional[float] = 1.0,
+        clock=None,
+        yield_every: int = 256,
+    ):
+        if speed is not None and speed <= 0:
+            raise ValueError("Replay speed must be positive")
+        self.store = store
+        self.trace = trace
+        self.speed = speed
+        self.clock = clock or MonotonicClock()
+        self.yield_every = yield_every
+        self._stopped = False
+        self._iterator: Optional[Iterator[Batch]] = None
+        self._pending: Optional[Batch] = None
+
+    def stop(self):
+        """Stop the replay before the next batch is committed."""
+        self._stopped = True
+
+    async def run(self) -> ReplayStats:
+        clock, speed, update = self.clock, self.speed, self.store.update
+        updates = batches = 0
+        first: Optional[float] = None
+        last = 0.0
+        started = clock.now()
+        self._stopped = False
+        if self._iterator is None:
+            self._iterator = iter(self.trace)
+        while not self._stopped:
+            if self._pending is None:
+                self._pending = next(self._iterator, None)
+                if self._pending is None:
+                    break
+            timestamp, batch = self._pending
+            if first is None:
+                first = timestamp
+            if speed is not None:
+                delay = started + (timestamp - first) / speed - clock.now()
+                if delay > 0:
+                    await clock.sleep(delay)
+                else:
+                    await asyncio.sleep(0)
+            elif batches % self.yield_every == self.yield_every - 1:
+                await asyncio.sleep(0)
+            if self._stopped:
+                break
+            update(batch, timestamp)
+            self._pending = None
+            updates += len(batch)
+            batches += 1
+            last = timestamp
+        elapsed = clock.now() - started
+        return ReplayStats(updates, batches, elapsed, 0.0 if first is None else last - first)
+
+    def run_sync(self) -> ReplayStats:
+        """Run the replay in a new event loop."""
+        return asyncio.run(self.run())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+"""Alignment of per-signal histories onto a common clock."""
+
+import math
+from typing import List, Mapping, Optional
+
+import numpy as np
+
+from sdv_model.history import SignalHistory
+
+HOLD = "hold"
+LINEAR = "linear"
+
+
+class Resampler:
+    """Resamples several signal histories into one dense, aligned matrix.
+
+    Rows are emitted at ``start + k / rate``. Each call to :meth:`update`
+    only looks at samples recorded since the previous call and emits the
+    grid points up to the watermark, the oldest latest-sample time over all
+    non-empty histories, so rows never change once emitted. Columns without
+    a sample before a grid point hold NaN.
+
+    Parameters
+    ----------
+    histories: Mapping[str, SignalHistory]
+        Histories to align, keyed by column name. Must be numeric.
+    rate: float
+        Output rate in Hz.
+    method: str
+        ``"hold"`` for last-value-hold or ``"linear"`` for interpolation.
+    start: Optional[float]
+        Time of the first row; defaults to the first sample time, rounded up
+        to a multiple of the period.
+    """
+
+    def __init__(
+        self,
+        histories: Mapping[str, SignalHistory],
+        rate: float,
+        method: str = HOLD,
+        start: Optional[float] = None,
+    ):
+        if rate <= 0:
+            raise ValueError("Resampling rate must be positive")
+        if method not in (HOLD, LINEAR):
+            raise ValueError(f"Unknown resampling method {method}")
+        for name, history in histories.items():
+            if not history.numeric:
+                raise TypeError(f"Cannot resample non-numeric datapoint {name}")
+        self.columns: List[str] = list(histories)
+        self.period = 1.0 / rate
+        self.method = method
+        self._histories = list(histories.values())
+        self._cursors = [0] * len(self._histories)
+        self._start = start
+        self._step = 0
+        self._times: List[np.ndarray] = []
+        self._rows: List[np.ndarray] = []
+        self._matrix: Optional[np.ndarray] = None
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """All rows emitted so far, one column per history."""
+        if self._matrix is None or len(self._matrix) != sum(map(len, self._rows)):
+            self._matrix = (
+                np.concatenate(self._rows) if self._rows else np.empty((0, len(self.columns)))
+            )
+        return self._matrix
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Grid time of every emitted row."""
+        return np.concatenate(self._times) if self._times else np.empty(0)
+
+    def _watermark(self) -> Optional[float]:
+        latest = [h.last_timestamp for h in self._histories if len(h)]
+        return min(latest) if latest else None
+
+    def update(self) -> np.ndarray:
+        """Emit the rows that became complete since the last call."""
+        watermark = self._watermark()
+        if watermark is None:
+            return np.empty((0, len(self.columns)))
+        if self._start is None:
+            first = min(h.timestamps[0] for h in self._histories if len(h))
+            self._start = math.ceil(first / self.period) * self.period
+        count = math.floor((watermark - self._start) / self.period) + 1 - self._step
+        if count <= 0:
+            return np.empty((0, len(self.columns)))
+
+        grid = self._start + self.period * np.arange(self._step, self._step + count)
+        rows = np.full((count, len(self.columns)), np.nan)
+        for column, history in enumerate(self._histories):
+            if not len(history):
+                continue
+            cursor = self._cursors[column]
+            # Slicing copies; a view exporting the live buffers would make
+            # appends of a concurrent recorder fail with a BufferError.
+            end = min(len(history.timestamps), len(history.values))
+            times = np.frombuffer(history.timestamps[cursor:end], dtype=np.float64)
+            values = np.frombuffer(history.values[cursor:end], dtype=history.typecode)
+            after = np.searchsorted(times, grid, side="right")
+            if self.method == HOLD:
+                valid = after > 0
+                rows[valid, column] = values[after[valid] - 1]
+            else:
+                rows[:, column] = np.interp(grid, times, values, left=np.nan)
+            self._cursors[column] = cursor + max(int(after[-1]) - 1, 0)
+
+        self._step += count
+        self._times.append(grid)
+        self._rows.append(rows)
+        return rows
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+
+"""Flat, indexed description of the datapoints of a generated model tree."""
+
+import hashlib
+import re
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+from sdv.model import DataPoint, Model
+
+DATATYPES = {
+    "DataPointBoolean": "boolean",
+    "DataPointBooleanArray": "boolean[]",
+    "DataPointInt8": "int8",
+    "DataPointInt8Array": "int8[]",
+    "DataPointInt16": "int16",
+    "DataPointInt16Array": "int16[]",
+    "DataPointInt32": "int32",
+    "DataPointInt32Array": "int32[]",
+    "DataPointInt64": "int64",
+    "DataPointInt64Array": "int64[]",
+    "DataPointUint8": "uint8",
+    "DataPointUint8Array": "uint8[]",
+    "DataPointUint16": "uint16",
+    "DataPointUint16Array": "uint16[]",
+    "DataPointUint32": "uint32",
+    "DataPointUint32Array": "uint32[]",
+    "DataPointUint64": "uint64",
+    "DataPointUint64Array": "uint64[]",
+    "DataPointFloat": "float",
+    "DataPointFloatArray": "float[]",
+    "DataPointDouble": "double",
+    "DataPointDoubleArray": "double[]",
+    "DataPointString": "string",
+    "DataPointStringArray": "string[]",
+}
+
+_ENTRY = re.compile(r"^    (\w+): (sensor|actuator|attribute|branch)\b")
+_UNIT = re.compile(r"^\s+Unit: (\S+)")
+_ALLOWED = re.compile(r"^\s+Allowed values: (.+)$")
+_RANGE = re.compile(r"^\s+Value range: \[([^,\]]*), *([^\]]*)\]")
+
+
+class DataPointSpec(NamedTuple):
+    """Static description of one datapoint.
+
+    Attributes
+    ----------
+    index: int
+        Position of the datapoint in schema order.
+    path: str
+        Full VSS path, e.g. ``Vehicle.Speed``.
+    datatype: str
+        VSS datatype derived from the DataPoint class, e.g. ``float``.
+    kind: str
+        ``sensor``, ``actuator`` or ``attribute``; empty if undocumented.
+    unit: Optional[str]
+        Unit from the catalog, if any.
+    allowed: Optional[Tuple[str, ...]]
+        Allowed values of enum-like string datapoints.
+    minimum: Optional[float]
+        Lower bound of the value range, if any.
+    maximum: Optional[float]
+        Upper bound of the value range, if any.
+    """
+
+    index: int
+    path: str
+    datatype: str
+    kind: str
+    unit: Optional[str] = None
+    allowed: Optional[Tuple[str, ...]] = None
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+
+
+def _bound(text: str) -> Optional[float]:
+    text = text.strip()
+    return float(text) if text else None
+
+
+def _parse_attributes(doc: Optional[str]) -> Dict[str, dict]:
+    """Parse the ``Attributes`` section of a generated model docstring."""
+    entries: Dict[str, dict] = {}
+    current: Optional[dict] = None
+    for line in (doc or "").splitlines():
+        match = _ENTRY.match(line)
+        if match:
+            current = entries.setdefault(match.group(1), {"kind": match.group(2)})
+            continue
+        if current is None:
+            continue
+        match = _UNIT.match(line)
+        if match:
+            current["unit"] = match.group(1)
+            continue
+        match = _ALLOWED.match(line)
+        if match:
+            current["allowed"] = tuple(v.strip() for v in match.group(1).split(","))
+            continue
+        match = _RANGE.match(line)
+        if match:
+            current["minimum"] = _bound(match.group(1))
+            current["maximum"] = _bound(match.group(2))
+    return entries
+
+
+Target = Union[int, str, DataPoint]
+
+
+def compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile a glob over datapoint paths.
+
+    ``*`` matches within one path segment, ``**`` across segments and
+    ``?`` a single character other than the separator.
+    """
+    parts = []
+    for token in re.split(r"(\*\*|\*|\?)", pattern):
+        if token == "**":
+            parts.append(".*")
+        elif token == "*":
+            parts.append(r"[^.]*")
+        elif token == "?":
+            parts.append(r"[^.]")
+        else:
+            parts.append(re.escape(token))
+    return re.compile("".join(parts) + r"\Z")
+
+
+class Schema:
+    """Datapoints of a model tree in a stable, depth-first order.
+
+    The order follows the attribute order of the generated ``__init__``
+    methods, so two instances of the same generated model always produce
+    the same indexes.
+
+    ``fingerprint`` is a 64-bit hash of the paths and datatypes in schema
+    order. Models generated from the same VSS release share it; any change
+    to the tree, e.g. a new ``VersionVSS`` release, changes it. Encoded data
+    carries it to tell which schema its indexes refer to.
+    """
+
+    def __init__(self, specs: List[DataPointSpec], nodes: Optional[List[DataPoint]] = None):
+        self.specs: Tuple[DataPointSpec, ...] = tuple(specs)
+        self.nodes: Tuple[Optional[DataPoint], ...] = (
+            tuple(nodes) if nodes is not None else (None,) * len(self.specs)
+        )
+        self._by_path = {spec.path: spec.index for spec in self.specs}
+        self._by_node = {id(node): i for i, node in enumerate(self.nodes) if node is not None}
+        digest = hashlib.blake2b(digest_size=8)
+        for spec in self.specs:
+            digest.update(f"{spec.path}:{spec.datatype}\n".encode())
+        self.fingerprint: int = int.from_bytes(digest.digest(), "little")
+
+    @classmethod
+    def from_model(cls, root: Model) -> "Schema":
+        """Build the schema of ``root`` and everything below it."""
+        specs: List[DataPointSpec] = []
+        nodes: List[DataPoint] = []
+
+        def walk(model: Model, prefix: str):
+            docs = _parse_attributes(type(model).__doc__)
+            for attr, child in vars(model).items():
+                if attr == "parent" or attr.startswith("_"):
+                    continue
+                if isinstance(child, DataPoint):
+                    meta = docs.get(attr, {})
+                    specs.append(
+                        DataPointSpec(
+                            index=len(specs),
+                            path=f"{prefix}.{child.name}",
+                            datatype=DATATYPES.get(type(child).__name__, "string"),
+                            kind=meta.get("kind", ""),
+                            unit=meta.get("unit"),
+                            allowed=meta.get("allowed"),
+                            minimum=meta.get("minimum"),
+                            maximum=meta.get("maximum"),
+                        )
+                    )
+                    nodes.append(child)
+                elif isinstance(child, Model):
+                    walk(child, f"{prefix}.{child.name}")
+
+        walk(root, root.get_path())
+        return cls(specs, nodes)
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def __iter__(self) -> Iterator[DataPointSpec]:
+        return iter(self.specs)
+
+    def __getitem__(self, target: Target) -> DataPointSpec:
+        return self.specs[self.index_of(target)]
+
+    def __contains__(self, target: object) -> bool:
+        if isinstance(target, str):
+            return target in self._by_path
+        return id(target) in self._by_node
+
+    @property
+    def paths(self) -> List[str]:
+        return [spec.path for spec in self.specs]
+
+    def index_of(self, target: Target) -> int:
+        """Resolve a datapoint node, path or index to its schema index."""
+        if isinstance(target, int):
+            if not 0 <= target < len(self.specs):
+                raise IndexError(f"Datapoint index {target} is out of range")
+            return target
+        if isinstance(target, str):
+            try:
+                return self._by_path[target]
+            except KeyError as err:
+                raise KeyError(f"Unknown datapoint {target}") from err
+        try:
+            return self._by_node[id(target)]
+        except KeyError:
+            return self.index_of(target.get_path())
+
+    def node(self, target: Target) -> Optional[DataPoint]:
+        """Return the model node of a datapoint, if the schema has one."""
+        return self.nodes[self.index_of(target)]
+
+    def match(self, pattern: Target) -> List[int]:
+        """Indexes of the datapoints matching a node, index, path or glob pattern."""
+        if not isinstance(pattern, str) or not any(char in pattern for char in "*?"):
+            return [self.index_of(pattern)]
+        matcher = compile_pattern(pattern).match
+        return [spec.index for spec in self.specs if matcher(spec.path)]
+
+    def remap(self, target: "Schema") -> "SchemaRemap":
+        """Translation of this schema's indexes to the indexes of ``target``."""
+        return SchemaRemap(self, target)
+
+    def under(self, prefix: str) -> List[int]:
+        """Indexes of all datapoints at or below the branch ``prefix``."""
+        branch = prefix + "."
+        return [s.index for s in self.specs if s.path == prefix or s.path.startswith(branch)]
+
+
+class SchemaRemap:
+    """Precomputed translation of indexes between two versions of a schema.
+
+    A source datapoint maps to the target datapoint with the same path and
+    datatype; others are dropped.
+
+    Attributes
+    ----------
+    table: Tuple[int, ...]
+        Target index of every source index, -1 where there is none.
+    missing: Tuple[int, ...]
+        Target indexes that no source datapoint maps to.
+    """
+
+    def __init__(self, source: Schema, target: Schema):
+        self.source = source
+        self.target = target
+        table = []
+        for spec in source:
+            index = target.index_of(spec.path) if spec.path in target else -1
+            if index != -1 and target.specs[index].datatype != spec.datatype:
+                index = -1
+            table.append(index)
+        self.table: Tuple[int, ...] = tuple(table)
+        mapped = set(table)
+        self.missing: Tuple[int, ...] = tuple(i for i in range(len(target)) if i not in mapped)
+
+    def __getitem__(self, index: int) -> Optional[int]:
+        mapped = self.table[index]
+        return None if mapped == -1 else mapped
+
+    def updates(self, updates: Mapping[int, Any]) -> Dict[int, Any]:
+        """Translate updates keyed by source index, dropping unmapped ones."""
+        table = self.table
+        return {table[i]: value for i, value in updates.items() if table[i] != -1}
+
+    def values(self, values: Sequence[Any]) -> List[Any]:
+        """Translate values in source order to values in target order."""
+        result: List[Any] = [None] * len(self.target)
+        for index, value in zip(self.table, values):
+            if index != -1:
+                result[index] = value
+        return result
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+
+"""Multi-version store of datapoint values with consistent read snapshots.
+
+Values are kept in fixed-size pages indexed by schema position. A commit
+copies only the pages it touches and publishes a new immutable
+:class:`Snapshot`, so readers holding an older snapshot keep a consistent
+view and never block the writer.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sdv_model.schema import Schema, Target
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 64
+
+Listener = Callable[["Snapshot", Tuple[int, ...]], None]
+WriteFilter = Callable[[int, Any, Any], bool]
+
+
+class Snapshot:
+    """Immutable view of all datapoint values at one version.
+
+    Attributes
+    ----------
+    schema: Schema
+        Schema the values are indexed by.
+    version: int
+        Monotonic version number, 0 for the empty initial snapshot.
+    timestamp: Optional[float]
+        Timestamp of the commit that produced this version.
+    """
+
+    __slots__ = ("schema", "version", "timestamp", "_pages", "_page_size")
+
+    def __init__(
+        self,
+        schema: Schema,
+        version: int,
+        timestamp: Optional[float],
+        pages: Tuple[Tuple[Any, ...], ...],
+        page_size: int = PAGE_SIZE,
+    ):
+        self.schema = schema
+        self.version = version
+        self.timestamp = timestamp
+        self._pages = pages
+        self._page_size = page_size
+
+    def __getitem__(self, target: Target) -> Any:
+        index = self.schema.index_of(target)
+        return self._pages[index // self._page_size][index % self._page_size]
+
+    def __len__(self) -> int:
+        return len(self.schema)
+
+    def get(self, target: Target, default: Any = None) -> Any:
+        value = self[target]
+        return default if value is None else value
+
+    def value_at(self, index: int) -> Any:
+        """Return the value at a schema index without resolving targets."""
+        return self._pages[index // self._page_size][index % self._page_size]
+
+    def gather(self, indexes: Iterable[int]) -> List[Any]:
+        """Return the values at ``indexes`` in the given order."""
+        pages, size = self._pages, self._page_size
+        return [pages[i // size][i % size] for i in indexes]
+
+    def values(self) -> List[Any]:
+        """Return all values in schema order."""
+        return [value for page in self._pages for value in page][: len(self.schema)]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the set values keyed by path."""
+        return {
+            spec.path: value
+            for spec, value in zip(self.schema.specs, self.values())
+            if value is not None
+        }
+
+    def shares_page(self, other: "Snapshot", index: int) -> bool:
+        """Tell whether both snapshots share the page holding ``index``."""
+        page = index // self._page_size
+        return self._pages[page] is other._pages[page]
+
+
+class WriteTransaction:
+    """Collects writes and commits them as one new version on exit."""
+
+    def __init__(self, store: "VersionedStore", timestamp: Optional[float] = None):
+        self._store = store
+        self._timestamp = timestamp
+        self._values: Dict[Target, Any] = {}
+        self.snapshot: Optional[Snapshot] = None
+
+    def set(self, target: Target, value: Any) -> "WriteTransaction":
+        self._values[target] = value
+        return self
+
+    def __enter__(self) -> "WriteTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.snapshot = self._store.update(self._values, self._timestamp)
+
+
+class VersionedStore:
+    """Copy-on-write store publishing one immutable snapshot per commit.
+
+    Writers are serialized by a lock; readers take :meth:`snapshot`, which
+    is a single attribute read and never waits for a writer. Listeners are
+    called after each commit, in commit order, with the new snapshot and the
+    indexes written by it. They run under the writer lock, which is what
+    keeps that order, so they should return quickly. An exception raised by
+    a listener is logged; it neither fails the committed write nor keeps
+    later listeners from seeing it. Write filters see every write with the
+    stored and the new value first; writes they reject are dropped before
+    they reach a page or a listener.
+    """
+
+    def __init__(self, schema: Schema, page_size: int = PAGE_SIZE):
+        self.schema = schema
+        self.page_size = page_size
+        count = -(-len(schema) // page_size)
+        empty = (None,) * page_size
+        self._lock = threading.Lock()
+        self._head = Snapshot(schema, 0, None, (empty,) * count, page_size)
+        self._listeners: List[Listener] = []
+        self._filters: List[WriteFilter] = []
+
+    def add_listener(self, listener: Listener):
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener):
+        self._listeners.remove(listener)
+
+    def add_filter(self, write_filter: WriteFilter):
+        self._filters.append(write_filter)
+
+    def remove_filter(self, write_filter: WriteFilter):
+        self._filters.remove(write_filter)
+
+    def snapshot(self) -> Snapshot:
+        """Return the latest committed version."""
+        return self._head
+
+    @property
+    def version(self) -> int:
+        return self._head.version
+
+    def transaction(self, timestamp: Optional[float] = None) -> WriteTransaction:
+        """Return a context manager committing its writes on exit."""
+        return WriteTransaction(self, timestamp)
+
+    def update(
+        self, values: Mapping[Target, Any], timestamp: Optional[float] = None
+    ) -> Snapshot:
+        """Commit ``values`` as a new version and return its snapshot.
+
+        If every write is rejected by a filter, no version is created and
+        the current snapshot is returned.
+        """
+        index_of = self.schema.index_of
+        filters = self._filters
+        size = self.page_size
+        with self._lock:
+            head = self._head
+            pages = list(head._pages)
+            touched: Dict[int, List[Any]] = {}
+            changed = []
+            for target, value in values.items():
+                index = index_of(target)
+                number = index // size
+                page = touched.get(number)
+                if filters:
+                    previous = (page or pages[number])[index % size]
+                    if not all(accept(index, previous, value) for accept in filters):
+                        continue
+                if page is None:
+                    page = touched[number] = list(pages[number])
+                page[index % size] = value
+                changed.append(index)
+            if not changed:
+                return head
+            for number, page in touched.items():
+                pages[number] = tuple(page)
+            snapshot = self._head = Snapshot(
+                self.schema,
+                head.version + 1,
+                time.time() if timestamp is None else timestamp,
+                tuple(pages),
+                size,
+            )
+            changed_indexes = tuple(changed)
+            for listener in tuple(self._listeners):
+                try:
+                    listener(snapshot, changed_indexes)
+                except Exception:  # pylint: disable=W0703
+                    logger.exception("Store listener %r failed", listener)
+            return snapshot
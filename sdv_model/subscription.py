@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+"""One broker subscription serving many datapoint callbacks.
+
+Apps register callbacks for datapoints, or for glob patterns over the
+model such as ``Vehicle.Cabin.Door.*.*.IsOpen``. The requested datapoints
+are compiled into a single ``SELECT`` query, and every reply of that one
+stream is demultiplexed to the callbacks of the datapoints it contains.
+The number of streams stays one however many datapoints an app watches.
+Subscriptions may carry a :class:`~sdv_model.ratelimit.RateLimit`, which
+is applied per datapoint before a reply field is decoded.
+"""
+
+import asyncio
+import inspect
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from sdv.model import DataPoint
+from sdv.vdb.reply import DataPointReply
+from sdv.vdb.subscriptions import SubscriptionManager, VdbSubscription
+
+from sdv_model.ratelimit import RateLimit, RateLimiter
+from sdv_model.schema import Schema
+
+logger = logging.getLogger(__name__)
+
+Callback = Callable[[Any], Any]
+Pattern = Union[str, DataPoint]
+Subscriber = Tuple[Callback, Optional[RateLimiter]]
+
+
+class SubscriptionSet:
+    """Collects datapoint subscriptions and serves them over one stream.
+
+    Callbacks receive the ``TypedDataPointResult`` of their datapoint, the
+    same object :meth:`DataPointReply.get` returns for a single-datapoint
+    subscription. Coroutine callbacks are awaited, except for trailing
+    rate-limited updates, which are scheduled as tasks. Exceptions raised
+    by a callback are logged, so they neither end the shared stream nor
+    keep the other callbacks from being called.
+
+    Parameters
+    ----------
+    schema: Schema
+        Schema of the model; its nodes provide datatypes and the client.
+    """
+
+    def __init__(self, schema: Schema):
+        self.schema = schema
+        self._callbacks: Dict[int, List[Subscriber]] = {}
+        self._by_path: Dict[str, Tuple[DataPoint, List[Subscriber]]] = {}
+        self._subscription: Optional[VdbSubscription] = None
+
+    def add(
+        self, pattern: Pattern, callback: Callback, limit: Optional[RateLimit] = None
+    ) -> Tuple[int, ...]:
+        """Call ``callback`` on updates of every datapoint matching ``pattern``.
+
+        With a ``limit``, the updates of each matched datapoint are rate
+        limited separately. Returns the matched schema indexes. Raises a
+        KeyError if nothing matches, and a ValueError for a ``limit`` that
+        does not fit a matched datapoint. Takes effect on the next
+        :meth:`subscribe`.
+        """
+        indexes = self.schema.match(pattern)
+        if not indexes:
+            raise KeyError(f"No datapoint matches {pattern}")
+        limiters: List[Optional[RateLimiter]] = [None] * len(indexes)
+        if limit is not None:
+            limiters = [
+                RateLimiter(
+                    limit,
+                    lambda item, cb=callback: _schedule(cb, item),
+                    datatype=self.schema.specs[index].datatype,
+                )
+                for index in indexes
+            ]
+        for index, limiter in zip(indexes, limiters):
+            subscribers = self._callbacks.setdefault(index, [])
+            if not subscribers:
+                node = self.schema.node(index)
+                if node is None:
+                    raise ValueError(f"Schema has no model node for index {index}")
+                self._by_path[self.schema.specs[index].path] = (node, subscribers)
+            subscribers.append((callback, limiter))
+        return tuple(indexes)
+
+    def remove(self, callback: Callback):
+        """Stop calling ``callback``; takes effect on the next :meth:`subscribe`."""
+        for index in list(self._callbacks):
+            subscribers = self._callbacks[index]
+            for subscriber in [entry for entry in subscribers if entry[0] == callback]:
+                subscribers.remove(subscriber)
+                if subscriber[1] is not None:
+                    subscriber[1].cancel()
+            if not subscribers:
+                del self._callbacks[index]
+                del self._by_path[self.schema.specs[index].path]
+
+    @property
+    def indexes(self) -> List[int]:
+        """Subscribed schema indexes in schema order."""
+        return sorted(self._callbacks)
+
+    @property
+    def query(self) -> str:
+        """The compiled query over all subscribed datapoints."""
+        paths = self.schema.specs
+        return "SELECT " + ", ".join(paths[index].path for index in self.indexes)
+
+    async def subscribe(self, client=None) -> Optional[VdbSubscription]:
+        """Open the stream for the current query, replacing an outdated one.
+
+        Parameters
+        ----------
+        client: Optional[VehicleDataBrokerClient]
+            Client to subscribe with; the model's client if omitted.
+        """
+        if self._subscription is not None:
+            if self._callbacks and self._subscription.query == self.query:
+                return self._subscription
+            await self.unsubscribe()
+        if not self._callbacks:
+            return None
+        if client is None:
+            client = next(iter(self._by_path.values()))[0].get_client()
+        self._subscription = VdbSubscription(client, self.query, self._on_reply)
+        SubscriptionManager._add_subscription(self._subscription)  # pylint: disable=W0212
+        return self._subscription
+
+    async def unsubscribe(self):
+        if self._subscription is not None:
+            await self._subscription.unsubscribe()
+            self._subscription = None
+
+    async def _on_reply(self, reply: DataPointReply):
+        by_path = self._by_path
+        for path in reply.reply.fields:
+            entry = by_path.get(path)
+            if entry is None:
+                continue
+            node, subscribers = entry
+            decoded: List[Any] = []
+
+            def result(node=node, decoded=decoded) -> Any:
+                if not decoded:
+                    decoded.append(reply.get(node))
+                return decoded[0]
+
+            for callback, limiter in tuple(subscribers):
+                try:
+                    if limiter is None:
+                        item = result()
+                    else:
+                        item = limiter.offer(result)
+                        if item is None:
+                            continue
+                    outcome = callback(item)
+                    if inspect.isawaitable(outcome):
+                        await outcome
+                except Exception:  # pylint: disable=W0703
+                    logger.exception("Subscription callback %r failed on %s", callback, path)
+
+
+def _schedule(callback: Callback, item: Any):
+    try:
+        outcome = callback(item)
+        if inspect.isawaitable(outcome):
+            asyncio.ensure_future(outcome)
+    except Exception:  # pylint: disable=W0703
+        logger.exception("Subscription callback %r failed", callback)
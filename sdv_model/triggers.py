@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+
+"""Vectorized threshold and edge triggers over datapoint values.
+
+Conditions such as ``Tire.Pressure < 200`` on every wheel or rising edges
+of ``OBD.Status.IsMILOn`` are registered once and compiled into NumPy
+arrays: one slot per watched datapoint and one row per trigger. Each
+update batch writes the changed values into their slots and evaluates all
+affected triggers with a few array operations. A trigger fires only when
+its condition changes state, never on every update that satisfies it.
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from sdv_model.schema import Schema, Target
+from sdv_model.snapshot import Snapshot, VersionedStore
+
+logger = logging.getLogger(__name__)
+
+ABOVE = 0
+BELOW = 1
+TRUE = 2
+
+# Which transitions of its condition make a trigger fire.
+ON_ENTER = 1
+ON_EXIT = 2
+ON_BOTH = ON_ENTER | ON_EXIT
+
+_NUMERIC = (
+    "boolean",
+    "int8",
+    "int16",
+    "int32",
+    "int64",
+    "uint8",
+    "uint16",
+    "uint32",
+    "uint64",
+    "float",
+    "double",
+)
+
+
+class TriggerEvent(NamedTuple):
+    """A state change of a trigger.
+
+    Attributes
+    ----------
+    trigger: int
+        Id returned on registration.
+    name: str
+        Name given on registration.
+    path: str
+        Path of the datapoint whose value caused the change.
+    value: Any
+        The value that caused the change.
+    active: bool
+        Whether the condition now holds.
+    timestamp: Optional[float]
+        Timestamp of the update batch.
+    """
+
+    trigger: int
+    name: str
+    path: str
+    value: Any
+    active: bool
+    timestamp: Optional[float]
+
+
+TriggerCallback = Callable[[TriggerEvent], Any]
+
+
+class TriggerRegistry:
+    """Compiles many threshold and edge conditions into vectorized checks.
+
+    Parameters
+    ----------
+    schema: Schema
+        Schema the updates are indexed by.
+    """
+
+    def __init__(self, schema: Schema):
+        self.schema = schema
+        self._slots: Dict[int, int] = {}
+        self._names: List[str] = []
+        self._callbacks: List[Optional[TriggerCallback]] = []
+        self._slot: List[int] = []
+        self._kind: List[int] = []
+        self._threshold: List[float] = []
+        self._hysteresis: List[float] = []
+        self._edges: List[int] = []
+        self._values = np.full(0, np.nan)
+        self._state = np.zeros(0, dtype=bool)
+        self._compiled = True
+        self._store: Optional[VersionedStore] = None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(
+        self,
+        pattern: Target,
+        kind: int,
+        threshold: float = 0.0,
+        callback: Optional[TriggerCallback] = None,
+        hysteresis: float = 0.0,
+        edges: int = ON_BOTH,
+        name: Optional[str] = None,
+    ) -> Tuple[int, ...]:
+        """Register a trigger for every datapoint matching ``pattern``.
+
+        Parameters
+        ----------
+        pattern: Target
+            Datapoint, path or glob pattern over paths.
+        kind: int
+            ``ABOVE`` or ``BELOW`` ``threshold``, or ``TRUE`` for booleans.
+        callback: Optional[TriggerCallback]
+            Called with each :class:`TriggerEvent` of the trigger.
+        hysteresis: float
+            Margin the value has to move back past the threshold before an
+            active threshold trigger clears.
+        edges: int
+            ``ON_ENTER``, ``ON_EXIT`` or ``ON_BOTH``.
+        name: Optional[str]
+            Name for events; the pattern if omitted.
+
+        Returns
+        -------
+        Tuple[int, ...]
+            Trigger ids, one per matched datapoint.
+        """
+        if kind not in (ABOVE, BELOW, TRUE):
+            raise ValueError(f"Unknown trigger kind {kind}")
+        indexes = self.schema.match(pattern)
+        if not indexes:
+            raise KeyError(f"No datapoint matches {pattern}")
+        for index in indexes:
+            spec = self.schema.specs[index]
+            if spec.datatype not in _NUMERIC:
+                raise TypeError(f"Datapoint {spec.path} of type {spec.datatype} is not numeric")
+        ids = []
+        for index in indexes:
+            ids.append(len(self._names))
+            self._names.append(name or str(pattern))
+            self._callbacks.append(callback)
+            self._slot.append(self._slots.setdefault(index, len(self._slots)))
+            self._kind.append(kind)
+            self._threshold.append(threshold)
+            self._hysteresis.append(hysteresis)
+            self._edges.append(edges)
+        self._compiled = False
+        return tuple(ids)
+
+    def above(self, pattern: Target, threshold: float, callback=None, **options):
+        return self.add(pattern, ABOVE, threshold, callback, **options)
+
+    def below(self, pattern: Target, threshold: float, callback=None, **options):
+        return self.add(pattern, BELOW, threshold, callback, **options)
+
+    def rising(self, pattern: Target, callback=None, **options):
+        return self.add(pattern, TRUE, callback=callback, edges=ON_ENTER, **options)
+
+    def falling(self, pattern: Target, callback=None, **options):
+        return self.add(pattern, TRUE, callback=callback, edges=ON_EXIT, **options)
+
+    def active(self, trigger: int) -> bool:
+        """Whether the condition of ``trigger`` currently holds."""
+        self._compile()
+        return bool(self._state[trigger])
+
+    def _compile(self):
+        if self._compiled:
+            return
+        count = len(self._names)
+        self._slot_array = np.array(self._slot, dtype=np.intp)
+        self._kind_array = np.array(self._kind, dtype=np.int8)
+        self._threshold_array = np.array(self._threshold, dtype=np.float64)
+        self._hysteresis_array = np.array(self._hysteresis, dtype=np.float64)
+        self._enter = (np.array(self._edges, dtype=np.int8) & ON_ENTER) != 0
+        self._exit = (np.array(self._edges, dtype=np.int8) & ON_EXIT) != 0
+        values = np.full(len(self._slots), np.nan)
+        values[: len(self._values)] = self._values
+        self._values = values
+        state = np.zeros(count, dtype=bool)
+        state[: len(self._state)] = self._state
+        self._state = state
+        self._slot_indexes = [0] * len(self._slots)
+        for index, slot in self._slots.items():
+            self._slot_indexes[slot] = index
+        self._compiled = True
+
+    def evaluate(
+        self, updates: Mapping[int, Any], timestamp: Optional[float] = None
+    ) -> List[TriggerEvent]:
+        """Apply an update batch keyed by schema index; return the fired events.
+
+        Callbacks are called before this returns; exceptions they raise
+        are logged and do not keep the other events from being delivered.
+        None values leave the state of their triggers unchanged.
+        """
+        self._compile()
+        slots = self._slots
+        positions: List[int] = []
+        values: List[Any] = []
+        for index, value in updates.items():
+            slot = slots.get(index)
+            if slot is not None and value is not None:
+                positions.append(slot)
+                values.append(value)
+        if not positions:
+            return []
+        self._values[positions] = values
+        touched = np.zeros(len(slots), dtype=bool)
+        touched[positions] = True
+
+        rows = np.flatnonzero(touched[self._slot_array])
+        current = self._values[self._slot_array[rows]]
+        kind = self._kind_array[rows]
+        threshold = self._threshold_array[rows]
+        margin = np.where(self._state[rows], self._hysteresis_array[rows], 0.0)
+        holds = np.where(
+            kind == ABOVE,
+            current > threshold - margin,
+            np.where(kind == BELOW, current < threshold + margin, current != 0),
+        )
+        changed = holds != self._state[rows]
+        self._state[rows] = holds
+        fired = rows[changed & np.where(holds, self._enter[rows], self._exit[rows])]
+
+        events = []
+        specs = self.schema.specs
+        for trigger in fired.tolist():
+            index = self._slot_indexes[self._slot[trigger]]
+            event = TriggerEvent(
+                trigger,
+                self._names[trigger],
+                specs[index].path,
+                updates[index],
+                bool(self._state[trigger]),
+                timestamp,
+            )
+            events.append(event)
+            callback = self._callbacks[trigger]
+            if callback is not None:
+                try:
+                    callback(event)
+                except Exception:  # pylint: disable=W0703
+                    logger.exception("Trigger callback %r failed on %s", callback, event.name)
+        return events
+
+    def attach(self, store: VersionedStore):
+        """Evaluate every commit of ``store``."""
+        self._store = store
+        store.add_listener(self._on_commit)
+
+    def _on_commit(self, snapshot: Snapshot, changed: Tuple[int, ...]):
+        watched = [index for index in changed if index in self._slots]
+        if watched:
+            self.evaluate(dict(zip(watched, snapshot.gather(watched))), snapshot.timestamp)
+
+    def close(self):
+        if self._store is not None:
+            self._store.remove_listener(self._on_commit)
+            self._store = None
@@ -5,5 +5,10 @@ setup(
     version="3.9",
     description="Vehicle Model",
     packages=find_packages(),
+    extras_require={
+        "numpy": ["numpy"],
+        "arrow": ["numpy", "pyarrow"],
+        "protobuf": ["protobuf"],
+    },
     zip_safe=False,
 )
@@ -0,0 +1,23 @@
+import pytest
+
+from sdv_model.schema import DataPointSpec, Schema
+
+DATAPOINTS = [
+    ("Vehicle.Speed", "float", "sensor"),
+    ("Vehicle.Cabin.Door.Row1.Left.IsOpen", "boolean", "actuator"),
+    ("Vehicle.Cabin.Door.Row1.Right.IsOpen", "boolean", "actuator"),
+    ("Vehicle.Cabin.Door.Row1.Left.Window.Position", "uint8", "actuator"),
+    ("Vehicle.Powertrain.TractionBattery.CurrentVoltage", "float", "sensor"),
+    ("Vehicle.Powertrain.TractionBattery.CurrentCurrent", "float", "sensor"),
+    ("Vehicle.VehicleIdentification.VIN", "string", "attribute"),
+]
+
+
+@pytest.fixture
+def schema() -> Schema:
+    return Schema(
+        [
+            DataPointSpec(index, path, datatype, kind)
+            for index, (path, datatype, kind) in enumerate(DATAPOINTS)
+        ]
+    )
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from sdv_model.actuators import ActuatorWriteBuffer
+from sdv_model.fakebroker import FakeBroker
+from sdv_model.schema import Schema
+
+DOOR = "Vehicle.Cabin.Door.Row1.Left"
+
+
+@pytest.fixture(name="vehicle_schema")
+def fixture_vehicle_schema() -> Schema:
+    from sdv_model import vehicle  # pylint: disable=C0415
+
+    return Schema.from_model(vehicle)
+
+
+def test_writes_are_coalesced_into_one_request(vehicle_schema):
+    broker = FakeBroker(vehicle_schema)
+
+    async def main():
+        buffer = ActuatorWriteBuffer(vehicle_schema, window=0.01, client=broker)
+        first = buffer.set(f"{DOOR}.Shade.Position", 10)
+        buffer.set(f"{DOOR}.Shade.Position", 20)
+        doors = buffer.set_matching("Vehicle.Cabin.Door.Row1.*.IsOpen", True)
+        await asyncio.gather(first, doors)
+        return buffer.stats
+
+    stats = asyncio.run(main())
+
+    snapshot = broker.store.snapshot()
+    assert snapshot.value_at(vehicle_schema.index_of(f"{DOOR}.Shade.Position")) == 20
+    assert snapshot.value_at(vehicle_schema.index_of(f"{DOOR}.IsOpen")) is True
+    assert (stats.writes, stats.coalesced, stats.flushes, stats.failed) == (4, 1, 1, 0)
+    assert broker.calls == 1
+
+
+def test_value_the_batch_cannot_take_fails_every_future_of_the_batch(vehicle_schema):
+    broker = FakeBroker(vehicle_schema)
+
+    async def main():
+        buffer = ActuatorWriteBuffer(vehicle_schema, window=0.01, client=broker)
+        futures = [buffer.set(f"{DOOR}.IsOpen", True), buffer.set(f"{DOOR}.Shade.Position", -1)]
+        outcomes = await asyncio.wait_for(
+            asyncio.gather(*futures, return_exceptions=True), timeout=1.0
+        )
+        retried = buffer.set(f"{DOOR}.Shade.Position", 30)
+        await buffer.flush()
+        await retried
+        return outcomes, buffer.stats
+
+    outcomes, stats = asyncio.run(main())
+
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    assert (stats.flushes, stats.failed, stats.pending) == (2, 1, 0)
+    assert broker.calls == 1
+
+
+def test_sensors_and_attributes_are_rejected(vehicle_schema):
+    buffer = ActuatorWriteBuffer(vehicle_schema, client=FakeBroker(vehicle_schema))
+
+    with pytest.raises(TypeError):
+        buffer.set("Vehicle.Speed", 10.0)
+    with pytest.raises(KeyError):
+        buffer.set_matching("Vehicle.Body.Unknown.*", True)
+    assert buffer.stats.writes == 0
@@ -0,0 +1,55 @@
+import math
+import threading
+
+import pytest
+
+from sdv_model.aggregate import QuantileSketch, SlidingWindow, TumblingWindow, WindowAggregators
+from sdv_model.snapshot import VersionedStore
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_sketch_counts_non_finite_values_without_inserting_them(value):
+    sketch = QuantileSketch()
+    sketch.add(1.0)
+    sketch.add(value)
+    sketch.add(3.0)
+    sketch.remove(value)
+
+    assert sketch.count == 2
+    assert sketch.nonfinite == 0
+    assert sketch.quantile(1.0) == pytest.approx(3.0, rel=0.01)
+
+
+def test_windows_skip_non_finite_samples():
+    tumbling = TumblingWindow(10.0)
+    sliding = SlidingWindow(10.0)
+    for timestamp, value in enumerate([1.0, math.nan, 3.0, math.inf, -math.inf]):
+        tumbling.add(float(timestamp), value)
+        sliding.add(float(timestamp), value)
+
+    for window, stats in ((tumbling, tumbling.current()), (sliding, sliding.current())):
+        assert window.nonfinite == 3
+        assert stats.count == 2
+        assert (stats.minimum, stats.maximum, stats.mean) == (1.0, 3.0, 2.0)
+
+
+def test_non_finite_sample_committed_by_writer_thread_reaches_windows(schema):
+    store = VersionedStore(schema)
+    aggregators = WindowAggregators(store)
+    window = aggregators.attach("Vehicle.Speed", SlidingWindow(1000.0))
+    values = [math.nan if step % 10 == 0 else float(step) for step in range(1000)]
+
+    def write():
+        for step, value in enumerate(values):
+            store.update({"Vehicle.Speed": value}, float(step))
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    writer.join()
+    aggregators.close()
+
+    stats = window.current()
+    assert store.snapshot().version == len(values)
+    assert window.nonfinite == 100
+    assert stats.count == 900
+    assert stats.maximum == 999.0
@@ -0,0 +1,58 @@
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from sdv_model.codec.arrow import ParquetTraceWriter, arrow_type, export_histories  # noqa: E402
+from sdv_model.history import SignalHistory  # noqa: E402
+from sdv_model.schema import DataPointSpec  # noqa: E402
+from sdv_model.snapshot import VersionedStore  # noqa: E402
+
+
+def test_histories_export_as_sparse_rows_over_chunks(schema, tmp_path):
+    speed = SignalHistory(schema["Vehicle.Speed"])
+    vin = SignalHistory(schema["Vehicle.VehicleIdentification.VIN"])
+    for timestamp, value in [(0.0, 1.0), (1.0, 2.0), (90.0, 3.0)]:
+        speed.append(timestamp, value)
+    vin.append(1.0, "WVW000001")
+    path = str(tmp_path / "trace.parquet")
+
+    export_histories(path, {"speed": speed, "vin": vin}, chunk_seconds=60.0)
+    table = pq.read_table(path)
+
+    assert table.column_names == ["timestamp", "Vehicle.Speed", "Vehicle.VehicleIdentification.VIN"]
+    assert table.schema.field("Vehicle.Speed").type == pa.float32()
+    assert table.to_pydict() == {
+        "timestamp": [0.0, 1.0, 90.0],
+        "Vehicle.Speed": [1.0, 2.0, 3.0],
+        "Vehicle.VehicleIdentification.VIN": [None, "WVW000001", None],
+    }
+    assert pq.ParquetFile(path).num_row_groups == 2
+
+
+def test_enum_and_array_datapoints_get_dictionary_and_list_columns():
+    enum = DataPointSpec(0, "Vehicle.Gear", "string", "sensor", allowed=("P", "D"))
+    codes = DataPointSpec(1, "Vehicle.OBD.DTCList", "string[]", "sensor")
+
+    assert pa.types.is_dictionary(arrow_type(enum))
+    assert arrow_type(codes) == pa.list_(pa.string())
+
+
+def test_trace_writer_records_store_commits_in_batches(schema, tmp_path):
+    store = VersionedStore(schema)
+    path = str(tmp_path / "commits.parquet")
+    writer = ParquetTraceWriter(
+        path, schema, targets=["Vehicle.Speed", "Vehicle.Cabin.Door.Row1.Left.IsOpen"], batch_rows=2
+    )
+    writer.attach(store)
+    store.update({"Vehicle.Speed": 10.0}, 1.0)
+    store.update({"Vehicle.Cabin.Door.Row1.Left.IsOpen": True}, 2.0)
+    store.update({"Vehicle.Speed": 11.0, "Vehicle.VehicleIdentification.VIN": "X"}, 3.0)
+    writer.close()
+
+    assert pq.read_table(path).to_pydict() == {
+        "timestamp": [1.0, 2.0, 3.0],
+        "Vehicle.Speed": [10.0, None, 11.0],
+        "Vehicle.Cabin.Door.Row1.Left.IsOpen": [None, True, None],
+    }
+    assert pq.ParquetFile(path).num_row_groups == 2
@@ -0,0 +1,34 @@
+import asyncio
+import json
+
+import pytest
+
+from sdv_model.attributes import AttributeCache
+from sdv_model.fakebroker import FakeBroker
+
+VIN = "Vehicle.VehicleIdentification.VIN"
+
+
+def test_unavailable_attribute_is_retried_and_not_persisted(schema, tmp_path):
+    broker = FakeBroker(schema)
+    path = tmp_path / "attributes.json"
+    cache = AttributeCache(schema, client=broker, path=str(path))
+
+    assert asyncio.run(cache.load()) == 0
+    assert cache.missing == [schema.index_of(VIN)]
+    with pytest.raises(LookupError):
+        cache[VIN]
+    assert not path.exists()
+
+    broker.store.update({VIN: "WVW000001"})
+    assert asyncio.run(cache.load()) == 1
+    assert cache[VIN] == "WVW000001"
+    assert json.loads(path.read_text())["values"] == {VIN: "WVW000001"}
+    assert broker.calls == 2
+
+
+def test_schema_without_model_needs_a_client(schema):
+    cache = AttributeCache(schema)
+
+    with pytest.raises(ValueError, match="client"):
+        asyncio.run(cache.load())
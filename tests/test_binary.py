@@ -0,0 +1,66 @@
+import pytest
+
+from sdv_model.codec.binary import SnapshotCodec
+from sdv_model.schema import DataPointSpec, Schema
+from sdv_model.snapshot import VersionedStore
+
+VALUES = [12.5, True, None, 40, 401.25, -3.5, "WVW000001"]
+
+
+def test_values_round_trip_and_view_reads_single_datapoints(schema):
+    codec = SnapshotCodec(schema)
+
+    data = codec.encode(VALUES, 7.0)
+    timestamp, values = codec.decode(data)
+    view = codec.view(data)
+
+    assert timestamp == 7.0
+    assert values == VALUES
+    assert [view.value_at(index) for index in range(len(schema))] == VALUES
+    assert view["Vehicle.VehicleIdentification.VIN"] == "WVW000001"
+    assert view.get("Vehicle.Cabin.Door.Row1.Right.IsOpen", "closed") == "closed"
+
+
+def test_array_values_round_trip():
+    schema = Schema(
+        [
+            DataPointSpec(0, "Vehicle.OBD.DTCList", "string[]", "sensor"),
+            DataPointSpec(1, "Vehicle.Cabin.SeatPositions", "uint8[]", "sensor"),
+        ]
+    )
+    codec = SnapshotCodec(schema)
+
+    assert codec.decode(codec.encode([["P0001", "P0002"], [1, 2, 3]])) == (
+        None,
+        [["P0001", "P0002"], [1, 2, 3]],
+    )
+
+
+def test_snapshot_of_an_older_schema_is_remapped(schema):
+    old = Schema(
+        [
+            DataPointSpec(0, "Vehicle.VehicleIdentification.VIN", "string", "attribute"),
+            DataPointSpec(1, "Vehicle.Speed", "float", "sensor"),
+            DataPointSpec(2, "Vehicle.Retired", "int32", "sensor"),
+        ]
+    )
+    data = SnapshotCodec(old).encode(["WVW000001", 88.0, 5], 1.0)
+    codec = SnapshotCodec(schema, sources=[old])
+    store = VersionedStore(schema)
+
+    _, values = codec.decode(data)
+    codec.decode_into(data, store)
+
+    assert values == [88.0, None, None, None, None, None, "WVW000001"]
+    assert codec.view(data)["Vehicle.Speed"] == 88.0
+    assert store.snapshot()["Vehicle.VehicleIdentification.VIN"] == "WVW000001"
+
+
+def test_unknown_schema_and_out_of_range_values_are_rejected(schema):
+    other = Schema([DataPointSpec(0, "Vehicle.Speed", "double", "sensor")])
+    codec = SnapshotCodec(schema)
+
+    with pytest.raises(ValueError, match="unknown schema"):
+        codec.decode(SnapshotCodec(other).encode([1.0]))
+    with pytest.raises(ValueError, match="datatype"):
+        codec.encode([None, None, None, 300, None, None, None])
@@ -0,0 +1,72 @@
+import io
+import tracemalloc
+
+import pytest
+
+from sdv_model.codec.csvlog import import_csv
+from sdv_model.schema import DataPointSpec, Schema
+
+
+@pytest.fixture
+def log_schema(schema):
+    specs = list(schema)
+    specs.append(DataPointSpec(len(specs), "Vehicle.OBD.DTCList", "string[]", "sensor"))
+    return Schema(specs)
+
+
+LOG = (
+    "timestamp,Vehicle.Speed,Vehicle.VehicleIdentification.VIN,"
+    "Vehicle.Cabin.Door.Row1.Left.IsOpen,Vehicle.OBD.DTCList\n"
+    '0.0,10.5,"line one\nline two",true,"[""P0001"",""P0002""]"\n'
+    "1.0,,plain,false,\n"
+    '2.0,12.0,"a, b",,[]\n'
+)
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 2, 65536])
+def test_quoted_newlines_and_arrays_survive_chunking(log_schema, chunk_rows):
+    histories = import_csv(io.StringIO(LOG), log_schema, chunk_rows=chunk_rows)
+
+    assert list(histories["Vehicle.Speed"]) == [(0.0, 10.5), (2.0, 12.0)]
+    assert list(histories["Vehicle.VehicleIdentification.VIN"]) == [
+        (0.0, "line one\nline two"),
+        (1.0, "plain"),
+        (2.0, "a, b"),
+    ]
+    assert list(histories["Vehicle.Cabin.Door.Row1.Left.IsOpen"]) == [(0.0, 1), (1.0, 0)]
+    assert list(histories["Vehicle.OBD.DTCList"]) == [(0.0, ["P0001", "P0002"]), (2.0, [])]
+
+
+def test_array_cell_that_is_no_json_list_is_rejected(log_schema):
+    log = "timestamp,Vehicle.OBD.DTCList\n0.0,P0001\n"
+
+    with pytest.raises(ValueError, match="Vehicle.OBD.DTCList"):
+        import_csv(io.StringIO(log), log_schema)
+
+
+def test_one_long_cell_does_not_inflate_the_chunk(schema, tmp_path):
+    columns = [f"Vehicle.Sensor{number}" for number in range(100)]
+    wide = Schema(
+        list(schema)
+        + [
+            DataPointSpec(len(schema) + number, path, "float", "sensor")
+            for number, path in enumerate(columns)
+        ]
+    )
+    path = tmp_path / "wide.csv"
+    with open(path, "w", encoding="utf-8", newline="") as fp:
+        fp.write(",".join(["timestamp", "Vehicle.VehicleIdentification.VIN"] + columns) + "\n")
+        for row in range(2000):
+            vin = "X" * 100_000 if row == 1000 else "WVW"
+            fp.write(",".join([str(row), vin] + ["1.25"] * len(columns)) + "\n")
+
+    tracemalloc.start()
+    try:
+        histories = import_csv(str(path), wide, chunk_rows=4096)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert len(histories["Vehicle.Sensor99"]) == 2000
+    assert len(histories["Vehicle.VehicleIdentification.VIN"].values[1000]) == 100_000
+    assert peak < 20 * path.stat().st_size
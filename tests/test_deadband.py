@@ -0,0 +1,42 @@
+from sdv_model.deadband import Deadband, DeadbandFilter
+from sdv_model.schema import DataPointSpec, Schema
+from sdv_model.snapshot import VersionedStore
+
+
+def test_unit_default_suppresses_small_float_changes():
+    schema = Schema(
+        [
+            DataPointSpec(0, "Vehicle.Speed", "float", "sensor", unit="km/h"),
+            DataPointSpec(1, "Vehicle.Cabin.Door.Row1.Left.IsOpen", "boolean", "actuator"),
+        ]
+    )
+    store = VersionedStore(schema)
+    deadband = DeadbandFilter(schema)
+    store.add_filter(deadband)
+
+    store.update({0: 50.0, 1: False})
+    assert store.update({0: 50.05, 1: False}).version == 1
+    assert store.update({0: 50.2}).version == 2
+    assert store.snapshot()[0] == 50.2
+    assert deadband.suppressed == 2
+
+
+def test_relative_band_scales_with_the_stored_value(schema):
+    deadband = DeadbandFilter(schema, {"Vehicle.Speed": Deadband(absolute=0.1, relative=0.01)})
+
+    assert not deadband(0, 100.0, 100.9)
+    assert deadband(0, 100.0, 101.1)
+    assert not deadband(0, 1.0, 1.05)
+    assert deadband(0, 1.0, 1.2)
+
+
+def test_first_values_none_and_disabled_bands_always_pass(schema):
+    deadband = DeadbandFilter(schema, {"Vehicle.Powertrain.TractionBattery.CurrentVoltage": None})
+
+    assert deadband(0, None, 1.0)
+    assert deadband(0, 1.0, None)
+    assert deadband(4, 400.0, 400.0)
+    assert deadband.get(4) is None
+    assert not deadband(6, "VIN", "VIN")
+    assert deadband(6, "VIN", "OTHER")
+    assert deadband.suppressed == 1
@@ -0,0 +1,39 @@
+import pytest
+
+from sdv_model.codec.delta import DeltaDecoder, DeltaEncoder
+from sdv_model.schema import DataPointSpec, Schema
+
+
+def test_frames_round_trip(schema):
+    encoder, decoder = DeltaEncoder(schema), DeltaDecoder(schema)
+    for step in range(3):
+        frame = encoder.encode({"Vehicle.Speed": 10.0 + step, 3: step, 1: None}, float(step))
+        assert decoder.decode(frame) == (float(step), {0: 10.0 + step, 1: None, 3: step})
+
+
+def test_duplicate_datapoint_is_rejected_without_advancing_the_stream(schema):
+    encoder, decoder = DeltaEncoder(schema), DeltaDecoder(schema)
+
+    with pytest.raises(ValueError, match="Vehicle.Speed"):
+        encoder.encode({"Vehicle.Speed": 1.0, 0: 2.0})
+
+    assert encoder.sequence == 0
+    assert decoder.decode(encoder.encode({0: 3.0}))[1] == {0: 3.0}
+
+
+def test_frame_of_another_schema_is_rejected(schema):
+    other = Schema([DataPointSpec(0, "Vehicle.Speed", "double", "sensor")])
+    frame = DeltaEncoder(other).encode({0: 1.0})
+
+    with pytest.raises(ValueError, match="unknown schema"):
+        DeltaDecoder(schema).decode(frame)
+
+
+def test_failed_frame_leaves_encoder_in_step_with_decoder(schema):
+    encoder, decoder = DeltaEncoder(schema), DeltaDecoder(schema)
+    decoder.decode(encoder.encode({"Vehicle.Speed": 10.0}))
+
+    with pytest.raises(TypeError):
+        encoder.encode({"Vehicle.Speed": 20.0, "Vehicle.Cabin.Door.Row1.Left.Window.Position": 1.5})
+
+    assert decoder.decode(encoder.encode({"Vehicle.Speed": 55.5}))[1] == {0: 55.5}
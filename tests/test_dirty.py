@@ -0,0 +1,60 @@
+import threading
+
+import pytest
+
+from sdv_model.dirty import DirtyTracker
+from sdv_model.snapshot import VersionedStore
+
+DOOR = "Vehicle.Cabin.Door.Row1.Left"
+
+
+def test_datapoint_targets_are_rejected_where_a_branch_is_expected(schema):
+    tracker = DirtyTracker(VersionedStore(schema))
+    tracker.mark(0)
+
+    for method in (tracker.dirty_children, tracker.dirty_datapoints, tracker.take):
+        with pytest.raises(TypeError):
+            method("Vehicle.Speed")
+        with pytest.raises(TypeError):
+            method(0)
+    with pytest.raises(TypeError):
+        list(tracker.dirty_branches("Vehicle.Speed"))
+    assert tracker.is_dirty("Vehicle.Speed")
+
+
+def test_take_clears_subtree_and_cleans_ancestors(schema):
+    store = VersionedStore(schema)
+    tracker = DirtyTracker(store)
+    store.update({f"{DOOR}.IsOpen": True, f"{DOOR}.Window.Position": 50})
+
+    assert tracker.dirty_children(DOOR) == [f"{DOOR}.Window", f"{DOOR}.IsOpen"]
+    assert sorted(tracker.take(DOOR)) == [1, 3]
+    assert not tracker.is_dirty()
+
+    store.update({"Vehicle.Speed": 1.0})
+    tracker.clear("Vehicle.Speed")
+    assert not tracker.is_dirty("Vehicle")
+
+
+def test_consumer_take_races_writer_thread_without_losing_marks(schema):
+    store = VersionedStore(schema)
+    tracker = DirtyTracker(store)
+    paths = [spec.path for spec in schema if spec.datatype == "float"]
+    taken = set()
+    done = threading.Event()
+
+    def write():
+        for step in range(2000):
+            store.update({paths[step % len(paths)]: float(step)})
+        done.set()
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    while not done.is_set():
+        taken.update(tracker.take())
+    writer.join()
+    taken.update(tracker.take())
+
+    assert taken == {schema.index_of(path) for path in paths}
+    assert not tracker.is_dirty()
+    assert tracker._dirty_children == [0] * len(tracker.branches)
@@ -0,0 +1,108 @@
+import asyncio
+import threading
+
+from sdv_model.dispatch import CoalescingDispatcher
+
+SPEED, VOLTAGE = 0, 4
+
+
+def test_updates_within_one_iteration_are_coalesced(schema):
+    dispatcher = CoalescingDispatcher(schema)
+    calls = []
+    dispatcher.register([SPEED, VOLTAGE], calls.append)
+
+    async def main():
+        for step in range(3):
+            dispatcher.notify({SPEED: float(step)})
+        dispatcher.notify({VOLTAGE: 400.0})
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+
+    assert calls == [{SPEED: 2.0, VOLTAGE: 400.0}]
+    assert (dispatcher.received, dispatcher.dispatched) == (4, 1)
+
+
+def test_first_notify_from_another_thread_without_loop_does_not_stop_dispatch(schema):
+    dispatcher = CoalescingDispatcher(schema)
+    calls = []
+    dispatcher.register([SPEED, VOLTAGE], calls.append)
+    errors = []
+
+    def notify():
+        try:
+            dispatcher.notify({SPEED: 1.0})
+        except RuntimeError as error:
+            errors.append(error)
+
+    thread = threading.Thread(target=notify)
+    thread.start()
+    thread.join()
+
+    async def main():
+        dispatcher.notify({VOLTAGE: 400.0})
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+
+    assert len(errors) == 1
+    assert calls == [{SPEED: 1.0, VOLTAGE: 400.0}]
+
+
+def test_notify_from_another_thread_dispatches_on_the_given_loop(schema):
+    calls = []
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        dispatcher = CoalescingDispatcher(schema, loop)
+        done = asyncio.Event()
+        dispatcher.register([SPEED], lambda changes: (calls.append(changes), done.set()))
+        thread = threading.Thread(target=dispatcher.notify, args=({SPEED: 3.0},))
+        thread.start()
+        await asyncio.wait_for(done.wait(), 1.0)
+        thread.join()
+
+    asyncio.run(main())
+
+    assert calls == [{SPEED: 3.0}]
+
+
+def test_failing_callback_does_not_skip_the_others(schema, caplog):
+    dispatcher = CoalescingDispatcher(schema)
+    calls = []
+
+    def broken(changes):
+        raise RuntimeError("callback bug")
+
+    async def later(changes):
+        calls.append(("coroutine", changes))
+
+    dispatcher.register([SPEED], broken)
+    dispatcher.register([SPEED], calls.append)
+    dispatcher.register([SPEED], later)
+
+    async def main():
+        dispatcher.notify({SPEED: 5.0})
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+
+    assert calls == [{SPEED: 5.0}, ("coroutine", {SPEED: 5.0})]
+    assert "callback bug" in caplog.text
+
+
+def test_unregistered_callback_is_not_called(schema):
+    dispatcher = CoalescingDispatcher(schema)
+    calls = []
+    dispatcher.register([SPEED], calls.append)
+    dispatcher.unregister(calls.append)
+
+    async def main():
+        dispatcher.notify({SPEED: 1.0})
+        await asyncio.sleep(0)
+
+    asyncio.run(main())
+
+    assert calls == []
+    assert dispatcher.received == 1
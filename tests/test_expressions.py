@@ -0,0 +1,104 @@
+import logging
+import math
+
+import numpy as np
+import pytest
+
+from sdv_model.expressions import ExpressionEngine
+from sdv_model.snapshot import VersionedStore
+
+BATTERY = "Vehicle.Powertrain.TractionBattery"
+VOLTAGE = f"{BATTERY}.CurrentVoltage"
+CURRENT = f"{BATTERY}.CurrentCurrent"
+
+
+def test_update_recomputes_only_dependent_expressions(schema):
+    engine = ExpressionEngine(schema)
+    received = []
+    engine.define("Power", f"{VOLTAGE} * {CURRENT}", lambda *change: received.append(change))
+    engine.define("PowerKw", "Power / 1000")
+    engine.define("SpeedMs", "Vehicle.Speed / 3.6")
+
+    assert math.isnan(engine["Power"])
+    assert engine.update({4: 400.0}) == {}
+    assert engine.update({5: 10.0}) == {"Power": 4000.0, "PowerKw": 4.0}
+    assert engine.update({0: 36.0}) == {"SpeedMs": 10.0}
+    assert engine.update({5: 10.0}) == {}
+    assert received == [("Power", 4000.0)]
+    assert engine.expressions["PowerKw"].depends == ("Power",)
+    assert engine.expressions["Power"].inputs == (4, 5)
+
+
+def test_glob_arguments_expand_to_all_matching_datapoints(schema):
+    engine = ExpressionEngine(schema)
+    engine.define("Largest", f"max('{BATTERY}.Current*')")
+    engine.define("Mean", f"mean('{BATTERY}.Current*', Vehicle.Speed)")
+
+    engine.update({4: 400.0, 5: -20.0, 0: 10.0})
+
+    assert engine["Largest"] == 400.0
+    assert engine["Mean"] == pytest.approx(130.0)
+
+
+def test_evaluate_computes_columns_of_samples(schema):
+    engine = ExpressionEngine(schema)
+    engine.define("Power", f"{VOLTAGE} * {CURRENT}")
+    engine.define("Charging", "Power < 0")
+
+    columns = engine.evaluate({VOLTAGE: [400.0, 410.0, 390.0], CURRENT: [10.0, -5.0, 0.0]})
+
+    np.testing.assert_array_equal(columns["Power"], [4000.0, -2050.0, 0.0])
+    np.testing.assert_array_equal(columns["Charging"], [0.0, 1.0, 0.0])
+    with pytest.raises(ValueError):
+        engine.evaluate({VOLTAGE: [400.0], CURRENT: [1.0, 2.0]})
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "Vehicle.VehicleIdentification.VIN * 2",
+        "Vehicle.Unknown + 1",
+        "Later + 1",
+        "__import__('os')",
+        "Vehicle.Speed if Vehicle.Speed else 0",
+        "0 < Vehicle.Speed < 10",
+        "max('Vehicle.Body.*')",
+        "Vehicle.Speed +",
+        "'text'",
+    ],
+)
+def test_invalid_expressions_are_rejected(schema, source):
+    engine = ExpressionEngine(schema)
+
+    with pytest.raises(ValueError):
+        engine.define("Bad", source)
+    assert not engine.expressions
+
+
+def test_failing_callback_is_logged_and_dependents_still_update(schema, caplog):
+    engine = ExpressionEngine(schema)
+
+    def fail(name, value):
+        raise RuntimeError("callback failed")
+
+    engine.define("SpeedMs", "Vehicle.Speed / 3.6", fail)
+    engine.define("Doubled", "SpeedMs * 2")
+
+    with caplog.at_level(logging.ERROR, logger="sdv_model.expressions"):
+        changed = engine.update({0: 36.0})
+
+    assert changed == {"SpeedMs": 10.0, "Doubled": 20.0}
+    assert len(caplog.records) == 1
+
+
+def test_attached_engine_follows_store_commits(schema):
+    store = VersionedStore(schema)
+    engine = ExpressionEngine(schema)
+    engine.define("Power", f"{VOLTAGE} * {CURRENT}")
+    engine.attach(store)
+
+    store.update({VOLTAGE: 400.0, CURRENT: 2.0})
+    engine.close()
+    store.update({CURRENT: 3.0})
+
+    assert engine["Power"] == 800.0
@@ -0,0 +1,21 @@
+import pytest
+
+from sdv_model.fakebroker import RandomWalk
+from sdv_model.schema import DataPointSpec
+
+
+@pytest.mark.parametrize(
+    "datatype, minimum, maximum, expected",
+    [
+        ("float", None, None, (-100.0, 100.0)),
+        ("uint8", None, None, (0, 100.0)),
+        ("float", 500.0, None, (500.0, 700.0)),
+        ("float", None, -500.0, (-700.0, -500.0)),
+        ("uint8", 200, None, (200, 255)),
+        ("int16", 10, 20, (10, 20)),
+    ],
+)
+def test_bounds_stay_ordered_with_one_sided_limits(datatype, minimum, maximum, expected):
+    spec = DataPointSpec(0, "Vehicle.Speed", datatype, "sensor", minimum=minimum, maximum=maximum)
+
+    assert RandomWalk._bounds(spec) == expected
@@ -0,0 +1,128 @@
+import asyncio
+import threading
+
+import pytest
+
+from sdv_model.fanout import BLOCK, CONFLATE, DROP_OLDEST, Consumer, FanOut
+from sdv_model.snapshot import VersionedStore
+
+SPEED, VOLTAGE = 0, 4
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def drain(consumer):
+    while len(consumer):
+        yield consumer.get_nowait()
+
+
+def test_drop_oldest_keeps_the_latest_batches():
+    async def main():
+        consumer = Consumer("drop", maxsize=2, policy=DROP_OLDEST)
+        for step in range(5):
+            await consumer.put(float(step), {SPEED: step})
+        return [await consumer.get(), await consumer.get()], consumer.stats
+
+    batches, stats = run(main())
+
+    assert batches == [(3.0, {SPEED: 3}), (4.0, {SPEED: 4})]
+    assert (stats.pending, stats.delivered, stats.dropped) == (0, 2, 3)
+
+
+def test_conflate_merges_queued_batches_to_latest_values():
+    async def main():
+        consumer = Consumer("conflate", maxsize=2, policy=CONFLATE)
+        await consumer.put(0.0, {SPEED: 0})
+        await consumer.put(1.0, {VOLTAGE: 400})
+        await consumer.put(2.0, {SPEED: 2})
+        return consumer.get_nowait(), consumer.stats
+
+    batch, stats = run(main())
+
+    assert batch == (2.0, {SPEED: 2, VOLTAGE: 400})
+    assert (stats.pending, stats.conflated, stats.dropped) == (0, 2, 0)
+
+
+def test_full_block_consumer_only_delays_its_own_publisher(schema):
+    async def main():
+        fanout = FanOut(schema)
+        blocked = fanout.add_consumer("block", maxsize=1, policy=BLOCK)
+        fast = fanout.add_consumer("fast", maxsize=10)
+        await fanout.publish(0.0, {SPEED: 0})
+        publishing = asyncio.ensure_future(fanout.publish(1.0, {SPEED: 1}))
+        await asyncio.sleep(0.01)
+        assert not publishing.done()
+        assert len(fast) == 2
+        assert blocked.get_nowait() == (0.0, {SPEED: 0})
+        await asyncio.wait_for(publishing, 1.0)
+        return blocked.get_nowait(), blocked.stats
+
+    batch, stats = run(main())
+
+    assert batch == (1.0, {SPEED: 1})
+    assert stats.blocked >= 0.01
+
+
+def test_attached_store_never_waits_and_block_backlog_is_bounded(schema):
+    async def main():
+        store = VersionedStore(schema)
+        fanout = FanOut(schema)
+        blocked = fanout.add_consumer("block", maxsize=2, policy=BLOCK, max_backlog=3)
+        fast = fanout.add_consumer("fast", maxsize=100, targets=["Vehicle.Speed"])
+        fanout.attach(store)
+        writer = threading.Thread(
+            target=lambda: [store.update({SPEED: float(step)}, float(step)) for step in range(10)]
+        )
+        writer.start()
+        writer.join()
+        await asyncio.sleep(0.01)
+        stats = blocked.stats
+        received = [batch async for batch in drain(blocked)]
+        await fanout.close()
+        return stats, received, len(fast)
+
+    stats, received, fast = run(main())
+
+    assert (stats.pending, stats.backlog, stats.dropped) == (2, 3, 5)
+    assert [timestamp for timestamp, _ in received] == [0.0, 1.0, 7.0, 8.0, 9.0]
+    assert fast == 10
+
+
+def test_close_ends_readers_after_queued_batches():
+    async def main():
+        consumer = Consumer("reader")
+        received = []
+
+        async def read():
+            async for batch in consumer:
+                received.append(batch)
+
+        reader = asyncio.ensure_future(read())
+        await consumer.put(0.0, {SPEED: 0})
+        await asyncio.sleep(0)
+        consumer.close()
+        await asyncio.wait_for(reader, 1.0)
+        with pytest.raises(StopAsyncIteration):
+            await consumer.get()
+        return received
+
+    assert run(main()) == [(0.0, {SPEED: 0})]
+
+
+def test_lag_metrics_track_waiting_and_delivered_batches():
+    async def main():
+        consumer = Consumer("lag")
+        assert consumer.stats.lag == 0.0
+        await consumer.put(0.0, {SPEED: 0})
+        await asyncio.sleep(0.02)
+        waiting = consumer.stats.lag
+        consumer.get_nowait()
+        return waiting, consumer.stats
+
+    waiting, stats = run(main())
+
+    assert waiting >= 0.02
+    assert stats.last_lag >= waiting
+    assert stats.lag == 0.0
@@ -0,0 +1,69 @@
+import io
+import json
+import math
+
+import pytest
+
+from sdv_model.codec.jsonl import (
+    JsonlTraceWriter,
+    load_updates,
+    read_batches,
+    read_updates,
+    write_updates,
+)
+from sdv_model.snapshot import VersionedStore
+
+
+def test_store_commits_round_trip_through_a_trace(schema):
+    source, target = VersionedStore(schema), VersionedStore(schema)
+    fp = io.StringIO()
+    writer = JsonlTraceWriter(fp, schema)
+    writer.attach(source)
+    source.update({"Vehicle.Speed": 10.0, "Vehicle.VehicleIdentification.VIN": "WVW"}, 1.0)
+    source.update({"Vehicle.Speed": 11.0}, 2.0)
+    writer.close()
+
+    fp.seek(0)
+    assert load_updates(fp, target) == 3
+    assert target.snapshot().values() == source.snapshot().values()
+    assert target.version == 2
+
+
+def test_batches_group_by_timestamp_and_skip_unknown_paths(schema):
+    fp = io.StringIO()
+    write_updates(
+        fp,
+        [
+            (1.0, "Vehicle.Speed", 1.0),
+            (1.0, "Vehicle.Unknown", 0),
+            (1.0, "Vehicle.Powertrain.TractionBattery.CurrentVoltage", 400.0),
+            (2.0, "Vehicle.Speed", 2.0),
+        ],
+    )
+
+    fp.seek(0)
+    assert list(read_batches(fp, schema, strict=False, max_batch=1)) == [
+        (1.0, {0: 1.0}),
+        (1.0, {4: 400.0}),
+        (2.0, {0: 2.0}),
+    ]
+    fp.seek(0)
+    with pytest.raises(KeyError):
+        list(read_batches(fp, schema))
+
+
+def test_non_finite_values_are_written_as_null():
+    fp = io.StringIO()
+    write_updates(fp, [(1.0, "Vehicle.Speed", math.nan), (2.0, "Vehicle.List", [1.0, math.inf])])
+
+    lines = fp.getvalue().splitlines()
+    assert [json.loads(line)["value"] for line in lines] == [None, [1.0, None]]
+    assert "NaN" not in fp.getvalue() and "Infinity" not in fp.getvalue()
+
+
+@pytest.mark.parametrize("line", ['[1, 2, 3]', '"text"', '{"ts": 1.0}', "{"])
+def test_invalid_lines_raise_value_error_with_line_number(line):
+    fp = io.StringIO('{"ts": 0.0, "path": "Vehicle.Speed", "value": 1.0}\n\n' + line + "\n")
+
+    with pytest.raises(ValueError, match="line 3"):
+        list(read_updates(fp))
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import threading
+
+from sdv_model.priority import Priority, PriorityMap, PriorityScheduler
+
+
+def test_batches_are_processed_by_class(schema):
+    priorities = PriorityMap(schema)
+    handled = []
+    scheduler = PriorityScheduler(priorities, lambda timestamp, updates: handled.append(updates))
+    scheduler.submit({6: "VIN"})
+    scheduler.submit({0: 10.0, 1: True})
+
+    assert scheduler.drain() == 3
+    assert handled == [{0: 10.0}, {1: True}, {6: "VIN"}]
+    assert priorities[0] == Priority.CONTROL
+
+
+def test_submit_from_threads_while_run_starts_and_stops(schema):
+    handled = []
+    scheduler = PriorityScheduler(
+        PriorityMap(schema), lambda timestamp, updates: handled.append(updates)
+    )
+    stop = threading.Event()
+
+    def submit():
+        while not stop.is_set():
+            scheduler.submit({0: 1.0})
+
+    async def main():
+        for _ in range(20):
+            task = asyncio.ensure_future(scheduler.run())
+            await asyncio.sleep(0.001)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    submitter = threading.Thread(target=submit)
+    submitter.start()
+    try:
+        asyncio.run(main())
+    finally:
+        stop.set()
+        submitter.join()
+
+    assert handled
+    assert scheduler._wakeup is None
+
+
+def test_failing_handler_is_logged_and_scheduler_keeps_going(schema, caplog):
+    handled = []
+
+    async def handle(timestamp, updates):
+        if 0 in updates:
+            raise RuntimeError("handler failed")
+        handled.append(updates)
+
+    scheduler = PriorityScheduler(PriorityMap(schema), handle)
+
+    async def main():
+        task = asyncio.ensure_future(scheduler.run())
+        scheduler.submit({0: 10.0, 6: "VIN"})
+        scheduler.submit({1: True})
+        while scheduler.pending() or len(handled) < 2:
+            await asyncio.sleep(0.001)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    def fail(timestamp, updates):
+        raise RuntimeError("handler failed")
+
+    with caplog.at_level(logging.ERROR, logger="sdv_model.priority"):
+        asyncio.run(asyncio.wait_for(main(), timeout=1.0))
+        scheduler.handler = fail
+        scheduler.submit({0: 10.0, 1: True})
+        assert scheduler.drain() == 2
+
+    assert handled == [{1: True}, {6: "VIN"}]
+    assert len(caplog.records) == 3
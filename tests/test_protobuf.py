@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import pytest
+
+import sdv_model
+
+pytest.importorskip("google.protobuf")
+
+from sdv_model.codec.protobuf import ProtobufCodec, generate_proto  # noqa: E402
+from sdv_model.schema import Schema  # noqa: E402
+from sdv_model.snapshot import VersionedStore  # noqa: E402
+
+SPEED = "Vehicle.Speed"
+VIN = "Vehicle.VehicleIdentification.VIN"
+
+
+@pytest.fixture(scope="module")
+def vehicle_schema() -> Schema:
+    from sdv_model import vehicle  # pylint: disable=C0415
+
+    return Schema.from_model(vehicle)
+
+
+@pytest.fixture(scope="module")
+def codec(vehicle_schema) -> ProtobufCodec:
+    return ProtobufCodec(vehicle_schema)
+
+
+def test_snapshot_round_trips_through_the_wire(codec, vehicle_schema):
+    store = VersionedStore(vehicle_schema)
+    snapshot = store.update({SPEED: 42.5, VIN: "WVW000001"}, 3.0)
+    wire = codec.to_snapshot(snapshot).SerializeToString()
+    message = codec.module.VehicleSnapshot.FromString(wire)
+
+    target = VersionedStore(vehicle_schema)
+    codec.apply_snapshot(message, target)
+
+    assert codec.from_snapshot(message)[0] == 3.0
+    assert target.snapshot().values() == snapshot.values()
+
+
+def test_update_batch_round_trips_and_skips_unset_values(codec, vehicle_schema):
+    batch = codec.to_updates({SPEED: 42.5, VIN: None}, 4.0)
+    decoded = codec.module.VehicleUpdateBatch.FromString(batch.SerializeToString())
+
+    assert codec.from_updates(decoded) == (4.0, {vehicle_schema.index_of(SPEED): 42.5})
+
+
+def test_messages_of_another_schema_are_rejected(codec, vehicle_schema):
+    batch = codec.to_updates({SPEED: 42.5})
+    batch.schema_fingerprint ^= 1
+    message = codec.module.VehicleSnapshot(timestamp=1.0)
+
+    with pytest.raises(ValueError, match="unknown schema"):
+        codec.from_updates(batch)
+    with pytest.raises(ValueError, match="unknown schema"):
+        codec.from_snapshot(message)
+
+
+def test_unknown_ids_and_wrong_value_types_are_rejected(codec, vehicle_schema):
+    batch = codec.to_updates({})
+    batch.updates.add(id=len(vehicle_schema), bool_value=True)
+    with pytest.raises(ValueError, match="Unknown datapoint id"):
+        codec.from_updates(batch)
+
+    batch = codec.to_updates({})
+    batch.updates.add(id=vehicle_schema.index_of(SPEED), string_value="fast")
+    with pytest.raises(ValueError, match=SPEED):
+        codec.from_updates(batch)
+
+
+def test_bundled_proto_is_up_to_date(vehicle_schema):
+    bundled = Path(sdv_model.__file__).parent / "proto" / "vehicle.proto"
+    assert bundled.read_text(encoding="utf-8") == generate_proto(vehicle_schema)
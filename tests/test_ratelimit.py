@@ -0,0 +1,104 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from sdv_model.ratelimit import RateLimit, RateLimiter
+from sdv_model.schema import Schema
+from sdv_model.subscription import SubscriptionSet
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _offer(limiter, clock, updates):
+    emitted = []
+    for timestamp, value in updates:
+        clock.now = timestamp
+        item = limiter.offer(lambda value=value: value)
+        if item is not None:
+            emitted.append(item)
+    return emitted
+
+
+def test_leading_only_limit_drops_updates_within_the_interval():
+    clock = Clock()
+    limiter = RateLimiter(RateLimit(1.0, trailing=False), clock=clock)
+
+    emitted = _offer(limiter, clock, [(0.0, 1), (0.5, 2), (1.0, 3), (1.2, 4), (2.5, 5)])
+
+    assert emitted == [1, 3, 5]
+    assert (limiter.passed, limiter.dropped) == (3, 2)
+
+
+def test_decimation_keeps_every_nth_update_without_decoding_the_others():
+    clock = Clock()
+    limiter = RateLimiter(RateLimit(decimate=3, trailing=False), clock=clock)
+    decoded = []
+
+    def make(value):
+        decoded.append(value)
+        return value
+
+    emitted = [limiter.offer(lambda value=value: make(value)) for value in range(7)]
+
+    assert [item for item in emitted if item is not None] == [2, 5]
+    assert decoded == [2, 5]
+
+
+def test_leading_average_emits_mean_of_the_updates_since_the_last_emission():
+    clock = Clock()
+    limiter = RateLimiter(RateLimit(1.0, trailing=False, average=True), clock=clock)
+
+    emitted = _offer(limiter, clock, [(0.0, 1.0), (0.4, 2.0), (0.8, 4.0), (1.0, 6.0)])
+    result = limiter.offer(lambda: SimpleNamespace(value=1.0, timestamp=None))
+
+    assert emitted == [1.0, 4.0]
+    assert result is None
+
+
+def test_trailing_emission_delivers_the_latest_held_update():
+    emitted = []
+
+    async def main():
+        limiter = RateLimiter(RateLimit(0.01), emitted.append)
+        for value in range(4):
+            assert limiter.offer(lambda value=value: value) == (0 if value == 0 else None)
+        await asyncio.sleep(0.05)
+        return limiter
+
+    limiter = asyncio.run(main())
+    assert emitted == [3]
+    assert (limiter.passed, limiter.dropped) == (2, 2)
+
+
+@pytest.mark.parametrize(
+    "limit, options",
+    [
+        (RateLimit(-1.0), {}),
+        (RateLimit(decimate=0, trailing=False), {}),
+        (RateLimit(leading=False, trailing=False), {}),
+        (RateLimit(leading=False, trailing=False, average=True), {}),
+        (RateLimit(1.0), {}),
+        (RateLimit(1.0, trailing=False, average=True), {"datatype": "string"}),
+        (RateLimit(1.0, trailing=False, average=True), {"datatype": "float[]"}),
+    ],
+)
+def test_limits_that_cannot_work_are_rejected(limit, options):
+    with pytest.raises(ValueError):
+        RateLimiter(limit, **options)
+
+
+def test_subscription_rejects_averaging_a_string_datapoint(schema):
+    nodes = [SimpleNamespace(path=spec.path) for spec in schema]
+    subscriptions = SubscriptionSet(Schema(list(schema), nodes))
+
+    with pytest.raises(ValueError):
+        subscriptions.add("Vehicle.**", print, RateLimit(1.0, average=True))
+    assert subscriptions.indexes == []
+    assert subscriptions.add("Vehicle.Speed", print, RateLimit(1.0, average=True)) == (0,)
@@ -0,0 +1,68 @@
+import asyncio
+
+from sdv_model.replay import TraceReplayer, VirtualClock
+from sdv_model.snapshot import VersionedStore
+
+
+class LateClock(VirtualClock):
+    """Clock that is always past the schedule, so the replay never sleeps."""
+
+    def now(self) -> float:
+        self._now += 1.0
+        return self._now
+
+
+def trace(count):
+    return [(float(step), {"Vehicle.Speed": float(step)}) for step in range(count)]
+
+
+def test_replay_runs_again_after_stop(schema):
+    store = VersionedStore(schema)
+    replayer = TraceReplayer(store, trace(10), clock=VirtualClock())
+    replayer.stop()
+
+    stats = replayer.run_sync()
+
+    assert stats.batches == 10
+    assert store.snapshot()["Vehicle.Speed"] == 9.0
+
+
+def test_paced_replay_behind_schedule_yields_to_the_loop(schema):
+    store = VersionedStore(schema)
+    replayer = TraceReplayer(store, trace(100), speed=1.0, clock=LateClock())
+    versions = []
+
+    async def watch():
+        while len(versions) < 100:
+            versions.append(store.snapshot().version)
+            await asyncio.sleep(0)
+
+    async def main():
+        watcher = asyncio.ensure_future(watch())
+        await replayer.run()
+        watcher.cancel()
+
+    asyncio.run(main())
+
+    assert 1 < len(set(versions))
+
+
+def test_stopped_replay_of_a_one_shot_trace_resumes_without_losing_batches(schema):
+    store = VersionedStore(schema)
+    committed = []
+    store.add_listener(lambda snapshot, changed: committed.append(snapshot.timestamp))
+    replayer = TraceReplayer(store, iter(trace(10)), speed=1.0, clock=VirtualClock())
+
+    class StopAt(VirtualClock):
+        async def sleep(self, seconds):
+            if self._now >= 4.0:
+                replayer.stop()
+            await super().sleep(seconds)
+
+    replayer.clock = StopAt()
+    first = replayer.run_sync()
+    replayer.clock = VirtualClock()
+    second = replayer.run_sync()
+
+    assert (first.batches, second.batches) == (5, 5)
+    assert committed == [float(step) for step in range(10)]
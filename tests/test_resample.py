@@ -0,0 +1,46 @@
+import sys
+import threading
+
+import numpy as np
+
+from sdv_model.history import HistoryRecorder
+from sdv_model.resample import Resampler
+from sdv_model.snapshot import VersionedStore
+
+
+def test_resample_while_recorder_appends_from_writer_thread(schema):
+    store = VersionedStore(schema)
+    recorder = HistoryRecorder(store, ["Vehicle.Speed"])
+    store.update({"Vehicle.Speed": 0.0}, 0.0)
+    resampler = Resampler(recorder.histories, rate=100.0)
+
+    def write():
+        for step in range(1, 20000):
+            store.update({"Vehicle.Speed": float(step)}, step / 1000)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        writer = threading.Thread(target=write)
+        writer.start()
+        while writer.is_alive():
+            resampler.update()
+        writer.join()
+    finally:
+        sys.setswitchinterval(interval)
+    resampler.update()
+
+    history = recorder["Vehicle.Speed"]
+    assert len(history.timestamps) == len(history.values) == 20000
+    assert np.allclose(resampler.matrix[:, 0], resampler.timestamps * 1000, atol=1.0)
+
+
+def test_hold_emits_last_value_per_grid_point(schema):
+    store = VersionedStore(schema)
+    recorder = HistoryRecorder(store, ["Vehicle.Speed"])
+    for timestamp, value in ((0.0, 1.0), (0.15, 2.0), (0.31, 3.0)):
+        store.update({"Vehicle.Speed": value}, timestamp)
+
+    rows = Resampler(recorder.histories, rate=10.0).update()
+
+    assert rows[:, 0].tolist() == [1.0, 1.0, 2.0, 2.0]
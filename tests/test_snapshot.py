@@ -0,0 +1,57 @@
+import threading
+
+from sdv_model.snapshot import VersionedStore
+
+
+def test_failing_listener_does_not_fail_commit_or_skip_others(schema, caplog):
+    store = VersionedStore(schema)
+    seen = []
+
+    def broken(snapshot, changed):
+        raise RuntimeError("listener bug")
+
+    store.add_listener(broken)
+    store.add_listener(lambda snapshot, changed: seen.append((snapshot.version, changed)))
+
+    snapshot = store.update({"Vehicle.Speed": 12.5}, 1.0)
+
+    assert snapshot.version == 1
+    assert store.snapshot()["Vehicle.Speed"] == 12.5
+    assert seen == [(1, (0,))]
+    assert "listener bug" in caplog.text
+
+
+def test_listeners_see_commits_of_concurrent_writers_in_order(schema):
+    store = VersionedStore(schema)
+    versions = []
+    store.add_listener(lambda snapshot, changed: versions.append(snapshot.version))
+
+    def write(target):
+        for step in range(500):
+            store.update({target: float(step)})
+
+    writers = [
+        threading.Thread(target=write, args=(path,))
+        for path in ("Vehicle.Speed", "Vehicle.Powertrain.TractionBattery.CurrentVoltage")
+    ]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+
+    assert versions == list(range(1, 1001))
+
+
+def test_listener_may_remove_itself(schema):
+    store = VersionedStore(schema)
+    calls = []
+
+    def once(snapshot, changed):
+        calls.append(snapshot.version)
+        store.remove_listener(once)
+
+    store.add_listener(once)
+    store.update({"Vehicle.Speed": 1.0})
+    store.update({"Vehicle.Speed": 2.0})
+
+    assert calls == [1]
@@ -0,0 +1,81 @@
+import asyncio
+import logging
+from types import SimpleNamespace
+
+from sdv_model.ratelimit import RateLimit
+from sdv_model.schema import Schema
+from sdv_model.subscription import SubscriptionSet
+
+SPEED = "Vehicle.Speed"
+LEFT_DOOR = "Vehicle.Cabin.Door.Row1.Left.IsOpen"
+
+
+def _reply(values):
+    """Reply of one stream update carrying ``values`` keyed by path."""
+    return SimpleNamespace(
+        reply=SimpleNamespace(fields=list(values)),
+        get=lambda node: SimpleNamespace(value=values[node.path]),
+    )
+
+
+def _subscriptions(schema):
+    nodes = [SimpleNamespace(path=spec.path) for spec in schema]
+    return SubscriptionSet(Schema(list(schema), nodes))
+
+
+def test_query_covers_matched_datapoints_in_schema_order(schema):
+    subscriptions = _subscriptions(schema)
+    subscriptions.add("Vehicle.Cabin.Door.*.*.IsOpen", print)
+    subscriptions.add("Vehicle.Speed", print)
+
+    assert subscriptions.indexes == [0, 1, 2]
+    assert subscriptions.query == (
+        "SELECT Vehicle.Speed, Vehicle.Cabin.Door.Row1.Left.IsOpen, "
+        "Vehicle.Cabin.Door.Row1.Right.IsOpen"
+    )
+    subscriptions.remove(print)
+    assert subscriptions.indexes == []
+
+
+def test_failing_callback_is_logged_and_others_still_called(schema, caplog):
+    subscriptions = _subscriptions(schema)
+    received = []
+
+    def fail(result):
+        raise RuntimeError("callback failed")
+
+    async def record(result):
+        received.append(result.value)
+
+    subscriptions.add("Vehicle.Speed", fail)
+    subscriptions.add("Vehicle.Speed", record)
+    subscriptions.add("Vehicle.Cabin.Door.*.Left.IsOpen", record)
+
+    with caplog.at_level(logging.ERROR, logger="sdv_model.subscription"):
+        asyncio.run(subscriptions._on_reply(_reply({SPEED: 50.0, LEFT_DOOR: True})))
+
+    assert received == [50.0, True]
+    assert len(caplog.records) == 1
+    assert "Vehicle.Speed" in caplog.records[0].getMessage()
+
+
+def test_failing_trailing_callback_is_logged(schema, caplog):
+    subscriptions = _subscriptions(schema)
+    received = []
+
+    def fail(result):
+        received.append(result.value)
+        raise RuntimeError("callback failed")
+
+    subscriptions.add("Vehicle.Speed", fail, RateLimit(min_interval=0.01))
+
+    async def main():
+        for speed in (1.0, 2.0, 3.0):
+            await subscriptions._on_reply(_reply({SPEED: speed}))
+        await asyncio.sleep(0.05)
+
+    with caplog.at_level(logging.ERROR, logger="sdv_model.subscription"):
+        asyncio.run(main())
+
+    assert received == [1.0, 3.0]
+    assert len(caplog.records) == 2
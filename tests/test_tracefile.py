@@ -0,0 +1,80 @@
+import pytest
+
+from sdv_model.codec.tracefile import TraceFileReader, TraceFileWriter
+from sdv_model.schema import DataPointSpec, Schema
+from sdv_model.snapshot import VersionedStore
+
+
+def record(path, schema, **options):
+    store = VersionedStore(schema)
+    with TraceFileWriter(str(path), schema, chunk_seconds=10.0, **options) as writer:
+        writer.attach(store)
+        for step in range(30):
+            updates = {0: float(step), "Vehicle.Cabin.Door.Row1.Left.IsOpen": step % 2}
+            if step % 10 == 0:
+                updates["Vehicle.VehicleIdentification.VIN"] = f"VIN{step}"
+            store.update(updates, float(step))
+    return writer
+
+
+@pytest.mark.parametrize("compression", ["none", "zlib", "lzma"])
+def test_recording_round_trips_in_chunks(schema, tmp_path, compression):
+    path = tmp_path / "trace.sdvt"
+    writer = record(path, schema, compression=compression)
+
+    with TraceFileReader(str(path), schema) as reader:
+        histories = reader.read()
+        assert (reader.start, reader.end) == (0.0, 29.0)
+
+    assert len(writer.chunks) == 3
+    assert list(histories["Vehicle.Speed"]) == [(float(step), float(step)) for step in range(30)]
+    assert list(histories["Vehicle.VehicleIdentification.VIN"]) == [
+        (0.0, "VIN0"),
+        (10.0, "VIN10"),
+        (20.0, "VIN20"),
+    ]
+    assert list(histories["Vehicle.Cabin.Door.Row1.Left.IsOpen"].values[:3]) == [0, 1, 0]
+
+
+def test_window_reads_only_overlapping_chunks_and_trims_edges(schema, tmp_path):
+    path = tmp_path / "trace.sdvt"
+    record(path, schema)
+
+    with TraceFileReader(str(path), schema) as reader:
+        assert len(reader.chunks_between(12.0, 15.0)) == 1
+        histories = reader.read(["Vehicle.Speed"], start=8.0, end=21.0)
+
+    assert list(histories) == ["Vehicle.Speed"]
+    assert list(histories["Vehicle.Speed"].timestamps) == [float(step) for step in range(8, 22)]
+
+
+def test_recording_of_an_older_schema_is_remapped(schema, tmp_path):
+    old = Schema(
+        [
+            DataPointSpec(0, "Vehicle.Retired", "int32", "sensor"),
+            DataPointSpec(1, "Vehicle.Speed", "float", "sensor"),
+        ]
+    )
+    path = tmp_path / "old.sdvt"
+    with TraceFileWriter(str(path), old) as writer:
+        writer.write(1.0, {0: 7, 1: 50.0})
+
+    with pytest.raises(ValueError, match="unknown schema"):
+        TraceFileReader(str(path), schema)
+    with TraceFileReader(str(path), schema, sources=[old]) as reader:
+        histories = reader.read()
+
+    assert list(histories) == ["Vehicle.Speed"]
+    assert list(histories["Vehicle.Speed"]) == [(1.0, 50.0)]
+
+
+def test_file_not_closed_by_its_writer_is_rejected(schema, tmp_path):
+    path = tmp_path / "open.sdvt"
+    writer = TraceFileWriter(str(path), schema)
+    writer.write(1.0, {0: 1.0})
+    writer.flush()
+    writer._fp.flush()
+
+    with pytest.raises(ValueError, match="not closed"):
+        TraceFileReader(str(path), schema)
+    writer.close()
@@ -0,0 +1,82 @@
+import logging
+
+import pytest
+
+from sdv_model.snapshot import VersionedStore
+from sdv_model.triggers import TriggerRegistry
+
+DOORS = "Vehicle.Cabin.Door.Row1.*.IsOpen"
+
+
+def test_threshold_fires_on_state_changes_only_and_honours_hysteresis(schema):
+    triggers = TriggerRegistry(schema)
+    (trigger,) = triggers.above("Vehicle.Speed", 100.0, hysteresis=5.0, name="speeding")
+    speeds = [90.0, 101.0, 120.0, 97.0, 94.0, 99.0, 106.0]
+
+    events = [triggers.evaluate({0: speed}, float(step)) for step, speed in enumerate(speeds)]
+
+    fired = [(event.value, event.active, event.timestamp) for batch in events for event in batch]
+    assert fired == [(101.0, True, 1.0), (94.0, False, 4.0), (106.0, True, 6.0)]
+    assert events[1][0].name == "speeding"
+    assert events[1][0].path == "Vehicle.Speed"
+    assert triggers.active(trigger)
+
+
+def test_edges_select_the_transitions_that_fire(schema):
+    triggers = TriggerRegistry(schema)
+    rising = triggers.rising(DOORS)
+    falling = triggers.falling("Vehicle.Cabin.Door.Row1.Left.IsOpen")
+
+    opened = triggers.evaluate({1: True, 2: True})
+    closed = triggers.evaluate({1: False, 2: None})
+
+    assert sorted(event.trigger for event in opened) == list(rising)
+    assert [(event.trigger, event.active) for event in closed] == [(falling[0], False)]
+    assert triggers.active(rising[1])
+
+
+def test_failing_callback_is_logged_and_later_triggers_still_fire(schema, caplog):
+    triggers = TriggerRegistry(schema)
+    received = []
+
+    def fail(event):
+        raise RuntimeError("callback failed")
+
+    triggers.below("Vehicle.Speed", 10.0, fail)
+    triggers.below("Vehicle.Speed", 20.0, received.append)
+
+    with caplog.at_level(logging.ERROR, logger="sdv_model.triggers"):
+        events = triggers.evaluate({0: 5.0})
+
+    assert len(events) == 2
+    assert received == [events[1]]
+    assert len(caplog.records) == 1
+
+
+def test_attached_registry_evaluates_store_commits(schema):
+    store = VersionedStore(schema)
+    triggers = TriggerRegistry(schema)
+    received = []
+    triggers.below("Vehicle.Powertrain.TractionBattery.CurrentVoltage", 300.0, received.append)
+    triggers.attach(store)
+
+    store.update({"Vehicle.Powertrain.TractionBattery.CurrentVoltage": 280.0}, 1.0)
+    store.update({"Vehicle.Speed": 10.0}, 2.0)
+    triggers.close()
+    store.update({"Vehicle.Powertrain.TractionBattery.CurrentVoltage": 400.0}, 3.0)
+
+    assert [(event.value, event.active, event.timestamp) for event in received] == [
+        (280.0, True, 1.0)
+    ]
+
+
+def test_invalid_triggers_are_rejected(schema):
+    triggers = TriggerRegistry(schema)
+
+    with pytest.raises(TypeError):
+        triggers.rising("Vehicle.VehicleIdentification.VIN")
+    with pytest.raises(KeyError):
+        triggers.rising("Vehicle.Body.*")
+    with pytest.raises(ValueError):
+        triggers.add("Vehicle.Speed", 7)
+    assert len(triggers) == 0